@@ -1,17 +1,42 @@
 """
 Flask Application Factory
 """
+import os
 from flask import Flask
 from app.database import init_db
+from app.profiling import init_profiling
 
 def create_app():
     """Create and configure Flask app"""
     app = Flask(__name__)
     app.config['SECRET_KEY'] = 'your-secret-key-change-in-production'
     app.config['SESSION_TYPE'] = 'filesystem'
+    app.config['ADMIN_ROLE'] = 'dm'
+    # List endpoints stream their rows once the requested limit reaches this
+    app.config['STREAM_MIN_ROWS'] = 1000
+    
+    # Request profiling (opt-in per request, or sampled)
+    app.config['PROFILE_SAMPLE_RATE'] = float(os.environ.get('APDS_PROFILE_SAMPLE_RATE', 0))
+    if os.environ.get('APDS_PROFILE_DIR'):
+        app.config['PROFILE_DIR'] = os.environ['APDS_PROFILE_DIR']
+    
+    # Background WAL checkpoint / ANALYZE / vacuum scheduler
+    app.config['DB_MAINTENANCE_ENABLED'] = os.environ.get('APDS_DB_MAINTENANCE', '1') != '0'
+    
+    # Off-peak archiving of monitoring rows older than N days (0 = disabled)
+    app.config['DB_ARCHIVE_AFTER_DAYS'] = int(os.environ.get('APDS_ARCHIVE_AFTER_DAYS', 0))
+    
+    # Scheduled online snapshots (0 = disabled)
+    app.config['DB_BACKUP_INTERVAL_SECONDS'] = int(os.environ.get('APDS_BACKUP_INTERVAL_SECONDS', 0))
+    if os.environ.get('APDS_BACKUP_DIR'):
+        app.config['DB_BACKUP_DIR'] = os.environ['APDS_BACKUP_DIR']
+    
+    # Stored responses of write API calls sent with an Idempotency-Key
+    app.config['IDEMPOTENCY_TTL_SECONDS'] = int(os.environ.get('APDS_IDEMPOTENCY_TTL_SECONDS', 24 * 3600))
     
     # Initialize database
     init_db(app)
+    init_profiling(app)
     
     # Register blueprints
     from app.routes.auth_routes import auth_bp
@@ -20,6 +45,7 @@ def create_app():
     from app.routes.form_routes import forms_bp
     from app.routes.view_routes import views_bp
     from app.routes.report_routes import reports_bp
+    from app.routes.admin_routes import admin_bp
     
     app.register_blueprint(auth_bp)
     app.register_blueprint(dashboard_bp)
@@ -27,13 +53,13 @@ def create_app():
     app.register_blueprint(forms_bp)
     app.register_blueprint(views_bp)
     app.register_blueprint(reports_bp)
+    app.register_blueprint(admin_bp)
     
     # Root route
     @app.route('/')
     def index():
         from flask import redirect, url_for
-        from app.controllers.auth_controller import AuthController
-        auth_controller = AuthController()
+        from app.routes.auth_routes import auth_controller
         if auth_controller.is_authenticated():
             user = auth_controller.get_current_user()
             return redirect(auth_controller._get_role_dashboard(user['role']))
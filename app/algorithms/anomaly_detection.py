@@ -0,0 +1,186 @@
+"""
+Streaming Anomaly Detection
+
+Keeps rolling statistics per equipment and metric (voltage, current, power
+factor) and checks each new reading against them in O(1), without looking at
+history. Per series:
+  - mean: slow EWMA baseline (alpha)
+  - fast_mean: fast EWMA of the same readings (fast_alpha)
+  - variance: EWMA of the squared noise around the fast mean
+  - rate_variance: EWMA variance of the change per hour between readings
+Each reading can raise:
+  - 'zscore'          the reading is more than z_threshold deviations from the baseline
+  - 'rate_of_change'  its change per hour since the previous reading is an outlier
+  - 'drift'           the fast mean has moved drift_threshold deviations away from the
+                      baseline (slow drifts the per-reading z-score never sees);
+                      raised once when the drift starts, again only after it cleared
+Nothing is raised until a series has seen `warmup` readings. Outliers are
+clipped before they update the baseline so one spike does not widen it, and
+the return to normal after a spike is not reported as a fast change.
+
+Readings are placed in time by date and shift; the state table is a dict of
+small slotted records so the whole plant fits in a few hundred KB.
+"""
+import math
+from datetime import date
+
+METRICS = ('voltage', 'current', 'power_factor')
+
+# Hour of day a reading is taken in each shift (unknown shifts count as midday)
+SHIFT_HOURS = {'morning': 8, 'afternoon': 15, 'evening': 15, 'night': 22}
+
+# Smallest deviation assumed per metric, so flat series do not flag noise
+MIN_DEVIATION = {'voltage': 0.5, 'current': 0.5, 'power_factor': 0.005}
+
+DRIFT_FLAG = 1
+OUTLIER_FLAG = 2
+
+
+def reading_hour(monitoring_date, shift: str = None) -> float:
+    """Hours since 0001-01-01 at which a reading was taken"""
+    if isinstance(monitoring_date, str):
+        monitoring_date = date.fromisoformat(monitoring_date[:10])
+    hour = SHIFT_HOURS.get((shift or '').lower(), 12)
+    return monitoring_date.toordinal() * 24.0 + hour
+
+
+class SeriesState:
+    """Rolling statistics of one equipment metric"""
+
+    __slots__ = ('count', 'mean', 'variance', 'fast_mean', 'rate_variance',
+                 'last_value', 'last_at', 'flags')
+
+    def __init__(self, count=0, mean=0.0, variance=0.0, fast_mean=0.0, rate_variance=0.0,
+                 last_value=None, last_at=None, flags=0):
+        self.count = count
+        self.mean = mean
+        self.variance = variance
+        self.fast_mean = fast_mean
+        self.rate_variance = rate_variance
+        self.last_value = last_value
+        self.last_at = last_at
+        self.flags = flags
+
+    def to_tuple(self) -> tuple:
+        return tuple(getattr(self, field) for field in self.__slots__)
+
+    def to_dict(self) -> dict:
+        data = {field: getattr(self, field) for field in self.__slots__}
+        data['deviation'] = math.sqrt(self.variance)
+        return data
+
+
+class Anomaly:
+    """One detected anomaly"""
+
+    __slots__ = ('metric', 'kind', 'value', 'expected', 'score')
+
+    def __init__(self, metric: str, kind: str, value: float, expected: float, score: float):
+        self.metric = metric
+        self.kind = kind
+        self.value = value
+        self.expected = expected
+        self.score = score
+
+    def describe(self) -> str:
+        label = self.metric.replace('_', ' ')
+        if self.kind == 'drift':
+            return f"{label} drifting to {self.value:g} from a baseline of {self.expected:.4g} (z={self.score:.1f})"
+        if self.kind == 'rate_of_change':
+            return f"{label} changed unusually fast to {self.value:g} (z={self.score:.1f})"
+        return f"{label} {self.value:g} far from its usual {self.expected:.4g} (z={self.score:.1f})"
+
+    def to_dict(self) -> dict:
+        return {field: getattr(self, field) for field in self.__slots__}
+
+
+class AnomalyDetector:
+    """EWMA-based detector over a state table keyed by (equipment_id, metric)"""
+
+    def __init__(self, alpha: float = 0.02, fast_alpha: float = 0.3, z_threshold: float = 4.0,
+                 rate_threshold: float = 5.0, drift_threshold: float = 2.0, warmup: int = 30):
+        self.alpha = alpha
+        self.fast_alpha = fast_alpha
+        self.z_threshold = z_threshold
+        self.rate_threshold = rate_threshold
+        self.drift_threshold = drift_threshold
+        self.warmup = warmup
+        self.states = {}
+
+    def load(self, rows):
+        """Fill the state table from (equipment_id, metric, *SeriesState fields) rows"""
+        for equipment_id, metric, *fields in rows:
+            self.states[(equipment_id, metric)] = SeriesState(*fields)
+
+    def update(self, equipment_id: int, at_hour: float, readings: dict) -> list:
+        """Add one reading ({metric: value}); returns the anomalies it raises"""
+        anomalies = []
+        for metric in METRICS:
+            value = readings.get(metric)
+            # Empty or zero readings are not measurements, as for the thresholds
+            if not value:
+                continue
+            state = self.states.get((equipment_id, metric))
+            if state is None:
+                state = self.states[(equipment_id, metric)] = SeriesState()
+            self._update_series(metric, state, float(value), at_hour, anomalies)
+        return anomalies
+
+    def _update_series(self, metric: str, state: SeriesState, value: float, at_hour: float, anomalies: list):
+        if state.count == 0:
+            state.count, state.mean, state.fast_mean = 1, value, value
+            state.last_value, state.last_at = value, at_hour
+            return
+
+        floor = MIN_DEVIATION[metric]
+        # Variances start at zero; correct the EWMA bias of the first readings
+        correction = 1 - (1 - self.alpha) ** state.count
+        deviation = max(math.sqrt(state.variance / correction), floor)
+        armed = state.count >= self.warmup
+
+        # Reading against the baseline
+        z = (value - state.mean) / deviation
+        outlier = abs(z) > self.z_threshold
+        if armed and outlier:
+            anomalies.append(Anomaly(metric, 'zscore', value, state.mean, z))
+        # Coming back to normal right after an outlier is not a fast change of its own
+        recovering = state.flags & OUTLIER_FLAG and not outlier
+
+        # Change per hour since the previous reading (out-of-order readings skip this)
+        rate = None
+        if state.last_at is not None and at_hour > state.last_at:
+            rate = (value - state.last_value) / (at_hour - state.last_at)
+            rate_deviation = max(math.sqrt(state.rate_variance / correction), floor / 24)
+            rate_z = rate / rate_deviation
+            if armed and abs(rate_z) > self.rate_threshold and not recovering:
+                anomalies.append(Anomaly(metric, 'rate_of_change', value, state.last_value, rate_z))
+            rate = max(-self.rate_threshold * rate_deviation, min(rate, self.rate_threshold * rate_deviation))
+
+        # Clip outliers before they move the baseline. The variance is the noise
+        # around the fast mean, so a slow drift does not widen it.
+        clipped = max(state.mean - self.z_threshold * deviation,
+                      min(value, state.mean + self.z_threshold * deviation))
+        residual = clipped - state.fast_mean
+        state.variance = (1 - self.alpha) * (state.variance + self.alpha * residual * residual)
+        state.mean += self.alpha * (clipped - state.mean)
+        state.fast_mean += self.fast_alpha * (clipped - state.fast_mean)
+        if rate is not None:
+            state.rate_variance = (1 - self.alpha) * (state.rate_variance + self.alpha * rate * rate)
+        state.count += 1
+        state.flags = state.flags | OUTLIER_FLAG if outlier else state.flags & ~OUTLIER_FLAG
+        if state.last_at is None or at_hour >= state.last_at:
+            state.last_value, state.last_at = value, at_hour
+
+        # Sustained drift of the fast mean away from the baseline, raised on the way in
+        drift_z = (state.fast_mean - state.mean) / deviation
+        if armed and abs(drift_z) > self.drift_threshold:
+            if not state.flags & DRIFT_FLAG:
+                state.flags |= DRIFT_FLAG
+                anomalies.append(Anomaly(metric, 'drift', value, state.mean, drift_z))
+        elif abs(drift_z) < self.drift_threshold / 2:
+            state.flags &= ~DRIFT_FLAG
+
+    def describe(self, equipment_id: int) -> dict:
+        """Current statistics per metric of one equipment"""
+        return {metric: self.states[(equipment_id, metric)].to_dict()
+                for metric in METRICS if (equipment_id, metric) in self.states}
@@ -0,0 +1,290 @@
+"""
+Fault Similarity Index
+
+In-memory TF-IDF index over past faults, used to suggest root causes for a
+new fault. Each document is one fault: its description, root cause analysis
+and resolution report texts. Text is lower-cased, split into words, stop
+words dropped and plural/verb endings stripped; each word counts 1 + log(tf).
+
+A query is scored against the documents sharing at least one word with it
+(through the inverted index) by cosine similarity, then boosted when the
+equipment type matches and the severity is close:
+    score = cosine * (1 + TYPE_BOOST * same type + SEVERITY_BOOST * closeness)
+
+IDF is taken at query time, while each document's vector length is computed
+with the IDF of when it was added; rebuild() refreshes them. Words in more
+than `max_df` of the documents carry little weight but have the longest
+posting lists, so queries skip them unless exhaustive=True (by default only
+without numpy, where each posting is a Python loop).
+
+Documents can be added, replaced and removed one at a time. Postings are
+dicts keyed by fault id. With numpy installed (optional), every document also
+has a slot in per-slot arrays (vector length, equipment type, severity), and
+each word's posting is cached as (slots, weights) arrays that adds and
+removes patch in place; queries are then scored with bincount instead of
+Python loops, which keeps them in milliseconds at 100k documents.
+
+text_overlap() is the cheap word-overlap check used to spot duplicate reports
+of one failure.
+"""
+import heapq
+import math
+import re
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+WORD_PATTERN = re.compile(r'[a-z][a-z0-9]+')
+
+STOP_WORDS = frozenset((
+    'an', 'as', 'at', 'be', 'by', 'in', 'is', 'it', 'no', 'of', 'on', 'or', 'to', 'the', 'and', 'for', 'with', 'was', 'were', 'are', 'has', 'had', 'have', 'been', 'from',
+    'this', 'that', 'not', 'but', 'all', 'any', 'its', 'into', 'onto', 'after', 'before',
+    'during', 'due', 'then', 'than', 'out', 'off', 'per', 'via', 'also', 'one', 'two'
+))
+
+SUFFIXES = ('ings', 'ing', 'ies', 'ied', 'es', 'ed', 's')
+
+SEVERITY_RANKS = {'low': 0, 'medium': 1, 'high': 2, 'critical': 3}
+
+TYPE_BOOST = 0.25
+SEVERITY_BOOST = 0.1
+
+
+def stem(word: str) -> str:
+    """Strip one common English ending, keeping at least three letters ('tripped' -> 'trip')"""
+    for suffix in SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            if suffix in ('ies', 'ied'):
+                return word[:-3] + 'y'
+            if suffix == 'es' and not word[:-2].endswith(('ss', 'x', 'z', 'ch', 'sh')):
+                continue
+            if suffix == 's' and word.endswith('ss'):
+                return word
+            word = word[:-len(suffix)]
+            # Doubled final consonant before -ed/-ing
+            if suffix != 's' and word[-1] == word[-2] and word[-1] not in 'aeioulsz':
+                word = word[:-1]
+            return word
+    return word
+
+
+def tokenize(text: str) -> list:
+    """Stemmed words of a text without stop words"""
+    return [stem(word) for word in WORD_PATTERN.findall((text or '').lower()) if word not in STOP_WORDS]
+
+
+def term_weights(text: str) -> dict:
+    """Sublinear term frequencies (1 + log tf) of a text"""
+    return {term: 1.0 + math.log(count) for term, count in Counter(tokenize(text)).items()}
+
+
+def text_overlap(first: str, second: str) -> float:
+    """
+    Share of the shorter text's words found in the other (overlap coefficient
+    of the stemmed word sets), so a terse report still matches a longer one
+    """
+    first, second = set(tokenize(first)), set(tokenize(second))
+    if not first or not second:
+        return 0.0
+    return len(first & second) / min(len(first), len(second))
+
+
+def severity_boost(severity: str, query_rank: int) -> float:
+    """Boost for a document severity given the query's severity rank (None: no boost)"""
+    if query_rank is None or severity not in SEVERITY_RANKS:
+        return 0.0
+    return SEVERITY_BOOST * (1 - abs(SEVERITY_RANKS[severity] - query_rank) / 3)
+
+
+class FaultDocument:
+    """One indexed fault"""
+
+    __slots__ = ('slot', 'weights', 'norm', 'equipment_type', 'severity')
+
+    def __init__(self, slot: int, weights: dict, norm: float, equipment_type: str, severity: str):
+        self.slot = slot
+        self.weights = weights
+        self.norm = norm
+        self.equipment_type = equipment_type
+        self.severity = severity
+
+
+class FaultSimilarityIndex:
+    """Inverted TF-IDF index of fault documents keyed by fault id"""
+
+    def __init__(self, max_df: float = None):
+        self.max_df = max_df if max_df is not None else (1.0 if np is not None else 0.5)
+        self._reset()
+
+    def _reset(self):
+        self.documents = {}
+        self.postings = {}
+        # Slot -> fault id (None for a freed slot, reused by the next add)
+        self._slot_ids = []
+        self._free_slots = []
+        # numpy only: word -> (slots, weights), and per slot the vector length,
+        # equipment type hash and severity rank (4 when unknown)
+        self._arrays = {}
+        if np is not None:
+            self._norms = np.full(64, np.inf)
+            self._types = np.zeros(64, dtype=np.int64)
+            self._ranks = np.full(64, 4, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.documents)
+
+    def idf(self, term: str) -> float:
+        """log(N / df); 0 for words in every document or none"""
+        df = len(self.postings.get(term, ()))
+        return math.log(len(self.documents) / df) if df else 0.0
+
+    def add(self, fault_id: int, text: str, equipment_type: str = None, severity: str = None):
+        """Index a fault, replacing an earlier version of it"""
+        self.remove(fault_id)
+        document = self._insert(fault_id, term_weights(text), equipment_type, severity)
+        document.norm = math.sqrt(sum((weight * self.idf(term)) ** 2 for term, weight in document.weights.items()))
+        if np is not None:
+            self._norms[document.slot] = document.norm or np.inf
+            for term, weight in document.weights.items():
+                arrays = self._arrays.get(term)
+                if arrays is not None:
+                    self._arrays[term] = (np.append(arrays[0], document.slot), np.append(arrays[1], weight))
+
+    def remove(self, fault_id: int):
+        """Drop a fault from the index (no-op when absent)"""
+        document = self.documents.pop(fault_id, None)
+        if document is None:
+            return
+        self._slot_ids[document.slot] = None
+        self._free_slots.append(document.slot)
+        for term in document.weights:
+            posting = self.postings[term]
+            del posting[fault_id]
+            if not posting:
+                del self.postings[term]
+            arrays = self._arrays.get(term)
+            if arrays is not None:
+                keep = arrays[0] != document.slot
+                self._arrays[term] = (arrays[0][keep], arrays[1][keep])
+        if np is not None:
+            self._norms[document.slot] = np.inf
+
+    def rebuild(self, rows):
+        """Replace the whole index with (fault_id, text, equipment_type, severity) rows"""
+        self._reset()
+        for fault_id, text, equipment_type, severity in rows:
+            self._insert(fault_id, term_weights(text), equipment_type, severity)
+        # Vector lengths once every document frequency is known
+        idf = {term: self.idf(term) for term in self.postings}
+        for document in self.documents.values():
+            document.norm = math.sqrt(sum((weight * idf[term]) ** 2 for term, weight in document.weights.items()))
+            if np is not None:
+                self._norms[document.slot] = document.norm or np.inf
+        if np is not None:
+            for term in self.postings:
+                self._posting_arrays(term)
+
+    def _insert(self, fault_id: int, weights: dict, equipment_type: str, severity: str) -> FaultDocument:
+        """Give a document a slot and post its words (vector length left to the caller)"""
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._slot_ids[slot] = fault_id
+        else:
+            slot = len(self._slot_ids)
+            self._slot_ids.append(fault_id)
+            if np is not None and slot == len(self._norms):
+                self._norms = np.concatenate((self._norms, np.full(slot, np.inf)))
+                self._types = np.concatenate((self._types, np.zeros(slot, dtype=np.int64)))
+                self._ranks = np.concatenate((self._ranks, np.full(slot, 4, dtype=np.int64)))
+        if np is not None:
+            self._types[slot] = hash(equipment_type)
+            self._ranks[slot] = SEVERITY_RANKS.get(severity, 4)
+        for term, weight in weights.items():
+            self.postings.setdefault(term, {})[fault_id] = weight
+        document = self.documents[fault_id] = FaultDocument(slot, weights, 0.0, equipment_type, severity)
+        return document
+
+    def query(self, text: str, equipment_type: str = None, severity: str = None, k: int = 5,
+              exclude: int = None, exhaustive: bool = False) -> list:
+        """Top k (fault_id, score, cosine) by boosted cosine similarity, best first"""
+        total = len(self.documents)
+        if not total or k < 1:
+            return []
+        query = {}
+        for term, weight in term_weights(text).items():
+            posting = self.postings.get(term)
+            if not posting or (not exhaustive and len(posting) > self.max_df * total):
+                continue
+            idf = math.log(total / len(posting))
+            if idf > 0:
+                # Dot product terms are (tf_q * idf) * (tf_d * idf)
+                query[term] = (weight * idf, weight * idf * idf)
+        if not query:
+            return []
+        query_norm = math.sqrt(sum(weight * weight for weight, _ in query.values()))
+        if np is not None:
+            return self._query_numpy(query, query_norm, equipment_type, severity, k, exclude)
+
+        dots = {}
+        for term, (_, factor) in query.items():
+            for fault_id, weight in self.postings[term].items():
+                dots[fault_id] = dots.get(fault_id, 0.0) + weight * factor
+        dots.pop(exclude, None)
+
+        documents = self.documents
+        severity_rank = SEVERITY_RANKS.get(severity)
+
+        def scored(item):
+            fault_id, dot = item
+            document = documents[fault_id]
+            cosine = dot / (query_norm * document.norm) if document.norm else 0.0
+            boost = 1.0 + severity_boost(document.severity, severity_rank)
+            if equipment_type is not None and document.equipment_type == equipment_type:
+                boost += TYPE_BOOST
+            return cosine * boost, cosine, fault_id
+
+        best = heapq.nlargest(k, map(scored, dots.items()))
+        return [(fault_id, score, cosine) for score, cosine, fault_id in best]
+
+    def _query_numpy(self, query: dict, query_norm: float, equipment_type: str, severity: str,
+                     k: int, exclude: int) -> list:
+        slots, values = [], []
+        for term, (_, factor) in query.items():
+            arrays = self._posting_arrays(term)
+            slots.append(arrays[0])
+            values.append(arrays[1] * factor)
+        dots = np.bincount(np.concatenate(slots), weights=np.concatenate(values),
+                           minlength=len(self._slot_ids))
+        if exclude in self.documents:
+            dots[self.documents[exclude].slot] = 0.0
+        candidates = np.flatnonzero(dots)
+        if not len(candidates):
+            return []
+
+        cosine = dots[candidates] / (query_norm * self._norms[candidates])
+        boost = np.ones(len(candidates))
+        if equipment_type is not None:
+            boost += TYPE_BOOST * (self._types[candidates] == hash(equipment_type))
+        if severity in SEVERITY_RANKS:
+            ranks = self._ranks[candidates]
+            boost += np.where(ranks < 4, SEVERITY_BOOST * (1 - np.abs(ranks - SEVERITY_RANKS[severity]) / 3), 0.0)
+        score = cosine * boost
+        top = np.argpartition(-score, k - 1)[:k] if len(candidates) > k else np.arange(len(candidates))
+        best = sorted(((score[i], cosine[i], self._slot_ids[candidates[i]]) for i in top.tolist()),
+                      reverse=True)
+        return [(fault_id, float(score), float(cosine)) for score, cosine, fault_id in best]
+
+    def _posting_arrays(self, term: str) -> tuple:
+        """(slots, weights) arrays of a word's posting, compiled on first use"""
+        arrays = self._arrays.get(term)
+        if arrays is None:
+            posting = self.postings[term]
+            arrays = self._arrays[term] = (
+                np.fromiter((self.documents[fault_id].slot for fault_id in posting),
+                            dtype=np.int64, count=len(posting)),
+                np.fromiter(posting.values(), dtype=np.float64, count=len(posting))
+            )
+        return arrays
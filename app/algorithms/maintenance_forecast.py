@@ -0,0 +1,121 @@
+"""
+Maintenance Forecast
+
+Fits a straight line to each equipment's recent daily trend and projects when
+it crosses that equipment's warning threshold:
+  - power factor mean falling below power_factor_warning_min
+  - current mean rising above current_warning_max
+  - voltage mean leaving [voltage_warning_low, voltage_warning_high]
+  - voltage standard deviation growing past a quarter of that band
+    (readings would then regularly swing outside it)
+All equipment are fitted at once: the daily values form an (equipment x day)
+matrix with NaN for days without readings, and least squares is computed with
+masked numpy sums. The earliest crossing per equipment is returned with a
+confidence of R^2 scaled by how many days had data (equipment already past a
+limit get the data coverage alone).
+
+numpy is required here (optional for the rest of the application).
+"""
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Days with data needed for full confidence
+FULL_CONFIDENCE_DAYS = 30
+
+# Fewest days with data a trend is fitted on
+MIN_DAYS = 7
+
+# (series, limit for it, crossing upwards?)
+CHECKS = (
+    ('power_factor', lambda limits: limits['power_factor_warning_min'], False),
+    ('current', lambda limits: limits['current_warning_max'], True),
+    ('voltage', lambda limits: limits['voltage_warning_high'], True),
+    ('voltage', lambda limits: limits['voltage_warning_low'], False),
+    ('voltage_std', lambda limits: (limits['voltage_warning_high'] - limits['voltage_warning_low']) / 4, True),
+)
+
+CHECK_NAMES = ('power_factor', 'current', 'voltage_high', 'voltage_low', 'voltage_variance')
+
+
+def fit_lines(values):
+    """
+    Least-squares line per row of an (n x days) matrix with NaN gaps.
+    Returns slope, intercept (at day 0), R^2 and the number of days used.
+    """
+    mask = ~np.isnan(values)
+    x = np.broadcast_to(np.arange(values.shape[1], dtype=float), values.shape)
+    y = np.where(mask, values, 0.0)
+    xm = np.where(mask, x, 0.0)
+    n = mask.sum(axis=1).astype(float)
+    sx, sy = xm.sum(axis=1), y.sum(axis=1)
+    sxx, syy, sxy = (xm * xm).sum(axis=1), (y * y).sum(axis=1), (xm * y).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        var_x = n * sxx - sx * sx
+        var_y = n * syy - sy * sy
+        cov = n * sxy - sx * sy
+        slope = cov / var_x
+        intercept = (sy - slope * sx) / n
+        # A flat series is a perfect (zero-slope) fit
+        r2 = np.where(var_y > 1e-12, cov * cov / (var_x * var_y), 1.0)
+    too_few = n < MIN_DAYS
+    slope[too_few] = np.nan
+    intercept[too_few] = np.nan
+    return slope, intercept, np.clip(r2, 0.0, 1.0), n
+
+
+def days_until(slope, intercept, limit, today: float, rising: bool):
+    """
+    Days from `today` until the fitted line crosses `limit` in the given
+    direction (0 when already past it, NaN when it is not heading there)
+    """
+    with np.errstate(invalid='ignore', divide='ignore'):
+        now = intercept + slope * today
+        crossing = (limit - intercept) / slope - today
+        heading = slope > 0 if rising else slope < 0
+        past = now >= limit if rising else now <= limit
+    days = np.where(heading, crossing, np.nan)
+    days = np.where(past & ~np.isnan(slope), 0.0, days)
+    return np.where(np.isnan(limit), np.nan, days)
+
+
+def forecast(series: dict, limits: dict, today: float, horizon_days: float) -> dict:
+    """
+    Earliest threshold crossing per equipment.
+
+    series: metric -> (n x days) matrix of daily values ('power_factor',
+            'current', 'voltage', 'voltage_std'); day 0 is the window start
+    limits: limit field -> length-n array (NaN = no limit)
+    today:  day index of today in the same axis
+    Returns arrays: days (NaN = no crossing within the horizon), metric index
+    into CHECKS, limit, slope, confidence, days_used.
+    """
+    candidates = []
+    for metric, limit_of, rising in CHECKS:
+        slope, intercept, r2, n = fit_lines(series[metric])
+        limit = limit_of(limits)
+        days = days_until(slope, intercept, limit, today, rising)
+        coverage = np.minimum(n / FULL_CONFIDENCE_DAYS, 1.0)
+        # Already past the limit: only the amount of data matters, not the fit
+        confidence = np.where(days == 0, coverage, r2 * coverage)
+        candidates.append((days, limit, slope, confidence, n))
+
+    days = np.stack([c[0] for c in candidates])
+    days = np.where(days <= horizon_days, days, np.nan)
+    filled = np.where(np.isnan(days), np.inf, days)
+    best = filled.argmin(axis=0)
+    columns = np.arange(days.shape[1])
+
+    def pick(position):
+        return np.stack([c[position] for c in candidates])[best, columns]
+
+    return {
+        'days': days[best, columns],
+        'metric': best,
+        'limit': pick(1),
+        'slope': pick(2),
+        'confidence': pick(3),
+        'days_used': pick(4)
+    }
+
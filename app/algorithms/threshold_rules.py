@@ -0,0 +1,158 @@
+"""
+Threshold Rules Engine
+
+Classifies monitoring readings (voltage, current, power factor) as normal,
+warning or critical using threshold profiles:
+  - the default profile (no equipment type or equipment)
+  - per equipment type profiles
+  - per equipment profiles
+A limit left empty (None) in a more specific profile is inherited from the
+less specific one; empty in the default profile means "no limit".
+
+Profiles are compiled once into lookup tables (equipment id -> limits,
+equipment type -> limits). classify() handles single readings and
+classify_batch() whole columns of readings, vectorized with numpy when it is
+installed (optional) and the readings already come as arrays; for plain
+lists converting to arrays costs more than the Python loop saves.
+
+Readings that are empty or zero are not checked, as before.
+"""
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+STATUSES = ('normal', 'warning', 'critical')
+NORMAL, WARNING, CRITICAL = range(3)
+
+LIMIT_FIELDS = (
+    'voltage_warning_low', 'voltage_warning_high',
+    'voltage_critical_low', 'voltage_critical_high',
+    'current_warning_max', 'current_critical_max',
+    'power_factor_warning_min', 'power_factor_critical_min',
+)
+
+# The thresholds MonitoringService used to hard-code
+DEFAULT_LIMITS = {
+    'voltage_warning_low': 220.0,
+    'voltage_warning_high': 240.0,
+    'voltage_critical_low': None,
+    'voltage_critical_high': None,
+    'current_warning_max': 100.0,
+    'current_critical_max': None,
+    'power_factor_warning_min': 0.90,
+    'power_factor_critical_min': 0.85,
+}
+
+
+def _merge(base: tuple, profile) -> tuple:
+    return tuple(base[i] if getattr(profile, field) is None else float(getattr(profile, field))
+                 for i, field in enumerate(LIMIT_FIELDS))
+
+
+def evaluate(limits: tuple, voltage, current, power_factor) -> int:
+    """Severity (NORMAL/WARNING/CRITICAL) of one reading against one set of limits"""
+    v_low, v_high, v_crit_low, v_crit_high, i_warn, i_crit, pf_warn, pf_crit = limits
+    level = NORMAL
+    if voltage:
+        if (v_crit_low is not None and voltage < v_crit_low) or (v_crit_high is not None and voltage > v_crit_high):
+            return CRITICAL
+        if (v_low is not None and voltage < v_low) or (v_high is not None and voltage > v_high):
+            level = WARNING
+    if current:
+        if i_crit is not None and current > i_crit:
+            return CRITICAL
+        if i_warn is not None and current > i_warn:
+            level = WARNING
+    if power_factor:
+        if pf_crit is not None and power_factor < pf_crit:
+            return CRITICAL
+        if pf_warn is not None and power_factor < pf_warn:
+            level = WARNING
+    return level
+
+
+class ThresholdRules:
+    """Compiled threshold profiles"""
+
+    def __init__(self, default: tuple, by_type: dict, by_equipment: dict, signature=None):
+        self.default = default
+        self.by_type = by_type
+        self.by_equipment = by_equipment
+        self.signature = signature
+
+    @classmethod
+    def compile(cls, profiles: list, equipment_types: dict = None, signature=None) -> 'ThresholdRules':
+        """
+        Build the lookup tables from ThresholdProfile models; equipment_types maps
+        the ids of equipment with their own profile to their type, so those
+        profiles inherit from the type profile
+        """
+        equipment_types = equipment_types or {}
+        active = [p for p in profiles if p.is_active]
+        default = tuple(DEFAULT_LIMITS[field] for field in LIMIT_FIELDS)
+        for profile in active:
+            if profile.equipment_type is None and profile.equipment_id is None:
+                default = tuple(getattr(profile, field) for field in LIMIT_FIELDS)
+        by_type = {}
+        for profile in active:
+            if profile.equipment_type is not None and profile.equipment_id is None:
+                by_type[profile.equipment_type] = _merge(default, profile)
+        by_equipment = {}
+        for profile in active:
+            if profile.equipment_id is not None:
+                base = by_type.get(equipment_types.get(profile.equipment_id), default)
+                by_equipment[profile.equipment_id] = _merge(base, profile)
+        return cls(default, by_type, by_equipment, signature)
+
+    def limits_for(self, equipment_id: int = None, equipment_type: str = None) -> tuple:
+        """Effective limits for an equipment (most specific profile wins)"""
+        limits = self.by_equipment.get(equipment_id)
+        if limits is None:
+            limits = self.by_type.get(equipment_type, self.default)
+        return limits
+
+    def describe(self, equipment_id: int = None, equipment_type: str = None) -> dict:
+        """Effective limits as a field -> value dict"""
+        return dict(zip(LIMIT_FIELDS, self.limits_for(equipment_id, equipment_type)))
+
+    def classify(self, voltage, current, power_factor, equipment_id: int = None,
+                 equipment_type: str = None) -> str:
+        """Status of a single reading"""
+        return STATUSES[evaluate(self.limits_for(equipment_id, equipment_type),
+                                 voltage, current, power_factor)]
+
+    def classify_batch(self, equipment_ids, equipment_types, voltages, currents, power_factors) -> list:
+        """Statuses for parallel columns of readings (lists or numpy arrays)"""
+        if np is not None and isinstance(voltages, np.ndarray):
+            return self._classify_vectorized(equipment_ids, equipment_types, voltages, currents, power_factors)
+        limits_for = self.limits_for
+        return [STATUSES[evaluate(limits_for(equipment_id, equipment_type), v, i, pf)]
+                for equipment_id, equipment_type, v, i, pf
+                in zip(equipment_ids, equipment_types, voltages, currents, power_factors)]
+
+    def _classify_vectorized(self, equipment_ids, equipment_types, voltages, currents, power_factors) -> list:
+        # Look limits up once per distinct equipment, then broadcast them to its readings
+        ids = np.array(equipment_ids, dtype=float)
+        ids = np.where(np.isnan(ids), -1, ids).astype(np.int64)
+        distinct, first, inverse = np.unique(ids, return_index=True, return_inverse=True)
+        # Missing limits become NaN, and every comparison with NaN is False
+        table = np.array([self.limits_for(None if equipment_id < 0 else int(equipment_id), equipment_types[row])
+                          for equipment_id, row in zip(distinct, first)], dtype=float)[inverse]
+
+        def column(values):
+            data = np.array(values, dtype=float)    # None -> NaN
+            return data, ~np.isnan(data) & (data != 0)
+
+        v, v_ok = column(voltages)
+        i, i_ok = column(currents)
+        pf, pf_ok = column(power_factors)
+        with np.errstate(invalid='ignore'):
+            critical = ((v_ok & ((v < table[:, 2]) | (v > table[:, 3])))
+                        | (i_ok & (i > table[:, 5]))
+                        | (pf_ok & (pf < table[:, 7])))
+            warning = ((v_ok & ((v < table[:, 0]) | (v > table[:, 1])))
+                       | (i_ok & (i > table[:, 4]))
+                       | (pf_ok & (pf < table[:, 6])))
+        levels = np.where(critical, CRITICAL, np.where(warning, WARNING, NORMAL))
+        return np.array(STATUSES, dtype=object)[levels].tolist()
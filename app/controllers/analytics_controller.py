@@ -0,0 +1,28 @@
+"""
+Analytics Controller
+"""
+from app.patterns.factory import ServiceFactory
+
+class AnalyticsController:
+    """Controller for reliability analytics"""
+    
+    def __init__(self):
+        self.reliability_service = ServiceFactory.create_reliability_service()
+    
+    def get_reliability(self, dimension: str = 'equipment', period: str = 'all') -> dict:
+        """Get MTBF/MTTR per equipment, type or location"""
+        try:
+            return {
+                'success': True,
+                'data': self.reliability_service.get_reliability(dimension, period)
+            }
+        except ValueError as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': f'Error computing reliability: {str(e)}'
+            }
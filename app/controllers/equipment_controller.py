@@ -2,13 +2,14 @@
 Equipment Controller
 """
 from app.repositories.equipment_repository import EquipmentRepository
-from app.patterns.factory import RepositoryFactory
+from app.patterns.factory import RepositoryFactory, ServiceFactory
 
 class EquipmentController:
     """Controller for equipment operations"""
     
     def __init__(self):
         self.equipment_repository = RepositoryFactory.create_equipment_repository()
+        self.health_service = ServiceFactory.create_equipment_health_service()
     
     def get_all_equipment(self) -> dict:
         """Get all equipment"""
@@ -56,7 +57,50 @@ class EquipmentController:
                 'success': False,
                 'message': str(e)
             }
-
-
-
-
+    
+    def get_health_ranking(self, limit: int = 50, offset: int = 0) -> dict:
+        """Get equipment health scores, worst first"""
+        try:
+            return {
+                'success': True,
+                'data': self.health_service.get_ranking(limit, offset)
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def get_equipment_health(self, equipment_id: int) -> dict:
+        """Get the health score of one equipment"""
+        try:
+            health = self.health_service.get_equipment_health(equipment_id)
+            if health:
+                return {
+                    'success': True,
+                    'data': health
+                }
+            return {
+                'success': False,
+                'message': 'No health data for this equipment'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def rebuild_health(self) -> dict:
+        """Recompute all health scores from the source tables"""
+        try:
+            count = self.health_service.rebuild()
+            return {
+                'success': True,
+                'message': f'Health recomputed for {count} equipment',
+                'data': {'equipment': count}
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
@@ -0,0 +1,68 @@
+"""
+Export Controller
+"""
+import os
+import tempfile
+from datetime import date
+from app.patterns.factory import ServiceFactory
+
+MIMETYPES = {
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+    'arrow': 'application/vnd.apache.arrow.file'
+}
+
+class ExportController:
+    """Controller for bulk data exports"""
+
+    def __init__(self):
+        self.export_service = ServiceFactory.create_export_service()
+
+    def export(self, kind: str, filters: dict, file_format: str = 'csv') -> dict:
+        """
+        Start an export; 'data' is a generator of response chunks. CSV is
+        streamed from the cursor, Parquet/Arrow are written to a temporary
+        file first (removed once it has been sent).
+        """
+        if file_format not in MIMETYPES:
+            return {'success': False, 'message': f"Unknown export format: {file_format}"}
+        if file_format != 'csv' and not self.export_service.parquet_available():
+            return {'success': False, 'message': 'Parquet/Arrow export requires pyarrow on the server'}
+
+        filename = f"{kind}_export_{date.today().isoformat()}.{file_format}"
+        try:
+            if file_format == 'csv':
+                data = self.export_service.iter_csv(kind, filters)
+                rows = size = None
+            else:
+                fd, path = tempfile.mkstemp(prefix='apds_export_', suffix=f'.{file_format}')
+                os.close(fd)
+                try:
+                    rows = self.export_service.write_file(kind, filters, path, file_format)
+                except Exception:
+                    os.unlink(path)
+                    raise
+                size = os.path.getsize(path)
+                data = self._read_and_remove(path)
+            return {
+                'success': True,
+                'data': data,
+                'rows': rows,
+                'size': size,
+                'filename': filename,
+                'mimetype': MIMETYPES[file_format]
+            }
+        except ValueError as e:
+            return {'success': False, 'message': str(e)}
+
+    @staticmethod
+    def _read_and_remove(path: str, chunk_size: int = 256 * 1024):
+        try:
+            with open(path, 'rb') as f:
+                while True:
+                    chunk = f.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk
+        finally:
+            os.unlink(path)
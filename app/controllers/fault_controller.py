@@ -10,6 +10,7 @@ class FaultController:
     
     def __init__(self):
         self.fault_service = ServiceFactory.create_fault_service()
+        self.similar_fault_service = ServiceFactory.create_similar_fault_service()
     
     def report_fault(self, data: dict) -> dict:
         """Report a fault"""
@@ -18,15 +19,24 @@ class FaultController:
             if not reported_by:
                 return {'success': False, 'message': 'Not authenticated'}
             
-            fault = self.fault_service.report_fault(
+            fault, duplicate = self.fault_service.submit_report(
                 equipment_id=int(data.get('equipment_id')),
                 reported_by=reported_by,
                 fault_description=data.get('fault_description'),
-                severity=data.get('severity', 'low')
+                severity=data.get('severity', 'low'),
+                deduplicate=not self._flag(data.get('force_new', False))
             )
             
+            if duplicate:
+                return {
+                    'success': True,
+                    'duplicate': True,
+                    'message': f'Fault #{fault.id} is already open for this equipment; your report was added to it',
+                    'data': {**fault.to_dict(), 'duplicate_report': duplicate.to_dict()}
+                }
             return {
                 'success': True,
+                'duplicate': False,
                 'message': 'Fault reported successfully',
                 'data': fault.to_dict()
             }
@@ -36,6 +46,13 @@ class FaultController:
                 'message': str(e)
             }
     
+    @staticmethod
+    def _flag(value) -> bool:
+        """A JSON or form flag: true/"true"/"1"/"yes" are true, anything else ("false", "0") is not"""
+        if isinstance(value, str):
+            return value.strip().lower() in ('1', 'true', 'yes')
+        return value is True or value == 1
+    
     def get_fault(self, fault_id: int) -> dict:
         """Get fault by ID"""
         try:
@@ -55,13 +72,16 @@ class FaultController:
                 'message': str(e)
             }
     
-    def get_all_faults(self, limit: int = 100) -> dict:
-        """Get all faults"""
+    def get_all_faults(self, limit: int = 100, stream: bool = False) -> dict:
+        """Get all faults ('data' is a generator when streaming)"""
         try:
-            faults = self.fault_service.get_all_faults(limit)
+            if stream:
+                faults = self.fault_service.iter_all_faults(limit)
+            else:
+                faults = self.fault_service.get_all_faults(limit, as_dict=True)
             return {
                 'success': True,
-                'data': [fault.to_dict() for fault in faults]
+                'data': faults
             }
         except Exception as e:
             return {
@@ -72,10 +92,10 @@ class FaultController:
     def get_faults_by_status(self, status: str) -> dict:
         """Get faults by status"""
         try:
-            faults = self.fault_service.get_faults_by_status(status)
+            faults = self.fault_service.get_faults_by_status(status, as_dict=True)
             return {
                 'success': True,
-                'data': [fault.to_dict() for fault in faults]
+                'data': faults
             }
         except Exception as e:
             return {
@@ -110,4 +130,43 @@ class FaultController:
                 'success': False,
                 'message': f'Error updating fault status: {str(e)}'
             }
-
+    
+    def get_fault_duplicates(self, fault_id: int) -> dict:
+        """Duplicate reports attached to a fault"""
+        try:
+            return {
+                'success': True,
+                'data': [duplicate.to_dict() for duplicate in self.fault_service.get_duplicates(fault_id)]
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def get_similar_faults(self, fault_id: int, k: int = 5) -> dict:
+        """Most similar resolved faults and their root causes"""
+        try:
+            return {
+                'success': True,
+                'data': self.similar_fault_service.find_similar(fault_id, k)
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def rebuild_similarity_index(self) -> dict:
+        """Reload the similar-fault index from the database"""
+        try:
+            return {
+                'success': True,
+                'message': 'Similar-fault index rebuilt',
+                'data': self.similar_fault_service.rebuild()
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
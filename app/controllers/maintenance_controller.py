@@ -0,0 +1,58 @@
+"""
+Maintenance Controller
+"""
+from app.patterns.factory import ServiceFactory
+
+class MaintenanceController:
+    """Controller for predictive maintenance forecasts"""
+    
+    def __init__(self):
+        self.forecast_service = ServiceFactory.create_maintenance_forecast_service()
+    
+    def run_forecast(self, data: dict) -> dict:
+        """Recompute maintenance forecasts for all equipment"""
+        try:
+            result = self.forecast_service.run_forecast(
+                window_days=int(data.get('window_days', 90)),
+                horizon_days=int(data.get('horizon_days', 180)),
+                lead_days=int(data.get('lead_days', 7)),
+                apply=bool(data.get('apply', False)),
+                min_confidence=float(data.get('min_confidence', 0.5))
+            )
+            return {
+                'success': True,
+                'message': 'Maintenance forecast updated',
+                'data': result
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def get_forecasts(self, min_confidence: float = 0.0, limit: int = 100) -> dict:
+        """Get forecasts, soonest suggested maintenance first"""
+        try:
+            return {
+                'success': True,
+                'data': self.forecast_service.get_forecasts(min_confidence, limit)
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def get_equipment_forecast(self, equipment_id: int) -> dict:
+        """Get the forecast for one equipment"""
+        try:
+            forecast = self.forecast_service.get_equipment_forecast(equipment_id)
+            return {
+                'success': True,
+                'data': forecast.to_dict() if forecast else None
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
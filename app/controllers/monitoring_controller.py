@@ -72,10 +72,10 @@ class MonitoringController:
     def get_equipment_history(self, equipment_id: int, limit: int = 100) -> dict:
         """Get equipment monitoring history"""
         try:
-            records = self.monitoring_service.get_equipment_monitoring_history(equipment_id, limit)
+            records = self.monitoring_service.get_equipment_monitoring_history(equipment_id, limit, as_dict=True)
             return {
                 'success': True,
-                'data': [record.to_dict() for record in records]
+                'data': records
             }
         except Exception as e:
             return {
@@ -83,17 +83,46 @@ class MonitoringController:
                 'message': str(e)
             }
     
-    def get_technician_history(self, limit: int = 100) -> dict:
-        """Get technician monitoring history"""
+    def get_technician_history(self, limit: int = 100, stream: bool = False) -> dict:
+        """Get technician monitoring history ('data' is a generator when streaming)"""
         try:
             technician_id = session.get('user_id')
             if not technician_id:
                 return {'success': False, 'message': 'Not authenticated'}
             
-            records = self.monitoring_service.get_technician_monitoring_history(technician_id, limit)
+            if stream:
+                records = self.monitoring_service.iter_technician_monitoring_history(technician_id, limit)
+            else:
+                records = self.monitoring_service.get_technician_monitoring_history(technician_id, limit, as_dict=True)
             return {
                 'success': True,
-                'data': [record.to_dict() for record in records]
+                'data': records
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def get_status_board(self) -> dict:
+        """Get every equipment's latest reading and status"""
+        try:
+            return {
+                'success': True,
+                'data': self.monitoring_service.get_status_board()
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def get_anomaly_state(self, equipment_id: int) -> dict:
+        """Get the anomaly detector's rolling statistics for an equipment"""
+        try:
+            return {
+                'success': True,
+                'data': self.monitoring_service.get_anomaly_state(equipment_id)
             }
         except Exception as e:
             return {
@@ -104,10 +133,10 @@ class MonitoringController:
     def get_critical_records(self) -> dict:
         """Get critical monitoring records"""
         try:
-            records = self.monitoring_service.get_critical_monitoring_records()
+            records = self.monitoring_service.get_critical_monitoring_records(as_dict=True)
             return {
                 'success': True,
-                'data': [record.to_dict() for record in records]
+                'data': records
             }
         except Exception as e:
             return {
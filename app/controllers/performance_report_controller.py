@@ -38,8 +38,8 @@ class PerformanceReportController:
                 'message': str(e)
             }
     
-    def compile_report_data(self, data: dict) -> dict:
-        """Compile monitoring data for report"""
+    def compile_report_data(self, data: dict, stream: bool = False) -> dict:
+        """Compile monitoring data for report ('records' is a generator when streaming)"""
         try:
             technician_id = session.get('user_id')
             if not technician_id:
@@ -48,7 +48,8 @@ class PerformanceReportController:
             compiled_data = self.report_service.compile_report_data(
                 technician_id=technician_id,
                 period_start=date.fromisoformat(data.get('period_start')),
-                period_end=date.fromisoformat(data.get('period_end'))
+                period_end=date.fromisoformat(data.get('period_end')),
+                stream=stream
             )
             
             return {
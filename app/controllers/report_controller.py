@@ -124,23 +124,16 @@ class ReportController:
     def get_all_pending_reports(self) -> dict:
         """Get all pending reports (both regular and performance reports)"""
         try:
-            from app.controllers.performance_report_controller import PerformanceReportController
-            performance_report_controller = PerformanceReportController()
-
             # Get regular reports
             regular_reports = self.get_pending_approval()
             regular_data = regular_reports.get('data', []) if regular_reports.get('success') else []
 
             # Get performance reports
-            performance_reports = performance_report_controller.get_pending_approval()
-            performance_data = performance_reports.get('data', []) if performance_reports.get('success') else []
+            performance_data = [r.to_dict() for r in self.perf_report_service.get_pending_approval_reports()]
 
             # Combine and format reports
             all_reports = []
 
-            print("REGULAR DATA", regular_data)
-            print("PERFORMANCE DATA", performance_data)
-
             # Add regular reports with type indicator
             for report in regular_data:
                 report['report_type'] = 'resolution'
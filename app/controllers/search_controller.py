@@ -0,0 +1,51 @@
+"""
+Search Controller
+"""
+from app.patterns.factory import ServiceFactory
+
+class SearchController:
+    """Controller for full-text search"""
+    
+    def __init__(self):
+        self.search_service = ServiceFactory.create_search_service()
+    
+    def search(self, text: str, types: str = None, equipment_id: int = None,
+               page: int = 1, per_page: int = 20) -> dict:
+        """Search fault, RCA and resolution report texts"""
+        try:
+            return {
+                'success': True,
+                'data': self.search_service.search(
+                    text,
+                    entity_types=types.split(',') if types else None,
+                    equipment_id=equipment_id,
+                    page=page,
+                    per_page=per_page
+                )
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def search_library(self, text: str, group_by: str = 'equipment', types: str = None,
+                       equipment_id: int = None, page: int = 1, per_page: int = 20) -> dict:
+        """Search technical references and documentation items, grouped"""
+        try:
+            return {
+                'success': True,
+                'data': self.search_service.search_library(
+                    text,
+                    group_by=group_by,
+                    entity_types=types.split(',') if types else None,
+                    equipment_id=equipment_id,
+                    page=page,
+                    per_page=per_page
+                )
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
@@ -0,0 +1,117 @@
+"""
+Sync Controller
+"""
+import json
+from flask import session, current_app
+from app.patterns.factory import ServiceFactory
+from app.services.idempotency_service import IdempotencyService, MAX_KEY_LENGTH, request_fingerprint
+from app.controllers.monitoring_controller import MonitoringController
+from app.controllers.fault_controller import FaultController
+from app.controllers.notification_controller import NotificationController
+
+# Queued offline writes accepted per upload
+MAX_OPERATIONS = 100
+
+OPERATION_TYPES = ('monitoring.create', 'monitoring.update', 'fault.report', 'notification.read')
+
+class SyncController:
+    """Controller for delta sync of offline clients"""
+
+    def __init__(self):
+        self.sync_service = ServiceFactory.create_sync_service()
+        self.idempotency_service = ServiceFactory.create_idempotency_service()
+        self.monitoring_controller = MonitoringController()
+        self.fault_controller = FaultController()
+        self.notification_controller = NotificationController()
+
+    def get_changes(self, since: int = 0, tables: str = None, limit: int = 500) -> dict:
+        """Equipment, monitoring records, faults and notifications changed after `since`"""
+        try:
+            entities = tables.split(',') if tables else None
+            return {
+                'success': True,
+                'data': self.sync_service.get_changes(session.get('user_id'), session.get('role'),
+                                                      since, entities, limit)
+            }
+        except Exception as e:
+            return {'success': False, 'message': str(e)}
+
+    def apply_operations(self, data: dict) -> dict:
+        """
+        Apply a batch of queued offline writes in order. Each operation is
+        {"id": client id, "type": one of OPERATION_TYPES, "target": record id
+        (updates), "data": {...}} and gets its own result; an operation whose
+        id was applied before returns its first result again (replayed).
+        """
+        try:
+            operations = (data or {}).get('operations')
+            if not isinstance(operations, list) or not operations:
+                return {'success': False, 'message': 'operations must be a non-empty list'}
+            if len(operations) > MAX_OPERATIONS:
+                return {'success': False, 'message': f'At most {MAX_OPERATIONS} operations per upload'}
+            results = [self._apply(operation) for operation in operations]
+            return {
+                'success': True,
+                'data': {
+                    'applied': sum(1 for result in results if result['success']),
+                    'results': results,
+                    'latest_seq': self.sync_service.get_latest_seq()
+                }
+            }
+        except Exception as e:
+            return {'success': False, 'message': str(e)}
+
+    def _apply(self, operation) -> dict:
+        """Run one queued write, at most once per operation id"""
+        if not isinstance(operation, dict):
+            return {'id': None, 'success': False, 'message': 'Each operation must be an object'}
+        op_id = operation.get('id')
+        kind = operation.get('type')
+        if kind not in OPERATION_TYPES:
+            return {'id': op_id, 'success': False,
+                    'message': f"Unknown operation type. Use: {', '.join(OPERATION_TYPES)}"}
+        if op_id is None:
+            return {'id': None, **self._run(kind, operation)}
+
+        user_id = session.get('user_id')
+        key = f"sync:{op_id}"
+        if len(key) > MAX_KEY_LENGTH:
+            return {'id': op_id, 'success': False, 'message': 'Operation id is too long'}
+        body = json.dumps([operation.get('target'), operation.get('data')], sort_keys=True).encode()
+        state, row = self.idempotency_service.begin(user_id, key, request_fingerprint('SYNC', kind, b'', body))
+        if state == IdempotencyService.REPLAY:
+            return {**json.loads(row['response_body']), 'id': op_id, 'replayed': True}
+        if state == IdempotencyService.MISMATCH:
+            return {'id': op_id, 'success': False, 'message': 'Operation id was already used for a different operation'}
+        if state == IdempotencyService.IN_PROGRESS:
+            return {'id': op_id, 'success': False, 'message': 'Operation is still being applied'}
+
+        result = self._run(kind, operation)
+        if result['success']:
+            self.idempotency_service.complete(user_id, key, 200, 'application/json',
+                                              current_app.json.dumps(result).encode(),
+                                              current_app.config['IDEMPOTENCY_TTL_SECONDS'])
+        else:
+            # Failures may be transient (locked database): a later upload runs it again
+            self.idempotency_service.release(user_id, key)
+        return {'id': op_id, **result}
+
+    def _run(self, kind: str, operation: dict) -> dict:
+        """Result of one operation; a bad operation (e.g. non-numeric target) fails only itself"""
+        try:
+            return self._dispatch(kind, operation.get('target'), operation.get('data') or {})
+        except Exception as e:
+            return {'success': False, 'message': str(e)}
+
+    def _dispatch(self, kind: str, target, data: dict) -> dict:
+        if kind == 'monitoring.create':
+            return self.monitoring_controller.create_monitoring(data)
+        if kind == 'fault.report':
+            return self.fault_controller.report_fault(data)
+        try:
+            target = int(target)
+        except (TypeError, ValueError):
+            return {'success': False, 'message': f'{kind} needs a numeric target record id'}
+        if kind == 'monitoring.update':
+            return self.monitoring_controller.update_monitoring(target, data)
+        return self.notification_controller.mark_as_read(target)
@@ -0,0 +1,141 @@
+"""
+Threshold Controller
+"""
+from app.patterns.factory import ServiceFactory
+from app.algorithms.threshold_rules import LIMIT_FIELDS
+
+class ThresholdController:
+    """Controller for monitoring threshold profiles"""
+    
+    def __init__(self):
+        self.threshold_service = ServiceFactory.create_threshold_service()
+        self.reclassification_service = ServiceFactory.create_reclassification_service()
+    
+    def get_profiles(self) -> dict:
+        """Get all threshold profiles"""
+        try:
+            profiles = self.threshold_service.get_profiles()
+            return {
+                'success': True,
+                'data': [profile.to_dict() for profile in profiles]
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def create_profile(self, data: dict) -> dict:
+        """Create threshold profile"""
+        try:
+            equipment_id = data.get('equipment_id')
+            profile = self.threshold_service.create_profile(
+                name=data.get('name'),
+                equipment_type=data.get('equipment_type'),
+                equipment_id=int(equipment_id) if equipment_id else None,
+                limits={field: data[field] for field in LIMIT_FIELDS if field in data},
+                is_active=bool(data.get('is_active', True))
+            )
+            return {
+                'success': True,
+                'message': 'Threshold profile created successfully',
+                'data': profile.to_dict()
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def update_profile(self, profile_id: int, data: dict) -> dict:
+        """Update threshold profile"""
+        try:
+            profile = self.threshold_service.update_profile(
+                profile_id=profile_id,
+                name=data.get('name'),
+                limits={field: data[field] for field in LIMIT_FIELDS if field in data},
+                is_active=bool(data['is_active']) if 'is_active' in data else None
+            )
+            return {
+                'success': True,
+                'message': 'Threshold profile updated successfully',
+                'data': profile.to_dict()
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def delete_profile(self, profile_id: int) -> dict:
+        """Delete threshold profile"""
+        try:
+            self.threshold_service.delete_profile(profile_id)
+            return {
+                'success': True,
+                'message': 'Threshold profile deleted successfully'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def get_equipment_limits(self, equipment_id: int) -> dict:
+        """Get the limits that apply to an equipment"""
+        try:
+            return {
+                'success': True,
+                'data': self.threshold_service.get_effective_limits(equipment_id)
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def start_reclassification(self, data: dict) -> dict:
+        """Start re-classifying monitoring history with the current thresholds"""
+        try:
+            status = self.reclassification_service.start(resume=bool(data.get('resume', True)))
+            return {
+                'success': True,
+                'message': 'Re-classification started',
+                'data': status
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def get_reclassification_status(self) -> dict:
+        """Get progress of the current or last re-classification run"""
+        try:
+            return {
+                'success': True,
+                'data': self.reclassification_service.status()
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
+    
+    def cancel_reclassification(self) -> dict:
+        """Stop the running re-classification after its current chunk"""
+        try:
+            if not self.reclassification_service.cancel():
+                return {
+                    'success': False,
+                    'message': 'No re-classification run in progress'
+                }
+            return {
+                'success': True,
+                'message': 'Re-classification cancelling'
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'message': str(e)
+            }
@@ -3,11 +3,17 @@ Database initialization module
 """
 from flask import Flask
 from app.database.db_connection import DatabaseConnection
+from app.database.maintenance import DatabaseMaintenance
+from app.database.backup import BackupScheduler
+from app.patterns.container import container
 
 def init_db(app: Flask):
-    """Initialize database connection"""
+    """Initialize database connection, background maintenance and scheduled backups"""
     db = DatabaseConnection()
     db.init_app(app)
+    container.init_app(app)
+    DatabaseMaintenance(db, app)
+    BackupScheduler(db, app)
     return db
 
 
@@ -0,0 +1,209 @@
+"""
+Monitoring Archive
+
+Moves daily_monitoring rows older than a horizon into a separate archive
+database (operations_monitoring_archive.db next to the live one, ATTACHed as
+'archive'). Each day is moved in its own short transaction:
+  1. the day's totals are added to monitoring_daily_rollup (main database),
+     so summaries over archived periods are unchanged
+  2. the rows are copied into archive.daily_monitoring with their ids
+  3. the rows are deleted from the live table
+Rows still referenced by data_reverification stay in the live table.
+
+The archive boundary (latest archived_before in monitoring_archive_runs) lets
+the repository read the archive only when a query reaches back past it.
+"""
+import os
+import sqlite3
+import time
+from datetime import date, timedelta
+
+ARCHIVE_SCHEMA = 'archive'
+
+ARCHIVE_TABLE = """
+    CREATE TABLE IF NOT EXISTS archive.daily_monitoring (
+        id INTEGER PRIMARY KEY,
+        equipment_id INTEGER NULL,
+        technician_id INTEGER NULL,
+        monitoring_date DATE NOT NULL,
+        shift TEXT,
+        voltage REAL,
+        current REAL,
+        power_factor REAL,
+        operational_status TEXT NOT NULL,
+        observations TEXT,
+        created_at TIMESTAMP
+    )
+"""
+
+ARCHIVE_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS archive.idx_archive_monitoring_date ON daily_monitoring(monitoring_date)",
+    "CREATE INDEX IF NOT EXISTS archive.idx_archive_monitoring_equipment ON daily_monitoring(equipment_id, monitoring_date)",
+)
+
+MONITORING_COLUMNS = ('id, equipment_id, technician_id, monitoring_date, shift, voltage, current, '
+                      'power_factor, operational_status, observations, created_at')
+
+# Rows of one day that may leave the live table
+DAY_PREDICATE = """
+    monitoring_date >= ? AND monitoring_date < date(?, '+1 day')
+    AND id NOT IN (SELECT original_monitoring_id FROM data_reverification)
+"""
+
+ROLLUP_UPSERT = f"""
+    INSERT INTO monitoring_daily_rollup
+        (monitoring_date, equipment_id, technician_id, readings, normal_count, warning_count,
+         critical_count, voltage_sum, voltage_count, current_sum, current_count,
+         power_factor_sum, power_factor_count)
+    SELECT date(monitoring_date), IFNULL(equipment_id, 0), IFNULL(technician_id, 0), COUNT(*),
+           SUM(operational_status = 'normal'), SUM(operational_status = 'warning'),
+           SUM(operational_status = 'critical'),
+           TOTAL(CASE WHEN voltage <> 0 THEN voltage END), COUNT(CASE WHEN voltage <> 0 THEN 1 END),
+           TOTAL(CASE WHEN current <> 0 THEN current END), COUNT(CASE WHEN current <> 0 THEN 1 END),
+           TOTAL(CASE WHEN power_factor <> 0 THEN power_factor END),
+           COUNT(CASE WHEN power_factor <> 0 THEN 1 END)
+    FROM main.daily_monitoring
+    WHERE {DAY_PREDICATE}
+    GROUP BY 1, 2, 3
+    ON CONFLICT (monitoring_date, equipment_id, technician_id) DO UPDATE SET
+        readings = readings + excluded.readings,
+        normal_count = normal_count + excluded.normal_count,
+        warning_count = warning_count + excluded.warning_count,
+        critical_count = critical_count + excluded.critical_count,
+        voltage_sum = voltage_sum + excluded.voltage_sum,
+        voltage_count = voltage_count + excluded.voltage_count,
+        current_sum = current_sum + excluded.current_sum,
+        current_count = current_count + excluded.current_count,
+        power_factor_sum = power_factor_sum + excluded.power_factor_sum,
+        power_factor_count = power_factor_count + excluded.power_factor_count
+"""
+
+
+def get_archive_path(db_path: str) -> str:
+    """Archive database path (APDS_ARCHIVE_DB_PATH overrides <db>_archive.db)"""
+    return os.environ.get('APDS_ARCHIVE_DB_PATH') or os.path.splitext(db_path)[0] + '_archive.db'
+
+
+def archive_boundary(conn: sqlite3.Connection):
+    """Date (ISO text) before which monitoring rows may be archived, or None"""
+    row = conn.execute("SELECT MAX(archived_before) FROM monitoring_archive_runs").fetchone()
+    return row[0]
+
+
+def attach_archive(conn: sqlite3.Connection, path: str):
+    """ATTACH the archive database to a connection (no-op when already attached)"""
+    attached = {row[1] for row in conn.execute("PRAGMA database_list")}
+    if ARCHIVE_SCHEMA in attached:
+        return
+    conn.execute(f"ATTACH DATABASE ? AS {ARCHIVE_SCHEMA}", (path,))
+    conn.execute(ARCHIVE_TABLE)
+    for statement in ARCHIVE_INDEXES:
+        conn.execute(statement)
+
+
+class MonitoringArchiver:
+    """Moves old daily_monitoring rows into the archive database"""
+
+    def __init__(self, db, archive_path: str = None, day_sleep: float = 0.01):
+        self.db = db
+        self.archive_path = archive_path or get_archive_path(db.db_path)
+        self.day_sleep = day_sleep
+
+    def archive(self, before: date, conn: sqlite3.Connection = None, stop=None) -> dict:
+        """
+        Archive every movable row dated before `before`, one day per transaction.
+        `stop` (a threading.Event) ends the run early between days.
+        """
+        own_conn = conn is None
+        if own_conn:
+            conn = self.db.open_connection()
+        start = time.perf_counter()
+        try:
+            attach_archive(conn, self.archive_path)
+            before_text = before.isoformat()
+            days = [row[0] for row in conn.execute(
+                "SELECT DISTINCT date(monitoring_date) FROM main.daily_monitoring "
+                "WHERE monitoring_date < ? ORDER BY 1", (before_text,))]
+
+            # Publish the boundary first so readers include the archive while rows move
+            previous = archive_boundary(conn)
+            boundary = max(previous or before_text, before_text)
+            run_id = conn.execute(
+                "INSERT INTO monitoring_archive_runs (archived_before) VALUES (?)", (boundary,)
+            ).lastrowid
+            conn.commit()
+
+            rows_archived = days_archived = 0
+            for day in days:
+                if stop is not None and stop.is_set():
+                    break
+                rows_archived += self._archive_day(conn, day)
+                days_archived += 1
+                conn.execute(
+                    "UPDATE monitoring_archive_runs SET rows_archived = ?, days_archived = ? WHERE id = ?",
+                    (rows_archived, days_archived, run_id))
+                conn.commit()
+                time.sleep(self.day_sleep)
+
+            conn.execute("UPDATE monitoring_archive_runs SET finished_at = CURRENT_TIMESTAMP WHERE id = ?",
+                         (run_id,))
+            conn.commit()
+            return {
+                'archived_before': boundary,
+                'rows_archived': rows_archived,
+                'days_archived': days_archived,
+                'archive_path': self.archive_path,
+                'duration_ms': round((time.perf_counter() - start) * 1000, 2)
+            }
+        except Exception:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            if own_conn:
+                conn.close()
+
+    def archive_older_than(self, days: int, conn: sqlite3.Connection = None, stop=None) -> dict:
+        """Archive rows more than `days` days old"""
+        return self.archive(date.today() - timedelta(days=days), conn, stop)
+
+    def _archive_day(self, conn: sqlite3.Connection, day: str) -> int:
+        params = (day, day)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(ROLLUP_UPSERT, params)
+            conn.execute(
+                f"INSERT OR REPLACE INTO archive.daily_monitoring ({MONITORING_COLUMNS}) "
+                f"SELECT {MONITORING_COLUMNS} FROM main.daily_monitoring WHERE {DAY_PREDICATE}", params)
+            # A move, not a deletion: keep it out of the sync change log
+            conn.execute("INSERT OR IGNORE INTO main.change_log_pause (reason) VALUES ('archive')")
+            moved = conn.execute(f"DELETE FROM main.daily_monitoring WHERE {DAY_PREDICATE}", params).rowcount
+            conn.execute("DELETE FROM main.change_log_pause WHERE reason = 'archive'")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        return moved
+
+    def status(self) -> dict:
+        """Boundary, live/archived row counts and the last run"""
+        conn = self.db.open_connection()
+        try:
+            boundary = archive_boundary(conn)
+            live_rows = conn.execute("SELECT COUNT(*) FROM daily_monitoring").fetchone()[0]
+            archived_rows = 0
+            if boundary and os.path.exists(self.archive_path):
+                attach_archive(conn, self.archive_path)
+                archived_rows = conn.execute("SELECT COUNT(*) FROM archive.daily_monitoring").fetchone()[0]
+            last_run = conn.execute(
+                "SELECT * FROM monitoring_archive_runs ORDER BY id DESC LIMIT 1").fetchone()
+            return {
+                'archived_before': boundary,
+                'live_rows': live_rows,
+                'archived_rows': archived_rows,
+                'archive_path': self.archive_path,
+                'archive_bytes': os.path.getsize(self.archive_path) if os.path.exists(self.archive_path) else 0,
+                'last_run': dict(last_run) if last_run else None
+            }
+        finally:
+            conn.close()
@@ -0,0 +1,278 @@
+"""
+Online Database Backup
+
+Snapshots operations_monitoring.db with the SQLite online backup API while the
+app keeps running. The copy is taken inside one read transaction on the
+source: in WAL mode that never blocks writers, and the backup sees one
+consistent version of the database instead of restarting whenever someone
+writes. Pages are copied in small steps with a sleep in between, which only
+throttles the disk I/O. Every snapshot is integrity-checked and gets a
+sha256sum-compatible checksum file; old snapshots are pruned by retention
+rules, and a snapshot can be restored into the database while the app is
+stopped.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+SNAPSHOT_PREFIX = 'operations_monitoring-'
+SNAPSHOT_SUFFIX = '.db'
+
+
+def file_checksum(path: str) -> str:
+    """SHA-256 of a file, read in 1 MB chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DatabaseBackup:
+    """Creates, verifies, prunes and restores database snapshots"""
+
+    def __init__(self, db, backup_dir: str = None, pages_per_step: int = 256, step_sleep: float = 0.01):
+        self.db = db
+        self.backup_dir = backup_dir or os.path.join(os.path.dirname(db.db_path), 'backups')
+        self.pages_per_step = pages_per_step
+        self.step_sleep = step_sleep
+
+    def create_snapshot(self, label: str = None) -> dict:
+        """Copy the live database into a new snapshot file and return its details"""
+        os.makedirs(self.backup_dir, exist_ok=True)
+        # Microseconds keep two snapshots taken in the same second apart
+        name = f"{SNAPSHOT_PREFIX}{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}"
+        if label:
+            name += f"-{label}"
+        path = os.path.join(self.backup_dir, name + SNAPSHOT_SUFFIX)
+        tmp_path = path + '.tmp'
+
+        start = time.perf_counter()
+        steps = 0
+
+        def progress(status, remaining, total):
+            nonlocal steps
+            steps += 1
+            # Throttle the I/O; writers are not waiting on the backup
+            if remaining:
+                time.sleep(self.step_sleep)
+
+        source = self.db.open_connection()
+        target = sqlite3.connect(tmp_path)
+        try:
+            # Hold one read transaction across all steps: without it every write
+            # from another connection restarts the backup from the first page
+            source.execute("BEGIN")
+            source.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone()
+            source.backup(target, pages=self.pages_per_step, progress=progress)
+            source.rollback()
+            # A snapshot is a standalone file, not a WAL database
+            target.execute("PRAGMA journal_mode = DELETE")
+            result = target.execute("PRAGMA integrity_check").fetchone()[0]
+        finally:
+            target.close()
+            source.close()
+        if result != 'ok':
+            os.remove(tmp_path)
+            raise RuntimeError(f"Snapshot failed integrity check: {result}")
+
+        os.replace(tmp_path, path)
+        checksum = file_checksum(path)
+        with open(path + '.sha256', 'w', encoding='utf-8') as f:
+            f.write(f"{checksum}  {os.path.basename(path)}\n")
+
+        return {
+            'path': path,
+            'size_bytes': os.path.getsize(path),
+            'sha256': checksum,
+            'steps': steps,
+            'duration_ms': round((time.perf_counter() - start) * 1000, 2)
+        }
+
+    def list_snapshots(self) -> list:
+        """Snapshots in the backup directory, newest first"""
+        if not os.path.isdir(self.backup_dir):
+            return []
+        snapshots = []
+        for name in os.listdir(self.backup_dir):
+            if not (name.startswith(SNAPSHOT_PREFIX) and name.endswith(SNAPSHOT_SUFFIX)):
+                continue
+            path = os.path.join(self.backup_dir, name)
+            snapshots.append({
+                'path': path,
+                'name': name,
+                'size_bytes': os.path.getsize(path),
+                'created_at': datetime.fromtimestamp(os.path.getmtime(path)).isoformat(),
+                'has_checksum': os.path.exists(path + '.sha256')
+            })
+        return sorted(snapshots, key=lambda s: s['name'], reverse=True)
+
+    def verify(self, path: str) -> dict:
+        """Check a snapshot against its checksum file and run an integrity check"""
+        checksum_path = path + '.sha256'
+        if not os.path.exists(checksum_path):
+            return {'path': path, 'ok': False, 'message': 'Checksum file missing'}
+        with open(checksum_path, encoding='utf-8') as f:
+            expected = f.read().split()[0]
+        actual = file_checksum(path)
+        if actual != expected:
+            return {'path': path, 'ok': False, 'message': 'Checksum mismatch',
+                    'expected': expected, 'actual': actual}
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            result = conn.execute("PRAGMA integrity_check").fetchone()[0]
+        finally:
+            conn.close()
+        return {'path': path, 'ok': result == 'ok',
+                'message': 'OK' if result == 'ok' else f"Integrity check failed: {result}"}
+
+    def apply_retention(self, keep_last: int = 7, keep_days: int = None) -> list:
+        """Delete snapshots beyond the newest keep_last (and older than keep_days, if set)"""
+        removed = []
+        cutoff = datetime.now() - timedelta(days=keep_days) if keep_days else None
+        for index, snapshot in enumerate(self.list_snapshots()):
+            if index < keep_last:
+                continue
+            if cutoff and datetime.fromisoformat(snapshot['created_at']) >= cutoff:
+                continue
+            for path in (snapshot['path'], snapshot['path'] + '.sha256'):
+                if os.path.exists(path):
+                    os.remove(path)
+            removed.append(snapshot['path'])
+        return removed
+
+    def restore(self, path: str, force: bool = False) -> dict:
+        """
+        Restore a verified snapshot into the database. Refuses while any other
+        connection has the database open (e.g. the running app) unless forced;
+        forcing it replaces the data under those connections. A safety
+        snapshot of the current database is taken first.
+        """
+        check = self.verify(path)
+        if not check['ok']:
+            raise ValueError(f"Refusing to restore {path}: {check['message']}")
+        # This process's own connections would count as users of the database
+        self.db.close()
+
+        target = sqlite3.connect(self.db.db_path, timeout=0, isolation_level=None)
+        try:
+            # Leaving WAL mode needs the only connection to the database
+            try:
+                exclusive = target.execute("PRAGMA journal_mode = DELETE").fetchone()[0].lower() == 'delete'
+            except sqlite3.OperationalError:
+                exclusive = False
+            if not exclusive and not force:
+                raise RuntimeError("The database is in use (is the app running?). "
+                                   "Stop it before restoring, or force the restore.")
+            target.execute("PRAGMA busy_timeout = 30000")
+            safety = self.create_snapshot(label='pre-restore')
+            source = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+            try:
+                source.backup(target, pages=self.pages_per_step)
+            finally:
+                source.close()
+        finally:
+            # Back to WAL (also when the restore failed after the check)
+            if exclusive or force:
+                target.execute("PRAGMA journal_mode = WAL")
+                target.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            target.close()
+        return {'restored_from': path, 'safety_snapshot': safety['path'], 'forced': not exclusive}
+
+
+class BackupScheduler:
+    """Takes snapshots on a fixed interval (and on request) and applies retention"""
+
+    DEFAULTS = {
+        'DB_BACKUP_INTERVAL_SECONDS': 0,      # 0 disables scheduled snapshots
+        'DB_BACKUP_DIR': None,
+        'DB_BACKUP_KEEP_LAST': 7,
+        'DB_BACKUP_KEEP_DAYS': None,
+    }
+
+    def __init__(self, db, app=None):
+        self.db = db
+        self.backup = None
+        self.interval = 0
+        self.keep_last = self.DEFAULTS['DB_BACKUP_KEEP_LAST']
+        self.keep_days = None
+        self.last_snapshot = None
+        self.last_error = None
+        self.running = False
+        self._requested = False
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._lock = threading.Lock()
+        self._thread = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Read configuration from the app and start the scheduler if an interval is set"""
+        for key, value in self.DEFAULTS.items():
+            app.config.setdefault(key, value)
+        self.backup = DatabaseBackup(self.db, app.config['DB_BACKUP_DIR'])
+        self.interval = app.config['DB_BACKUP_INTERVAL_SECONDS']
+        self.keep_last = app.config['DB_BACKUP_KEEP_LAST']
+        self.keep_days = app.config['DB_BACKUP_KEEP_DAYS']
+        app.extensions['db_backup'] = self
+        if self.interval:
+            self.start()
+
+    def start(self):
+        """Start the background thread (once per process)"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='apds-db-backup', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+
+    def request_snapshot(self):
+        """Ask the background thread for a snapshot now (non-blocking; starts the thread if needed)"""
+        with self._lock:
+            self._requested = True
+        self._wake.set()
+        self.start()
+
+    def status(self) -> dict:
+        """Schedule, queued/running snapshot, last snapshot and last error"""
+        return {
+            'enabled': bool(self.interval),
+            'interval_seconds': self.interval,
+            'backup_dir': self.backup.backup_dir if self.backup else None,
+            'pending': self._requested,
+            'running': self.running,
+            'last_snapshot': self.last_snapshot,
+            'last_error': self.last_error
+        }
+
+    def _run(self):
+        while True:
+            # Sleep until the next scheduled snapshot or a request
+            self._wake.wait(self.interval or None)
+            self._wake.clear()
+            if self._stop.is_set():
+                return
+            with self._lock:
+                self._requested = False
+            self.running = True
+            try:
+                self.last_snapshot = self.backup.create_snapshot()
+                self.last_snapshot['created_at'] = datetime.now().isoformat()
+                self.backup.apply_retention(self.keep_last, self.keep_days)
+                self.last_error = None
+            except Exception as e:
+                self.last_error = str(e)
+                print(f"Warning: Database snapshot failed: {e}")
+            finally:
+                self.running = False
@@ -3,8 +3,270 @@ Database Connection Singleton Pattern
 """
 import sqlite3
 import os
+import threading
 import time
 from typing import Optional
+from app.database.profiles import get_profile_name, get_profile, apply_profile, format_settings
+
+DEFAULT_DB_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'operations_monitoring.db')
+
+# Bump whenever _create_tables changes so existing databases pick up the new schema
+SCHEMA_VERSION = 16
+
+# Fill equipment_latest_reading from daily_monitoring for equipment without an entry
+LATEST_READING_BACKFILL = """
+    INSERT OR IGNORE INTO equipment_latest_reading
+        (equipment_id, monitoring_id, technician_id, monitoring_date, shift,
+         voltage, current, power_factor, operational_status, recorded_at)
+    SELECT equipment_id, id, technician_id, monitoring_date, shift,
+           voltage, current, power_factor, operational_status, created_at
+    FROM (
+        SELECT *, ROW_NUMBER() OVER (
+            PARTITION BY equipment_id ORDER BY monitoring_date DESC, id DESC
+        ) AS position
+        FROM daily_monitoring
+        WHERE equipment_id IS NOT NULL
+    )
+    WHERE position = 1
+"""
+
+# Weight of an open fault in equipment_health.open_fault_severity (also in EQUIPMENT_HEALTH_REBUILD)
+FAULT_SEVERITY_WEIGHTS = {'low': 1.0, 'medium': 2.0, 'high': 4.0, 'critical': 8.0}
+
+# Decay of the recent status mix per new reading
+HEALTH_STATUS_DECAY = 0.1
+
+# Recompute equipment_health for every equipment from monitoring, faults,
+# escalations and re-verifications. The status mix weighs the n-th latest
+# reading by decay * (1 - decay)^(n - 1), as the per-reading updates do.
+EQUIPMENT_HEALTH_REBUILD = """
+    WITH RECURSIVE weights(position, weight) AS (
+        SELECT 1, :decay
+        UNION ALL
+        SELECT position + 1, weight * (1 - :decay) FROM weights WHERE position < 60
+    ),
+    recent AS (
+        SELECT equipment_id, operational_status, ROW_NUMBER() OVER (
+            PARTITION BY equipment_id ORDER BY monitoring_date DESC, id DESC
+        ) AS position
+        FROM daily_monitoring
+        WHERE equipment_id IS NOT NULL
+    ),
+    mix AS (
+        SELECT r.equipment_id, COUNT(*) AS readings, SUM(w.weight) AS mix_weight,
+               TOTAL(CASE WHEN r.operational_status = 'warning' THEN w.weight END) AS mix_warning,
+               TOTAL(CASE WHEN r.operational_status = 'critical' THEN w.weight END) AS mix_critical
+        FROM recent r LEFT JOIN weights w ON w.position = r.position
+        GROUP BY r.equipment_id
+    ),
+    failures AS (
+        SELECT equipment_id, COUNT(*) AS failures,
+               COUNT(CASE WHEN status != 'resolved' THEN 1 END) AS open_faults,
+               TOTAL(CASE WHEN status != 'resolved' THEN CASE severity
+                   WHEN 'critical' THEN 8.0 WHEN 'high' THEN 4.0 WHEN 'medium' THEN 2.0 ELSE 1.0
+               END END) AS open_fault_severity,
+               MIN(reported_at) AS first_failure_at, MAX(reported_at) AS last_failure_at
+        FROM faults
+        GROUP BY equipment_id
+    ),
+    escalated AS (
+        SELECT f.equipment_id, COUNT(*) AS open_escalations
+        FROM escalations x JOIN faults f ON f.id = x.fault_id
+        WHERE x.status != 'resolved'
+        GROUP BY f.equipment_id
+    ),
+    discrepancies AS (
+        SELECT m.equipment_id, COUNT(*) AS open_discrepancies
+        FROM data_reverification v JOIN daily_monitoring m ON m.id = v.original_monitoring_id
+        WHERE v.status = 'discrepancy'
+        GROUP BY m.equipment_id
+    )
+    INSERT OR REPLACE INTO equipment_health
+        (equipment_id, readings, mix_weight, mix_warning, mix_critical, open_faults,
+         open_fault_severity, open_escalations, open_discrepancies, failures,
+         first_failure_at, last_failure_at, mtbf_hours, updated_at)
+    SELECT e.id, COALESCE(mix.readings, 0), COALESCE(mix.mix_weight, 0),
+           COALESCE(mix.mix_warning, 0), COALESCE(mix.mix_critical, 0),
+           COALESCE(failures.open_faults, 0), COALESCE(failures.open_fault_severity, 0),
+           COALESCE(escalated.open_escalations, 0), COALESCE(discrepancies.open_discrepancies, 0),
+           COALESCE(failures.failures, 0), failures.first_failure_at, failures.last_failure_at,
+           CASE WHEN failures.failures > 1
+                THEN (julianday(failures.last_failure_at) - julianday(failures.first_failure_at))
+                     * 24.0 / (failures.failures - 1)
+           END,
+           CURRENT_TIMESTAMP
+    FROM equipment e
+    LEFT JOIN mix ON mix.equipment_id = e.id
+    LEFT JOIN failures ON failures.equipment_id = e.id
+    LEFT JOIN escalated ON escalated.equipment_id = e.id
+    LEFT JOIN discrepancies ON discrepancies.equipment_id = e.id
+"""
+
+# Recompute one equipment's warning/critical share of the status mix from its
+# latest readings, weighted as in EQUIPMENT_HEALTH_REBUILD (e.g. after a
+# re-classification changed stored statuses; the reading count is unchanged)
+EQUIPMENT_HEALTH_MIX_REFRESH = """
+    WITH RECURSIVE weights(position, weight) AS (
+        SELECT 1, :decay
+        UNION ALL
+        SELECT position + 1, weight * (1 - :decay) FROM weights WHERE position < 60
+    ),
+    recent AS (
+        SELECT operational_status, ROW_NUMBER() OVER (ORDER BY monitoring_date DESC, id DESC) AS position
+        FROM (
+            SELECT operational_status, monitoring_date, id FROM daily_monitoring
+            WHERE equipment_id = :id
+            ORDER BY monitoring_date DESC, id DESC
+            LIMIT 60
+        )
+    )
+    UPDATE equipment_health SET
+        (mix_warning, mix_critical) = (
+            SELECT TOTAL(CASE WHEN r.operational_status = 'warning' THEN w.weight END),
+                   TOTAL(CASE WHEN r.operational_status = 'critical' THEN w.weight END)
+            FROM recent r JOIN weights w ON w.position = r.position
+        ),
+        updated_at = CURRENT_TIMESTAMP
+    WHERE equipment_id = :id
+"""
+
+# Full-text indexes (FTS5). Rows are keyed rowid = source id * 4 + kind code, so the
+# sync triggers replace one row in O(log n). Besides title and body, the filter columns
+# (entity type, equipment, ...) are indexed too, so filters are part of the match.
+#
+# Per index: its columns after entity_type, kind codes, and per kind the source table,
+# the columns whose changes reindex a row and one expression per index column over
+# the source row `src`.
+SEARCH_KINDS = {'fault': 1, 'rca': 2, 'report': 3}
+SEARCH_COLUMNS = ('fault_id UNINDEXED', 'equipment', 'title', 'body')
+SEARCH_SOURCES = {
+    'fault': ('faults', 'fault_description, equipment_id',
+              "src.id", "src.equipment_id", "src.fault_description", "''"),
+    'rca': ('root_cause_analysis', 'root_cause, contributing_factors, fault_id',
+            "src.fault_id", "(SELECT equipment_id FROM faults WHERE id = src.fault_id)",
+            "src.root_cause", "COALESCE(src.contributing_factors, '')"),
+    'report': ('resolution_reports', 'resolution_description, actions_taken, preventive_measures, fault_id',
+               "src.fault_id", "(SELECT equipment_id FROM faults WHERE id = src.fault_id)",
+               "src.resolution_description",
+               "src.actions_taken || char(10) || COALESCE(src.preventive_measures, '')"),
+}
+
+# Technical reference and documentation library
+LIBRARY_KINDS = {'reference': 1, 'document': 2}
+LIBRARY_COLUMNS = ('package', 'equipment', 'title', 'body')
+LIBRARY_SOURCES = {
+    'reference': ('technical_references', 'document_name, findings, relevance, conclusions, equipment_id',
+                  "NULL", "src.equipment_id", "src.document_name",
+                  "COALESCE(src.findings, '') || char(10) || COALESCE(src.relevance, '')"
+                  " || char(10) || COALESCE(src.conclusions, '')"),
+    'document': ('documentation_items', 'document_name, content, package_id',
+                 "src.package_id",
+                 "(SELECT f.equipment_id FROM documentation_packages p JOIN faults f ON f.id = p.fault_id"
+                 " WHERE p.id = src.package_id)",
+                 "src.document_name", "COALESCE(src.content, '')"),
+}
+
+
+def fts_sync_statements(index: str, columns: tuple, kinds: dict, sources: dict) -> list:
+    """Backfill statements and sync triggers keeping an FTS index equal to its sources"""
+    prefix = index.replace('_index', '')
+    names = ', '.join(['rowid', 'entity_type'] + [column.split()[0] for column in columns])
+    insert = f"INSERT INTO {index} ({names})"
+    statements = []
+    for kind, (table, watched, *values) in sources.items():
+        code = kinds[kind]
+
+        def row(alias: str) -> str:
+            return ', '.join([f"src.id * 4 + {code}", f"'{kind}'", *values]).replace('src.', f'{alias}.')
+
+        statements.append(f"{insert} SELECT {row('src')} FROM {table} src")
+        statements.append(f"""
+            CREATE TRIGGER IF NOT EXISTS {prefix}_{table}_insert AFTER INSERT ON {table} BEGIN
+                {insert} SELECT {row('new')};
+            END
+        """)
+        statements.append(f"""
+            CREATE TRIGGER IF NOT EXISTS {prefix}_{table}_update AFTER UPDATE OF {watched} ON {table} BEGIN
+                DELETE FROM {index} WHERE rowid = old.id * 4 + {code};
+                {insert} SELECT {row('new')};
+            END
+        """)
+        statements.append(f"""
+            CREATE TRIGGER IF NOT EXISTS {prefix}_{table}_delete AFTER DELETE ON {table} BEGIN
+                DELETE FROM {index} WHERE rowid = old.id * 4 + {code};
+            END
+        """)
+    return statements
+
+# Change sequence for delta sync: per synced entity, the table it watches and the
+# column naming the user a row belongs to (kept with deletions, which have no row
+# left to check). change_log keeps one row per changed record (its latest change),
+# so it never outgrows the tables and a sync cursor only ever moves forward over it.
+# Deletes made while change_log_pause has a row are not changes but moves (archiving):
+# they only drop the record's entry, and clients keep the record.
+CHANGE_LOG_SOURCES = {
+    'equipment': ('equipment', None),
+    'monitoring': ('daily_monitoring', 'technician_id'),
+    'faults': ('faults', None),
+    'notifications': ('notifications', 'user_id'),
+}
+
+
+def change_log_statements(backfill: bool = False) -> list:
+    """Triggers recording every change to the synced tables (and the backfill from existing rows)"""
+    statements = []
+    for entity, (table, owner) in CHANGE_LOG_SOURCES.items():
+        if backfill:
+            statements.append(f"INSERT INTO change_log (entity, row_id, owner_id, deleted) "
+                              f"SELECT '{entity}', id, {owner or 'NULL'}, 0 FROM {table} ORDER BY id")
+        for event, alias, deleted in (('insert', 'new', 0), ('update', 'new', 0), ('delete', 'old', 1)):
+            guard = " WHERE NOT EXISTS (SELECT 1 FROM change_log_pause)" if deleted else ""
+            statements.append(f"DROP TRIGGER IF EXISTS changes_{table}_{event}")
+            # Delete then insert (not INSERT OR REPLACE, which an outer OR IGNORE would override)
+            statements.append(f"""
+                CREATE TRIGGER changes_{table}_{event} AFTER {event.upper()} ON {table} BEGIN
+                    DELETE FROM change_log WHERE entity = '{entity}' AND row_id = {alias}.id;
+                    INSERT INTO change_log (entity, row_id, owner_id, deleted)
+                    SELECT '{entity}', {alias}.id, {f"{alias}.{owner}" if owner else 'NULL'}, {deleted}{guard};
+                END
+            """)
+    return statements
+
+# Add (:sign = 1) or remove (:sign = -1) the readings matching {where} in equipment_daily_stats
+DAILY_STATS_MERGE = """
+    INSERT INTO equipment_daily_stats
+        (equipment_id, monitoring_date, readings, voltage_sum, voltage_sq_sum, voltage_count,
+         current_sum, current_sq_sum, current_count,
+         power_factor_sum, power_factor_sq_sum, power_factor_count)
+    SELECT equipment_id, date(monitoring_date), :sign * COUNT(*),
+           :sign * TOTAL(CASE WHEN voltage <> 0 THEN voltage END),
+           :sign * TOTAL(CASE WHEN voltage <> 0 THEN voltage * voltage END),
+           :sign * COUNT(CASE WHEN voltage <> 0 THEN 1 END),
+           :sign * TOTAL(CASE WHEN current <> 0 THEN current END),
+           :sign * TOTAL(CASE WHEN current <> 0 THEN current * current END),
+           :sign * COUNT(CASE WHEN current <> 0 THEN 1 END),
+           :sign * TOTAL(CASE WHEN power_factor <> 0 THEN power_factor END),
+           :sign * TOTAL(CASE WHEN power_factor <> 0 THEN power_factor * power_factor END),
+           :sign * COUNT(CASE WHEN power_factor <> 0 THEN 1 END)
+    FROM daily_monitoring
+    WHERE equipment_id IS NOT NULL AND {where}
+    GROUP BY 1, 2
+    ON CONFLICT (equipment_id, monitoring_date) DO UPDATE SET
+        readings = readings + excluded.readings,
+        voltage_sum = voltage_sum + excluded.voltage_sum,
+        voltage_sq_sum = voltage_sq_sum + excluded.voltage_sq_sum,
+        voltage_count = voltage_count + excluded.voltage_count,
+        current_sum = current_sum + excluded.current_sum,
+        current_sq_sum = current_sq_sum + excluded.current_sq_sum,
+        current_count = current_count + excluded.current_count,
+        power_factor_sum = power_factor_sum + excluded.power_factor_sum,
+        power_factor_sq_sum = power_factor_sq_sum + excluded.power_factor_sq_sum,
+        power_factor_count = power_factor_count + excluded.power_factor_count
+"""
+
+def get_database_path() -> str:
+    """Database file path (APDS_DB_PATH overrides the default, e.g. for benchmarks)"""
+    return os.environ.get('APDS_DB_PATH') or DEFAULT_DB_PATH
 
 class DatabaseConnection:
     """
@@ -13,6 +275,9 @@ class DatabaseConnection:
     """
     _instance: Optional['DatabaseConnection'] = None
     _connection: Optional[sqlite3.Connection] = None
+    _idle: list = []
+    _pool_lock = threading.Lock()
+    pool_size = 8
 
     def __new__(cls):
         if cls._instance is None:
@@ -21,22 +286,8 @@ class DatabaseConnection:
 
     def __init__(self):
         if self._connection is None:
-            db_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'operations_monitoring.db')
-
-            # Check if database file exists and is accessible
-            if os.path.exists(db_path):
-                # Check if file is locked by another process
-                if not self._check_database_accessible(db_path):
-                    print("=" * 80)
-                    print("WARNING: Database file appears to be locked by another process!")
-                    print("=" * 80)
-                    print("Please close any of the following that might be using the database:")
-                    print("  - DB Browser for SQLite")
-                    print("  - Another instance of this application")
-                    print("  - Any other SQLite tools")
-                    print("=" * 80)
-                    print("Attempting to connect with retry logic...")
-                    print("")
+            db_path = get_database_path()
+            self.db_path = db_path
 
             # Add timeout to handle database locks (30 seconds)
             max_retries = 3
@@ -47,6 +298,8 @@ class DatabaseConnection:
                     break
                 except sqlite3.OperationalError as e:
                     if "database is locked" in str(e).lower() and attempt < max_retries - 1:
+                        if attempt == 0:
+                            self._print_lock_warning()
                         wait_time = (attempt + 1) * 0.5  # 0.5s, 1s, 1.5s
                         print(f"Database locked, retrying in {wait_time} seconds... (attempt {attempt + 1}/{max_retries})")
                         time.sleep(wait_time)
@@ -54,38 +307,23 @@ class DatabaseConnection:
                     else:
                         raise
 
-            # Set busy timeout FIRST before any other operations
-            try:
-                self._connection.execute("PRAGMA busy_timeout = 30000")
-            except sqlite3.OperationalError:
-                pass  # If database is locked, continue anyway
+            # Apply the connection profile (busy_timeout, WAL, synchronous, cache...) once
+            self.profile_name = get_profile_name()
+            self.settings = apply_profile(self._connection, get_profile(self.profile_name))
+            print(f"Database profile '{self.profile_name}': {format_settings(self.settings)}")
 
-            # Enable WAL mode for better concurrency (with error handling)
-            try:
-                self._connection.execute("PRAGMA journal_mode = WAL")
-                self._connection.commit()
-            except sqlite3.OperationalError as e:
-                # If database is locked, try to continue with default journal mode
-                if "database is locked" in str(e).lower():
-                    print(f"Warning: Could not set WAL mode (database may be locked): {e}")
-                    print("Continuing with default journal mode...")
-                # Try to get current journal mode
-                try:
-                    result = self._connection.execute("PRAGMA journal_mode").fetchone()
-                    if result:
-                        print(f"Current journal mode: {result[0]}")
-                except:
-                    pass
+            # Read-only profile never writes, so it cannot create tables
+            if self.settings.get('query_only'):
+                return
 
-            # Enable foreign key constraints
-            try:
-                self._connection.execute("PRAGMA foreign_keys = ON")
-            except sqlite3.OperationalError:
-                pass  # Continue even if this fails
+            # Schema is already current: skip the CREATE TABLE pass
+            if self._get_schema_version() >= SCHEMA_VERSION:
+                return
 
             # Create tables (with error handling)
             try:
                 self._create_tables()
+                self._set_schema_version(SCHEMA_VERSION)
             except sqlite3.OperationalError as e:
                 if "database is locked" in str(e).lower():
                     print(f"Warning: Database is locked during table creation. Some tables may not be created.")
@@ -93,17 +331,30 @@ class DatabaseConnection:
                 else:
                     raise
 
-    def _check_database_accessible(self, db_path: str) -> bool:
-        """Check if database file is accessible (not locked)"""
+    def _print_lock_warning(self):
+        """Tell the operator which tools usually hold the database lock"""
+        print("=" * 80)
+        print("WARNING: Database file appears to be locked by another process!")
+        print("=" * 80)
+        print("Please close any of the following that might be using the database:")
+        print("  - DB Browser for SQLite")
+        print("  - Another instance of this application")
+        print("  - Any other SQLite tools")
+        print("=" * 80)
+        print("Attempting to connect with retry logic...")
+        print("")
+
+    def _get_schema_version(self) -> int:
+        """Schema version stamped in the database header (PRAGMA user_version)"""
+        return self._connection.execute("PRAGMA user_version").fetchone()[0]
+
+    def _set_schema_version(self, version: int):
+        """Stamp the schema version once all tables exist"""
         try:
-            # Try to open the file in append mode to check if it's locked
-            test_conn = sqlite3.connect(db_path, timeout=1.0)
-            test_conn.close()
-            return True
-        except sqlite3.OperationalError:
-            return False
-        except Exception:
-            return True  # If it's a different error, assume it's accessible
+            self._connection.execute(f"PRAGMA user_version = {int(version)}")
+        except sqlite3.OperationalError as e:
+            # Tables are re-checked on the next start instead
+            print(f"Warning: Could not record schema version: {e}")
 
     def _create_tables(self):
         """Create all database tables"""
@@ -402,6 +653,298 @@ class DatabaseConnection:
             )
         """)
 
+        # Per-day monitoring totals; archived days keep their summaries here
+        # (NULL equipment/technician ids are stored as 0)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS monitoring_daily_rollup (
+                monitoring_date DATE NOT NULL,
+                equipment_id INTEGER NOT NULL,
+                technician_id INTEGER NOT NULL,
+                readings INTEGER NOT NULL DEFAULT 0,
+                normal_count INTEGER NOT NULL DEFAULT 0,
+                warning_count INTEGER NOT NULL DEFAULT 0,
+                critical_count INTEGER NOT NULL DEFAULT 0,
+                voltage_sum REAL NOT NULL DEFAULT 0,
+                voltage_count INTEGER NOT NULL DEFAULT 0,
+                current_sum REAL NOT NULL DEFAULT 0,
+                current_count INTEGER NOT NULL DEFAULT 0,
+                power_factor_sum REAL NOT NULL DEFAULT 0,
+                power_factor_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (monitoring_date, equipment_id, technician_id)
+            ) WITHOUT ROWID
+        """)
+
+        # Archive runs: monitoring rows dated before archived_before may live in the archive database
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS monitoring_archive_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                archived_before DATE NOT NULL,
+                rows_archived INTEGER NOT NULL DEFAULT 0,
+                days_archived INTEGER NOT NULL DEFAULT 0,
+                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                finished_at TIMESTAMP
+            )
+        """)
+
+        # Date-range reads and the archiver walk daily_monitoring by date
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_daily_monitoring_date
+            ON daily_monitoring(monitoring_date)
+        """)
+
+        # Per-equipment history and latest-reading refreshes
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_daily_monitoring_equipment
+            ON daily_monitoring(equipment_id, monitoring_date)
+        """)
+
+        # Per-equipment fault history (reliability analytics, open-fault lookups)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_faults_equipment
+            ON faults(equipment_id, reported_at)
+        """)
+
+        # RCAs and resolution reports of a fault (fault pages, similar-fault documents)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_root_cause_analysis_fault
+            ON root_cause_analysis(fault_id)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_resolution_reports_fault
+            ON resolution_reports(fault_id)
+        """)
+
+        # Reports of an already open fault, attached to it instead of opening a new one
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS fault_duplicates (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                fault_id INTEGER NOT NULL,
+                reported_by INTEGER NOT NULL,
+                fault_description TEXT NOT NULL,
+                severity TEXT NOT NULL,
+                similarity REAL NOT NULL,
+                reported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (fault_id) REFERENCES faults(id),
+                FOREIGN KEY (reported_by) REFERENCES users(id)
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_fault_duplicates_fault
+            ON fault_duplicates(fault_id)
+        """)
+
+        # Responses of write API calls by Idempotency-Key, replayed when a client retries
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS idempotency_keys (
+                user_id INTEGER NOT NULL,
+                idempotency_key TEXT NOT NULL,
+                request_hash TEXT NOT NULL,
+                status_code INTEGER,
+                content_type TEXT,
+                response_body BLOB,
+                created_at REAL NOT NULL,
+                expires_at REAL NOT NULL,
+                PRIMARY KEY (user_id, idempotency_key)
+            ) WITHOUT ROWID
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_idempotency_keys_expires
+            ON idempotency_keys(expires_at)
+        """)
+
+        # Latest monitoring reading per equipment, kept current by MonitoringRepository
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS equipment_latest_reading (
+                equipment_id INTEGER PRIMARY KEY,
+                monitoring_id INTEGER NOT NULL,
+                technician_id INTEGER,
+                monitoring_date DATE NOT NULL,
+                shift TEXT,
+                voltage REAL,
+                current REAL,
+                power_factor REAL,
+                operational_status TEXT NOT NULL,
+                recorded_at TIMESTAMP,
+                FOREIGN KEY (equipment_id) REFERENCES equipment(id)
+            )
+        """)
+        # Backfill from existing history (no-op once populated)
+        cursor.execute(LATEST_READING_BACKFILL)
+
+        # Monitoring threshold profiles: default (no type/equipment), per equipment type,
+        # per equipment. Empty limits inherit from the less specific profile.
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS threshold_profiles (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                name TEXT NOT NULL,
+                equipment_type TEXT,
+                equipment_id INTEGER,
+                voltage_warning_low REAL,
+                voltage_warning_high REAL,
+                voltage_critical_low REAL,
+                voltage_critical_high REAL,
+                current_warning_max REAL,
+                current_critical_max REAL,
+                power_factor_warning_min REAL,
+                power_factor_critical_min REAL,
+                is_active INTEGER DEFAULT 1,
+                revision INTEGER NOT NULL DEFAULT 0,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                CHECK (equipment_type IS NULL OR equipment_id IS NULL),
+                FOREIGN KEY (equipment_id) REFERENCES equipment(id)
+            )
+        """)
+        # Default profile with the long-standing APDS thresholds
+        cursor.execute("""
+            INSERT INTO threshold_profiles
+                (name, voltage_warning_low, voltage_warning_high, current_warning_max,
+                 power_factor_warning_min, power_factor_critical_min, revision)
+            SELECT 'Default', 220, 240, 100, 0.90, 0.85, 1
+            WHERE NOT EXISTS (
+                SELECT 1 FROM threshold_profiles WHERE equipment_type IS NULL AND equipment_id IS NULL
+            )
+        """)
+
+        # Re-classification runs: daily_monitoring is walked by id, next_id is where to resume
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS reclassification_runs (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                rules_signature TEXT NOT NULL,
+                first_id INTEGER NOT NULL DEFAULT 0,
+                last_id INTEGER NOT NULL DEFAULT 0,
+                next_id INTEGER NOT NULL DEFAULT 0,
+                rows_scanned INTEGER NOT NULL DEFAULT 0,
+                rows_changed INTEGER NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'running',
+                error TEXT,
+                started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                finished_at TIMESTAMP
+            )
+        """)
+
+        # Rolling per-equipment statistics of the anomaly detector (persisted periodically)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS anomaly_state (
+                equipment_id INTEGER NOT NULL,
+                metric TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                mean REAL NOT NULL,
+                variance REAL NOT NULL,
+                fast_mean REAL NOT NULL,
+                rate_variance REAL NOT NULL,
+                last_value REAL,
+                last_at REAL,
+                flags INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (equipment_id, metric)
+            ) WITHOUT ROWID
+        """)
+
+        # Per equipment and day V/I/PF sums, counts and sums of squares (kept when rows are archived)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS equipment_daily_stats (
+                equipment_id INTEGER NOT NULL,
+                monitoring_date DATE NOT NULL,
+                readings INTEGER NOT NULL,
+                voltage_sum REAL NOT NULL,
+                voltage_sq_sum REAL NOT NULL,
+                voltage_count INTEGER NOT NULL,
+                current_sum REAL NOT NULL,
+                current_sq_sum REAL NOT NULL,
+                current_count INTEGER NOT NULL,
+                power_factor_sum REAL NOT NULL,
+                power_factor_sq_sum REAL NOT NULL,
+                power_factor_count INTEGER NOT NULL,
+                PRIMARY KEY (equipment_id, monitoring_date)
+            ) WITHOUT ROWID
+        """)
+        # Backfill from existing history (only into an empty table)
+        if cursor.execute("SELECT 1 FROM equipment_daily_stats LIMIT 1").fetchone() is None:
+            cursor.execute(DAILY_STATS_MERGE.format(where='1'), {'sign': 1})
+
+        # Suggested maintenance dates from the monitoring trend forecast (latest run)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS maintenance_forecasts (
+                equipment_id INTEGER PRIMARY KEY,
+                suggested_date DATE NOT NULL,
+                crossing_date DATE NOT NULL,
+                metric TEXT NOT NULL,
+                limit_value REAL NOT NULL,
+                slope_per_day REAL NOT NULL,
+                confidence REAL NOT NULL,
+                days_used INTEGER NOT NULL,
+                computed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                FOREIGN KEY (equipment_id) REFERENCES equipment(id)
+            )
+        """)
+
+        # Materialized health score per equipment, kept current by EquipmentHealthService
+        # from events. score (0-100, lower is worse) loses up to:
+        #   40 for the recent status mix (warning counts half, critical fully)
+        #   30 for open faults by severity weight (half of it at a weight of 4)
+        #   10 each for open escalations and unresolved data discrepancies (5 apiece)
+        #   20 for a short mean time between failures (half of it at 30 days)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS equipment_health (
+                equipment_id INTEGER PRIMARY KEY,
+                readings INTEGER NOT NULL DEFAULT 0,
+                mix_weight REAL NOT NULL DEFAULT 0,
+                mix_warning REAL NOT NULL DEFAULT 0,
+                mix_critical REAL NOT NULL DEFAULT 0,
+                open_faults INTEGER NOT NULL DEFAULT 0,
+                open_fault_severity REAL NOT NULL DEFAULT 0,
+                open_escalations INTEGER NOT NULL DEFAULT 0,
+                open_discrepancies INTEGER NOT NULL DEFAULT 0,
+                failures INTEGER NOT NULL DEFAULT 0,
+                first_failure_at TIMESTAMP,
+                last_failure_at TIMESTAMP,
+                mtbf_hours REAL,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                score REAL GENERATED ALWAYS AS (max(0.0, 100.0
+                    - CASE WHEN mix_weight > 0
+                           THEN 40.0 * (0.5 * mix_warning + mix_critical) / mix_weight ELSE 0.0 END
+                    - 30.0 * open_fault_severity / (open_fault_severity + 4.0)
+                    - min(10.0, 5.0 * open_escalations)
+                    - min(10.0, 5.0 * open_discrepancies)
+                    - CASE WHEN mtbf_hours IS NOT NULL
+                           THEN 20.0 * 720.0 / (720.0 + max(mtbf_hours, 0.0)) ELSE 0.0 END)) STORED,
+                FOREIGN KEY (equipment_id) REFERENCES equipment(id)
+            )
+        """)
+        # Worst-first ranking walks this index
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_equipment_health_score
+            ON equipment_health(score, equipment_id)
+        """)
+        # Backfill from existing history (only into an empty table)
+        if cursor.execute("SELECT 1 FROM equipment_health LIMIT 1").fetchone() is None:
+            cursor.execute(EQUIPMENT_HEALTH_REBUILD, {'decay': HEALTH_STATUS_DECAY})
+
+        # Change sequence for GET /api/sync (filled from existing rows when first created)
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'change_log'").fetchone()
+        if not exists:
+            cursor.execute("""
+                CREATE TABLE change_log (
+                    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                    entity TEXT NOT NULL,
+                    row_id INTEGER NOT NULL,
+                    owner_id INTEGER,
+                    deleted INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            cursor.execute("CREATE UNIQUE INDEX idx_change_log_row ON change_log(entity, row_id)")
+        elif 'owner_id' not in [column[1] for column in cursor.execute("PRAGMA table_info(change_log)")]:
+            cursor.execute("ALTER TABLE change_log ADD COLUMN owner_id INTEGER")
+        # Only ever has a row inside the archiver's own transactions
+        cursor.execute("CREATE TABLE IF NOT EXISTS change_log_pause (reason TEXT PRIMARY KEY)")
+        for statement in change_log_statements(backfill=not exists):
+            cursor.execute(statement)
+
+        # Full-text indexes (need SQLite built with FTS5; search is disabled without it).
+        # Titles weigh twice as much as bodies in ORDER BY rank.
+        self._create_fts_index(cursor, 'search_index', SEARCH_COLUMNS, SEARCH_KINDS, SEARCH_SOURCES)
+        self._create_fts_index(cursor, 'library_index', LIBRARY_COLUMNS, LIBRARY_KINDS, LIBRARY_SOURCES)
+
         try:
             self._connection.commit()
         except sqlite3.OperationalError as e:
@@ -417,16 +960,79 @@ class DatabaseConnection:
             else:
                 raise
 
+    def _create_fts_index(self, cursor, index: str, columns: tuple, kinds: dict, sources: dict):
+        """Create, fill and attach sync triggers to an FTS5 index unless it exists"""
+        try:
+            exists = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (index,)).fetchone()
+            if exists:
+                return
+            cursor.execute(f"""
+                CREATE VIRTUAL TABLE {index} USING fts5(
+                    entity_type, {', '.join(columns)}, tokenize = 'porter unicode61'
+                )
+            """)
+            weights = ', '.join(['0'] * (len(columns) - 1) + ['2.0', '1.0'])
+            cursor.execute(f"INSERT INTO {index} ({index}, rank) VALUES ('rank', 'bm25({weights})')")
+            for statement in fts_sync_statements(index, columns, kinds, sources):
+                cursor.execute(statement)
+        except sqlite3.OperationalError as e:
+            print(f"Warning: Full-text search ({index}) is not available: {e}")
+
     def get_connection(self):
-        """Get database connection"""
+        """
+        Get database connection.
+        Inside a request this is the request's own connection (checked out of
+        the pool on first use); elsewhere it is the shared process connection.
+        """
+        from app.patterns.container import container
+        if container.in_request_scope():
+            return container.resolve('db_connection')
         return self._connection
 
+    def open_connection(self, profile_name: str = None, **overrides) -> sqlite3.Connection:
+        """Open an additional connection to the same database (e.g. for background jobs)"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+        conn.row_factory = sqlite3.Row
+        settings = get_profile(profile_name or self.profile_name)
+        settings.update(overrides)
+        apply_profile(conn, settings)
+        return conn
+
     def init_app(self, app):
-        """Initialize with Flask app"""
-        pass
+        """Initialize with Flask app: bind a pooled connection to each request"""
+        from app.patterns.container import container, REQUEST_SCOPE
+        app.config.setdefault('DB_POOL_SIZE', 8)
+        self.pool_size = app.config['DB_POOL_SIZE']
+        container.register('db_connection', self.acquire_connection,
+                           scope=REQUEST_SCOPE, dispose=self.release_connection)
+
+    def acquire_connection(self) -> sqlite3.Connection:
+        """Take an idle pooled connection, opening one (profile applied once) if none is idle"""
+        with self._pool_lock:
+            if self._idle:
+                return self._idle.pop()
+        return self.open_connection()
+
+    def release_connection(self, conn: sqlite3.Connection, error=None):
+        """Finish the request's transaction and return the connection to the pool"""
+        if conn.in_transaction:
+            if error is None:
+                conn.commit()
+            else:
+                conn.rollback()
+        with self._pool_lock:
+            if len(self._idle) < self.pool_size:
+                self._idle.append(conn)
+                return
+        conn.close()
 
     def close(self):
-        """Close database connection"""
+        """Close database connection and pooled connections"""
+        with self._pool_lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
         if self._connection:
             self._connection.close()
             self._connection = None
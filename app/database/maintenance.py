@@ -0,0 +1,253 @@
+"""
+Database Maintenance Scheduler
+
+Runs SQLite housekeeping on a background thread with its own connection so
+request threads are never blocked:
+  - WAL checkpoints: PASSIVE on size/time thresholds, TRUNCATE when the -wal
+    file grows past a hard limit
+  - PRAGMA optimize periodically, full ANALYZE in the off-peak window
+  - incremental vacuum in the off-peak window (when auto_vacuum=INCREMENTAL)
+  - archiving of old daily_monitoring rows in the off-peak window
+    (when DB_ARCHIVE_AFTER_DAYS is set)
+  - purging of expired Idempotency-Key responses
+  - writing the anomaly detector's in-memory statistics to anomaly_state
+"""
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from app.database.archive import MonitoringArchiver
+
+
+class DatabaseMaintenance:
+    """Background maintenance for the application database"""
+
+    DEFAULTS = {
+        'DB_MAINTENANCE_ENABLED': True,
+        'DB_MAINTENANCE_POLL_SECONDS': 30,
+        'DB_WAL_PASSIVE_BYTES': 16 * 1024 * 1024,
+        'DB_WAL_TRUNCATE_BYTES': 64 * 1024 * 1024,
+        'DB_CHECKPOINT_INTERVAL_SECONDS': 300,
+        'DB_OPTIMIZE_INTERVAL_SECONDS': 3600,
+        'DB_ANALYZE_INTERVAL_SECONDS': 24 * 3600,
+        'DB_OFFPEAK_HOURS': (1, 5),           # [start, end) local hours
+        'DB_VACUUM_FREE_PAGES': 1000,         # only vacuum when this many pages are free
+        'DB_VACUUM_STEP_PAGES': 500,          # pages released per step
+        'DB_ARCHIVE_AFTER_DAYS': 0,           # 0 disables archiving
+        'DB_ARCHIVE_INTERVAL_SECONDS': 24 * 3600,
+        'DB_IDEMPOTENCY_PURGE_INTERVAL_SECONDS': 3600,
+        'DB_ANOMALY_PERSIST_INTERVAL_SECONDS': 60,
+        # Give up quickly instead of queueing behind request writers
+        'DB_MAINTENANCE_BUSY_TIMEOUT_MS': 1000,
+    }
+
+    # One scheduler per process, shared by every app created in it
+    _process_instance = None
+    _process_lock = threading.Lock()
+
+    TASKS = ('checkpoint', 'optimize', 'analyze', 'incremental_vacuum', 'archive', 'purge_idempotency_keys',
+             'persist_anomaly_state')
+
+    def __init__(self, db, app=None):
+        self.db = db
+        self.config = dict(self.DEFAULTS)
+        self.conn = None
+        self.archiver = MonitoringArchiver(db)
+        self._thread = None
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._requested = set()
+        self._lock = threading.Lock()
+        self._status = {task: {'last_run': None, 'duration_ms': None, 'result': None,
+                               'error': None, 'runs': 0} for task in self.TASKS}
+        self._last_run = {task: 0.0 for task in self.TASKS}
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """
+        Read configuration from the app and start the scheduler thread with the
+        app's first request, so apps that never serve one (scripts, the debug
+        reloader's watcher process) never start it. Apps created later in the
+        same process share the first enabled app's scheduler.
+        DB_MAINTENANCE_ENABLED = False (APDS_DB_MAINTENANCE=0) opts out.
+        """
+        for key, value in self.DEFAULTS.items():
+            app.config.setdefault(key, value)
+            self.config[key] = app.config[key]
+        app.extensions['db_maintenance'] = self
+        if not self.config['DB_MAINTENANCE_ENABLED'] or self.db.settings.get('query_only'):
+            return
+        with DatabaseMaintenance._process_lock:
+            if DatabaseMaintenance._process_instance is None:
+                DatabaseMaintenance._process_instance = self
+            shared = DatabaseMaintenance._process_instance
+        app.extensions['db_maintenance'] = shared
+        app.before_request(shared._start_with_first_request)
+
+    def _start_with_first_request(self):
+        if self._thread is None:
+            self.start()
+
+    def start(self):
+        """Start the background thread (once per process)"""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._run, name='apds-db-maintenance', daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """Stop the background thread and close its connection"""
+        self._stop.set()
+        self._wake.set()
+        if self._thread:
+            self._thread.join(timeout=10)
+
+    def request_run(self, task: str):
+        """Ask the scheduler to run a task on its next wake-up (non-blocking)"""
+        if task not in self.TASKS:
+            raise ValueError(f"Unknown maintenance task: {task}")
+        with self._lock:
+            self._requested.add(task)
+        self._wake.set()
+
+    def status(self) -> dict:
+        """Last run, duration and result for each task, plus current WAL size"""
+        with self._lock:
+            tasks = {task: dict(info) for task, info in self._status.items()}
+        return {
+            'running': bool(self._thread and self._thread.is_alive()),
+            'wal_bytes': self._wal_size(),
+            'tasks': tasks
+        }
+
+    def _run(self):
+        self.conn = self.db.open_connection(busy_timeout=self.config['DB_MAINTENANCE_BUSY_TIMEOUT_MS'])
+        # Start interval clocks now so nothing heavy runs right at startup
+        now = time.monotonic()
+        self._last_run = {task: now for task in self.TASKS}
+        try:
+            while not self._stop.is_set():
+                self._tick()
+                self._wake.wait(self.config['DB_MAINTENANCE_POLL_SECONDS'])
+                self._wake.clear()
+        finally:
+            self.conn.close()
+
+    def _tick(self):
+        with self._lock:
+            requested = set(self._requested)
+            self._requested.clear()
+        now = time.monotonic()
+        offpeak = self._is_offpeak()
+        wal_size = self._wal_size()
+
+        if wal_size >= self.config['DB_WAL_TRUNCATE_BYTES']:
+            self._execute('checkpoint', lambda: self._checkpoint('TRUNCATE'))
+        elif ('checkpoint' in requested or wal_size >= self.config['DB_WAL_PASSIVE_BYTES']
+              or now - self._last_run['checkpoint'] >= self.config['DB_CHECKPOINT_INTERVAL_SECONDS']):
+            self._execute('checkpoint', lambda: self._checkpoint('PASSIVE'))
+
+        if 'optimize' in requested or now - self._last_run['optimize'] >= self.config['DB_OPTIMIZE_INTERVAL_SECONDS']:
+            self._execute('optimize', self._optimize)
+
+        if 'analyze' in requested or (offpeak and now - self._last_run['analyze'] >= self.config['DB_ANALYZE_INTERVAL_SECONDS']):
+            self._execute('analyze', self._analyze)
+
+        if 'incremental_vacuum' in requested or offpeak:
+            force = 'incremental_vacuum' in requested
+            self._execute('incremental_vacuum', lambda: self._incremental_vacuum(force))
+
+        archive_days = self.config['DB_ARCHIVE_AFTER_DAYS']
+        if 'archive' in requested or (archive_days and offpeak and
+                                      now - self._last_run['archive'] >= self.config['DB_ARCHIVE_INTERVAL_SECONDS']):
+            self._execute('archive', lambda: self._archive(archive_days))
+
+        if ('purge_idempotency_keys' in requested or now - self._last_run['purge_idempotency_keys']
+                >= self.config['DB_IDEMPOTENCY_PURGE_INTERVAL_SECONDS']):
+            self._execute('purge_idempotency_keys', self._purge_idempotency_keys)
+
+        if ('persist_anomaly_state' in requested or now - self._last_run['persist_anomaly_state']
+                >= self.config['DB_ANOMALY_PERSIST_INTERVAL_SECONDS']):
+            self._execute('persist_anomaly_state', self._persist_anomaly_state)
+
+    def _execute(self, task: str, func):
+        start = time.perf_counter()
+        result, error = None, None
+        try:
+            result = func()
+        except Exception as e:
+            error = str(e)
+            print(f"Warning: Database maintenance task '{task}' failed: {e}")
+        duration = (time.perf_counter() - start) * 1000
+        self._last_run[task] = time.monotonic()
+        with self._lock:
+            info = self._status[task]
+            info.update({'last_run': datetime.now().isoformat(), 'duration_ms': round(duration, 2),
+                         'result': result, 'error': error})
+            info['runs'] += 1
+
+    def _wal_size(self) -> int:
+        try:
+            return os.path.getsize(self.db.db_path + '-wal')
+        except OSError:
+            return 0
+
+    def _is_offpeak(self) -> bool:
+        start, end = self.config['DB_OFFPEAK_HOURS']
+        hour = datetime.now().hour
+        if start <= end:
+            return start <= hour < end
+        return hour >= start or hour < end
+
+    def _checkpoint(self, mode: str) -> dict:
+        busy, log_frames, checkpointed = self.conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        return {'mode': mode, 'busy': bool(busy), 'log_frames': log_frames,
+                'checkpointed_frames': checkpointed}
+
+    def _optimize(self) -> dict:
+        self.conn.execute("PRAGMA optimize")
+        return {'optimized': True}
+
+    def _analyze(self) -> dict:
+        self.conn.execute("ANALYZE")
+        self.conn.commit()
+        return {'analyzed': True}
+
+    def _incremental_vacuum(self, force: bool = False) -> dict:
+        auto_vacuum = self.conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        free_pages = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if auto_vacuum != 2:
+            return {'skipped': 'auto_vacuum is not INCREMENTAL', 'free_pages': free_pages}
+        if free_pages < self.config['DB_VACUUM_FREE_PAGES'] and not force:
+            return {'skipped': 'below threshold', 'free_pages': free_pages}
+        released = 0
+        # Small steps keep each write transaction short
+        while free_pages > 0 and not self._stop.is_set() and (force or self._is_offpeak()):
+            step = min(free_pages, self.config['DB_VACUUM_STEP_PAGES'])
+            self.conn.execute(f"PRAGMA incremental_vacuum({step})")
+            self.conn.commit()
+            released += step
+            free_pages = self.conn.execute("PRAGMA freelist_count").fetchone()[0]
+            time.sleep(0.05)
+        return {'released_pages': released, 'free_pages': free_pages}
+
+    def _archive(self, days: int) -> dict:
+        if not days:
+            return {'skipped': 'DB_ARCHIVE_AFTER_DAYS is not set'}
+        return self.archiver.archive_older_than(days, self.conn, self._stop)
+
+    def _persist_anomaly_state(self) -> dict:
+        from app.patterns.container import container
+        # Only the running detector has state to write; never build one here
+        service = container.existing('anomaly_service')
+        if service is None:
+            return {'skipped': 'anomaly detection has not run'}
+        return {'saved_series': service.persist()}
+
+    def _purge_idempotency_keys(self) -> dict:
+        cursor = self.conn.execute("DELETE FROM idempotency_keys WHERE expires_at <= ?", (time.time(),))
+        self.conn.commit()
+        return {'purged': cursor.rowcount}
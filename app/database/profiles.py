@@ -0,0 +1,109 @@
+"""
+SQLite Connection Profiles
+
+Each profile is the set of PRAGMAs applied once when a connection is opened.
+The profile is chosen with APDS_DB_PROFILE (default: oltp); single PRAGMAs can
+be overridden with APDS_DB_<PRAGMA>, e.g. APDS_DB_CACHE_SIZE=-131072.
+"""
+import os
+import sqlite3
+
+DEFAULT_PROFILE = 'oltp'
+
+# Order matters: busy_timeout first so the rest can wait for locks,
+# auto_vacuum before the file is first written (only new databases pick it up),
+# journal_mode before anything that depends on WAL.
+PRAGMA_ORDER = [
+    'busy_timeout',
+    'auto_vacuum',
+    'journal_mode',
+    'synchronous',
+    'foreign_keys',
+    'cache_size',
+    'mmap_size',
+    'temp_store',
+    'wal_autocheckpoint',
+    'query_only'
+]
+
+CONNECTION_PROFILES = {
+    # Interactive app traffic: durable enough in WAL, large page cache
+    'oltp': {
+        'busy_timeout': 30000,
+        'auto_vacuum': 'INCREMENTAL',
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'foreign_keys': 'ON',
+        'cache_size': -65536,           # 64 MB
+        'mmap_size': 268435456,         # 256 MB
+        'temp_store': 'MEMORY',
+        'wal_autocheckpoint': 1000,     # pages
+    },
+    # Bulk loading: fewer, larger checkpoints and a bigger cache
+    'ingest': {
+        'busy_timeout': 60000,
+        'auto_vacuum': 'INCREMENTAL',
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'foreign_keys': 'ON',
+        'cache_size': -262144,          # 256 MB
+        'mmap_size': 536870912,         # 512 MB
+        'temp_store': 'MEMORY',
+        'wal_autocheckpoint': 10000,
+    },
+    # Reporting / tooling: never writes, maps as much of the file as possible
+    'readonly': {
+        'busy_timeout': 30000,
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'foreign_keys': 'ON',
+        'cache_size': -131072,          # 128 MB
+        'mmap_size': 1073741824,        # 1 GB
+        'temp_store': 'MEMORY',
+        'wal_autocheckpoint': 0,
+        'query_only': 'ON',
+    }
+}
+
+
+def get_profile_name() -> str:
+    """Profile selected for this environment"""
+    name = os.environ.get('APDS_DB_PROFILE', DEFAULT_PROFILE).lower()
+    if name not in CONNECTION_PROFILES:
+        print(f"Warning: Unknown database profile '{name}', using '{DEFAULT_PROFILE}'")
+        name = DEFAULT_PROFILE
+    return name
+
+
+def get_profile(name: str = None) -> dict:
+    """PRAGMA settings for a profile, with APDS_DB_<PRAGMA> overrides applied"""
+    settings = dict(CONNECTION_PROFILES[name or get_profile_name()])
+    for pragma in PRAGMA_ORDER:
+        override = os.environ.get(f"APDS_DB_{pragma.upper()}")
+        if override is not None:
+            settings[pragma] = override
+    return settings
+
+
+def apply_profile(conn: sqlite3.Connection, settings: dict) -> dict:
+    """Apply profile PRAGMAs to a connection and return the effective values"""
+    effective = {}
+    for pragma in PRAGMA_ORDER:
+        if pragma not in settings:
+            continue
+        try:
+            conn.execute(f"PRAGMA {pragma} = {settings[pragma]}")
+        except sqlite3.OperationalError as e:
+            # A locked database must not stop the app from starting
+            print(f"Warning: Could not set PRAGMA {pragma} (database may be locked): {e}")
+        try:
+            row = conn.execute(f"PRAGMA {pragma}").fetchone()
+            effective[pragma] = row[0] if row else None
+        except sqlite3.OperationalError:
+            effective[pragma] = None
+    return effective
+
+
+def format_settings(effective: dict) -> str:
+    """One-line summary of effective settings for the startup log"""
+    return ', '.join(f"{pragma}={value}" for pragma, value in effective.items())
@@ -1,11 +1,11 @@
 """
 Audit Log Model
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@model
 class AuditLog:
     """Audit Log model"""
     id: Optional[int] = None
@@ -47,7 +47,7 @@ class AuditLog:
             'new_values': self.new_values,
             'ip_address': self.ip_address,
             'user_agent': self.user_agent,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': iso(self, 'created_at')
         }
 
 
@@ -0,0 +1,202 @@
+"""
+Model Base - slotted dataclasses with fast row mapping
+
+@model turns a model class into a slotted dataclass and adds:
+  - lazy date/datetime fields: the SQLite text is kept as-is and only parsed
+    with fromisoformat the first time the attribute is read
+  - Model.from_row(row): sqlite3.Row -> model without an intermediate dict,
+    using a mapper generated once per result-set shape
+  - Model.json_mapper(columns): sqlite3.Row -> the same dict to_dict() returns,
+    without building the model at all (for read-only list endpoints)
+"""
+import typing
+from dataclasses import dataclass, fields, MISSING
+from datetime import datetime, date
+
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value)
+
+
+def _parse_date(value: str) -> date:
+    return datetime.fromisoformat(value).date()
+
+
+def iso_datetime(value: str) -> str:
+    """SQLite datetime text -> datetime.isoformat() text without building a datetime"""
+    if len(value) == 19 and value[10] in ' T':
+        return value[:10] + 'T' + value[11:]
+    if len(value) == 10:
+        return value + 'T00:00:00'
+    return datetime.fromisoformat(value).isoformat()
+
+
+def iso_date(value: str) -> str:
+    """SQLite date (or datetime) text -> date.isoformat() text"""
+    if len(value) == 10:
+        return value
+    return datetime.fromisoformat(value).date().isoformat()
+
+
+class LazyTemporal:
+    """
+    Data descriptor wrapping a slot: stores raw SQLite text and parses it
+    on first read, caching the parsed value back into the slot.
+    """
+    __slots__ = ('name', 'slot', 'kind', 'parse', 'to_iso')
+
+    def __init__(self, name: str, slot, kind: type):
+        self.name = name
+        self.slot = slot
+        self.kind = kind
+        self.parse = _parse_date if kind is date else _parse_datetime
+        self.to_iso = iso_date if kind is date else iso_datetime
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            return self
+        value = self.slot.__get__(obj, owner)
+        if value.__class__ is str:
+            value = self.parse(value) if value else None
+            self.slot.__set__(obj, value)
+        return value
+
+    def __set__(self, obj, value):
+        self.slot.__set__(obj, value)
+
+    def isoformat(self, obj):
+        """ISO text of the field, straight from the raw value when not yet parsed"""
+        value = self.slot.__get__(obj, type(obj))
+        if not value:
+            return None
+        if value.__class__ is str:
+            return self.to_iso(value)
+        return value.isoformat()
+
+
+def iso(obj, name: str):
+    """isoformat() of a date/datetime model field (None when empty) without forcing a parse"""
+    return type(obj).__dict__[name].isoformat(obj)
+
+
+def _temporal_kind(annotation):
+    """date/datetime for (Optional) temporal annotations, else None"""
+    for candidate in typing.get_args(annotation) or (annotation,):
+        if candidate is datetime:
+            return datetime
+        if candidate is date:
+            return date
+    return None
+
+
+def _field_default(f):
+    if f.default is not MISSING:
+        return f.default
+    if f.default_factory is not MISSING:
+        return f.default_factory()
+    return None
+
+
+def model(cls):
+    """Class decorator: slotted dataclass with lazy temporal fields and row mappers"""
+    cls = dataclass(slots=True)(cls)
+    hints = typing.get_type_hints(cls)
+    cls._model_fields = tuple(fields(cls))
+    cls._temporal_fields = {}
+    cls._bool_fields = set()
+    for f in cls._model_fields:
+        kind = _temporal_kind(hints[f.name])
+        if kind is not None:
+            cls._temporal_fields[f.name] = kind
+            setattr(cls, f.name, LazyTemporal(f.name, cls.__dict__[f.name], kind))
+        elif hints[f.name] is bool:
+            cls._bool_fields.add(f.name)
+    cls._row_mappers = {}
+    cls._json_mappers = {}
+    cls.from_row = classmethod(_from_row)
+    cls.from_rows = classmethod(_from_rows)
+    cls.json_mapper = classmethod(_json_mapper)
+    return cls
+
+
+def _from_row(cls, row):
+    """Build a model straight from a sqlite3.Row"""
+    if row is None:
+        return None
+    return _row_mapper(cls, tuple(row.keys()))(row)
+
+
+def _from_rows(cls, rows) -> list:
+    """Build models for a whole result set with one generated mapper"""
+    if not rows:
+        return []
+    mapper = _row_mapper(cls, tuple(rows[0].keys()))
+    return [mapper(row) for row in rows]
+
+
+def _row_mapper(cls, columns: tuple):
+    """Generated row -> model function for one result-set shape (cached)"""
+    mapper = cls._row_mappers.get(columns)
+    if mapper is not None:
+        return mapper
+
+    index = {name: i for i, name in enumerate(columns)}
+    namespace = {'new': object.__new__, 'cls': cls, 'bool': bool}
+    lines = ['def mapper(row):', '    obj = new(cls)']
+    for f in cls._model_fields:
+        descriptor = cls.__dict__[f.name]
+        setter = f"set_{f.name}"
+        namespace[setter] = (descriptor.slot if isinstance(descriptor, LazyTemporal) else descriptor).__set__
+        default = _field_default(f)
+        if f.name not in index:
+            namespace[f"default_{f.name}"] = default
+            lines.append(f"    {setter}(obj, default_{f.name})")
+        elif f.name in cls._bool_fields:
+            lines.append(f"    {setter}(obj, bool(row[{index[f.name]}]))")
+        elif f.name in cls._temporal_fields and default is not None:
+            # from_dict falls back to the default when the column is empty
+            namespace[f"default_{f.name}"] = default
+            lines.append(f"    {setter}(obj, row[{index[f.name]}] or default_{f.name})")
+        else:
+            lines.append(f"    {setter}(obj, row[{index[f.name]}])")
+    lines.append('    return obj')
+    exec('\n'.join(lines), namespace)
+    mapper = namespace['mapper']
+    cls._row_mappers[columns] = mapper
+    return mapper
+
+
+def _json_mapper(cls, columns: tuple):
+    """
+    Generated row -> dict function producing exactly what to_dict() returns,
+    without building the model (cached per result-set shape)
+    """
+    columns = tuple(columns)
+    mapper = cls._json_mappers.get(columns)
+    if mapper is not None:
+        return mapper
+
+    index = {name: i for i, name in enumerate(columns)}
+    template = cls().to_dict()
+    namespace = {'bool': bool, 'iso_date': iso_date, 'iso_datetime': iso_datetime}
+    items = []
+    for key, default in template.items():
+        if key not in index:
+            namespace[f"default_{key}"] = default
+            items.append(f"{key!r}: default_{key}")
+            continue
+        value = f"row[{index[key]}]"
+        kind = cls._temporal_fields.get(key)
+        if kind is not None:
+            convert = 'iso_date' if kind is date else 'iso_datetime'
+            fallback = f"default_{key}"
+            namespace[fallback] = default
+            items.append(f"{key!r}: {convert}({value}) if {value} else {fallback}")
+        elif key in cls._bool_fields:
+            items.append(f"{key!r}: bool({value})")
+        else:
+            items.append(f"{key!r}: {value}")
+    exec('def mapper(row):\n    return {' + ', '.join(items) + '}', namespace)
+    mapper = namespace['mapper']
+    cls._json_mappers[columns] = mapper
+    return mapper
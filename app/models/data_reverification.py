@@ -1,11 +1,11 @@
 """
 Data Re-verification Model (UC-05)
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime, date
 from typing import Optional
 
-@dataclass
+@model
 class DataReverification:
     """Data Re-verification model"""
     id: Optional[int] = None
@@ -60,7 +60,7 @@ class DataReverification:
             'original_monitoring_id': self.original_monitoring_id,
             'technician_id': self.technician_id,
             'engineer_id': self.engineer_id,
-            'verification_date': self.verification_date.isoformat() if isinstance(self.verification_date, date) else str(self.verification_date),
+            'verification_date': iso(self, 'verification_date'),
             'original_voltage': self.original_voltage,
             'original_current': self.original_current,
             'original_power_factor': self.original_power_factor,
@@ -74,7 +74,7 @@ class DataReverification:
             'comparison_results': self.comparison_results,
             'status': self.status,
             'engineer_approval': self.engineer_approval,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': iso(self, 'created_at')
         }
 
 
@@ -1,11 +1,11 @@
 """
 Delivery/Service Verification Model (UC-13, UC-14, UC-15)
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime, date
 from typing import Optional
 
-@dataclass
+@model
 class DeliveryServiceVerification:
     """Delivery/Service Verification model"""
     id: Optional[int] = None
@@ -52,17 +52,17 @@ class DeliveryServiceVerification:
             'vendor_id': self.vendor_id,
             'equipment_id': self.equipment_id,
             'verification_type': self.verification_type,
-            'delivery_date': self.delivery_date.isoformat() if self.delivery_date else None,
-            'service_date': self.service_date.isoformat() if self.service_date else None,
+            'delivery_date': iso(self, 'delivery_date'),
+            'service_date': iso(self, 'service_date'),
             'engineer_id': self.engineer_id,
             'dgm_id': self.dgm_id,
             'quality_assessment': self.quality_assessment,
             'compliance_status': self.compliance_status,
             'verification_status': self.verification_status,
             'verified_by': self.verified_by,
-            'verified_at': self.verified_at.isoformat() if self.verified_at else None,
+            'verified_at': iso(self, 'verified_at'),
             'supporting_documents': self.supporting_documents,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': iso(self, 'created_at')
         }
 
 
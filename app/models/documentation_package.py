@@ -1,11 +1,11 @@
 """
 Documentation Package Model (UC-09, UC-10)
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@model
 class DocumentationPackage:
     """Documentation Package model"""
     id: Optional[int] = None
@@ -46,14 +46,14 @@ class DocumentationPackage:
             'package_name': self.package_name,
             'documentation_type': self.documentation_type,
             'status': self.status,
-            'completion_date': self.completion_date.isoformat() if self.completion_date else None,
-            'submitted_at': self.submitted_at.isoformat() if self.submitted_at else None,
+            'completion_date': iso(self, 'completion_date'),
+            'submitted_at': iso(self, 'submitted_at'),
             'approved_by': self.approved_by,
-            'approved_at': self.approved_at.isoformat() if self.approved_at else None,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'approved_at': iso(self, 'approved_at'),
+            'created_at': iso(self, 'created_at')
         }
 
-@dataclass
+@model
 class DocumentationItem:
     """Documentation Item model"""
     id: Optional[int] = None
@@ -89,7 +89,7 @@ class DocumentationItem:
             'content': self.content,
             'version': self.version,
             'status': self.status,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': iso(self, 'created_at')
         }
 
 
@@ -1,11 +1,11 @@
 """
 Equipment Model
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime, date
 from typing import Optional
 
-@dataclass
+@model
 class Equipment:
     """Equipment model"""
     id: Optional[int] = None
@@ -42,9 +42,9 @@ class Equipment:
             'equipment_type': self.equipment_type,
             'location': self.location,
             'status': self.status,
-            'last_maintenance_date': self.last_maintenance_date.isoformat() if self.last_maintenance_date else None,
-            'next_maintenance_date': self.next_maintenance_date.isoformat() if self.next_maintenance_date else None,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'last_maintenance_date': iso(self, 'last_maintenance_date'),
+            'next_maintenance_date': iso(self, 'next_maintenance_date'),
+            'created_at': iso(self, 'created_at')
         }
 
 
@@ -0,0 +1,44 @@
+"""
+Equipment Health Model
+"""
+from app.models.base import model, iso
+from datetime import datetime
+from typing import Optional
+
+@model
+class EquipmentHealth:
+    """Materialized health score of an equipment (0-100, lower is worse)"""
+    equipment_id: Optional[int] = None
+    score: float = 100.0
+    readings: int = 0
+    mix_weight: float = 0.0
+    mix_warning: float = 0.0
+    mix_critical: float = 0.0
+    open_faults: int = 0
+    open_fault_severity: float = 0.0
+    open_escalations: int = 0
+    open_discrepancies: int = 0
+    failures: int = 0
+    first_failure_at: Optional[datetime] = None
+    last_failure_at: Optional[datetime] = None
+    mtbf_hours: Optional[float] = None
+    updated_at: Optional[datetime] = None
+
+    def to_dict(self) -> dict:
+        """Convert EquipmentHealth to dictionary"""
+        return {
+            'equipment_id': self.equipment_id,
+            'score': round(self.score, 1),
+            'readings': self.readings,
+            'warning_share': self.mix_warning / self.mix_weight if self.mix_weight else 0.0,
+            'critical_share': self.mix_critical / self.mix_weight if self.mix_weight else 0.0,
+            'open_faults': self.open_faults,
+            'open_fault_severity': self.open_fault_severity,
+            'open_escalations': self.open_escalations,
+            'open_discrepancies': self.open_discrepancies,
+            'failures': self.failures,
+            'first_failure_at': iso(self, 'first_failure_at'),
+            'last_failure_at': iso(self, 'last_failure_at'),
+            'mtbf_hours': self.mtbf_hours,
+            'updated_at': iso(self, 'updated_at')
+        }
@@ -1,11 +1,11 @@
 """
 Escalation Model
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@model
 class Escalation:
     """Escalation model"""
     id: Optional[int] = None
@@ -43,8 +43,8 @@ class Escalation:
             'escalation_reason': self.escalation_reason,
             'escalation_level': self.escalation_level,
             'status': self.status,
-            'escalated_at': self.escalated_at.isoformat() if self.escalated_at else None,
-            'resolved_at': self.resolved_at.isoformat() if self.resolved_at else None
+            'escalated_at': iso(self, 'escalated_at'),
+            'resolved_at': iso(self, 'resolved_at')
         }
 
 
@@ -1,11 +1,11 @@
 """
 Fault Model
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@model
 class Fault:
     """Fault model"""
     id: Optional[int] = None
@@ -40,8 +40,8 @@ class Fault:
             'fault_description': self.fault_description,
             'severity': self.severity,
             'status': self.status,
-            'reported_at': self.reported_at.isoformat() if self.reported_at else None,
-            'resolved_at': self.resolved_at.isoformat() if self.resolved_at else None
+            'reported_at': iso(self, 'reported_at'),
+            'resolved_at': iso(self, 'resolved_at')
         }
 
 
@@ -0,0 +1,29 @@
+"""
+Fault Duplicate Model
+"""
+from app.models.base import model, iso
+from datetime import datetime
+from typing import Optional
+
+@model
+class FaultDuplicate:
+    """A fault report attached to an already open fault of the same equipment"""
+    id: Optional[int] = None
+    fault_id: int = 0
+    reported_by: int = 0
+    fault_description: str = ""
+    severity: str = "low"
+    similarity: float = 0.0
+    reported_at: Optional[datetime] = None
+
+    def to_dict(self) -> dict:
+        """Convert FaultDuplicate to dictionary"""
+        return {
+            'id': self.id,
+            'fault_id': self.fault_id,
+            'reported_by': self.reported_by,
+            'fault_description': self.fault_description,
+            'severity': self.severity,
+            'similarity': self.similarity,
+            'reported_at': iso(self, 'reported_at')
+        }
@@ -0,0 +1,33 @@
+"""
+Maintenance Forecast Model
+"""
+from app.models.base import model, iso
+from datetime import date, datetime
+from typing import Optional
+
+@model
+class MaintenanceForecast:
+    """Suggested maintenance date for an equipment from its monitoring trend"""
+    equipment_id: Optional[int] = None
+    suggested_date: Optional[date] = None
+    crossing_date: Optional[date] = None
+    metric: str = ""
+    limit_value: float = 0.0
+    slope_per_day: float = 0.0
+    confidence: float = 0.0
+    days_used: int = 0
+    computed_at: Optional[datetime] = None
+    
+    def to_dict(self) -> dict:
+        """Convert MaintenanceForecast to dictionary"""
+        return {
+            'equipment_id': self.equipment_id,
+            'suggested_date': iso(self, 'suggested_date'),
+            'crossing_date': iso(self, 'crossing_date'),
+            'metric': self.metric,
+            'limit_value': self.limit_value,
+            'slope_per_day': self.slope_per_day,
+            'confidence': self.confidence,
+            'days_used': self.days_used,
+            'computed_at': iso(self, 'computed_at')
+        }
@@ -1,11 +1,11 @@
 """
 Daily Monitoring Model
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime, date
 from typing import Optional
 
-@dataclass
+@model
 class DailyMonitoring:
     """Daily monitoring data model - APDS: Voltage, Current, Power Factor"""
     id: Optional[int] = None
@@ -43,13 +43,13 @@ class DailyMonitoring:
             'id': self.id,
             'equipment_id': self.equipment_id,
             'technician_id': self.technician_id,
-            'monitoring_date': self.monitoring_date.isoformat() if isinstance(self.monitoring_date, date) else str(self.monitoring_date),
+            'monitoring_date': iso(self, 'monitoring_date'),
             'shift': self.shift,
             'voltage': self.voltage,
             'current': self.current,
             'power_factor': self.power_factor,
             'operational_status': self.operational_status,
             'observations': self.observations,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': iso(self, 'created_at')
         }
 
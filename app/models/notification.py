@@ -1,11 +1,11 @@
 """
 Notification Model
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@model
 class Notification:
     """Notification model"""
     id: Optional[int] = None
@@ -44,7 +44,7 @@ class Notification:
             'is_read': self.is_read,
             'related_entity_type': self.related_entity_type,
             'related_entity_id': self.related_entity_id,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': iso(self, 'created_at')
         }
 
 
@@ -1,11 +1,11 @@
 """
 Performance Report Model (UC-04)
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime, date
 from typing import Optional
 
-@dataclass
+@model
 class PerformanceReport:
     """Performance Report model"""
     id: Optional[int] = None
@@ -44,16 +44,16 @@ class PerformanceReport:
         return {
             'id': self.id,
             'technician_id': self.technician_id,
-            'report_period_start': self.report_period_start.isoformat() if isinstance(self.report_period_start, date) else str(self.report_period_start),
-            'report_period_end': self.report_period_end.isoformat() if isinstance(self.report_period_end, date) else str(self.report_period_end),
+            'report_period_start': iso(self, 'report_period_start'),
+            'report_period_end': iso(self, 'report_period_end'),
             'report_type': self.report_type,
             'analysis': self.analysis,
             'recommendations': self.recommendations,
             'status': self.status,
-            'submitted_at': self.submitted_at.isoformat() if self.submitted_at else None,
+            'submitted_at': iso(self, 'submitted_at'),
             'approved_by': self.approved_by,
-            'approved_at': self.approved_at.isoformat() if self.approved_at else None,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'approved_at': iso(self, 'approved_at'),
+            'created_at': iso(self, 'created_at')
         }
 
 
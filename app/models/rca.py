@@ -1,11 +1,11 @@
 """
 Root Cause Analysis Model
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@model
 class RootCauseAnalysis:
     """Root Cause Analysis model"""
     id: Optional[int] = None
@@ -35,7 +35,7 @@ class RootCauseAnalysis:
             'analyzed_by': self.analyzed_by,
             'root_cause': self.root_cause,
             'contributing_factors': self.contributing_factors,
-            'analysis_date': self.analysis_date.isoformat() if self.analysis_date else None
+            'analysis_date': iso(self, 'analysis_date')
         }
 
 
@@ -1,11 +1,11 @@
 """
 Resolution Report Model
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@model
 class ResolutionReport:
     """Resolution Report model"""
     id: Optional[int] = None
@@ -48,9 +48,9 @@ class ResolutionReport:
             'actions_taken': self.actions_taken,
             'preventive_measures': self.preventive_measures,
             'status': self.status,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'created_at': iso(self, 'created_at'),
             'approved_by': self.approved_by,
-            'approved_at': self.approved_at.isoformat() if self.approved_at else None
+            'approved_at': iso(self, 'approved_at')
         }
 
 
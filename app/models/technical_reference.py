@@ -1,11 +1,11 @@
 """
 Technical Reference Model (UC-07)
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@model
 class TechnicalReference:
     """Technical Reference model for drawings, manuals, history"""
     id: Optional[int] = None
@@ -47,7 +47,7 @@ class TechnicalReference:
             'findings': self.findings,
             'relevance': self.relevance,
             'conclusions': self.conclusions,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': iso(self, 'created_at')
         }
 
 
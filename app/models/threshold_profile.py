@@ -0,0 +1,76 @@
+"""
+Threshold Profile Model
+"""
+from app.models.base import model, iso
+from datetime import datetime
+from typing import Optional
+
+@model
+class ThresholdProfile:
+    """Monitoring threshold profile (default, per equipment type or per equipment)"""
+    id: Optional[int] = None
+    name: str = ""
+    equipment_type: Optional[str] = None
+    equipment_id: Optional[int] = None
+    voltage_warning_low: Optional[float] = None
+    voltage_warning_high: Optional[float] = None
+    voltage_critical_low: Optional[float] = None
+    voltage_critical_high: Optional[float] = None
+    current_warning_max: Optional[float] = None
+    current_critical_max: Optional[float] = None
+    power_factor_warning_min: Optional[float] = None
+    power_factor_critical_min: Optional[float] = None
+    is_active: bool = True
+    revision: int = 0
+    updated_at: Optional[datetime] = None
+    
+    @property
+    def scope(self) -> str:
+        """'equipment', 'equipment_type' or 'default'"""
+        if self.equipment_id is not None:
+            return 'equipment'
+        if self.equipment_type is not None:
+            return 'equipment_type'
+        return 'default'
+    
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Create ThresholdProfile from dictionary"""
+        return cls(
+            id=data.get('id'),
+            name=data.get('name', ''),
+            equipment_type=data.get('equipment_type'),
+            equipment_id=data.get('equipment_id'),
+            voltage_warning_low=data.get('voltage_warning_low'),
+            voltage_warning_high=data.get('voltage_warning_high'),
+            voltage_critical_low=data.get('voltage_critical_low'),
+            voltage_critical_high=data.get('voltage_critical_high'),
+            current_warning_max=data.get('current_warning_max'),
+            current_critical_max=data.get('current_critical_max'),
+            power_factor_warning_min=data.get('power_factor_warning_min'),
+            power_factor_critical_min=data.get('power_factor_critical_min'),
+            is_active=bool(data.get('is_active', True)),
+            revision=data.get('revision', 0),
+            updated_at=datetime.fromisoformat(data['updated_at']) if data.get('updated_at') else None
+        )
+    
+    def to_dict(self) -> dict:
+        """Convert ThresholdProfile to dictionary"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'scope': self.scope,
+            'equipment_type': self.equipment_type,
+            'equipment_id': self.equipment_id,
+            'voltage_warning_low': self.voltage_warning_low,
+            'voltage_warning_high': self.voltage_warning_high,
+            'voltage_critical_low': self.voltage_critical_low,
+            'voltage_critical_high': self.voltage_critical_high,
+            'current_warning_max': self.current_warning_max,
+            'current_critical_max': self.current_critical_max,
+            'power_factor_warning_min': self.power_factor_warning_min,
+            'power_factor_critical_min': self.power_factor_critical_min,
+            'is_active': self.is_active,
+            'revision': self.revision,
+            'updated_at': iso(self, 'updated_at')
+        }
@@ -1,11 +1,11 @@
 """
 User Model
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@model
 class User:
     """User model representing system users"""
     id: Optional[int] = None
@@ -39,7 +39,7 @@ class User:
             'email': self.email,
             'role': self.role,
             'full_name': self.full_name,
-            'created_at': self.created_at.isoformat() if self.created_at else None,
+            'created_at': iso(self, 'created_at'),
             'is_active': self.is_active
         }
     
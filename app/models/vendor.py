@@ -1,11 +1,11 @@
 """
 Vendor Model (UC-15)
 """
-from dataclasses import dataclass
+from app.models.base import model, iso
 from datetime import datetime
 from typing import Optional
 
-@dataclass
+@model
 class Vendor:
     """Vendor model"""
     id: Optional[int] = None
@@ -38,7 +38,7 @@ class Vendor:
             'material_list': self.material_list,
             'vendor_code': self.vendor_code,
             'is_active': self.is_active,
-            'created_at': self.created_at.isoformat() if self.created_at else None
+            'created_at': iso(self, 'created_at')
         }
 
 
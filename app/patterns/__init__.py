@@ -3,7 +3,7 @@ Design Patterns Package
 """
 from app.patterns.factory import RepositoryFactory, ServiceFactory
 from app.patterns.strategy import EscalationStrategy, NotificationStrategy
-from app.patterns.observer import NotificationObserver, Subject
+from app.patterns.observer import NotificationObserver, HealthObserver, ReliabilityObserver, SimilarityObserver, Subject
 from app.database.db_connection import DatabaseConnection
 from app.patterns.template_method import ReportGenerator
 
@@ -13,6 +13,9 @@ __all__ = [
     'EscalationStrategy',
     'NotificationStrategy',
     'NotificationObserver',
+    'HealthObserver',
+    'ReliabilityObserver',
+    'SimilarityObserver',
     'Subject',
     'DatabaseConnection',
     'ReportGenerator'
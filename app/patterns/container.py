@@ -0,0 +1,93 @@
+"""
+Dependency Container
+
+Holds the providers for shared application objects in two scopes:
+  - 'app':     built once per process (stateless services and repositories)
+  - 'request': built once per Flask app context and disposed on teardown
+               (e.g. the database connection a request runs on)
+"""
+import threading
+from flask import g, has_app_context, current_app
+
+APP_SCOPE = 'app'
+REQUEST_SCOPE = 'request'
+
+
+class Container:
+    """Registry of named providers with app and request scoped instances"""
+
+    def __init__(self):
+        self._providers = {}
+        self._instances = {}
+        self._lock = threading.RLock()
+
+    def register(self, name: str, provider, scope: str = APP_SCOPE, dispose=None):
+        """Register a provider; dispose(instance, error) runs when a request instance is released"""
+        if scope not in (APP_SCOPE, REQUEST_SCOPE):
+            raise ValueError(f"Unknown scope: {scope}")
+        with self._lock:
+            self._providers[name] = (provider, scope, dispose)
+            self._instances.pop(name, None)
+
+    def provider(self, scope: str = APP_SCOPE):
+        """Decorator registering a create_<name> factory function as provider '<name>'"""
+        def decorator(create):
+            name = create.__name__
+            if name.startswith('create_'):
+                name = name[len('create_'):]
+            self.register(name, create, scope)
+
+            def resolve():
+                return self.resolve(name)
+            resolve.__name__ = create.__name__
+            resolve.__doc__ = create.__doc__
+            return resolve
+        return decorator
+
+    def resolve(self, name: str):
+        """Instance of a provider for the current scope"""
+        provider, scope, _ = self._providers[name]
+        if scope == REQUEST_SCOPE:
+            if not self.in_request_scope():
+                return provider()
+            instances = g.setdefault('_container_instances', {})
+            if name not in instances:
+                instances[name] = provider()
+            return instances[name]
+
+        instance = self._instances.get(name)
+        if instance is None:
+            with self._lock:
+                instance = self._instances.get(name)
+                if instance is None:
+                    instance = provider()
+                    self._instances[name] = instance
+        return instance
+
+    def existing(self, name: str):
+        """The app-scoped instance of a provider if it was built already, else None"""
+        return self._instances.get(name)
+
+    def in_request_scope(self) -> bool:
+        """True inside an app context whose teardown releases request instances"""
+        return has_app_context() and current_app.extensions.get('container') is self
+
+    def init_app(self, app):
+        """Release request-scoped instances when each app context ends"""
+        app.extensions['container'] = self
+        app.teardown_appcontext(self._dispose_request_instances)
+
+    def _dispose_request_instances(self, error=None):
+        instances = g.pop('_container_instances', None)
+        if not instances:
+            return
+        for name, instance in instances.items():
+            dispose = self._providers[name][2]
+            if dispose is not None:
+                try:
+                    dispose(instance, error)
+                except Exception as e:
+                    print(f"Warning: Could not release request-scoped '{name}': {e}")
+
+
+container = Container()
@@ -16,6 +16,15 @@ from app.repositories.vendor_repository import VendorRepository
 from app.repositories.delivery_verification_repository import DeliveryVerificationRepository
 from app.repositories.data_reverification_repository import DataReverificationRepository
 from app.repositories.documentation_package_repository import DocumentationPackageRepository
+from app.repositories.threshold_profile_repository import ThresholdProfileRepository
+from app.repositories.anomaly_state_repository import AnomalyStateRepository
+from app.repositories.maintenance_forecast_repository import MaintenanceForecastRepository
+from app.repositories.equipment_health_repository import EquipmentHealthRepository
+from app.repositories.reliability_repository import ReliabilityRepository
+from app.repositories.search_repository import SearchRepository
+from app.repositories.fault_similarity_repository import FaultSimilarityRepository
+from app.repositories.idempotency_repository import IdempotencyRepository
+from app.repositories.sync_repository import SyncRepository
 
 from app.services.auth_service import AuthService
 from app.services.performance_report_service import PerformanceReportService
@@ -29,103 +38,238 @@ from app.services.report_service import ReportService
 from app.services.documentation_package_service import DocumentationPackageService
 from app.services.delivery_verification_service import DeliveryVerificationService
 from app.services.vendor_service import VendorService
+from app.services.export_service import ExportService
+from app.services.threshold_service import ThresholdService
+from app.services.reclassification_service import ReclassificationService
+from app.services.anomaly_service import AnomalyService
+from app.services.maintenance_forecast_service import MaintenanceForecastService
+from app.services.equipment_health_service import EquipmentHealthService
+from app.services.reliability_service import ReliabilityService
+from app.services.search_service import SearchService
+from app.services.similar_fault_service import SimilarFaultService
+from app.services.idempotency_service import IdempotencyService
+from app.services.sync_service import SyncService
+from app.patterns.observer import Subject, NotificationObserver, HealthObserver, ReliabilityObserver, SimilarityObserver
+from app.patterns.container import container
 
 class RepositoryFactory:
-    """Factory for creating repository instances"""
+    """Factory for repository instances (app-scoped in the container)"""
     
     @staticmethod
+    @container.provider()
     def create_user_repository():
         return UserRepository()
     
     @staticmethod
+    @container.provider()
     def create_equipment_repository():
         return EquipmentRepository()
     
     @staticmethod
+    @container.provider()
     def create_monitoring_repository():
         return MonitoringRepository()
     
     @staticmethod
+    @container.provider()
     def create_fault_repository():
         return FaultRepository()
     
     @staticmethod
+    @container.provider()
     def create_rca_repository():
         return RCARepository()
     
     @staticmethod
+    @container.provider()
     def create_report_repository():
         return ReportRepository()
     
     @staticmethod
+    @container.provider()
     def create_notification_repository():
         return NotificationRepository()
     
     @staticmethod
+    @container.provider()
     def create_escalation_repository():
         return EscalationRepository()
     
     @staticmethod
+    @container.provider()
     def create_audit_repository():
         return AuditRepository()
     
     @staticmethod
+    @container.provider()
     def create_performance_report_repository():
         return PerformanceReportRepository()
     
     @staticmethod
+    @container.provider()
     def create_technical_reference_repository():
         return TechnicalReferenceRepository()
     
     @staticmethod
+    @container.provider()
     def create_vendor_repository():
         return VendorRepository()
     
     @staticmethod
+    @container.provider()
     def create_delivery_verification_repository():
         return DeliveryVerificationRepository()
     
     @staticmethod
+    @container.provider()
     def create_data_reverification_repository():
         return DataReverificationRepository()
     
     @staticmethod
+    @container.provider()
     def create_documentation_package_repository():
         return DocumentationPackageRepository()
+    
+    @staticmethod
+    @container.provider()
+    def create_threshold_profile_repository():
+        return ThresholdProfileRepository()
+    
+    @staticmethod
+    @container.provider()
+    def create_anomaly_state_repository():
+        return AnomalyStateRepository()
+    
+    @staticmethod
+    @container.provider()
+    def create_maintenance_forecast_repository():
+        return MaintenanceForecastRepository()
+    
+    @staticmethod
+    @container.provider()
+    def create_equipment_health_repository():
+        return EquipmentHealthRepository()
+    
+    @staticmethod
+    @container.provider()
+    def create_reliability_repository():
+        return ReliabilityRepository()
+    
+    @staticmethod
+    @container.provider()
+    def create_search_repository():
+        return SearchRepository()
+    
+    @staticmethod
+    @container.provider()
+    def create_fault_similarity_repository():
+        return FaultSimilarityRepository()
+    
+    @staticmethod
+    @container.provider()
+    def create_idempotency_repository():
+        return IdempotencyRepository()
+    
+    @staticmethod
+    @container.provider()
+    def create_sync_repository():
+        return SyncRepository()
 
 class ServiceFactory:
-    """Factory for creating service instances"""
+    """Factory for service instances (app-scoped in the container)"""
     
     @staticmethod
+    @container.provider()
     def create_auth_service():
         repo = RepositoryFactory.create_user_repository()
-        return AuthService(repo)
+        audit_repo = RepositoryFactory.create_audit_repository()
+        return AuthService(repo, audit_repo)
     
     @staticmethod
+    @container.provider()
     def create_monitoring_service():
         monitoring_repo = RepositoryFactory.create_monitoring_repository()
         equipment_repo = RepositoryFactory.create_equipment_repository()
-        return MonitoringService(monitoring_repo, equipment_repo)
+        return MonitoringService(monitoring_repo, equipment_repo, ServiceFactory.create_threshold_service(),
+                                 ServiceFactory.create_anomaly_service(), ServiceFactory.create_event_bus())
     
     @staticmethod
+    @container.provider()
+    def create_event_bus():
+        events = Subject()
+        events.attach(NotificationObserver(ServiceFactory.create_notification_service()))
+        events.attach(HealthObserver(ServiceFactory.create_equipment_health_service()))
+        events.attach(ReliabilityObserver(ServiceFactory.create_reliability_service()))
+        events.attach(SimilarityObserver(ServiceFactory.create_similar_fault_service()))
+        return events
+    
+    @staticmethod
+    @container.provider()
+    def create_equipment_health_service():
+        return EquipmentHealthService(RepositoryFactory.create_equipment_health_repository())
+    
+    @staticmethod
+    @container.provider()
+    def create_reliability_service():
+        return ReliabilityService(RepositoryFactory.create_reliability_repository())
+    
+    @staticmethod
+    @container.provider()
+    def create_search_service():
+        return SearchService(RepositoryFactory.create_search_repository())
+    
+    @staticmethod
+    @container.provider()
+    def create_similar_fault_service():
+        return SimilarFaultService(RepositoryFactory.create_fault_similarity_repository())
+    
+    @staticmethod
+    @container.provider()
+    def create_idempotency_service():
+        return IdempotencyService(RepositoryFactory.create_idempotency_repository())
+    
+    @staticmethod
+    @container.provider()
+    def create_sync_service():
+        return SyncService(RepositoryFactory.create_sync_repository())
+    
+    @staticmethod
+    @container.provider()
+    def create_anomaly_service():
+        state_repo = RepositoryFactory.create_anomaly_state_repository()
+        return AnomalyService(state_repo, ServiceFactory.create_event_bus())
+    
+    @staticmethod
+    @container.provider()
+    def create_threshold_service():
+        threshold_repo = RepositoryFactory.create_threshold_profile_repository()
+        equipment_repo = RepositoryFactory.create_equipment_repository()
+        return ThresholdService(threshold_repo, equipment_repo)
+    
+    @staticmethod
+    @container.provider()
     def create_fault_service():
         fault_repo = RepositoryFactory.create_fault_repository()
         equipment_repo = RepositoryFactory.create_equipment_repository()
-        return FaultService(fault_repo, equipment_repo)
+        return FaultService(fault_repo, equipment_repo, ServiceFactory.create_event_bus())
     
     @staticmethod
+    @container.provider()
     def create_escalation_service():
         escalation_repo = RepositoryFactory.create_escalation_repository()
         fault_repo = RepositoryFactory.create_fault_repository()
         user_repo = RepositoryFactory.create_user_repository()
-        return EscalationService(escalation_repo, fault_repo, user_repo)
+        return EscalationService(escalation_repo, fault_repo, user_repo, ServiceFactory.create_event_bus())
     
     @staticmethod
+    @container.provider()
     def create_notification_service():
         notification_repo = RepositoryFactory.create_notification_repository()
-        return NotificationService(notification_repo)
+        user_repo = RepositoryFactory.create_user_repository()
+        return NotificationService(notification_repo, user_repo)
     
     @staticmethod
+    @container.provider()
     def create_report_service():
         report_repo = RepositoryFactory.create_report_repository()
         rca_repo = RepositoryFactory.create_rca_repository()
@@ -133,29 +277,34 @@ class ServiceFactory:
         return ReportService(report_repo, rca_repo, fault_repo)
     
     @staticmethod
+    @container.provider()
     def create_performance_report_service():
         report_repo = RepositoryFactory.create_performance_report_repository()
         monitoring_repo = RepositoryFactory.create_monitoring_repository()
         return PerformanceReportService(report_repo, monitoring_repo)
     
     @staticmethod
+    @container.provider()
     def create_data_reverification_service():
         reverification_repo = RepositoryFactory.create_data_reverification_repository()
         monitoring_repo = RepositoryFactory.create_monitoring_repository()
-        return DataReverificationService(reverification_repo, monitoring_repo)
+        return DataReverificationService(reverification_repo, monitoring_repo, ServiceFactory.create_event_bus())
     
     @staticmethod
+    @container.provider()
     def create_technical_reference_service():
         reference_repo = RepositoryFactory.create_technical_reference_repository()
         return TechnicalReferenceService(reference_repo)
     
     @staticmethod
+    @container.provider()
     def create_documentation_package_service():
         package_repo = RepositoryFactory.create_documentation_package_repository()
         fault_repo = RepositoryFactory.create_fault_repository()
         return DocumentationPackageService(package_repo, fault_repo)
     
     @staticmethod
+    @container.provider()
     def create_delivery_verification_service():
         verification_repo = RepositoryFactory.create_delivery_verification_repository()
         vendor_repo = RepositoryFactory.create_vendor_repository()
@@ -163,6 +312,25 @@ class ServiceFactory:
         return DeliveryVerificationService(verification_repo, vendor_repo, equipment_repo)
     
     @staticmethod
+    @container.provider()
     def create_vendor_service():
         vendor_repo = RepositoryFactory.create_vendor_repository()
         return VendorService(vendor_repo)
+    
+    @staticmethod
+    @container.provider()
+    def create_export_service():
+        return ExportService()
+    
+    @staticmethod
+    @container.provider()
+    def create_reclassification_service():
+        return ReclassificationService(ServiceFactory.create_threshold_service(),
+                                       ServiceFactory.create_equipment_health_service())
+    
+    @staticmethod
+    @container.provider()
+    def create_maintenance_forecast_service():
+        forecast_repo = RepositoryFactory.create_maintenance_forecast_repository()
+        equipment_repo = RepositoryFactory.create_equipment_repository()
+        return MaintenanceForecastService(forecast_repo, equipment_repo, ServiceFactory.create_threshold_service())
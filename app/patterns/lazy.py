@@ -0,0 +1,37 @@
+"""
+Lazy Initialization Pattern
+"""
+import threading
+
+
+class LazyController:
+    """
+    Proxy that builds a controller on first attribute access.
+    Route modules can declare their controllers at import time without
+    paying for service and repository construction until a request needs them.
+    """
+
+    def __init__(self, factory):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_lock', threading.Lock())
+
+    def _get_instance(self):
+        instance = self._instance
+        if instance is None:
+            with self._lock:
+                instance = self._instance
+                if instance is None:
+                    instance = self._factory()
+                    object.__setattr__(self, '_instance', instance)
+        return instance
+
+    def __getattr__(self, name):
+        return getattr(self._get_instance(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self._get_instance(), name, value)
+
+    def __repr__(self):
+        state = 'built' if self._instance is not None else 'pending'
+        return f"<LazyController {getattr(self._factory, '__name__', self._factory)} ({state})>"
@@ -29,9 +29,12 @@ class Subject:
             self._observers.remove(observer)
     
     def notify(self, event_type: str, data: dict):
-        """Notify all observers"""
+        """Notify all observers (a failing observer never fails the change that raised the event)"""
         for observer in self._observers:
-            observer.update(event_type, data)
+            try:
+                observer.update(event_type, data)
+            except Exception as e:
+                print(f"Warning: {type(observer).__name__} failed on '{event_type}': {e}")
 
 class NotificationObserver(Observer):
     """Observer that handles notifications"""
@@ -43,12 +46,16 @@ class NotificationObserver(Observer):
         """Handle notification events"""
         if event_type == 'fault_reported':
             self._handle_fault_reported(data)
+        elif event_type == 'fault_severity_raised':
+            self._handle_fault_severity_raised(data)
         elif event_type == 'fault_escalated':
             self._handle_fault_escalated(data)
         elif event_type == 'report_pending_approval':
             self._handle_report_pending(data)
         elif event_type == 'report_approved':
             self._handle_report_approved(data)
+        elif event_type == 'monitoring_anomaly':
+            self._handle_monitoring_anomaly(data)
     
     def _handle_fault_reported(self, data: dict):
         """Handle fault reported event"""
@@ -64,6 +71,19 @@ class NotificationObserver(Observer):
                 related_entity_id=fault.id
             )
     
+    def _handle_fault_severity_raised(self, data: dict):
+        """Handle a duplicate report raising an open fault to high or critical"""
+        fault = data.get('fault')
+        if fault and fault.severity in ['high', 'critical'] and data.get('previous_severity') not in ['high', 'critical']:
+            self.notification_service.create_notification_for_role(
+                role='engineer',
+                title='Fault Severity Raised',
+                message=f"Fault raised to {fault.severity}: {fault.fault_description}",
+                notification_type='error',
+                related_entity_type='fault',
+                related_entity_id=fault.id
+            )
+    
     def _handle_fault_escalated(self, data: dict):
         """Handle fault escalated event"""
         escalation = data.get('escalation')
@@ -103,7 +123,71 @@ class NotificationObserver(Observer):
                 related_entity_type='report',
                 related_entity_id=report.id
             )
+    
+    def _handle_monitoring_anomaly(self, data: dict):
+        """Handle monitoring anomaly event"""
+        equipment = data.get('equipment')
+        monitoring = data.get('monitoring')
+        anomalies = data.get('anomalies')
+        if equipment and monitoring and anomalies:
+            self.notification_service.create_notification_for_role(
+                role='engineer',
+                title='Monitoring Anomaly',
+                message=f"{equipment.equipment_name}: " + '; '.join(a.describe() for a in anomalies),
+                notification_type='warning',
+                related_entity_type='monitoring',
+                related_entity_id=monitoring.id
+            )
+
 
 
 
 
+
+class HealthObserver(Observer):
+    """Observer that keeps the materialized equipment health current"""
+    
+    def __init__(self, health_service):
+        self.health_service = health_service
+    
+    def update(self, event_type: str, data: dict):
+        """Handle events that move an equipment's health"""
+        if event_type == 'monitoring_recorded':
+            self.health_service.record_reading(data['monitoring'])
+        elif event_type == 'fault_reported':
+            self.health_service.fault_reported(data['fault'])
+        elif event_type == 'fault_status_changed':
+            self.health_service.fault_status_changed(data['fault'], data['previous_status'])
+        elif event_type == 'fault_severity_raised':
+            self.health_service.fault_severity_changed(data['fault'], data['previous_severity'])
+        elif event_type == 'fault_escalated':
+            self.health_service.escalation_changed(data['fault'], opened=True)
+        elif event_type == 'escalation_resolved':
+            self.health_service.escalation_changed(data['fault'], opened=False)
+        elif event_type == 'data_discrepancy':
+            self.health_service.discrepancy_changed(data['monitoring'], opened=True)
+        elif event_type == 'discrepancy_resolved':
+            self.health_service.discrepancy_changed(data['monitoring'], opened=False)
+
+
+class ReliabilityObserver(Observer):
+    """Observer that drops cached reliability figures when the fault history changes"""
+    
+    def __init__(self, reliability_service):
+        self.reliability_service = reliability_service
+    
+    def update(self, event_type: str, data: dict):
+        """Handle fault events"""
+        if event_type in ('fault_reported', 'fault_status_changed'):
+            self.reliability_service.invalidate()
+
+class SimilarityObserver(Observer):
+    """Observer that reindexes faults for similar-fault suggestions when their status changes"""
+    
+    def __init__(self, similar_fault_service):
+        self.similar_fault_service = similar_fault_service
+    
+    def update(self, event_type: str, data: dict):
+        """Handle fault status changes (resolving adds a fault, reopening removes it)"""
+        if event_type == 'fault_status_changed':
+            self.similar_fault_service.fault_changed(data['fault'].id)
@@ -0,0 +1,13 @@
+"""
+Request profiling module
+"""
+from flask import Flask
+from app.profiling.request_profiler import RequestProfiler, StackSampler
+
+def init_profiling(app: Flask):
+    """Initialize request profiling hooks"""
+    profiler = RequestProfiler()
+    profiler.init_app(app)
+    return profiler
+
+__all__ = ['RequestProfiler', 'StackSampler', 'init_profiling']
@@ -0,0 +1,224 @@
+"""
+Request Profiler - opt-in per-request profiling middleware
+"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from datetime import datetime
+from flask import g, request, session
+from app.models.user import User
+
+
+class StackSampler:
+    """
+    Samples the call stack of one thread at a fixed interval.
+    Produces flamegraph-compatible collapsed stacks ("a;b;c count").
+    """
+
+    def __init__(self, thread_id: int, interval: float = 0.005):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.samples = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='apds-stack-sampler', daemon=True)
+
+    def start(self):
+        """Start sampling in a background thread"""
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling and wait for the sampler thread"""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}:{frame.f_lineno}")
+                frame = frame.f_back
+            key = ';'.join(reversed(stack))
+            self.samples[key] = self.samples.get(key, 0) + 1
+
+    def collapsed(self) -> str:
+        """Return samples in collapsed-stack format"""
+        return '\n'.join(f"{stack} {count}" for stack, count in sorted(self.samples.items()))
+
+
+class RequestProfiler:
+    """
+    Profiles individual requests when asked to (header or query flag from an
+    authorized user) or when picked by the configured sampling rate.
+    Stores top-N stats, raw pstats and collapsed stacks under PROFILE_DIR.
+    """
+
+    HEADER = 'X-APDS-Profile'
+    QUERY_FLAG = '_profile'
+
+    def __init__(self, app=None):
+        # cProfile can only run one profiler at a time reliably; extra requests are skipped
+        self._lock = threading.Lock()
+        self.app = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """Register request hooks on the Flask app"""
+        app.config.setdefault('PROFILING_ENABLED', True)
+        app.config.setdefault('PROFILE_DIR', os.path.join(os.path.dirname(app.root_path), 'profiles'))
+        app.config.setdefault('PROFILE_SAMPLE_RATE', 0.0)
+        app.config.setdefault('PROFILE_TOP_N', 40)
+        app.config.setdefault('PROFILE_ROLE', 'dm')
+        app.config.setdefault('PROFILE_SAMPLING_INTERVAL', 0.005)
+        app.config.setdefault('PROFILE_KEEP', 200)
+        self.app = app
+        app.extensions['request_profiler'] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+
+    @property
+    def profile_dir(self) -> str:
+        return self.app.config['PROFILE_DIR']
+
+    def is_authorized(self) -> bool:
+        """Check if the current session may request profiles / view them"""
+        role = session.get('role')
+        if not role:
+            return False
+        return User(role=role).has_permission(self.app.config['PROFILE_ROLE'])
+
+    def _requested_trigger(self):
+        """Return the trigger reason for this request, or None"""
+        if request.endpoint == 'static' or request.path.startswith('/admin/profiles'):
+            return None
+        flag = request.headers.get(self.HEADER) or request.args.get(self.QUERY_FLAG)
+        if flag and flag.lower() in ('1', 'true', 'yes') and self.is_authorized():
+            return 'requested'
+        rate = self.app.config['PROFILE_SAMPLE_RATE']
+        if rate and random.random() < rate:
+            return 'sampled'
+        return None
+
+    def _before_request(self):
+        if not self.app.config['PROFILING_ENABLED']:
+            return None
+        trigger = self._requested_trigger()
+        if not trigger or not self._lock.acquire(blocking=False):
+            return None
+
+        profiler = cProfile.Profile()
+        sampler = StackSampler(threading.get_ident(), self.app.config['PROFILE_SAMPLING_INTERVAL'])
+        g._apds_profile = {
+            'trigger': trigger,
+            'profiler': profiler,
+            'sampler': sampler,
+            'started': time.perf_counter(),
+        }
+        sampler.start()
+        profiler.enable()
+        return None
+
+    def _after_request(self, response):
+        state = g.pop('_apds_profile', None)
+        if state is None:
+            return response
+        try:
+            duration = self._stop(state)
+            profile_id = self._save(state, duration, response.status_code)
+            response.headers['X-APDS-Profile-Id'] = profile_id
+        except Exception as e:
+            print(f"Warning: Could not save request profile: {e}")
+        finally:
+            self._lock.release()
+        return response
+
+    def _teardown_request(self, exc=None):
+        # Request failed before after_request ran - stop profiling without saving
+        state = g.pop('_apds_profile', None)
+        if state is not None:
+            self._stop(state)
+            self._lock.release()
+
+    def _stop(self, state: dict) -> float:
+        state['profiler'].disable()
+        state['sampler'].stop()
+        return time.perf_counter() - state['started']
+
+    def _save(self, state: dict, duration: float, status_code: int) -> str:
+        """Write profile artifacts and return the profile ID"""
+        os.makedirs(self.profile_dir, exist_ok=True)
+        slug = re.sub(r'[^A-Za-z0-9]+', '-', request.path).strip('-') or 'root'
+        profile_id = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{request.method.lower()}-{slug[:60]}-{uuid.uuid4().hex[:6]}"
+        base = os.path.join(self.profile_dir, profile_id)
+
+        profiler = state['profiler']
+        profiler.dump_stats(base + '.prof')
+
+        stream = io.StringIO()
+        stats = pstats.Stats(profiler, stream=stream)
+        stats.strip_dirs().sort_stats('cumulative').print_stats(self.app.config['PROFILE_TOP_N'])
+        with open(base + '.txt', 'w', encoding='utf-8') as f:
+            f.write(stream.getvalue())
+
+        with open(base + '.collapsed', 'w', encoding='utf-8') as f:
+            f.write(state['sampler'].collapsed())
+
+        meta = {
+            'id': profile_id,
+            'method': request.method,
+            'path': request.full_path.rstrip('?'),
+            'endpoint': request.endpoint,
+            'status_code': status_code,
+            'duration_ms': round(duration * 1000, 2),
+            'trigger': state['trigger'],
+            'user_id': session.get('user_id'),
+            'samples': sum(state['sampler'].samples.values()),
+            'created_at': datetime.now().isoformat()
+        }
+        with open(base + '.json', 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+
+        self._prune()
+        return profile_id
+
+    def _prune(self):
+        """Keep only the most recent PROFILE_KEEP profiles"""
+        profiles = self._meta_files()
+        for name in profiles[self.app.config['PROFILE_KEEP']:]:
+            profile_id = name[:-len('.json')]
+            for ext in ('.json', '.prof', '.txt', '.collapsed'):
+                try:
+                    os.remove(os.path.join(self.profile_dir, profile_id + ext))
+                except OSError:
+                    pass
+
+    def _meta_files(self) -> list:
+        """Metadata file names, newest first"""
+        if not os.path.isdir(self.profile_dir):
+            return []
+        names = [n for n in os.listdir(self.profile_dir) if n.endswith('.json')]
+        return sorted(names, reverse=True)
+
+    def list_profiles(self, limit: int = 50) -> list:
+        """Return metadata of recent profiles, newest first"""
+        profiles = []
+        for name in self._meta_files()[:limit]:
+            try:
+                with open(os.path.join(self.profile_dir, name), encoding='utf-8') as f:
+                    profiles.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        return profiles
@@ -0,0 +1,24 @@
+"""
+Anomaly State Repository
+"""
+from app.repositories.base_repository import BaseRepository
+
+STATE_COLUMNS = ('equipment_id', 'metric', 'count', 'mean', 'variance', 'fast_mean',
+                 'rate_variance', 'last_value', 'last_at', 'flags')
+
+class AnomalyStateRepository(BaseRepository):
+    """Repository for the anomaly detector's state table"""
+    
+    def find_all(self) -> list:
+        """All series states as tuples in STATE_COLUMNS order"""
+        query = f"SELECT {', '.join(STATE_COLUMNS)} FROM anomaly_state"
+        return [tuple(row) for row in self.fetch_all(query)]
+    
+    def save_all(self, rows: list):
+        """Insert or replace series states (tuples in STATE_COLUMNS order)"""
+        query = f"""
+            INSERT OR REPLACE INTO anomaly_state ({', '.join(STATE_COLUMNS)})
+            VALUES ({', '.join('?' for _ in STATE_COLUMNS)})
+        """
+        self.execute_many(query, rows)
+        self.commit()
@@ -10,13 +10,11 @@ class BaseRepository(ABC):
     
     def __init__(self):
         self.db = DatabaseConnection()
-        self.conn = self.db.get_connection()
-        # Ensure foreign keys are enabled on this connection
-        if self.conn:
-            try:
-                self.conn.execute("PRAGMA foreign_keys = ON")
-            except:
-                pass
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Connection for the current request (profile PRAGMAs already applied)"""
+        return self.db.get_connection()
     
     def execute_query(self, query: str, params: tuple = None, retries: int = 3):
         """Execute a query and return cursor with retry logic for database locks"""
@@ -153,6 +151,34 @@ class BaseRepository(ABC):
             return dict(row)
         return None
     
+    def rows_to_json(self, rows, model_cls) -> list:
+        """Map rows straight to to_dict()-shaped dicts without building models (read-only lists)"""
+        if not rows:
+            return []
+        mapper = model_cls.json_mapper(tuple(rows[0].keys()))
+        return [mapper(row) for row in rows]
+    
+    def iter_json(self, query: str, params: tuple, model_cls, batch_size: int = 500):
+        """
+        Run the query now and return a generator that yields to_dict()-shaped
+        dicts from the open cursor in batches, so memory stays flat for large results
+        """
+        cursor = self.execute_query(query, params)
+        mapper = model_cls.json_mapper(tuple(column[0] for column in cursor.description))
+        
+        def rows():
+            try:
+                while True:
+                    batch = cursor.fetchmany(batch_size)
+                    if not batch:
+                        break
+                    for row in batch:
+                        yield mapper(row)
+            finally:
+                cursor.close()
+        
+        return rows()
+    
     def rows_to_dicts(self, rows):
         """Convert multiple rows to list of dictionaries"""
         return [dict(row) for row in rows] if rows else []
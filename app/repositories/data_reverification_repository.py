@@ -45,8 +45,7 @@ class DataReverificationRepository(BaseRepository):
         query = "SELECT * FROM data_reverification WHERE id = ?"
         row = self.fetch_one(query, (reverification_id,))
         if row:
-            data = self.dict_to_row(row)
-            return DataReverification.from_dict(data)
+            return DataReverification.from_row(row)
         return None
     
     def find_by_technician(self, technician_id: int) -> list:
@@ -57,7 +56,7 @@ class DataReverificationRepository(BaseRepository):
             ORDER BY verification_date DESC
         """
         rows = self.fetch_all(query, (technician_id,))
-        return [DataReverification.from_dict(self.dict_to_row(row)) for row in rows]
+        return DataReverification.from_rows(rows)
     
     def find_pending_approval(self) -> list:
         """Find re-verifications pending engineer approval"""
@@ -67,7 +66,7 @@ class DataReverificationRepository(BaseRepository):
             ORDER BY verification_date DESC
         """
         rows = self.fetch_all(query)
-        return [DataReverification.from_dict(self.dict_to_row(row)) for row in rows]
+        return DataReverification.from_rows(rows)
     
     def update(self, reverification: DataReverification) -> bool:
         """Update re-verification"""
@@ -40,8 +40,7 @@ class DeliveryVerificationRepository(BaseRepository):
         query = "SELECT * FROM delivery_service_verification WHERE id = ?"
         row = self.fetch_one(query, (verification_id,))
         if row:
-            data = self.dict_to_row(row)
-            return DeliveryServiceVerification.from_dict(data)
+            return DeliveryServiceVerification.from_row(row)
         return None
     
     def find_by_vendor(self, vendor_id: int) -> list:
@@ -52,7 +51,7 @@ class DeliveryVerificationRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = self.fetch_all(query, (vendor_id,))
-        return [DeliveryServiceVerification.from_dict(self.dict_to_row(row)) for row in rows]
+        return DeliveryServiceVerification.from_rows(rows)
     
     def find_pending_verification(self) -> list:
         """Find pending verifications"""
@@ -62,7 +61,7 @@ class DeliveryVerificationRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = self.fetch_all(query)
-        return [DeliveryServiceVerification.from_dict(self.dict_to_row(row)) for row in rows]
+        return DeliveryServiceVerification.from_rows(rows)
     
     def update(self, verification: DeliveryServiceVerification) -> bool:
         """Update verification"""
@@ -29,8 +29,7 @@ class DocumentationPackageRepository(BaseRepository):
         query = "SELECT * FROM documentation_packages WHERE id = ?"
         row = self.fetch_one(query, (package_id,))
         if row:
-            data = self.dict_to_row(row)
-            return DocumentationPackage.from_dict(data)
+            return DocumentationPackage.from_row(row)
         return None
     
     def find_packages_by_fault(self, fault_id: int) -> list:
@@ -41,7 +40,7 @@ class DocumentationPackageRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = self.fetch_all(query, (fault_id,))
-        return [DocumentationPackage.from_dict(self.dict_to_row(row)) for row in rows]
+        return DocumentationPackage.from_rows(rows)
     
     def find_packages_by_engineer(self, engineer_id: int) -> list:
         """Find packages by engineer"""
@@ -51,7 +50,7 @@ class DocumentationPackageRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = self.fetch_all(query, (engineer_id,))
-        return [DocumentationPackage.from_dict(self.dict_to_row(row)) for row in rows]
+        return DocumentationPackage.from_rows(rows)
     
     def find_pending_submission(self) -> list:
         """Find packages pending submission"""
@@ -61,7 +60,7 @@ class DocumentationPackageRepository(BaseRepository):
             ORDER BY completion_date DESC
         """
         rows = self.fetch_all(query)
-        return [DocumentationPackage.from_dict(self.dict_to_row(row)) for row in rows]
+        return DocumentationPackage.from_rows(rows)
     
     def find_pending_approval(self) -> list:
         """Find packages pending approval"""
@@ -71,7 +70,7 @@ class DocumentationPackageRepository(BaseRepository):
             ORDER BY submitted_at DESC
         """
         rows = self.fetch_all(query)
-        return [DocumentationPackage.from_dict(self.dict_to_row(row)) for row in rows]
+        return DocumentationPackage.from_rows(rows)
     
     def update_package(self, package: DocumentationPackage) -> bool:
         """Update package"""
@@ -120,8 +119,7 @@ class DocumentationPackageRepository(BaseRepository):
         query = "SELECT * FROM documentation_items WHERE id = ?"
         row = self.fetch_one(query, (item_id,))
         if row:
-            data = self.dict_to_row(row)
-            return DocumentationItem.from_dict(data)
+            return DocumentationItem.from_row(row)
         return None
     
     def find_items_by_package(self, package_id: int) -> list:
@@ -132,7 +130,7 @@ class DocumentationPackageRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = self.fetch_all(query, (package_id,))
-        return [DocumentationItem.from_dict(self.dict_to_row(row)) for row in rows]
+        return DocumentationItem.from_rows(rows)
     
     def update_item(self, item: DocumentationItem) -> bool:
         """Update item"""
@@ -0,0 +1,125 @@
+"""
+Equipment Health Repository
+"""
+from app.repositories.base_repository import BaseRepository
+from app.models.equipment_health import EquipmentHealth
+from app.database.db_connection import EQUIPMENT_HEALTH_REBUILD, EQUIPMENT_HEALTH_MIX_REFRESH
+
+# Open-item counters adjust() may change
+COUNTERS = ('open_escalations', 'open_discrepancies')
+
+class EquipmentHealthRepository(BaseRepository):
+    """Repository for the materialized equipment health table (score is a generated column)"""
+
+    def record_reading(self, equipment_id: int, status: str, decay: float):
+        """Fold one reading's status into the decayed recent status mix"""
+        query = """
+            INSERT INTO equipment_health (equipment_id, readings, mix_weight, mix_warning, mix_critical)
+            VALUES (:id, 1, :decay, :decay * :warning, :decay * :critical)
+            ON CONFLICT (equipment_id) DO UPDATE SET
+                readings = readings + 1,
+                mix_weight = mix_weight * (1 - :decay) + :decay,
+                mix_warning = mix_warning * (1 - :decay) + :decay * :warning,
+                mix_critical = mix_critical * (1 - :decay) + :decay * :critical,
+                updated_at = CURRENT_TIMESTAMP
+        """
+        self.execute_query(query, {
+            'id': equipment_id,
+            'decay': decay,
+            'warning': 1.0 if status == 'warning' else 0.0,
+            'critical': 1.0 if status == 'critical' else 0.0
+        })
+        self.commit()
+
+    def record_failure(self, equipment_id: int, severity_weight: float, reported_at: str):
+        """Count a newly reported fault: one more open fault and failure, MTBF updated"""
+        query = """
+            INSERT INTO equipment_health
+                (equipment_id, open_faults, open_fault_severity, failures, first_failure_at, last_failure_at)
+            VALUES (:id, 1, :weight, 1, :at, :at)
+            ON CONFLICT (equipment_id) DO UPDATE SET
+                open_faults = open_faults + 1,
+                open_fault_severity = open_fault_severity + :weight,
+                failures = failures + 1,
+                first_failure_at = COALESCE(min(first_failure_at, :at), :at),
+                last_failure_at = COALESCE(max(last_failure_at, :at), :at),
+                mtbf_hours = CASE WHEN failures > 0 THEN
+                    (julianday(COALESCE(max(last_failure_at, :at), :at))
+                     - julianday(COALESCE(min(first_failure_at, :at), :at))) * 24.0 / failures
+                END,
+                updated_at = CURRENT_TIMESTAMP
+        """
+        self.execute_query(query, {'id': equipment_id, 'weight': severity_weight, 'at': reported_at})
+        self.commit()
+
+    def adjust_open_faults(self, equipment_id: int, count: int, severity_weight: float):
+        """Add (reopened) or remove (resolved) open faults without counting a failure"""
+        query = """
+            INSERT INTO equipment_health (equipment_id, open_faults, open_fault_severity)
+            VALUES (:id, max(:count, 0), max(:weight, 0.0))
+            ON CONFLICT (equipment_id) DO UPDATE SET
+                open_faults = max(open_faults + :count, 0),
+                open_fault_severity = max(open_fault_severity + :weight, 0.0),
+                updated_at = CURRENT_TIMESTAMP
+        """
+        self.execute_query(query, {'id': equipment_id, 'count': count, 'weight': severity_weight})
+        self.commit()
+
+    def adjust(self, equipment_id: int, counter: str, delta: int):
+        """Change an open-item counter (see COUNTERS), never below zero"""
+        if counter not in COUNTERS:
+            raise ValueError(f"Unknown health counter: {counter}")
+        query = f"""
+            INSERT INTO equipment_health (equipment_id, {counter}) VALUES (:id, max(:delta, 0))
+            ON CONFLICT (equipment_id) DO UPDATE SET
+                {counter} = max({counter} + :delta, 0),
+                updated_at = CURRENT_TIMESTAMP
+        """
+        self.execute_query(query, {'id': equipment_id, 'delta': delta})
+        self.commit()
+
+    def find_worst(self, limit: int = 50, offset: int = 0) -> list:
+        """(EquipmentHealth, equipment row) pairs, lowest score first (walks the score index)"""
+        query = """
+            SELECT h.*, e.equipment_code, e.equipment_name, e.equipment_type, e.location, e.status
+            FROM (
+                SELECT * FROM equipment_health ORDER BY score, equipment_id LIMIT ? OFFSET ?
+            ) h
+            JOIN equipment e ON e.id = h.equipment_id
+            ORDER BY h.score, h.equipment_id
+        """
+        rows = self.fetch_all(query, (limit, offset))
+        return list(zip(EquipmentHealth.from_rows(rows), rows))
+
+    def find_by_equipment(self, equipment_id: int) -> EquipmentHealth:
+        """Health of one equipment"""
+        query = "SELECT * FROM equipment_health WHERE equipment_id = ?"
+        row = self.fetch_one(query, (equipment_id,))
+        if row:
+            return EquipmentHealth.from_row(row)
+        return None
+
+    def rank_of(self, score: float, equipment_id: int) -> int:
+        """1-based position of an equipment in the worst-first ranking"""
+        query = """
+            SELECT COUNT(*) + 1 FROM equipment_health
+            WHERE score < ? OR (score = ? AND equipment_id < ?)
+        """
+        return self.fetch_one(query, (score, score, equipment_id))[0]
+
+    def refresh_status_mix(self, equipment_ids: list, decay: float) -> int:
+        """Recompute the status mix of the given equipment (None: all) from their latest readings"""
+        if equipment_ids is None:
+            equipment_ids = [row[0] for row in self.fetch_all("SELECT equipment_id FROM equipment_health")]
+        # One short transaction per equipment keeps writers moving
+        for equipment_id in equipment_ids:
+            self.execute_query(EQUIPMENT_HEALTH_MIX_REFRESH, {'id': equipment_id, 'decay': decay})
+            self.commit()
+        return len(equipment_ids)
+
+    def rebuild(self, decay: float) -> int:
+        """Recompute every equipment's health from the source tables"""
+        self.execute_query("DELETE FROM equipment_health")
+        self.execute_query(EQUIPMENT_HEALTH_REBUILD, {'decay': decay})
+        self.commit()
+        return self.fetch_one("SELECT COUNT(*) FROM equipment_health")[0]
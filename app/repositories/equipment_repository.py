@@ -2,6 +2,7 @@
 Equipment Repository
 """
 from app.repositories.base_repository import BaseRepository
+from app.repositories.status_board import latest_readings
 from app.models.equipment import Equipment
 
 class EquipmentRepository(BaseRepository):
@@ -24,6 +25,7 @@ class EquipmentRepository(BaseRepository):
             equipment.next_maintenance_date.isoformat() if equipment.next_maintenance_date else None
         ))
         self.commit()
+        latest_readings.invalidate()
         return cursor.lastrowid
     
     def find_by_id(self, equipment_id: int) -> Equipment:
@@ -31,8 +33,7 @@ class EquipmentRepository(BaseRepository):
         query = "SELECT * FROM equipment WHERE id = ?"
         row = self.fetch_one(query, (equipment_id,))
         if row:
-            data = self.dict_to_row(row)
-            return Equipment.from_dict(data)
+            return Equipment.from_row(row)
         return None
     
     def find_by_code(self, code: str) -> Equipment:
@@ -40,21 +41,20 @@ class EquipmentRepository(BaseRepository):
         query = "SELECT * FROM equipment WHERE equipment_code = ?"
         row = self.fetch_one(query, (code,))
         if row:
-            data = self.dict_to_row(row)
-            return Equipment.from_dict(data)
+            return Equipment.from_row(row)
         return None
     
     def find_all(self) -> list:
         """Find all equipment"""
         query = "SELECT * FROM equipment ORDER BY equipment_name"
         rows = self.fetch_all(query)
-        return [Equipment.from_dict(self.dict_to_row(row)) for row in rows]
+        return Equipment.from_rows(rows)
     
     def find_by_status(self, status: str) -> list:
         """Find equipment by status"""
         query = "SELECT * FROM equipment WHERE status = ?"
         rows = self.fetch_all(query, (status,))
-        return [Equipment.from_dict(self.dict_to_row(row)) for row in rows]
+        return Equipment.from_rows(rows)
     
     def update(self, equipment: Equipment) -> bool:
         """Update equipment"""
@@ -74,6 +74,7 @@ class EquipmentRepository(BaseRepository):
             equipment.id
         ))
         self.commit()
+        latest_readings.put(equipment.id, equipment.to_dict())
         return True
 
 
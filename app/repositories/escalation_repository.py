@@ -30,15 +30,14 @@ class EscalationRepository(BaseRepository):
         query = "SELECT * FROM escalations WHERE id = ?"
         row = self.fetch_one(query, (escalation_id,))
         if row:
-            data = self.dict_to_row(row)
-            return Escalation.from_dict(data)
+            return Escalation.from_row(row)
         return None
     
     def find_by_fault(self, fault_id: int) -> list:
         """Find escalations by fault"""
         query = "SELECT * FROM escalations WHERE fault_id = ? ORDER BY escalated_at DESC"
         rows = self.fetch_all(query, (fault_id,))
-        return [Escalation.from_dict(self.dict_to_row(row)) for row in rows]
+        return Escalation.from_rows(rows)
     
     def find_by_user(self, user_id: int) -> list:
         """Find escalations for user"""
@@ -48,13 +47,13 @@ class EscalationRepository(BaseRepository):
             ORDER BY escalated_at DESC
         """
         rows = self.fetch_all(query, (user_id,))
-        return [Escalation.from_dict(self.dict_to_row(row)) for row in rows]
+        return Escalation.from_rows(rows)
     
     def find_pending(self) -> list:
         """Find pending escalations"""
         query = "SELECT * FROM escalations WHERE status = 'pending' ORDER BY escalated_at DESC"
         rows = self.fetch_all(query)
-        return [Escalation.from_dict(self.dict_to_row(row)) for row in rows]
+        return Escalation.from_rows(rows)
     
     def update(self, escalation: Escalation) -> bool:
         """Update escalation"""
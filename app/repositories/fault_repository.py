@@ -3,10 +3,14 @@ Fault Repository
 """
 from app.repositories.base_repository import BaseRepository
 from app.models.fault import Fault
+from app.models.fault_duplicate import FaultDuplicate
 
 class FaultRepository(BaseRepository):
     """Repository for fault data access"""
     
+    # Use COALESCE to handle NULL reported_at values - use id as fallback for ordering
+    ALL_FAULTS_QUERY = "SELECT * FROM faults ORDER BY COALESCE(reported_at, datetime('1970-01-01')) DESC, id DESC LIMIT ?"
+    
     def create(self, fault: Fault) -> int:
         """Create new fault"""
         try:
@@ -35,44 +39,74 @@ class FaultRepository(BaseRepository):
         query = "SELECT * FROM faults WHERE id = ?"
         row = self.fetch_one(query, (fault_id,))
         if row:
-            data = self.dict_to_row(row)
-            return Fault.from_dict(data)
+            return Fault.from_row(row)
         return None
     
-    def find_all(self, limit: int = 100) -> list:
-        """Find all faults"""
-        # Check total count first
-        count_query = "SELECT COUNT(*) as count FROM faults"
-        count_row = self.fetch_one(count_query)
-        total_count = count_row['count'] if count_row else 0
-        # Use COALESCE to handle NULL reported_at values - use id as fallback for ordering
-        query = "SELECT * FROM faults ORDER BY COALESCE(reported_at, datetime('1970-01-01')) DESC, id DESC LIMIT ?"
-        rows = self.fetch_all(query, (limit,))
-        return [Fault.from_dict(self.dict_to_row(row)) for row in rows]
+    def find_all(self, limit: int = 100, as_dict: bool = False) -> list:
+        """Find all faults (as to_dict()-shaped dicts when as_dict is set)"""
+        rows = self.fetch_all(self.ALL_FAULTS_QUERY, (limit,))
+        return self.rows_to_json(rows, Fault) if as_dict else Fault.from_rows(rows)
+    
+    def iter_all(self, limit: int = 100):
+        """Stream the most recent faults as to_dict()-shaped dicts"""
+        return self.iter_json(self.ALL_FAULTS_QUERY, (limit,), Fault)
     
-    def find_by_status(self, status: str) -> list:
+    def find_by_status(self, status: str, as_dict: bool = False) -> list:
         """Find faults by status"""
         query = "SELECT * FROM faults WHERE status = ? ORDER BY reported_at DESC"
         rows = self.fetch_all(query, (status,))
-        return [Fault.from_dict(self.dict_to_row(row)) for row in rows]
+        return self.rows_to_json(rows, Fault) if as_dict else Fault.from_rows(rows)
     
     def find_by_equipment(self, equipment_id: int) -> list:
         """Find faults by equipment"""
         query = "SELECT * FROM faults WHERE equipment_id = ? ORDER BY reported_at DESC"
         rows = self.fetch_all(query, (equipment_id,))
-        return [Fault.from_dict(self.dict_to_row(row)) for row in rows]
+        return Fault.from_rows(rows)
     
     def find_by_severity(self, severity: str) -> list:
         """Find faults by severity"""
         query = "SELECT * FROM faults WHERE severity = ? ORDER BY reported_at DESC"
         rows = self.fetch_all(query, (severity,))
-        return [Fault.from_dict(self.dict_to_row(row)) for row in rows]
+        return Fault.from_rows(rows)
     
     def find_unresolved(self) -> list:
         """Find unresolved faults"""
         query = "SELECT * FROM faults WHERE status != 'resolved' ORDER BY reported_at DESC"
         rows = self.fetch_all(query)
-        return [Fault.from_dict(self.dict_to_row(row)) for row in rows]
+        return Fault.from_rows(rows)
+    
+    def find_open_since(self, equipment_id: int, since: str) -> list:
+        """Unresolved faults of an equipment reported at or after `since`, newest first (idx_faults_equipment)"""
+        query = """
+            SELECT * FROM faults
+            WHERE equipment_id = ? AND reported_at >= ? AND status != 'resolved'
+            ORDER BY reported_at DESC, id DESC
+        """
+        rows = self.fetch_all(query, (equipment_id, since))
+        return Fault.from_rows(rows)
+    
+    def create_duplicate(self, duplicate: FaultDuplicate) -> int:
+        """Attach a duplicate report to its fault"""
+        query = """
+            INSERT INTO fault_duplicates (fault_id, reported_by, fault_description, severity, similarity, reported_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """
+        cursor = self.execute_query(query, (
+            duplicate.fault_id,
+            duplicate.reported_by,
+            duplicate.fault_description,
+            duplicate.severity,
+            duplicate.similarity,
+            duplicate.reported_at.isoformat() if duplicate.reported_at else None
+        ))
+        self.commit()
+        return cursor.lastrowid
+    
+    def find_duplicates(self, fault_id: int) -> list:
+        """Duplicate reports attached to a fault, oldest first"""
+        query = "SELECT * FROM fault_duplicates WHERE fault_id = ? ORDER BY reported_at, id"
+        rows = self.fetch_all(query, (fault_id,))
+        return FaultDuplicate.from_rows(rows)
     
     def update(self, fault: Fault) -> bool:
         """Update fault"""
@@ -85,4 +119,9 @@ class FaultRepository(BaseRepository):
         self.execute_query(query, (fault.status, resolved_at, fault.id))
         self.commit()
         return True
+    
+    def update_severity(self, fault_id: int, severity: str) -> None:
+        """Change a fault's severity"""
+        self.execute_query("UPDATE faults SET severity = ? WHERE id = ?", (severity, fault_id))
+        self.commit()
 
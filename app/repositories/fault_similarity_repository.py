@@ -0,0 +1,90 @@
+"""
+Fault Similarity Repository
+"""
+from app.repositories.base_repository import BaseRepository
+
+class FaultSimilarityRepository(BaseRepository):
+    """Repository for the documents of the similar-fault index: resolved faults with an RCA"""
+
+    def find_documents(self, fault_ids: list = None) -> list:
+        """
+        (fault_id, text, equipment_type, severity) of every resolved fault with
+        a root cause analysis, or of those among `fault_ids`. The text joins the
+        description, RCAs and resolution reports.
+        """
+        where, params = "", ()
+        if fault_ids is not None:
+            if not fault_ids:
+                return []
+            where = f"AND f.id IN ({', '.join('?' * len(fault_ids))})"
+            params = tuple(fault_ids)
+        query = f"""
+            SELECT f.id,
+                   f.fault_description || char(10) || rca.text || char(10) || COALESCE(report.text, '') AS text,
+                   e.equipment_type, f.severity
+            FROM faults f
+            JOIN equipment e ON e.id = f.equipment_id
+            JOIN (
+                SELECT fault_id, group_concat(root_cause || char(10) || COALESCE(contributing_factors, ''),
+                                              char(10)) AS text
+                FROM root_cause_analysis
+                WHERE fault_id IN (SELECT f.id FROM faults f WHERE f.status = 'resolved' {where})
+                GROUP BY fault_id
+            ) rca ON rca.fault_id = f.id
+            LEFT JOIN (
+                SELECT fault_id, group_concat(resolution_description || char(10) || actions_taken
+                                              || char(10) || COALESCE(preventive_measures, ''), char(10)) AS text
+                FROM resolution_reports
+                WHERE fault_id IN (SELECT f.id FROM faults f WHERE f.status = 'resolved' {where})
+                GROUP BY fault_id
+            ) report ON report.fault_id = f.id
+            WHERE f.status = 'resolved' {where}
+        """
+        return [tuple(row) for row in self.fetch_all(query, params * 3)]
+
+    def find_watermarks(self) -> tuple:
+        """Highest fault, RCA and resolution report ids"""
+        query = """
+            SELECT (SELECT MAX(id) FROM faults), (SELECT MAX(id) FROM root_cause_analysis),
+                   (SELECT MAX(id) FROM resolution_reports)
+        """
+        return tuple(value or 0 for value in self.fetch_one(query))
+
+    def find_changed_fault_ids(self, watermarks: tuple) -> list:
+        """Faults created, or given an RCA or resolution report, after the watermarks"""
+        query = """
+            SELECT id FROM faults WHERE id > ?
+            UNION SELECT fault_id FROM root_cause_analysis WHERE id > ?
+            UNION SELECT fault_id FROM resolution_reports WHERE id > ?
+        """
+        return [row[0] for row in self.fetch_all(query, watermarks)]
+
+    def find_fault(self, fault_id: int) -> dict:
+        """Description, severity and equipment type of one fault (the query side)"""
+        query = """
+            SELECT f.id, f.fault_description, f.severity, f.status, e.equipment_type
+            FROM faults f
+            JOIN equipment e ON e.id = f.equipment_id
+            WHERE f.id = ?
+        """
+        row = self.fetch_one(query, (fault_id,))
+        return dict(row) if row else None
+
+    def find_details(self, fault_ids: list) -> dict:
+        """Fault, equipment, latest RCA and resolution report fields per fault id"""
+        if not fault_ids:
+            return {}
+        query = f"""
+            SELECT f.id AS fault_id, f.fault_description, f.severity, f.reported_at, f.resolved_at,
+                   e.id AS equipment_id, e.equipment_code, e.equipment_name, e.equipment_type,
+                   rca.root_cause, rca.contributing_factors,
+                   report.resolution_description, report.actions_taken, report.preventive_measures
+            FROM faults f
+            JOIN equipment e ON e.id = f.equipment_id
+            LEFT JOIN root_cause_analysis rca ON rca.id = (
+                SELECT MAX(id) FROM root_cause_analysis WHERE fault_id = f.id)
+            LEFT JOIN resolution_reports report ON report.id = (
+                SELECT MAX(id) FROM resolution_reports WHERE fault_id = f.id)
+            WHERE f.id IN ({', '.join('?' * len(fault_ids))})
+        """
+        return {row['fault_id']: dict(row) for row in self.fetch_all(query, tuple(fault_ids))}
@@ -0,0 +1,59 @@
+"""
+Idempotency Repository
+"""
+from app.repositories.base_repository import BaseRepository
+
+class IdempotencyRepository(BaseRepository):
+    """Repository for stored write API responses keyed by (user, Idempotency-Key)"""
+
+    def find(self, user_id: int, key: str, now: float):
+        """The unexpired entry for a key (primary key lookup), or None"""
+        query = """
+            SELECT request_hash, status_code, content_type, response_body
+            FROM idempotency_keys
+            WHERE user_id = ? AND idempotency_key = ? AND expires_at > ?
+        """
+        return self.fetch_one(query, (user_id, key, now))
+
+    def claim(self, user_id: int, key: str, request_hash: str, now: float, expires_at: float) -> bool:
+        """
+        Record a key as in progress. An expired entry for the same key is
+        taken over; False when another request holds the key.
+        """
+        query = """
+            INSERT INTO idempotency_keys (user_id, idempotency_key, request_hash, created_at, expires_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT (user_id, idempotency_key) DO UPDATE SET
+                request_hash = excluded.request_hash, status_code = NULL, content_type = NULL,
+                response_body = NULL, created_at = excluded.created_at, expires_at = excluded.expires_at
+            WHERE idempotency_keys.expires_at <= ?
+        """
+        cursor = self.execute_query(query, (user_id, key, request_hash, now, expires_at, now))
+        self.commit()
+        return cursor.rowcount == 1
+
+    def complete(self, user_id: int, key: str, status_code: int, content_type: str,
+                 body: bytes, expires_at: float):
+        """Store the response of the request holding a key"""
+        query = """
+            UPDATE idempotency_keys
+            SET status_code = ?, content_type = ?, response_body = ?, expires_at = ?
+            WHERE user_id = ? AND idempotency_key = ?
+        """
+        self.execute_query(query, (status_code, content_type, body, expires_at, user_id, key))
+        self.commit()
+
+    def release(self, user_id: int, key: str):
+        """Forget a key whose request failed, so a retry runs it again"""
+        query = """
+            DELETE FROM idempotency_keys
+            WHERE user_id = ? AND idempotency_key = ? AND status_code IS NULL
+        """
+        self.execute_query(query, (user_id, key))
+        self.commit()
+
+    def purge_expired(self, now: float) -> int:
+        """Delete expired entries; returns how many were removed"""
+        cursor = self.execute_query("DELETE FROM idempotency_keys WHERE expires_at <= ?", (now,))
+        self.commit()
+        return cursor.rowcount
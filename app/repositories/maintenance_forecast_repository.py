@@ -0,0 +1,107 @@
+"""
+Maintenance Forecast Repository
+"""
+from datetime import date
+from app.repositories.base_repository import BaseRepository
+from app.models.maintenance_forecast import MaintenanceForecast
+
+class MaintenanceForecastRepository(BaseRepository):
+    """Repository for daily equipment stats and maintenance forecasts"""
+    
+    def find_daily_stats(self, start_date: date, end_date: date) -> list:
+        """
+        Daily means per equipment in [start_date, end_date] as plain tuples:
+        (equipment_id, day offset from start_date, voltage mean, voltage variance,
+        current mean, power factor mean); NULL where the day had no such readings
+        """
+        query = """
+            SELECT equipment_id,
+                   CAST(julianday(monitoring_date) - julianday(?) AS INTEGER),
+                   voltage_sum / NULLIF(voltage_count, 0),
+                   CASE WHEN voltage_count > 1
+                        THEN voltage_sq_sum / voltage_count
+                             - (voltage_sum / voltage_count) * (voltage_sum / voltage_count)
+                   END,
+                   current_sum / NULLIF(current_count, 0),
+                   power_factor_sum / NULLIF(power_factor_count, 0)
+            FROM equipment_daily_stats
+            WHERE monitoring_date >= ? AND monitoring_date <= ?
+        """
+        start = start_date.isoformat()
+        cursor = self.execute_query(query, (start, start, end_date.isoformat()))
+        # Tens of thousands of rows go straight into numpy; skip sqlite3.Row
+        cursor.row_factory = None
+        return cursor.fetchall()
+    
+    def replace_all(self, forecasts: list):
+        """Replace the stored forecasts with a new run's"""
+        self.execute_query("DELETE FROM maintenance_forecasts")
+        query = """
+            INSERT INTO maintenance_forecasts
+            (equipment_id, suggested_date, crossing_date, metric, limit_value,
+             slope_per_day, confidence, days_used)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        self.execute_many(query, [(
+            forecast.equipment_id,
+            forecast.suggested_date.isoformat(),
+            forecast.crossing_date.isoformat(),
+            forecast.metric,
+            forecast.limit_value,
+            forecast.slope_per_day,
+            forecast.confidence,
+            forecast.days_used
+        ) for forecast in forecasts])
+        self.commit()
+    
+    def find_all(self, min_confidence: float = 0.0, limit: int = 100) -> list:
+        """Forecasts with their equipment, soonest suggested date first"""
+        query = """
+            SELECT f.*, e.equipment_code, e.equipment_name, e.equipment_type, e.location,
+                   e.next_maintenance_date
+            FROM maintenance_forecasts f
+            JOIN equipment e ON e.id = f.equipment_id
+            WHERE f.confidence >= ?
+            ORDER BY f.suggested_date, f.confidence DESC
+            LIMIT ?
+        """
+        rows = self.fetch_all(query, (min_confidence, limit))
+        forecasts = self.rows_to_json(rows, MaintenanceForecast)
+        for forecast, row in zip(forecasts, rows):
+            forecast['equipment'] = {
+                'equipment_code': row['equipment_code'],
+                'equipment_name': row['equipment_name'],
+                'equipment_type': row['equipment_type'],
+                'location': row['location'],
+                'next_maintenance_date': row['next_maintenance_date']
+            }
+        return forecasts
+    
+    def find_by_equipment(self, equipment_id: int) -> MaintenanceForecast:
+        """Forecast for one equipment"""
+        query = "SELECT * FROM maintenance_forecasts WHERE equipment_id = ?"
+        row = self.fetch_one(query, (equipment_id,))
+        if row:
+            return MaintenanceForecast.from_row(row)
+        return None
+    
+    def apply_suggestions(self, min_confidence: float) -> int:
+        """
+        Copy suggested dates into equipment.next_maintenance_date where none is
+        set or the suggestion is earlier; returns the number of equipment updated
+        """
+        query = """
+            UPDATE equipment
+            SET next_maintenance_date = (
+                SELECT suggested_date FROM maintenance_forecasts WHERE equipment_id = equipment.id
+            )
+            WHERE id IN (
+                SELECT f.equipment_id FROM maintenance_forecasts f
+                WHERE f.confidence >= ?
+                  AND (equipment.next_maintenance_date IS NULL
+                       OR f.suggested_date < equipment.next_maintenance_date)
+            )
+        """
+        cursor = self.execute_query(query, (min_confidence,))
+        self.commit()
+        return cursor.rowcount
@@ -2,12 +2,42 @@
 Monitoring Repository
 """
 from app.repositories.base_repository import BaseRepository
+from app.repositories.status_board import latest_readings, READING_COLUMNS
 from app.models.monitoring import DailyMonitoring
+from app.database.archive import archive_boundary, attach_archive, get_archive_path
+from app.database.db_connection import DAILY_STATS_MERGE
 from datetime import date
 
 class MonitoringRepository(BaseRepository):
     """Repository for monitoring data access"""
     
+    STATUS_BOARD_QUERY = """
+        SELECT e.id, e.equipment_code, e.equipment_name, e.equipment_type,
+               e.location, e.status, l.monitoring_id, l.technician_id, l.monitoring_date,
+               l.shift, l.voltage, l.current, l.power_factor, l.operational_status, l.recorded_at
+        FROM equipment e
+        LEFT JOIN equipment_latest_reading l ON l.equipment_id = e.id
+        ORDER BY e.equipment_name
+    """
+    
+    LATEST_READING_COLUMNS = """
+        (equipment_id, monitoring_id, technician_id, monitoring_date, shift,
+         voltage, current, power_factor, operational_status, recorded_at)
+    """
+    
+    LATEST_READING_SOURCE = """
+        SELECT equipment_id, id, technician_id, monitoring_date, shift,
+               voltage, current, power_factor, operational_status, created_at
+        FROM daily_monitoring
+    """
+    
+    TECHNICIAN_HISTORY_QUERY = """
+        SELECT * FROM daily_monitoring 
+        WHERE technician_id = ? 
+        ORDER BY monitoring_date DESC 
+        LIMIT ?
+    """
+    
     def create(self, monitoring: DailyMonitoring) -> int:
         """Create new monitoring record"""
         try:
@@ -29,23 +59,97 @@ class MonitoringRepository(BaseRepository):
                 monitoring.observations
             ))
             monitoring_id = cursor.lastrowid
+            self._record_latest(monitoring_id)
+            self._merge_daily_stats(monitoring_id, 1)
             self.commit()
+            self._mirror_latest(monitoring.equipment_id)
             return monitoring_id
         except Exception as e:
             # Re-raise with more context
             raise Exception(f"Failed to create monitoring record: {str(e)}. Equipment ID: {monitoring.equipment_id}, Technician ID: {monitoring.technician_id}")
     
+    def _record_latest(self, monitoring_id: int):
+        """Make a new reading its equipment's latest unless a newer one is already recorded"""
+        query = f"""
+            INSERT INTO equipment_latest_reading {self.LATEST_READING_COLUMNS}
+            {self.LATEST_READING_SOURCE}
+            WHERE id = ? AND equipment_id IS NOT NULL
+            ON CONFLICT (equipment_id) DO UPDATE SET
+                monitoring_id = excluded.monitoring_id, technician_id = excluded.technician_id,
+                monitoring_date = excluded.monitoring_date, shift = excluded.shift,
+                voltage = excluded.voltage, current = excluded.current,
+                power_factor = excluded.power_factor, operational_status = excluded.operational_status,
+                recorded_at = excluded.recorded_at
+            WHERE excluded.monitoring_date > equipment_latest_reading.monitoring_date
+               OR (excluded.monitoring_date = equipment_latest_reading.monitoring_date
+                   AND excluded.monitoring_id >= equipment_latest_reading.monitoring_id)
+        """
+        self.execute_query(query, (monitoring_id,))
+    
+    def _merge_daily_stats(self, monitoring_id: int, sign: int):
+        """Add (1) or remove (-1) a reading in its equipment's daily stats"""
+        self.execute_query(DAILY_STATS_MERGE.format(where='id = :id'), {'sign': sign, 'id': monitoring_id})
+        if sign < 0:
+            self.execute_query("""
+                DELETE FROM equipment_daily_stats
+                WHERE readings <= 0 AND (equipment_id, monitoring_date) IN (
+                    SELECT equipment_id, date(monitoring_date) FROM daily_monitoring WHERE id = ?
+                )
+            """, (monitoring_id,))
+    
+    def _refresh_latest(self, equipment_id: int):
+        """Recompute an equipment's latest reading from its history"""
+        self.execute_query("DELETE FROM equipment_latest_reading WHERE equipment_id = ?", (equipment_id,))
+        query = f"""
+            INSERT INTO equipment_latest_reading {self.LATEST_READING_COLUMNS}
+            {self.LATEST_READING_SOURCE}
+            WHERE equipment_id = ?
+            ORDER BY monitoring_date DESC, id DESC
+            LIMIT 1
+        """
+        self.execute_query(query, (equipment_id,))
+    
+    def _mirror_latest(self, equipment_id: int):
+        """Copy an equipment's committed latest reading into the in-memory mirror"""
+        if not equipment_id:
+            return
+        row = self.fetch_one("SELECT * FROM equipment_latest_reading WHERE equipment_id = ?", (equipment_id,))
+        latest_readings.put(equipment_id, dict(row) if row else dict.fromkeys(READING_COLUMNS))
+    
+    def get_status_board(self) -> list:
+        """Every equipment with its last V/I/PF, status and timestamp (from the in-memory mirror)"""
+        return latest_readings.board(lambda: self.fetch_all(self.STATUS_BOARD_QUERY))
+    
+    def _reaches_archive(self, start_date: date = None) -> bool:
+        """
+        True when rows dated from start_date (or any date) may be in the archive
+        database; the archive is attached to the connection before returning True
+        """
+        boundary = archive_boundary(self.conn)
+        if boundary is None or (start_date is not None and start_date.isoformat() >= boundary):
+            return False
+        attach_archive(self.conn, get_archive_path(self.db.db_path))
+        return True
+    
     def find_by_id(self, monitoring_id: int) -> DailyMonitoring:
-        """Find monitoring record by ID"""
+        """Find monitoring record by ID (live table first, then the archive)"""
         query = "SELECT * FROM daily_monitoring WHERE id = ?"
         row = self.fetch_one(query, (monitoring_id,))
+        if row is None and self._reaches_archive():
+            row = self.fetch_one("SELECT * FROM archive.daily_monitoring WHERE id = ?", (monitoring_id,))
         if row:
-            data = self.dict_to_row(row)
-            return DailyMonitoring.from_dict(data)
+            return DailyMonitoring.from_row(row)
         return None
     
-    def find_by_equipment(self, equipment_id: int, limit: int = 100) -> list:
-        """Find monitoring records by equipment"""
+    def is_archived(self, monitoring_id: int) -> bool:
+        """True when the record has been moved to the archive database (archived records are read-only)"""
+        if self.fetch_one("SELECT 1 FROM daily_monitoring WHERE id = ?", (monitoring_id,)):
+            return False
+        return (self._reaches_archive() and
+                self.fetch_one("SELECT 1 FROM archive.daily_monitoring WHERE id = ?", (monitoring_id,)) is not None)
+    
+    def find_by_equipment(self, equipment_id: int, limit: int = 100, as_dict: bool = False) -> list:
+        """Find monitoring records by equipment (reads the archive only when the live rows run out)"""
         query = """
             SELECT * FROM daily_monitoring 
             WHERE equipment_id = ? 
@@ -53,30 +157,101 @@ class MonitoringRepository(BaseRepository):
             LIMIT ?
         """
         rows = self.fetch_all(query, (equipment_id, limit))
-        return [DailyMonitoring.from_dict(self.dict_to_row(row)) for row in rows]
+        if len(rows) < limit and self._reaches_archive():
+            query = """
+                SELECT * FROM (
+                    SELECT * FROM main.daily_monitoring WHERE equipment_id = ?
+                    UNION ALL
+                    SELECT * FROM archive.daily_monitoring WHERE equipment_id = ?
+                )
+                ORDER BY monitoring_date DESC 
+                LIMIT ?
+            """
+            rows = self.fetch_all(query, (equipment_id, equipment_id, limit))
+        return self.rows_to_json(rows, DailyMonitoring) if as_dict else DailyMonitoring.from_rows(rows)
     
-    def find_by_technician(self, technician_id: int, limit: int = 100) -> list:
+    def find_by_technician(self, technician_id: int, limit: int = 100, as_dict: bool = False) -> list:
         """Find monitoring records by technician"""
-        query = """
-            SELECT * FROM daily_monitoring 
+        rows = self.fetch_all(self.TECHNICIAN_HISTORY_QUERY, (technician_id, limit))
+        return self.rows_to_json(rows, DailyMonitoring) if as_dict else DailyMonitoring.from_rows(rows)
+    
+    def iter_by_technician(self, technician_id: int, limit: int = 100):
+        """Stream monitoring records by technician as to_dict()-shaped dicts"""
+        return self.iter_json(self.TECHNICIAN_HISTORY_QUERY, (technician_id, limit), DailyMonitoring)
+    
+    def iter_by_technician_period(self, technician_id: int, start_date: date, end_date: date):
+        """Stream a technician's records for a period (inclusive), newest first"""
+        source = "daily_monitoring"
+        if self._reaches_archive(start_date):
+            source = "(SELECT * FROM main.daily_monitoring UNION ALL SELECT * FROM archive.daily_monitoring)"
+        query = f"""
+            SELECT * FROM {source} 
             WHERE technician_id = ? 
-            ORDER BY monitoring_date DESC 
-            LIMIT ?
+              AND monitoring_date >= ? AND monitoring_date < date(?, '+1 day')
+            ORDER BY monitoring_date DESC
+        """
+        return self.iter_json(query, (technician_id, start_date.isoformat(), end_date.isoformat()),
+                              DailyMonitoring)
+    
+    def summarize_technician_period(self, technician_id: int, start_date: date, end_date: date) -> dict:
+        """
+        Reading counts per status and averages (ignoring empty/zero values) for a period;
+        archived days are counted from monitoring_daily_rollup
         """
-        rows = self.fetch_all(query, (technician_id, limit))
-        return [DailyMonitoring.from_dict(self.dict_to_row(row)) for row in rows]
+        query = """
+            SELECT COALESCE(SUM(readings), 0) AS total_readings,
+                   COALESCE(SUM(normal_count), 0) AS normal_count,
+                   COALESCE(SUM(warning_count), 0) AS warning_count,
+                   COALESCE(SUM(critical_count), 0) AS critical_count,
+                   COALESCE(SUM(voltage_sum) / NULLIF(SUM(voltage_count), 0), 0) AS avg_voltage,
+                   COALESCE(SUM(current_sum) / NULLIF(SUM(current_count), 0), 0) AS avg_current,
+                   COALESCE(SUM(power_factor_sum) / NULLIF(SUM(power_factor_count), 0), 0) AS avg_power_factor
+            FROM (
+                SELECT COUNT(*) AS readings,
+                       SUM(operational_status = 'normal') AS normal_count,
+                       SUM(operational_status = 'warning') AS warning_count,
+                       SUM(operational_status = 'critical') AS critical_count,
+                       TOTAL(CASE WHEN voltage <> 0 THEN voltage END) AS voltage_sum,
+                       COUNT(CASE WHEN voltage <> 0 THEN 1 END) AS voltage_count,
+                       TOTAL(CASE WHEN current <> 0 THEN current END) AS current_sum,
+                       COUNT(CASE WHEN current <> 0 THEN 1 END) AS current_count,
+                       TOTAL(CASE WHEN power_factor <> 0 THEN power_factor END) AS power_factor_sum,
+                       COUNT(CASE WHEN power_factor <> 0 THEN 1 END) AS power_factor_count
+                FROM daily_monitoring 
+                WHERE technician_id = ? 
+                  AND monitoring_date >= ? AND monitoring_date < date(?, '+1 day')
+                UNION ALL
+                SELECT SUM(readings), SUM(normal_count), SUM(warning_count), SUM(critical_count),
+                       TOTAL(voltage_sum), SUM(voltage_count), TOTAL(current_sum), SUM(current_count),
+                       TOTAL(power_factor_sum), SUM(power_factor_count)
+                FROM monitoring_daily_rollup 
+                WHERE technician_id = ? AND monitoring_date BETWEEN ? AND ?
+            )
+        """
+        period = (start_date.isoformat(), end_date.isoformat())
+        row = self.fetch_one(query, (technician_id, *period, technician_id, *period))
+        return dict(row)
     
     def find_by_date_range(self, start_date: date, end_date: date) -> list:
-        """Find monitoring records by date range"""
+        """Find monitoring records by date range (including archived rows when the range reaches them)"""
         query = """
             SELECT * FROM daily_monitoring 
             WHERE monitoring_date BETWEEN ? AND ?
             ORDER BY monitoring_date DESC
         """
-        rows = self.fetch_all(query, (start_date.isoformat(), end_date.isoformat()))
-        return [DailyMonitoring.from_dict(self.dict_to_row(row)) for row in rows]
+        params = (start_date.isoformat(), end_date.isoformat())
+        if self._reaches_archive(start_date):
+            query = """
+                SELECT * FROM main.daily_monitoring WHERE monitoring_date BETWEEN ? AND ?
+                UNION ALL
+                SELECT * FROM archive.daily_monitoring WHERE monitoring_date BETWEEN ? AND ?
+                ORDER BY monitoring_date DESC
+            """
+            params = params * 2
+        rows = self.fetch_all(query, params)
+        return DailyMonitoring.from_rows(rows)
     
-    def find_critical_status(self) -> list:
+    def find_critical_status(self, as_dict: bool = False) -> list:
         """Find monitoring records with critical status"""
         query = """
             SELECT * FROM daily_monitoring 
@@ -84,10 +259,12 @@ class MonitoringRepository(BaseRepository):
             ORDER BY monitoring_date DESC
         """
         rows = self.fetch_all(query)
-        return [DailyMonitoring.from_dict(self.dict_to_row(row)) for row in rows]
+        return self.rows_to_json(rows, DailyMonitoring) if as_dict else DailyMonitoring.from_rows(rows)
     
     def update(self, monitoring: DailyMonitoring) -> None:
         """Update monitoring record"""
+        previous = self.fetch_one("SELECT equipment_id FROM daily_monitoring WHERE id = ?", (monitoring.id,))
+        self._merge_daily_stats(monitoring.id, -1)
         query = """
             UPDATE daily_monitoring 
             SET equipment_id = ?, monitoring_date = ?, shift = ?, 
@@ -106,11 +283,25 @@ class MonitoringRepository(BaseRepository):
             monitoring.observations,
             monitoring.id
         ))
+        self._merge_daily_stats(monitoring.id, 1)
+        # The record may have been (or become) its equipment's latest reading
+        affected = {monitoring.equipment_id, previous['equipment_id'] if previous else None} - {None, 0}
+        for equipment_id in affected:
+            self._refresh_latest(equipment_id)
         self.commit()
+        for equipment_id in affected:
+            self._mirror_latest(equipment_id)
     
     def delete(self, monitoring_id: int) -> None:
         """Delete monitoring record"""
+        latest = self.fetch_one("SELECT equipment_id FROM equipment_latest_reading WHERE monitoring_id = ?",
+                                (monitoring_id,))
+        self._merge_daily_stats(monitoring_id, -1)
         query = "DELETE FROM daily_monitoring WHERE id = ?"
         self.execute_query(query, (monitoring_id,))
+        if latest:
+            self._refresh_latest(latest['equipment_id'])
         self.commit()
+        if latest:
+            self._mirror_latest(latest['equipment_id'])
 
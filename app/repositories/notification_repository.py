@@ -32,8 +32,7 @@ class NotificationRepository(BaseRepository):
         query = "SELECT * FROM notifications WHERE id = ?"
         row = self.fetch_one(query, (notification_id,))
         if row:
-            data = self.dict_to_row(row)
-            return Notification.from_dict(data)
+            return Notification.from_row(row)
         return None
     
     def find_by_user(self, user_id: int, unread_only: bool = False) -> list:
@@ -43,7 +42,7 @@ class NotificationRepository(BaseRepository):
         else:
             query = "SELECT * FROM notifications WHERE user_id = ? ORDER BY created_at DESC"
         rows = self.fetch_all(query, (user_id,))
-        return [Notification.from_dict(self.dict_to_row(row)) for row in rows]
+        return Notification.from_rows(rows)
     
     def mark_as_read(self, notification_id: int) -> bool:
         """Mark notification as read"""
@@ -32,8 +32,7 @@ class PerformanceReportRepository(BaseRepository):
         query = "SELECT * FROM performance_reports WHERE id = ?"
         row = self.fetch_one(query, (report_id,))
         if row:
-            data = self.dict_to_row(row)
-            return PerformanceReport.from_dict(data)
+            return PerformanceReport.from_row(row)
         return None
     
     def find_by_technician(self, technician_id: int) -> list:
@@ -44,7 +43,7 @@ class PerformanceReportRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = self.fetch_all(query, (technician_id,))
-        return [PerformanceReport.from_dict(self.dict_to_row(row)) for row in rows]
+        return PerformanceReport.from_rows(rows)
     
     def find_by_status(self, status: str) -> list:
         """Find reports by status"""
@@ -54,7 +53,7 @@ class PerformanceReportRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = self.fetch_all(query, (status,))
-        return [PerformanceReport.from_dict(self.dict_to_row(row)) for row in rows]
+        return PerformanceReport.from_rows(rows)
     
     def find_pending_approval(self) -> list:
         """Find reports pending approval"""
@@ -64,7 +63,7 @@ class PerformanceReportRepository(BaseRepository):
             ORDER BY submitted_at DESC
         """
         rows = self.fetch_all(query)
-        return [PerformanceReport.from_dict(self.dict_to_row(row)) for row in rows]
+        return PerformanceReport.from_rows(rows)
     
     def update(self, report: PerformanceReport) -> bool:
         """Update performance report"""
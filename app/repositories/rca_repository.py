@@ -27,8 +27,7 @@ class RCARepository(BaseRepository):
         query = "SELECT * FROM root_cause_analysis WHERE id = ?"
         row = self.fetch_one(query, (rca_id,))
         if row:
-            data = self.dict_to_row(row)
-            return RootCauseAnalysis.from_dict(data)
+            return RootCauseAnalysis.from_row(row)
         return None
     
     def find_by_fault(self, fault_id: int) -> RootCauseAnalysis:
@@ -36,15 +35,14 @@ class RCARepository(BaseRepository):
         query = "SELECT * FROM root_cause_analysis WHERE fault_id = ?"
         row = self.fetch_one(query, (fault_id,))
         if row:
-            data = self.dict_to_row(row)
-            return RootCauseAnalysis.from_dict(data)
+            return RootCauseAnalysis.from_row(row)
         return None
     
     def find_all(self) -> list:
         """Find all RCAs"""
         query = "SELECT * FROM root_cause_analysis ORDER BY analysis_date DESC"
         rows = self.fetch_all(query)
-        return [RootCauseAnalysis.from_dict(self.dict_to_row(row)) for row in rows]
+        return RootCauseAnalysis.from_rows(rows)
 
 
 
@@ -0,0 +1,46 @@
+"""
+Reliability Repository
+"""
+from app.repositories.base_repository import BaseRepository
+
+# Grouping column and label per reliability dimension
+DIMENSIONS = {
+    'equipment': ('e.id', "e.equipment_code || ' - ' || e.equipment_name"),
+    'type': ('e.equipment_type', 'e.equipment_type'),
+    'location': ('e.location', 'e.location'),
+}
+
+class ReliabilityRepository(BaseRepository):
+    """Repository for MTBF/MTTR figures computed from the fault history"""
+
+    def find_reliability(self, dimension: str, since: str = None) -> list:
+        """
+        MTBF and MTTR (hours) per dimension value for faults reported since
+        `since` (all when None), shortest MTBF first. The time between failures
+        is taken per equipment with LAG over its faults, so the first fault in
+        the period still counts the gap to the fault before it.
+        """
+        key, label = DIMENSIONS[dimension]
+        query = f"""
+            WITH ordered AS (
+                SELECT equipment_id, reported_at, resolved_at,
+                       julianday(reported_at) - julianday(LAG(reported_at) OVER (
+                           PARTITION BY equipment_id ORDER BY reported_at, id
+                       )) AS days_since_previous
+                FROM faults
+            )
+            SELECT {key} AS key, MIN({label}) AS label,
+                   COUNT(*) AS failures,
+                   COUNT(DISTINCT o.equipment_id) AS equipment_count,
+                   COUNT(o.days_since_previous) AS intervals,
+                   AVG(o.days_since_previous) * 24.0 AS mtbf_hours,
+                   COUNT(o.resolved_at) AS repairs,
+                   AVG(CASE WHEN o.resolved_at IS NOT NULL
+                            THEN julianday(o.resolved_at) - julianday(o.reported_at) END) * 24.0 AS mttr_hours
+            FROM ordered o
+            JOIN equipment e ON e.id = o.equipment_id
+            WHERE ? IS NULL OR julianday(o.reported_at) >= julianday(?)
+            GROUP BY {key}
+            ORDER BY mtbf_hours IS NULL, mtbf_hours, failures DESC
+        """
+        return [dict(row) for row in self.fetch_all(query, (since, since))]
@@ -32,8 +32,7 @@ class ReportRepository(BaseRepository):
         query = "SELECT * FROM resolution_reports WHERE id = ?"
         row = self.fetch_one(query, (report_id,))
         if row:
-            data = self.dict_to_row(row)
-            return ResolutionReport.from_dict(data)
+            return ResolutionReport.from_row(row)
         return None
     
     def find_by_fault(self, fault_id: int) -> ResolutionReport:
@@ -41,27 +40,26 @@ class ReportRepository(BaseRepository):
         query = "SELECT * FROM resolution_reports WHERE fault_id = ?"
         row = self.fetch_one(query, (fault_id,))
         if row:
-            data = self.dict_to_row(row)
-            return ResolutionReport.from_dict(data)
+            return ResolutionReport.from_row(row)
         return None
     
     def find_by_status(self, status: str) -> list:
         """Find reports by status"""
         query = "SELECT * FROM resolution_reports WHERE status = ? ORDER BY created_at DESC"
         rows = self.fetch_all(query, (status,))
-        return [ResolutionReport.from_dict(self.dict_to_row(row)) for row in rows]
+        return ResolutionReport.from_rows(rows)
     
     def find_by_preparer(self, user_id: int) -> list:
         """Find reports by preparer"""
         query = "SELECT * FROM resolution_reports WHERE prepared_by = ? ORDER BY created_at DESC"
         rows = self.fetch_all(query, (user_id,))
-        return [ResolutionReport.from_dict(self.dict_to_row(row)) for row in rows]
+        return ResolutionReport.from_rows(rows)
     
     def find_pending_approval(self) -> list:
         """Find reports pending approval"""
         query = "SELECT * FROM resolution_reports WHERE status = 'pending_approval' ORDER BY created_at DESC"
         rows = self.fetch_all(query)
-        return [ResolutionReport.from_dict(self.dict_to_row(row)) for row in rows]
+        return ResolutionReport.from_rows(rows)
     
     def update(self, report: ResolutionReport) -> bool:
         """Update report"""
@@ -0,0 +1,109 @@
+"""
+Search Repository
+"""
+from app.repositories.base_repository import BaseRepository
+
+# Marks around matched terms in snippets (replaced by the service after escaping)
+MATCH_START, MATCH_END = '\x02', '\x03'
+
+
+def _filtered(match: str, entity_types: list = None, equipment_id: int = None) -> str:
+    """Match over titles and bodies, with the entity type and equipment filters as part of it"""
+    match = f"{{title body}} : ({match})"
+    if entity_types:
+        match += " AND entity_type : (" + ' OR '.join(f'"{kind}"' for kind in entity_types) + ")"
+    if equipment_id is not None:
+        match += f' AND equipment : "{int(equipment_id)}"'
+    return match
+
+
+class SearchRepository(BaseRepository):
+    """Repository for the search_index and library_index full-text tables (kept in sync by triggers)"""
+
+    def search(self, match: str, entity_types: list = None, equipment_id: int = None,
+               limit: int = 20, offset: int = 0) -> list:
+        """
+        Hits for an FTS5 match expression over titles and bodies, best BM25
+        rank first. Filters become part of the match. The page is cut inside
+        the index query; faults and equipment are joined to the page only.
+        """
+        match = _filtered(match, entity_types, equipment_id)
+        query = f"""
+            SELECT hit.*, f.severity, f.status AS fault_status, f.reported_at,
+                   e.equipment_code, e.equipment_name
+            FROM (
+                SELECT rowid / 4 AS entity_id, entity_type, fault_id,
+                       CAST(equipment AS INTEGER) AS equipment_id, rank AS score,
+                       highlight(search_index, 3, '{MATCH_START}', '{MATCH_END}') AS title,
+                       snippet(search_index, 4, '{MATCH_START}', '{MATCH_END}', '...', 24) AS snippet
+                FROM search_index
+                WHERE search_index MATCH ?
+                ORDER BY rank
+                LIMIT ? OFFSET ?
+            ) hit
+            LEFT JOIN faults f ON f.id = hit.fault_id
+            LEFT JOIN equipment e ON e.id = hit.equipment_id
+            ORDER BY hit.score
+        """
+        return [dict(row) for row in self.fetch_all(query, (match, limit, offset))]
+
+    def find_library_groups(self, match: str, group_column: str, entity_types: list = None,
+                            equipment_id: int = None, limit: int = 20, offset: int = 0) -> list:
+        """
+        Library groups (`group_column` is 'equipment' or 'package') for an FTS5
+        match expression with their hit count, best BM25 rank first and the
+        hits without a group last
+        """
+        query = f"""
+            SELECT CAST({group_column} AS INTEGER) AS group_key, MIN(rank) AS score, COUNT(*) AS hit_count
+            FROM library_index
+            WHERE library_index MATCH ?
+            GROUP BY group_key
+            ORDER BY group_key IS NULL, score, group_key
+            LIMIT ? OFFSET ?
+        """
+        match = _filtered(match, entity_types, equipment_id)
+        return [dict(row) for row in self.fetch_all(query, (match, limit, offset))]
+
+    def find_library_hits(self, match: str, group_column: str, group_keys: list, entity_types: list = None,
+                          equipment_id: int = None, per_group: int = 5) -> list:
+        """
+        Best `per_group` library hits (technical references and documentation
+        items) of each given group (None for the hits without one), with their
+        package and equipment labels
+        """
+        keys = [key for key in group_keys if key is not None]
+        # highlight() and snippet() cannot run beside a window function, so the
+        # best hits are picked first and the index is matched again for their texts
+        query = f"""
+            SELECT best.*, p.package_name, e.equipment_code, e.equipment_name,
+                   highlight(library_index, 3, '{MATCH_START}', '{MATCH_END}') AS title,
+                   snippet(library_index, 4, '{MATCH_START}', '{MATCH_END}', '...', 24) AS snippet
+            FROM (
+                SELECT * FROM (
+                    SELECT rowid AS hit_rowid, rowid / 4 AS entity_id, entity_type,
+                           CAST(package AS INTEGER) AS package_id,
+                           CAST(equipment AS INTEGER) AS equipment_id,
+                           CAST({group_column} AS INTEGER) AS group_key, rank AS score,
+                           ROW_NUMBER() OVER (PARTITION BY CAST({group_column} AS INTEGER) ORDER BY rank) AS position
+                    FROM library_index
+                    WHERE library_index MATCH :match
+                      AND (CAST({group_column} AS INTEGER) IN ({', '.join(f':key{i}' for i in range(len(keys))) or 'NULL'})
+                           OR (:ungrouped AND {group_column} IS NULL))
+                ) WHERE position <= :per_group
+            ) best
+            JOIN library_index ON library_index.rowid = best.hit_rowid
+            LEFT JOIN documentation_packages p ON p.id = best.package_id
+            LEFT JOIN equipment e ON e.id = best.equipment_id
+            WHERE library_index MATCH :match
+            ORDER BY best.score
+        """
+        params = {f'key{i}': key for i, key in enumerate(keys)}
+        params.update(match=_filtered(match, entity_types, equipment_id),
+                      ungrouped=None in group_keys, per_group=per_group)
+        return [dict(row) for row in self.fetch_all(query, params)]
+
+    def is_available(self, index: str = 'search_index') -> bool:
+        """False when SQLite was built without FTS5 and the index could not be created"""
+        return self.fetch_one(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (index,)) is not None
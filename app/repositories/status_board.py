@@ -0,0 +1,64 @@
+"""
+Equipment Status Board Mirror
+
+In-process copy of the status board: every equipment joined with its row in
+equipment_latest_reading. Repositories write through it after committing, so
+reads never touch the database; a full reload every `ttl` seconds picks up
+writes from other processes (CLI scripts, other workers) and new equipment.
+"""
+import threading
+import time
+from app.models.base import iso_datetime
+
+EQUIPMENT_COLUMNS = ('equipment_code', 'equipment_name', 'equipment_type', 'location', 'status')
+
+READING_COLUMNS = ('monitoring_id', 'technician_id', 'monitoring_date', 'shift', 'voltage',
+                   'current', 'power_factor', 'operational_status', 'recorded_at')
+
+BOARD_COLUMNS = EQUIPMENT_COLUMNS + READING_COLUMNS
+
+
+def _board_values(values: dict) -> dict:
+    values = {column: values[column] for column in BOARD_COLUMNS if column in values}
+    if values.get('recorded_at'):
+        values['recorded_at'] = iso_datetime(values['recorded_at'])
+    return values
+
+
+class LatestReadingMirror:
+    """Status board entries keyed by equipment id"""
+
+    def __init__(self, ttl: float = 30.0):
+        self.ttl = ttl
+        self._board = None
+        self._loaded_at = 0.0
+        self._lock = threading.Lock()
+
+    def board(self, load) -> list:
+        """Board entries in board order, reloading with load() when empty or stale"""
+        with self._lock:
+            if self._board is None or time.monotonic() - self._loaded_at > self.ttl:
+                self._board = {row['id']: {'id': row['id'], **_board_values(dict(row))} for row in load()}
+                self._loaded_at = time.monotonic()
+            # Entries are replaced, never mutated, so they can be handed out as-is
+            return list(self._board.values())
+
+    def put(self, equipment_id: int, values: dict):
+        """Merge committed equipment or reading columns into one entry"""
+        with self._lock:
+            if self._board is None:
+                return
+            entry = self._board.get(equipment_id)
+            if entry is None:
+                # Equipment added since the last load
+                self._board = None
+                return
+            self._board[equipment_id] = {**entry, **_board_values(values)}
+
+    def invalidate(self):
+        """Force a reload on the next read"""
+        with self._lock:
+            self._board = None
+
+
+latest_readings = LatestReadingMirror()
@@ -0,0 +1,48 @@
+"""
+Sync Repository
+"""
+from app.repositories.base_repository import BaseRepository
+from app.database.db_connection import CHANGE_LOG_SOURCES
+from app.models.equipment import Equipment
+from app.models.monitoring import DailyMonitoring
+from app.models.fault import Fault
+from app.models.notification import Notification
+
+# Model used to shape each synced entity's rows
+SYNC_MODELS = {
+    'equipment': Equipment,
+    'monitoring': DailyMonitoring,
+    'faults': Fault,
+    'notifications': Notification,
+}
+
+class SyncRepository(BaseRepository):
+    """Repository for the change_log sequence (kept by triggers) and the rows it points to"""
+
+    def find_changes(self, since: int, entities: list, limit: int) -> list:
+        """(seq, entity, row_id, owner_id, deleted) rows after a sequence number, oldest first"""
+        # +entity: walk the seq range, never the (entity, row_id) index (all of a table's rows)
+        query = f"""
+            SELECT seq, entity, row_id, owner_id, deleted FROM change_log
+            WHERE seq > ? AND +entity IN ({', '.join('?' for _ in entities)})
+            ORDER BY seq
+            LIMIT ?
+        """
+        return self.fetch_all(query, (since, *entities, limit))
+
+    def find_rows(self, entity: str, row_ids: list, owner_id: int = None) -> list:
+        """to_dict()-shaped rows of an entity by id, optionally only those of one owner"""
+        query = f"""
+            SELECT * FROM {CHANGE_LOG_SOURCES[entity][0]}
+            WHERE id IN ({', '.join('?' for _ in row_ids)})
+        """
+        params = list(row_ids)
+        if owner_id is not None:
+            query += f" AND {CHANGE_LOG_SOURCES[entity][1]} = ?"
+            params.append(owner_id)
+        return self.rows_to_json(self.fetch_all(query + " ORDER BY id", tuple(params)), SYNC_MODELS[entity])
+
+    def find_latest_seq(self) -> int:
+        """Newest sequence number (0 before any change)"""
+        row = self.fetch_one("SELECT MAX(seq) AS seq FROM change_log")
+        return row['seq'] or 0
@@ -33,8 +33,7 @@ class TechnicalReferenceRepository(BaseRepository):
         query = "SELECT * FROM technical_references WHERE id = ?"
         row = self.fetch_one(query, (reference_id,))
         if row:
-            data = self.dict_to_row(row)
-            return TechnicalReference.from_dict(data)
+            return TechnicalReference.from_row(row)
         return None
     
     def find_by_equipment(self, equipment_id: int) -> list:
@@ -45,7 +44,7 @@ class TechnicalReferenceRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = self.fetch_all(query, (equipment_id,))
-        return [TechnicalReference.from_dict(self.dict_to_row(row)) for row in rows]
+        return TechnicalReference.from_rows(rows)
     
     def find_by_engineer(self, engineer_id: int) -> list:
         """Find references by engineer"""
@@ -55,7 +54,7 @@ class TechnicalReferenceRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = self.fetch_all(query, (engineer_id,))
-        return [TechnicalReference.from_dict(self.dict_to_row(row)) for row in rows]
+        return TechnicalReference.from_rows(rows)
     
     def find_by_type(self, reference_type: str) -> list:
         """Find references by type"""
@@ -65,7 +64,7 @@ class TechnicalReferenceRepository(BaseRepository):
             ORDER BY created_at DESC
         """
         rows = self.fetch_all(query, (reference_type,))
-        return [TechnicalReference.from_dict(self.dict_to_row(row)) for row in rows]
+        return TechnicalReference.from_rows(rows)
 
 
 
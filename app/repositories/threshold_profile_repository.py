@@ -0,0 +1,94 @@
+"""
+Threshold Profile Repository
+"""
+from app.repositories.base_repository import BaseRepository
+from app.models.threshold_profile import ThresholdProfile
+from app.algorithms.threshold_rules import LIMIT_FIELDS
+
+class ThresholdProfileRepository(BaseRepository):
+    """Repository for threshold profile data access"""
+    
+    def create(self, profile: ThresholdProfile) -> int:
+        """Create new threshold profile"""
+        query = f"""
+            INSERT INTO threshold_profiles 
+            (name, equipment_type, equipment_id, {', '.join(LIMIT_FIELDS)}, is_active, revision)
+            VALUES (?, ?, ?, {', '.join('?' for _ in LIMIT_FIELDS)}, ?,
+                    (SELECT COALESCE(MAX(revision), 0) + 1 FROM threshold_profiles))
+        """
+        cursor = self.execute_query(query, (
+            profile.name,
+            profile.equipment_type,
+            profile.equipment_id,
+            *(getattr(profile, field) for field in LIMIT_FIELDS),
+            1 if profile.is_active else 0
+        ))
+        self.commit()
+        return cursor.lastrowid
+    
+    def find_by_id(self, profile_id: int) -> ThresholdProfile:
+        """Find threshold profile by ID"""
+        query = "SELECT * FROM threshold_profiles WHERE id = ?"
+        row = self.fetch_one(query, (profile_id,))
+        if row:
+            return ThresholdProfile.from_row(row)
+        return None
+    
+    def find_by_scope(self, equipment_type: str = None, equipment_id: int = None) -> ThresholdProfile:
+        """Find the profile for a scope (both None = the default profile)"""
+        query = """
+            SELECT * FROM threshold_profiles 
+            WHERE equipment_type IS ? AND equipment_id IS ?
+            ORDER BY id DESC LIMIT 1
+        """
+        row = self.fetch_one(query, (equipment_type, equipment_id))
+        if row:
+            return ThresholdProfile.from_row(row)
+        return None
+    
+    def find_all(self) -> list:
+        """Find all threshold profiles, least specific first"""
+        query = """
+            SELECT * FROM threshold_profiles 
+            ORDER BY equipment_id IS NOT NULL, equipment_type IS NOT NULL, equipment_type, equipment_id, id
+        """
+        rows = self.fetch_all(query)
+        return ThresholdProfile.from_rows(rows)
+    
+    def find_equipment_types(self) -> dict:
+        """Equipment id -> equipment type for equipment that has its own profile"""
+        query = """
+            SELECT e.id, e.equipment_type FROM equipment e 
+            JOIN threshold_profiles p ON p.equipment_id = e.id
+        """
+        return {row['id']: row['equipment_type'] for row in self.fetch_all(query)}
+    
+    def get_signature(self) -> tuple:
+        """Changes whenever a profile is created, updated or deleted"""
+        row = self.fetch_one("""
+            SELECT COUNT(*), COALESCE(MAX(revision), 0), COALESCE(MAX(id), 0) FROM threshold_profiles
+        """)
+        return tuple(row)
+    
+    def update(self, profile: ThresholdProfile) -> bool:
+        """Update threshold profile"""
+        query = f"""
+            UPDATE threshold_profiles 
+            SET name = ?, {', '.join(f'{field} = ?' for field in LIMIT_FIELDS)}, is_active = ?,
+                revision = (SELECT COALESCE(MAX(revision), 0) + 1 FROM threshold_profiles),
+                updated_at = CURRENT_TIMESTAMP
+            WHERE id = ?
+        """
+        self.execute_query(query, (
+            profile.name,
+            *(getattr(profile, field) for field in LIMIT_FIELDS),
+            1 if profile.is_active else 0,
+            profile.id
+        ))
+        self.commit()
+        return True
+    
+    def delete(self, profile_id: int) -> None:
+        """Delete threshold profile"""
+        self.execute_query("DELETE FROM threshold_profiles WHERE id = ?", (profile_id,))
+        self.commit()
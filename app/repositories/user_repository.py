@@ -29,8 +29,7 @@ class UserRepository(BaseRepository):
         query = "SELECT * FROM users WHERE id = ?"
         row = self.fetch_one(query, (user_id,))
         if row:
-            data = self.dict_to_row(row)
-            return User.from_dict(data)
+            return User.from_row(row)
         return None
     
     def find_by_username(self, username: str) -> User:
@@ -38,8 +37,7 @@ class UserRepository(BaseRepository):
         query = "SELECT * FROM users WHERE username = ?"
         row = self.fetch_one(query, (username,))
         if row:
-            data = self.dict_to_row(row)
-            return User.from_dict(data)
+            return User.from_row(row)
         return None
     
     def find_by_email(self, email: str) -> User:
@@ -47,21 +45,20 @@ class UserRepository(BaseRepository):
         query = "SELECT * FROM users WHERE email = ?"
         row = self.fetch_one(query, (email,))
         if row:
-            data = self.dict_to_row(row)
-            return User.from_dict(data)
+            return User.from_row(row)
         return None
     
     def find_by_role(self, role: str) -> list:
         """Find all users by role"""
         query = "SELECT * FROM users WHERE role = ? AND is_active = 1"
         rows = self.fetch_all(query, (role,))
-        return [User.from_dict(self.dict_to_row(row)) for row in rows]
+        return User.from_rows(rows)
     
     def find_all(self) -> list:
         """Find all users"""
         query = "SELECT * FROM users WHERE is_active = 1"
         rows = self.fetch_all(query)
-        return [User.from_dict(self.dict_to_row(row)) for row in rows]
+        return User.from_rows(rows)
     
     def update(self, user: User) -> bool:
         """Update user"""
@@ -29,8 +29,7 @@ class VendorRepository(BaseRepository):
         query = "SELECT * FROM vendors WHERE id = ?"
         row = self.fetch_one(query, (vendor_id,))
         if row:
-            data = self.dict_to_row(row)
-            return Vendor.from_dict(data)
+            return Vendor.from_row(row)
         return None
     
     def find_by_code(self, vendor_code: str) -> Vendor:
@@ -38,8 +37,7 @@ class VendorRepository(BaseRepository):
         query = "SELECT * FROM vendors WHERE vendor_code = ?"
         row = self.fetch_one(query, (vendor_code,))
         if row:
-            data = self.dict_to_row(row)
-            return Vendor.from_dict(data)
+            return Vendor.from_row(row)
         return None
     
     def find_all(self, active_only: bool = True) -> list:
@@ -49,7 +47,7 @@ class VendorRepository(BaseRepository):
         else:
             query = "SELECT * FROM vendors ORDER BY vendor_name"
         rows = self.fetch_all(query)
-        return [Vendor.from_dict(self.dict_to_row(row)) for row in rows]
+        return Vendor.from_rows(rows)
     
     def update(self, vendor: Vendor) -> bool:
         """Update vendor"""
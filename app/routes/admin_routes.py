@@ -0,0 +1,111 @@
+"""
+Admin Routes
+"""
+from flask import Blueprint, render_template, redirect, url_for, current_app, send_from_directory, abort, jsonify
+from app.controllers.auth_controller import AuthController
+from app.controllers.notification_controller import NotificationController
+from app.patterns.lazy import LazyController
+
+admin_bp = Blueprint('admin', __name__, url_prefix='/admin')
+auth_controller = LazyController(AuthController)
+notification_controller = LazyController(NotificationController)
+
+PROFILE_ARTIFACTS = {
+    'txt': 'text/plain',
+    'collapsed': 'text/plain',
+    'prof': 'application/octet-stream'
+}
+
+def require_admin_api():
+    """Require an admin role for admin APIs"""
+    if not auth_controller.is_authenticated():
+        return jsonify({'success': False, 'message': 'Authentication required'}), 401
+    if not auth_controller.require_role(current_app.config['ADMIN_ROLE']):
+        return jsonify({'success': False, 'message': 'Not authorized'}), 403
+    return None
+
+def require_profile_access():
+    """Require a role allowed to view profiles"""
+    if not auth_controller.is_authenticated():
+        return redirect(url_for('auth.login'))
+    if not current_app.extensions['request_profiler'].is_authorized():
+        return redirect(url_for('index'))
+    return None
+
+@admin_bp.route('/profiles')
+def profiles():
+    """Recent request profiles"""
+    auth_check = require_profile_access()
+    if auth_check:
+        return auth_check
+
+    user = auth_controller.get_current_user()
+    notifications = notification_controller.get_user_notifications(unread_only=True)
+    profiler = current_app.extensions['request_profiler']
+
+    return render_template('admin/profiles.html',
+                         user=user,
+                         notifications=notifications.get('data', []),
+                         profiles=profiler.list_profiles(),
+                         sample_rate=current_app.config['PROFILE_SAMPLE_RATE'])
+
+@admin_bp.route('/profiles/<profile_id>.<kind>')
+def profile_artifact(profile_id, kind):
+    """Download a profile artifact (top-N stats, collapsed stacks or raw pstats)"""
+    auth_check = require_profile_access()
+    if auth_check:
+        return auth_check
+
+    if kind not in PROFILE_ARTIFACTS:
+        abort(404)
+    profiler = current_app.extensions['request_profiler']
+    return send_from_directory(profiler.profile_dir, f"{profile_id}.{kind}",
+                               mimetype=PROFILE_ARTIFACTS[kind],
+                               as_attachment=(kind == 'prof'))
+
+@admin_bp.route('/maintenance', methods=['GET'])
+def maintenance_status():
+    """Database maintenance status (last run and duration per task)"""
+    auth_check = require_admin_api()
+    if auth_check:
+        return auth_check
+
+    maintenance = current_app.extensions['db_maintenance']
+    return jsonify({'success': True, 'data': maintenance.status()}), 200
+
+@admin_bp.route('/maintenance/<task>/run', methods=['POST'])
+def run_maintenance_task(task):
+    """Queue a maintenance task on the background thread"""
+    auth_check = require_admin_api()
+    if auth_check:
+        return auth_check
+
+    maintenance = current_app.extensions['db_maintenance']
+    try:
+        maintenance.request_run(task)
+    except ValueError as e:
+        return jsonify({'success': False, 'message': str(e)}), 400
+    return jsonify({'success': True, 'message': f'{task} queued'}), 202
+
+@admin_bp.route('/backups', methods=['GET'])
+def backup_list():
+    """Snapshot schedule status and available snapshots"""
+    auth_check = require_admin_api()
+    if auth_check:
+        return auth_check
+
+    scheduler = current_app.extensions['db_backup']
+    data = scheduler.status()
+    data['snapshots'] = scheduler.backup.list_snapshots()
+    return jsonify({'success': True, 'data': data}), 200
+
+@admin_bp.route('/backups', methods=['POST'])
+def create_backup():
+    """Queue an online snapshot on the backup thread (progress via GET /admin/backups)"""
+    auth_check = require_admin_api()
+    if auth_check:
+        return auth_check
+
+    scheduler = current_app.extensions['db_backup']
+    scheduler.request_snapshot()
+    return jsonify({'success': True, 'message': 'snapshot queued'}), 202
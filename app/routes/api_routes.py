@@ -1,7 +1,7 @@
 """
 API Routes
 """
-from flask import Blueprint, request, jsonify, session
+from flask import Blueprint, request, jsonify, session, Response
 from app.controllers.auth_controller import AuthController
 from app.controllers.monitoring_controller import MonitoringController
 from app.controllers.fault_controller import FaultController
@@ -15,21 +15,38 @@ from app.controllers.technical_reference_controller import TechnicalReferenceCon
 from app.controllers.documentation_package_controller import DocumentationPackageController
 from app.controllers.delivery_verification_controller import DeliveryVerificationController
 from app.controllers.vendor_controller import VendorController
+from app.controllers.export_controller import ExportController
+from app.controllers.threshold_controller import ThresholdController
+from app.controllers.maintenance_controller import MaintenanceController
+from app.controllers.analytics_controller import AnalyticsController
+from app.controllers.search_controller import SearchController
+from app.controllers.sync_controller import SyncController
+from app.patterns.lazy import LazyController
+from app.routes.streaming import stream_mode, respond
+from app.routes.idempotency import IdempotencyGuard
 
 api_bp = Blueprint('api', __name__, url_prefix='/api')
-auth_controller = AuthController()
-monitoring_controller = MonitoringController()
-fault_controller = FaultController()
-report_controller = ReportController()
-notification_controller = NotificationController()
-equipment_controller = EquipmentController()
-rca_controller = RCAController()
-performance_report_controller = PerformanceReportController()
-data_reverification_controller = DataReverificationController()
-technical_reference_controller = TechnicalReferenceController()
-documentation_package_controller = DocumentationPackageController()
-delivery_verification_controller = DeliveryVerificationController()
-vendor_controller = VendorController()
+# Idempotency-Key replay for every POST/PUT below
+IdempotencyGuard(api_bp)
+auth_controller = LazyController(AuthController)
+monitoring_controller = LazyController(MonitoringController)
+fault_controller = LazyController(FaultController)
+report_controller = LazyController(ReportController)
+notification_controller = LazyController(NotificationController)
+equipment_controller = LazyController(EquipmentController)
+rca_controller = LazyController(RCAController)
+performance_report_controller = LazyController(PerformanceReportController)
+data_reverification_controller = LazyController(DataReverificationController)
+technical_reference_controller = LazyController(TechnicalReferenceController)
+documentation_package_controller = LazyController(DocumentationPackageController)
+delivery_verification_controller = LazyController(DeliveryVerificationController)
+vendor_controller = LazyController(VendorController)
+export_controller = LazyController(ExportController)
+threshold_controller = LazyController(ThresholdController)
+maintenance_controller = LazyController(MaintenanceController)
+analytics_controller = LazyController(AnalyticsController)
+search_controller = LazyController(SearchController)
+sync_controller = LazyController(SyncController)
 
 def require_auth_api():
     """Check authentication for API"""
@@ -69,8 +86,9 @@ def get_technician_monitoring():
         return auth_check
     
     limit = request.args.get('limit', 100, type=int)
-    result = monitoring_controller.get_technician_history(limit)
-    return jsonify(result), 200
+    mode = stream_mode(limit)
+    result = monitoring_controller.get_technician_history(limit, stream=bool(mode))
+    return respond(result, mode)
 
 @api_bp.route('/monitoring/<int:monitoring_id>', methods=['GET'])
 def get_monitoring(monitoring_id):
@@ -127,8 +145,9 @@ def get_faults():
         return auth_check
     
     limit = request.args.get('limit', 100, type=int)
-    result = fault_controller.get_all_faults(limit)
-    return jsonify(result), 200
+    mode = stream_mode(limit)
+    result = fault_controller.get_all_faults(limit, stream=bool(mode))
+    return respond(result, mode)
 
 @api_bp.route('/faults/<int:fault_id>', methods=['GET'])
 def get_fault(fault_id):
@@ -141,6 +160,39 @@ def get_fault(fault_id):
     status_code = 200 if result['success'] else 404
     return jsonify(result), status_code
 
+@api_bp.route('/faults/<int:fault_id>/duplicates', methods=['GET'])
+def get_fault_duplicates(fault_id):
+    """Duplicate reports attached to a fault"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    result = fault_controller.get_fault_duplicates(fault_id)
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+@api_bp.route('/faults/<int:fault_id>/similar', methods=['GET'])
+def get_similar_faults(fault_id):
+    """Most similar resolved faults with their root causes"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    result = fault_controller.get_similar_faults(fault_id, request.args.get('k', 5, type=int))
+    status_code = 200 if result['success'] else 404
+    return jsonify(result), status_code
+
+@api_bp.route('/faults/similar/rebuild', methods=['POST'])
+def rebuild_similar_faults():
+    """Reload the similar-fault index"""
+    auth_check = require_engineer_api()
+    if auth_check:
+        return auth_check
+    
+    result = fault_controller.rebuild_similarity_index()
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
 @api_bp.route('/faults/<int:fault_id>/status', methods=['PUT'])
 def update_fault_status(fault_id):
     """Update fault status"""
@@ -284,6 +336,29 @@ def get_equipment():
     result = equipment_controller.get_all_equipment()
     return jsonify(result), 200
 
+@api_bp.route('/equipment/status-board', methods=['GET'])
+def get_equipment_status_board():
+    """Latest V/I/PF, status and timestamp for every equipment"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    result = monitoring_controller.get_status_board()
+    return jsonify(result), 200
+
+@api_bp.route('/equipment/health', methods=['GET'])
+def get_equipment_health_ranking():
+    """Equipment health scores, worst first"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    limit = request.args.get('limit', 50, type=int)
+    offset = request.args.get('offset', 0, type=int)
+    result = equipment_controller.get_health_ranking(limit, offset)
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
 @api_bp.route('/equipment/<int:equipment_id>', methods=['GET'])
 def get_equipment_by_id(equipment_id):
     """Get equipment by ID"""
@@ -295,6 +370,254 @@ def get_equipment_by_id(equipment_id):
     status_code = 200 if result['success'] else 404
     return jsonify(result), status_code
 
+@api_bp.route('/equipment/<int:equipment_id>/thresholds', methods=['GET'])
+def get_equipment_thresholds(equipment_id):
+    """Effective monitoring thresholds for an equipment"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    result = threshold_controller.get_equipment_limits(equipment_id)
+    status_code = 200 if result['success'] else 404
+    return jsonify(result), status_code
+
+@api_bp.route('/equipment/<int:equipment_id>/health', methods=['GET'])
+def get_equipment_health(equipment_id):
+    """Health score of an equipment and its rank"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    result = equipment_controller.get_equipment_health(equipment_id)
+    status_code = 200 if result['success'] else 404
+    return jsonify(result), status_code
+
+@api_bp.route('/equipment/<int:equipment_id>/anomaly-state', methods=['GET'])
+def get_equipment_anomaly_state(equipment_id):
+    """Rolling V/I/PF statistics the anomaly detector keeps for an equipment"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    result = monitoring_controller.get_anomaly_state(equipment_id)
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+# Threshold Profile API
+def require_engineer_api():
+    """Threshold changes are limited to engineers and above"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    if not auth_controller.require_role('engineer'):
+        return jsonify({'success': False, 'message': 'Not authorized'}), 403
+    return None
+
+@api_bp.route('/threshold-profiles', methods=['GET'])
+def get_threshold_profiles():
+    """Get all threshold profiles"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    result = threshold_controller.get_profiles()
+    return jsonify(result), 200
+
+@api_bp.route('/threshold-profiles', methods=['POST'])
+def create_threshold_profile():
+    """Create threshold profile"""
+    auth_check = require_engineer_api()
+    if auth_check:
+        return auth_check
+    
+    data = request.get_json()
+    result = threshold_controller.create_profile(data)
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+@api_bp.route('/threshold-profiles/<int:profile_id>', methods=['PUT'])
+def update_threshold_profile(profile_id):
+    """Update threshold profile"""
+    auth_check = require_engineer_api()
+    if auth_check:
+        return auth_check
+    
+    data = request.get_json()
+    result = threshold_controller.update_profile(profile_id, data)
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+@api_bp.route('/threshold-profiles/<int:profile_id>', methods=['DELETE'])
+def delete_threshold_profile(profile_id):
+    """Delete threshold profile"""
+    auth_check = require_engineer_api()
+    if auth_check:
+        return auth_check
+    
+    result = threshold_controller.delete_profile(profile_id)
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+@api_bp.route('/threshold-profiles/reclassify', methods=['GET'])
+def get_reclassification_status():
+    """Progress of the monitoring re-classification job"""
+    auth_check = require_engineer_api()
+    if auth_check:
+        return auth_check
+    
+    result = threshold_controller.get_reclassification_status()
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+@api_bp.route('/threshold-profiles/reclassify', methods=['POST'])
+def start_reclassification():
+    """Re-classify monitoring history with the current thresholds (background job)"""
+    auth_check = require_engineer_api()
+    if auth_check:
+        return auth_check
+    
+    data = request.get_json(silent=True) or {}
+    result = threshold_controller.start_reclassification(data)
+    status_code = 202 if result['success'] else 409
+    return jsonify(result), status_code
+
+@api_bp.route('/threshold-profiles/reclassify/cancel', methods=['POST'])
+def cancel_reclassification():
+    """Stop the re-classification job after its current chunk"""
+    auth_check = require_engineer_api()
+    if auth_check:
+        return auth_check
+    
+    result = threshold_controller.cancel_reclassification()
+    status_code = 200 if result['success'] else 409
+    return jsonify(result), status_code
+
+@api_bp.route('/equipment/health/rebuild', methods=['POST'])
+def rebuild_equipment_health():
+    """Recompute every equipment health score from the source tables"""
+    auth_check = require_engineer_api()
+    if auth_check:
+        return auth_check
+    
+    result = equipment_controller.rebuild_health()
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+# Maintenance Forecast API
+@api_bp.route('/maintenance/forecasts', methods=['GET'])
+def get_maintenance_forecasts():
+    """Suggested maintenance dates, soonest first"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    min_confidence = request.args.get('min_confidence', 0.0, type=float)
+    limit = request.args.get('limit', 100, type=int)
+    result = maintenance_controller.get_forecasts(min_confidence, limit)
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+@api_bp.route('/maintenance/forecasts', methods=['POST'])
+def run_maintenance_forecast():
+    """Recompute maintenance forecasts (optionally applying confident ones)"""
+    auth_check = require_engineer_api()
+    if auth_check:
+        return auth_check
+    
+    data = request.get_json(silent=True) or {}
+    result = maintenance_controller.run_forecast(data)
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+@api_bp.route('/equipment/<int:equipment_id>/maintenance-forecast', methods=['GET'])
+def get_equipment_maintenance_forecast(equipment_id):
+    """Suggested maintenance date for an equipment"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    result = maintenance_controller.get_equipment_forecast(equipment_id)
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+# Analytics API
+@api_bp.route('/analytics/reliability', methods=['GET'])
+def get_reliability_analytics():
+    """MTBF/MTTR per equipment, type or location"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    dimension = request.args.get('dimension', 'equipment')
+    period = request.args.get('period', 'all')
+    result = analytics_controller.get_reliability(dimension, period)
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+# Search API
+@api_bp.route('/search', methods=['GET'])
+def search():
+    """Full-text search over faults, RCAs and resolution reports"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    result = search_controller.search(
+        request.args.get('q', ''),
+        types=request.args.get('type'),
+        equipment_id=request.args.get('equipment_id', type=int),
+        page=request.args.get('page', 1, type=int),
+        per_page=request.args.get('per_page', 20, type=int)
+    )
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+@api_bp.route('/library/search', methods=['GET'])
+def search_library():
+    """Full-text search over technical references and documentation items"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    result = search_controller.search_library(
+        request.args.get('q', ''),
+        group_by=request.args.get('group_by', 'equipment'),
+        types=request.args.get('type'),
+        equipment_id=request.args.get('equipment_id', type=int),
+        page=request.args.get('page', 1, type=int),
+        per_page=request.args.get('per_page', 20, type=int)
+    )
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+# Delta sync API (offline clients)
+@api_bp.route('/sync', methods=['GET'])
+def get_sync_changes():
+    """Equipment, monitoring, faults and notifications changed since a sequence number"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    result = sync_controller.get_changes(
+        since=request.args.get('since', 0, type=int),
+        tables=request.args.get('tables'),
+        limit=request.args.get('limit', 500, type=int)
+    )
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
+@api_bp.route('/sync', methods=['POST'])
+def apply_sync_operations():
+    """Apply a batch of queued offline writes"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    
+    data = request.get_json(silent=True)
+    result = sync_controller.apply_operations(data)
+    status_code = 200 if result['success'] else 400
+    return jsonify(result), status_code
+
 # Performance Report API (UC-04)
 @api_bp.route('/performance-reports', methods=['POST'])
 def create_performance_report():
@@ -316,8 +639,9 @@ def compile_performance_data():
         return auth_check
     
     data = request.get_json()
-    result = performance_report_controller.compile_report_data(data)
-    return jsonify(result), 200
+    mode = stream_mode()
+    result = performance_report_controller.compile_report_data(data, stream=bool(mode))
+    return respond(result, mode, path=('data', 'records'))
 
 @api_bp.route('/performance-reports/<int:report_id>/submit', methods=['POST'])
 def submit_performance_report(report_id):
@@ -688,3 +1012,31 @@ def activate_vendor(vendor_id):
     status_code = 200 if result['success'] else 400
     return jsonify(result), status_code
 
+# Export API
+EXPORT_FILTERS = ('equipment_id', 'technician_id', 'status', 'start_date', 'end_date')
+
+@api_bp.route('/export/<kind>', methods=['GET'])
+def export_data(kind):
+    """Bulk export of monitoring or fault history (?format=csv|parquet|arrow)"""
+    auth_check = require_auth_api()
+    if auth_check:
+        return auth_check
+    if kind not in ('monitoring', 'faults'):
+        return jsonify({'success': False, 'message': f'Unknown export: {kind}'}), 404
+    
+    filters = {name: request.args.get(name) for name in EXPORT_FILTERS}
+    if not auth_controller.require_role('engineer'):
+        # Technicians can only export their own records
+        filters['technician_id'] = session['user_id']
+    
+    result = export_controller.export(kind, filters, request.args.get('format', 'csv'))
+    if not result['success']:
+        return jsonify(result), 400
+    
+    headers = {'Content-Disposition': f"attachment; filename={result['filename']}"}
+    if result['rows'] is not None:
+        headers['Content-Length'] = str(result['size'])
+        headers['X-Export-Rows'] = str(result['rows'])
+    # Not wrapped in stream_with_context: the export reads through its own
+    # connection, so the request's pooled connection is released right away
+    return Response(result['data'], mimetype=result['mimetype'], headers=headers)
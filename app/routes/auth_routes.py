@@ -3,9 +3,10 @@ Authentication Routes
 """
 from flask import Blueprint, request, jsonify, render_template, redirect, url_for, session
 from app.controllers.auth_controller import AuthController
+from app.patterns.lazy import LazyController
 
 auth_bp = Blueprint('auth', __name__)
-auth_controller = AuthController()
+auth_controller = LazyController(AuthController)
 
 @auth_bp.route('/login', methods=['GET', 'POST'])
 def login():
@@ -6,16 +6,15 @@ from app.controllers.auth_controller import AuthController
 from app.controllers.notification_controller import NotificationController
 from app.controllers.fault_controller import FaultController
 from app.controllers.monitoring_controller import MonitoringController
-from app.controllers.equipment_controller import EquipmentController
 from app.controllers.report_controller import ReportController
+from app.patterns.lazy import LazyController
 
 dashboard_bp = Blueprint('dashboard', __name__)
-auth_controller = AuthController()
-notification_controller = NotificationController()
-fault_controller = FaultController()
-monitoring_controller = MonitoringController()
-equipment_controller = EquipmentController()
-report_controller = ReportController()
+auth_controller = LazyController(AuthController)
+notification_controller = LazyController(NotificationController)
+fault_controller = LazyController(FaultController)
+monitoring_controller = LazyController(MonitoringController)
+report_controller = LazyController(ReportController)
 
 def require_auth():
     """Require authentication decorator"""
@@ -41,7 +40,7 @@ def technician_dashboard():
         return redirect(auth_controller._get_role_dashboard(user['role']))
     
     notifications = notification_controller.get_user_notifications(unread_only=True)
-    equipment = equipment_controller.get_all_equipment()
+    equipment = monitoring_controller.get_status_board()
     
     return render_template('dashboards/technician.html',
                          user=user,
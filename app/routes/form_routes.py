@@ -13,19 +13,20 @@ from app.controllers.technical_reference_controller import TechnicalReferenceCon
 from app.controllers.documentation_package_controller import DocumentationPackageController
 from app.controllers.delivery_verification_controller import DeliveryVerificationController
 from app.controllers.vendor_controller import VendorController
+from app.patterns.lazy import LazyController
 
 forms_bp = Blueprint('forms', __name__)
-auth_controller = AuthController()
-equipment_controller = EquipmentController()
-fault_controller = FaultController()
-notification_controller = NotificationController()
-performance_report_controller = PerformanceReportController()
-data_reverification_controller = DataReverificationController()
-monitoring_controller = MonitoringController()
-technical_reference_controller = TechnicalReferenceController()
-documentation_package_controller = DocumentationPackageController()
-delivery_verification_controller = DeliveryVerificationController()
-vendor_controller = VendorController()
+auth_controller = LazyController(AuthController)
+equipment_controller = LazyController(EquipmentController)
+fault_controller = LazyController(FaultController)
+notification_controller = LazyController(NotificationController)
+performance_report_controller = LazyController(PerformanceReportController)
+data_reverification_controller = LazyController(DataReverificationController)
+monitoring_controller = LazyController(MonitoringController)
+technical_reference_controller = LazyController(TechnicalReferenceController)
+documentation_package_controller = LazyController(DocumentationPackageController)
+delivery_verification_controller = LazyController(DeliveryVerificationController)
+vendor_controller = LazyController(VendorController)
 
 def require_auth():
     """Require authentication"""
@@ -60,7 +61,7 @@ def equipment_status():
         return auth_check
     
     user = auth_controller.get_current_user()
-    equipment = equipment_controller.get_all_equipment()
+    equipment = monitoring_controller.get_status_board()
     notifications = notification_controller.get_user_notifications(unread_only=True)
     
     return render_template('forms/equipment_status.html',
@@ -0,0 +1,107 @@
+"""
+Idempotency Keys for Write APIs
+
+A client that retries a POST or PUT after a timeout cannot tell whether the
+first attempt went through. Sending the same Idempotency-Key header on every
+attempt makes the retry safe: the first request with a key runs and its
+response is stored; later requests with that key get the stored response back
+(with an Idempotent-Replayed: true header) without running the write again.
+
+  - keys are per user and kept for IDEMPOTENCY_TTL_SECONDS
+  - reusing a key for a different method, path, query or body gives 422
+  - a retry that arrives while the first request is still running gives 409
+  - only successful responses are stored: 2xx without "success": false.
+    Controllers turn every exception (a locked database included) into a 400
+    or a success-false body, so anything else releases the key and a retry
+    runs again
+  - requests without the header, or without a logged-in user, are untouched
+"""
+from flask import Response, current_app, g, jsonify, request, session
+from app.patterns.factory import ServiceFactory
+from app.services.idempotency_service import IdempotencyService, MAX_KEY_LENGTH, request_fingerprint
+
+
+class IdempotencyGuard:
+    """Idempotency-Key handling for the POST/PUT routes of a blueprint"""
+
+    HEADER = 'Idempotency-Key'
+    REPLAYED_HEADER = 'Idempotent-Replayed'
+    METHODS = ('POST', 'PUT')
+
+    def __init__(self, blueprint=None):
+        if blueprint is not None:
+            self.init_blueprint(blueprint)
+
+    def init_blueprint(self, blueprint):
+        """Register request hooks on the blueprint"""
+        blueprint.record_once(lambda state: state.app.config.setdefault('IDEMPOTENCY_TTL_SECONDS', 24 * 3600))
+        blueprint.before_request(self._before_request)
+        blueprint.after_request(self._after_request)
+        blueprint.teardown_request(self._teardown_request)
+
+    def _before_request(self):
+        key = request.headers.get(self.HEADER)
+        user_id = session.get('user_id')
+        if request.method not in self.METHODS or key is None or user_id is None:
+            return None
+        if not key or len(key) > MAX_KEY_LENGTH:
+            return jsonify({'success': False,
+                            'message': f'{self.HEADER} must be 1 to {MAX_KEY_LENGTH} characters'}), 400
+
+        service = ServiceFactory.create_idempotency_service()
+        fingerprint = request_fingerprint(request.method, request.path, request.query_string,
+                                          request.get_data(cache=True))
+        try:
+            state, row = service.begin(user_id, key, fingerprint)
+        except Exception as e:
+            # Without the table the request still runs, just without replay protection
+            print(f"Warning: Idempotency check failed: {e}")
+            return None
+
+        if state == IdempotencyService.NEW:
+            g._apds_idempotency = (user_id, key)
+            return None
+        if state == IdempotencyService.REPLAY:
+            response = Response(row['response_body'], status=row['status_code'],
+                                content_type=row['content_type'])
+            response.headers[self.REPLAYED_HEADER] = 'true'
+            return response
+        if state == IdempotencyService.MISMATCH:
+            return jsonify({'success': False,
+                            'message': f'{self.HEADER} was already used for a different request'}), 422
+        response = jsonify({'success': False,
+                            'message': 'A request with this Idempotency-Key is still in progress'})
+        response.headers['Retry-After'] = '1'
+        return response, 409
+
+    def _after_request(self, response):
+        held = g.pop('_apds_idempotency', None)
+        if held is None:
+            return response
+        service = ServiceFactory.create_idempotency_service()
+        try:
+            if not self._replayable(response):
+                service.release(*held)
+            else:
+                service.complete(*held, response.status_code, response.content_type,
+                                 response.get_data(), current_app.config['IDEMPOTENCY_TTL_SECONDS'])
+        except Exception as e:
+            print(f"Warning: Could not store idempotent response: {e}")
+        return response
+
+    @staticmethod
+    def _replayable(response) -> bool:
+        """Whether a response is a completed write that a retry should get back"""
+        if not 200 <= response.status_code < 300 or response.is_streamed:
+            return False
+        body = response.get_json(silent=True)
+        return not (isinstance(body, dict) and body.get('success') is False)
+
+    def _teardown_request(self, exc=None):
+        # Request failed before after_request ran - free the key for a retry
+        held = g.pop('_apds_idempotency', None)
+        if held is not None:
+            try:
+                ServiceFactory.create_idempotency_service().release(*held)
+            except Exception as e:
+                print(f"Warning: Could not release idempotency key: {e}")
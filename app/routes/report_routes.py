@@ -5,11 +5,12 @@ from flask import Blueprint, render_template, redirect, url_for
 from app.controllers.auth_controller import AuthController
 from app.controllers.report_controller import ReportController
 from app.controllers.notification_controller import NotificationController
+from app.patterns.lazy import LazyController
 
 reports_bp = Blueprint('reports', __name__)
-auth_controller = AuthController()
-report_controller = ReportController()
-notification_controller = NotificationController()
+auth_controller = LazyController(AuthController)
+report_controller = LazyController(ReportController)
+notification_controller = LazyController(NotificationController)
 
 def require_auth():
     """Require authentication"""
@@ -0,0 +1,80 @@
+"""
+Streaming JSON Responses
+
+Large list endpoints can send their rows as they are read from the cursor
+instead of building the whole list and calling jsonify:
+  - JSON: the usual {"success": true, "data": [...]} body, written in chunks
+  - NDJSON: one record per line (?format=ndjson or Accept: application/x-ndjson)
+
+Streaming is used when the client asks for it (?stream=1 or NDJSON) or when
+the requested limit reaches STREAM_MIN_ROWS.
+"""
+from functools import partial
+from flask import Response, current_app, request, stream_with_context, jsonify
+
+NDJSON_MIMETYPE = 'application/x-ndjson'
+STREAM_PLACEHOLDER = '__streamed_items__'
+
+
+def stream_mode(limit: int = None):
+    """'ndjson', 'json' or None (regular jsonify) for the current request"""
+    if request.args.get('format') == 'ndjson':
+        return 'ndjson'
+    if request.accept_mimetypes.best == NDJSON_MIMETYPE:
+        return 'ndjson'
+    if request.args.get('stream', type=int):
+        return 'json'
+    if limit is not None and limit >= current_app.config.get('STREAM_MIN_ROWS', 1000):
+        return 'json'
+    return None
+
+
+def _batched(items, dumps, batch_size: int, separator: str):
+    batch = []
+    for item in items:
+        batch.append(dumps(item))
+        if len(batch) >= batch_size:
+            yield separator.join(batch)
+            batch = []
+    if batch:
+        yield separator.join(batch)
+
+
+def stream_json(payload: dict, path: tuple, mode: str = 'json', batch_size: int = 200) -> Response:
+    """
+    Stream payload with the generator found at payload[path[0]][path[1]]...
+    written as a JSON array (or as NDJSON lines of just the items)
+    """
+    container = payload
+    for key in path[:-1]:
+        container = container[key]
+    items = container[path[-1]]
+    # Same encoder (sorted keys, date handling) and compact output as jsonify
+    dumps = partial(current_app.json.dumps, separators=(',', ':'))
+
+    if mode == 'ndjson':
+        def generate():
+            for chunk in _batched(items, dumps, batch_size, '\n'):
+                yield chunk + '\n'
+        return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+    container[path[-1]] = STREAM_PLACEHOLDER
+    prefix, suffix = dumps(payload).split(f'"{STREAM_PLACEHOLDER}"', 1)
+
+    def generate():
+        yield prefix + '['
+        first = True
+        for chunk in _batched(items, dumps, batch_size, ','):
+            yield chunk if first else ',' + chunk
+            first = False
+        yield ']' + suffix
+    return Response(stream_with_context(generate()), mimetype='application/json')
+
+
+def respond(result: dict, mode, path: tuple = ('data',), error_status: int = 200):
+    """jsonify a controller result, or stream it when mode is set and the call succeeded"""
+    if not result.get('success'):
+        return jsonify(result), error_status
+    if mode:
+        return stream_json(result, path, mode)
+    return jsonify(result), 200
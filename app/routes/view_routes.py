@@ -7,13 +7,14 @@ from app.controllers.monitoring_controller import MonitoringController
 from app.controllers.fault_controller import FaultController
 from app.controllers.report_controller import ReportController
 from app.controllers.notification_controller import NotificationController
+from app.patterns.lazy import LazyController
 
 views_bp = Blueprint('views', __name__)
-auth_controller = AuthController()
-monitoring_controller = MonitoringController()
-fault_controller = FaultController()
-report_controller = ReportController()
-notification_controller = NotificationController()
+auth_controller = LazyController(AuthController)
+monitoring_controller = LazyController(MonitoringController)
+fault_controller = LazyController(FaultController)
+report_controller = LazyController(ReportController)
+notification_controller = LazyController(NotificationController)
 
 def require_auth():
     """Require authentication"""
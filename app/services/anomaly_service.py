@@ -0,0 +1,89 @@
+"""
+Anomaly Service
+"""
+import atexit
+import threading
+import time
+from app.repositories.anomaly_state_repository import AnomalyStateRepository
+from app.algorithms.anomaly_detection import AnomalyDetector, METRICS, reading_hour
+from app.patterns.observer import Subject
+from app.models.monitoring import DailyMonitoring
+from app.models.equipment import Equipment
+
+class AnomalyService:
+    """
+    Online anomaly detection on incoming monitoring readings. The statistics
+    live in memory and are written to anomaly_state every `persist_interval`
+    seconds (by the maintenance scheduler, or by the next reading when it
+    does not run) and once more at shutdown.
+    """
+    
+    def __init__(self, state_repository: AnomalyStateRepository, events: Subject,
+                 persist_interval: float = 60.0):
+        self.state_repository = state_repository
+        self.events = events
+        self.persist_interval = persist_interval
+        self.detector = AnomalyDetector()
+        self._loaded = False
+        self._dirty = set()
+        self._last_persist = time.monotonic()
+        self._lock = threading.Lock()
+        atexit.register(self._persist_at_exit)
+    
+    def check_reading(self, monitoring: DailyMonitoring, equipment: Equipment) -> list:
+        """Add a new reading to its equipment's statistics; anomalies raise 'monitoring_anomaly'"""
+        with self._lock:
+            if not self._loaded:
+                self.detector.load(self.state_repository.find_all())
+                self._loaded = True
+            anomalies = self.detector.update(
+                equipment.id,
+                reading_hour(monitoring.monitoring_date, monitoring.shift),
+                {metric: getattr(monitoring, metric) for metric in METRICS}
+            )
+            self._dirty.update((equipment.id, metric) for metric in METRICS)
+            persist_due = time.monotonic() - self._last_persist >= self.persist_interval
+        
+        if persist_due:
+            try:
+                self.persist()
+            except Exception as e:
+                print(f"Warning: Could not persist anomaly state: {e}")
+        if anomalies:
+            self.events.notify('monitoring_anomaly', {
+                'monitoring': monitoring,
+                'equipment': equipment,
+                'anomalies': anomalies
+            })
+        return anomalies
+    
+    def persist(self) -> int:
+        """Write the statistics changed since the last persist (kept for the next one if the write fails)"""
+        with self._lock:
+            states = self.detector.states
+            dirty, self._dirty = self._dirty, set()
+            rows = [(equipment_id, metric, *states[(equipment_id, metric)].to_tuple())
+                    for equipment_id, metric in dirty if (equipment_id, metric) in states]
+            self._last_persist = time.monotonic()
+        if rows:
+            try:
+                self.state_repository.save_all(rows)
+            except Exception:
+                with self._lock:
+                    self._dirty |= dirty
+                raise
+        return len(rows)
+    
+    def _persist_at_exit(self):
+        try:
+            self.persist()
+        except Exception as e:
+            print(f"Warning: Could not persist anomaly state at shutdown: {e}")
+    
+    def get_equipment_state(self, equipment_id: int) -> dict:
+        """Current rolling statistics per metric of an equipment"""
+        with self._lock:
+            if not self._loaded:
+                self.detector.load(self.state_repository.find_all())
+                self._loaded = True
+            return self.detector.describe(equipment_id)
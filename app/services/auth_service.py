@@ -10,9 +10,10 @@ from app.models.audit_log import AuditLog
 class AuthService:
     """Service for authentication and authorization"""
     
-    def __init__(self, user_repository: UserRepository):
+    def __init__(self, user_repository: UserRepository,
+                 audit_repository: AuditRepository):
         self.user_repository = user_repository
-        self.audit_repository = AuditRepository()
+        self.audit_repository = audit_repository
     
     def hash_password(self, password: str) -> str:
         """Hash password using SHA-256"""
@@ -5,14 +5,17 @@ from datetime import date, datetime
 from app.repositories.data_reverification_repository import DataReverificationRepository
 from app.repositories.monitoring_repository import MonitoringRepository
 from app.models.data_reverification import DataReverification
+from app.patterns.observer import Subject
 
 class DataReverificationService:
     """Service for data re-verification operations"""
     
     def __init__(self, reverification_repository: DataReverificationRepository,
-                 monitoring_repository: MonitoringRepository):
+                 monitoring_repository: MonitoringRepository,
+                 events: Subject = None):
         self.reverification_repository = reverification_repository
         self.monitoring_repository = monitoring_repository
+        self.events = events or Subject()
     
     def create_reverification(self, original_monitoring_id: int, technician_id: int,
                              new_voltage: float, new_current: float, new_power_factor: float,
@@ -22,6 +25,8 @@ class DataReverificationService:
         original = self.monitoring_repository.find_by_id(original_monitoring_id)
         if not original:
             raise ValueError("Original monitoring record not found")
+        if self.monitoring_repository.is_archived(original_monitoring_id):
+            raise ValueError("Original monitoring record is archived and can no longer be re-verified")
         
         # Calculate variances
         variance_voltage = abs(new_voltage - original.voltage) if original.voltage and new_voltage else None
@@ -75,6 +80,9 @@ class DataReverificationService:
         
         reverification_id = self.reverification_repository.create(reverification)
         reverification.id = reverification_id
+        
+        if status == "discrepancy":
+            self.events.notify('data_discrepancy', {'reverification': reverification, 'monitoring': original})
         return reverification
     
     def approve_reverification(self, reverification_id: int, engineer_id: int) -> DataReverification:
@@ -83,12 +91,18 @@ class DataReverificationService:
         if not reverification:
             raise ValueError("Re-verification not found")
         
+        had_discrepancy = reverification.status == "discrepancy"
         reverification.engineer_id = engineer_id
         reverification.engineer_approval = True
         reverification.status = "resolved"
         reverification.comparison_results += "; Engineer approved changes"
         
         self.reverification_repository.update(reverification)
+        
+        if had_discrepancy:
+            original = self.monitoring_repository.find_by_id(reverification.original_monitoring_id)
+            if original:
+                self.events.notify('discrepancy_resolved', {'reverification': reverification, 'monitoring': original})
         return reverification
     
     def get_reverification_by_id(self, reverification_id: int) -> DataReverification:
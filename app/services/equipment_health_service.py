@@ -0,0 +1,91 @@
+"""
+Equipment Health Service
+"""
+from datetime import datetime
+from app.repositories.equipment_health_repository import EquipmentHealthRepository
+from app.database.db_connection import FAULT_SEVERITY_WEIGHTS, HEALTH_STATUS_DECAY
+from app.models.monitoring import DailyMonitoring
+from app.models.fault import Fault
+from app.models.equipment_health import EquipmentHealth
+
+class EquipmentHealthService:
+    """
+    Keeps the materialized equipment_health table current from events
+    (see HealthObserver) and serves the worst-first ranking
+    """
+
+    def __init__(self, health_repository: EquipmentHealthRepository):
+        self.health_repository = health_repository
+
+    def record_reading(self, monitoring: DailyMonitoring):
+        """A new monitoring reading moves the recent status mix"""
+        self.health_repository.record_reading(monitoring.equipment_id, monitoring.operational_status,
+                                              HEALTH_STATUS_DECAY)
+
+    def fault_reported(self, fault: Fault):
+        """A new fault is open and counts as a failure"""
+        reported_at = fault.reported_at or datetime.now()
+        self.health_repository.record_failure(fault.equipment_id, self._weight(fault),
+                                              reported_at.isoformat())
+
+    def fault_status_changed(self, fault: Fault, previous_status: str):
+        """Resolving a fault closes it; reopening a resolved one opens it again"""
+        if fault.status == previous_status:
+            return
+        if fault.status == 'resolved':
+            self.health_repository.adjust_open_faults(fault.equipment_id, -1, -self._weight(fault))
+        elif previous_status == 'resolved':
+            self.health_repository.adjust_open_faults(fault.equipment_id, 1, self._weight(fault))
+
+    def fault_severity_changed(self, fault: Fault, previous_severity: str):
+        """An open fault's severity changed, so it weighs differently"""
+        if fault.status == 'resolved':
+            return
+        weight = self._weight(fault) - FAULT_SEVERITY_WEIGHTS.get(previous_severity, 1.0)
+        self.health_repository.adjust_open_faults(fault.equipment_id, 0, weight)
+
+    def escalation_changed(self, fault: Fault, opened: bool):
+        """An escalation on one of the equipment's faults was raised or resolved"""
+        self.health_repository.adjust(fault.equipment_id, 'open_escalations', 1 if opened else -1)
+
+    def discrepancy_changed(self, monitoring: DailyMonitoring, opened: bool):
+        """A re-verification found (or an engineer resolved) a discrepancy in a reading"""
+        self.health_repository.adjust(monitoring.equipment_id, 'open_discrepancies', 1 if opened else -1)
+
+    def get_ranking(self, limit: int = 50, offset: int = 0) -> list:
+        """Equipment health, worst first"""
+        ranking = []
+        for position, (health, row) in enumerate(self.health_repository.find_worst(limit, offset),
+                                                 start=offset + 1):
+            entry = health.to_dict()
+            entry['rank'] = position
+            entry['equipment'] = {
+                'equipment_code': row['equipment_code'],
+                'equipment_name': row['equipment_name'],
+                'equipment_type': row['equipment_type'],
+                'location': row['location'],
+                'status': row['status']
+            }
+            ranking.append(entry)
+        return ranking
+
+    def get_equipment_health(self, equipment_id: int) -> dict:
+        """Health of one equipment with its position in the ranking"""
+        health = self.health_repository.find_by_equipment(equipment_id)
+        if not health:
+            return None
+        entry = health.to_dict()
+        entry['rank'] = self.health_repository.rank_of(health.score, equipment_id)
+        return entry
+
+    def statuses_reclassified(self, equipment_ids: list = None) -> int:
+        """Stored reading statuses of some equipment (None: any) changed in bulk"""
+        return self.health_repository.refresh_status_mix(equipment_ids, HEALTH_STATUS_DECAY)
+
+    def rebuild(self) -> int:
+        """Recompute every equipment's health from scratch (e.g. after a bulk import)"""
+        return self.health_repository.rebuild(HEALTH_STATUS_DECAY)
+
+    @staticmethod
+    def _weight(fault: Fault) -> float:
+        return FAULT_SEVERITY_WEIGHTS.get(fault.severity, 1.0)
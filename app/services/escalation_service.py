@@ -7,6 +7,7 @@ from app.repositories.user_repository import UserRepository
 from app.models.escalation import Escalation
 from app.models.fault import Fault
 from app.patterns.strategy import SeverityBasedEscalation, TimeBasedEscalation
+from app.patterns.observer import Subject
 from datetime import datetime
 
 class EscalationService:
@@ -14,10 +15,12 @@ class EscalationService:
     
     def __init__(self, escalation_repository: EscalationRepository,
                  fault_repository: FaultRepository,
-                 user_repository: UserRepository):
+                 user_repository: UserRepository,
+                 events: Subject = None):
         self.escalation_repository = escalation_repository
         self.fault_repository = fault_repository
         self.user_repository = user_repository
+        self.events = events or Subject()
         self.severity_strategy = SeverityBasedEscalation()
         self.time_strategy = TimeBasedEscalation(hours_threshold=24)
     
@@ -72,6 +75,7 @@ class EscalationService:
         fault.status = "escalated"
         self.fault_repository.update(fault)
         
+        self.events.notify('fault_escalated', {'escalation': escalation, 'fault': fault})
         return escalation
     
     def get_escalation_by_id(self, escalation_id: int) -> Escalation:
@@ -102,9 +106,14 @@ class EscalationService:
         if not escalation:
             raise ValueError("Escalation not found")
         
+        was_resolved = escalation.status == "resolved"
         escalation.status = "resolved"
         escalation.resolved_at = datetime.now()
         self.escalation_repository.update(escalation)
+        
+        fault = self.fault_repository.find_by_id(escalation.fault_id)
+        if fault and not was_resolved:
+            self.events.notify('escalation_resolved', {'escalation': escalation, 'fault': fault})
         return escalation
 
 
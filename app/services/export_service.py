@@ -0,0 +1,221 @@
+"""
+Export Service
+Bulk export of monitoring and fault history to CSV, Parquet or Arrow.
+
+Exports read through their own read-only connection in fetchmany batches,
+so memory stays bounded for any result size and request connections are
+not tied up. Monitoring exports whose date range reaches back past the
+archive boundary also read the archived rows (the archive database is
+attached and both tables are merged in id order). Parquet/Arrow output
+needs pyarrow (optional).
+"""
+import csv
+import io
+import importlib.util
+from datetime import date
+from app.database.db_connection import DatabaseConnection
+from app.database.archive import archive_boundary, attach_archive, get_archive_path
+
+# pyarrow is optional and slow to import, so it is only loaded for columnar exports
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+FORMATS = ('csv', 'parquet', 'arrow')
+
+# column name -> arrow type name; order is the output column order.
+# Archived exports ('archived': True) run their select once per {schema}.
+EXPORTS = {
+    'monitoring': {
+        'select': """
+            SELECT m.id, m.equipment_id, e.equipment_code, m.technician_id, m.monitoring_date,
+                   m.shift, m.voltage, m.current, m.power_factor, m.operational_status,
+                   m.observations, m.created_at
+            FROM {schema}.daily_monitoring m
+            LEFT JOIN main.equipment e ON e.id = m.equipment_id
+        """,
+        'archived': True,
+        'columns': {
+            'id': 'int', 'equipment_id': 'int', 'equipment_code': 'str', 'technician_id': 'int',
+            'monitoring_date': 'str', 'shift': 'str', 'voltage': 'float', 'current': 'float',
+            'power_factor': 'float', 'operational_status': 'str', 'observations': 'str',
+            'created_at': 'str'
+        },
+        'filters': {
+            'equipment_id': 'm.equipment_id = ?',
+            'technician_id': 'm.technician_id = ?',
+            'status': 'm.operational_status = ?',
+            'start_date': 'm.monitoring_date >= ?',
+            'end_date': "m.monitoring_date < date(?, '+1 day')",
+        },
+        'order_by': 'm.id'
+    },
+    'faults': {
+        'select': """
+            SELECT f.id, f.equipment_id, e.equipment_code, f.reported_by, f.fault_description,
+                   f.severity, f.status, f.reported_at, f.resolved_at
+            FROM faults f
+            LEFT JOIN equipment e ON e.id = f.equipment_id
+        """,
+        'columns': {
+            'id': 'int', 'equipment_id': 'int', 'equipment_code': 'str', 'reported_by': 'int',
+            'fault_description': 'str', 'severity': 'str', 'status': 'str',
+            'reported_at': 'str', 'resolved_at': 'str'
+        },
+        'filters': {
+            'equipment_id': 'f.equipment_id = ?',
+            'technician_id': 'f.reported_by = ?',
+            'status': 'f.status = ?',
+            'start_date': 'f.reported_at >= ?',
+            'end_date': "f.reported_at < date(?, '+1 day')",
+        },
+        'order_by': 'f.id'
+    }
+}
+
+
+class ExportService:
+    """Service for bulk data exports"""
+
+    def __init__(self, batch_size: int = 5000):
+        self.db = DatabaseConnection()
+        self.batch_size = batch_size
+
+    @staticmethod
+    def parquet_available() -> bool:
+        """True when pyarrow is installed"""
+        return HAS_PYARROW
+
+    def build_query(self, kind: str, filters: dict, with_archive: bool = False) -> tuple:
+        """
+        SQL and parameters for an export with the given filters (live and
+        archived rows merged in id order when with_archive is set)
+        """
+        if kind not in EXPORTS:
+            raise ValueError(f"Unknown export: {kind}")
+        spec = EXPORTS[kind]
+        clauses, params = [], []
+        for name, clause in spec['filters'].items():
+            value = filters.get(name)
+            if value in (None, ''):
+                continue
+            try:
+                if name in ('start_date', 'end_date'):
+                    value = date.fromisoformat(str(value)).isoformat()
+                elif name in ('equipment_id', 'technician_id'):
+                    value = int(value)
+            except ValueError:
+                raise ValueError(f"Invalid {name}: {value}")
+            clauses.append(clause)
+            params.append(value)
+        where = ' WHERE ' + ' AND '.join(clauses) if clauses else ''
+        if with_archive and spec.get('archived'):
+            # Both arms scan in id order, so SQLite merges them without sorting
+            query = (spec['select'].format(schema='main') + where + ' UNION ALL '
+                     + spec['select'].format(schema='archive') + where + ' ORDER BY 1')
+            return query, tuple(params) * 2
+        query = spec['select'].format(schema='main') + where + f" ORDER BY {spec['order_by']}"
+        return query, tuple(params)
+
+    def _reaches_archive(self, conn, kind: str, filters: dict) -> bool:
+        """
+        True when archived rows may match (the range starts before the archive
+        boundary); the archive is attached to the connection before returning True
+        """
+        if not EXPORTS[kind].get('archived'):
+            return False
+        boundary = archive_boundary(conn)
+        start = filters.get('start_date')
+        if boundary is None or (start not in (None, '') and date.fromisoformat(str(start)).isoformat() >= boundary):
+            return False
+        attach_archive(conn, get_archive_path(self.db.db_path))
+        return True
+
+    def iter_batches(self, kind: str, filters: dict):
+        """
+        Run the export query now (so bad filters fail early) and return a
+        generator of row batches (lists of tuples) from a dedicated connection
+        """
+        # Bad filters fail before a connection is opened
+        self.build_query(kind, filters)
+        conn = self.db.open_connection('readonly')
+        conn.row_factory = None
+        try:
+            query, params = self.build_query(kind, filters, self._reaches_archive(conn, kind, filters))
+            cursor = conn.execute(query, params)
+        except Exception:
+            conn.close()
+            raise
+
+        def batches():
+            try:
+                while True:
+                    rows = cursor.fetchmany(self.batch_size)
+                    if not rows:
+                        break
+                    yield rows
+            finally:
+                conn.close()
+
+        return batches()
+
+    def iter_csv(self, kind: str, filters: dict):
+        """CSV text chunks: header, then one chunk per batch"""
+        batches = self.iter_batches(kind, filters)
+        columns = list(EXPORTS[kind]['columns'])
+
+        def chunks():
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            for rows in batches:
+                writer.writerows(rows)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue()
+
+        return chunks()
+
+    def write_file(self, kind: str, filters: dict, path: str, file_format: str = 'csv') -> int:
+        """Write an export to a file (Parquet/Arrow in one row group per batch); returns row count"""
+        if file_format not in FORMATS:
+            raise ValueError(f"Unknown export format: {file_format}")
+        if file_format == 'csv':
+            batches = self.iter_batches(kind, filters)
+            total = 0
+            with open(path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(list(EXPORTS[kind]['columns']))
+                for rows in batches:
+                    writer.writerows(rows)
+                    total += len(rows)
+            return total
+        return self._write_columnar(kind, filters, path, file_format)
+
+    def _write_columnar(self, kind: str, filters: dict, path: str, file_format: str) -> int:
+        if not HAS_PYARROW:
+            raise RuntimeError("Parquet/Arrow export requires pyarrow (pip install pyarrow)")
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {'int': pa.int64(), 'float': pa.float64(), 'str': pa.string()}
+        schema = pa.schema([(name, types[type_name])
+                            for name, type_name in EXPORTS[kind]['columns'].items()])
+        batches = self.iter_batches(kind, filters)
+        if file_format == 'parquet':
+            writer = pq.ParquetWriter(path, schema, compression='snappy')
+        else:
+            writer = pa.ipc.new_file(path, schema)
+        total = 0
+        try:
+            for rows in batches:
+                columns = list(zip(*rows))
+                table = pa.Table.from_arrays(
+                    [pa.array(values, type=field.type) for values, field in zip(columns, schema)],
+                    schema=schema
+                )
+                writer.write_table(table)
+                total += len(rows)
+        finally:
+            writer.close()
+        return total
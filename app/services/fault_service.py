@@ -4,27 +4,72 @@ Fault Service
 from app.repositories.fault_repository import FaultRepository
 from app.repositories.equipment_repository import EquipmentRepository
 from app.models.fault import Fault
+from app.models.fault_duplicate import FaultDuplicate
 from app.models.equipment import Equipment
-from datetime import datetime
+from app.patterns.observer import Subject
+from app.algorithms.fault_similarity import text_overlap, SEVERITY_RANKS
+from datetime import datetime, timedelta
 
 class FaultService:
-    """Service for fault management"""
+    """
+    Service for fault management. A report matching an open fault of the same
+    equipment (reported within `duplicate_window_minutes`, descriptions sharing
+    at least `duplicate_threshold` of their words) is attached to that fault as
+    a duplicate: no new fault, equipment update or notifications. A duplicate
+    with a higher severity raises the open fault's severity to it
+    (fault_severity_raised event).
+    """
     
     def __init__(self, fault_repository: FaultRepository,
-                 equipment_repository: EquipmentRepository):
+                 equipment_repository: EquipmentRepository,
+                 events: Subject = None,
+                 duplicate_window_minutes: int = 60,
+                 duplicate_threshold: float = 0.6):
         self.fault_repository = fault_repository
         self.equipment_repository = equipment_repository
+        self.events = events or Subject()
+        self.duplicate_window_minutes = duplicate_window_minutes
+        self.duplicate_threshold = duplicate_threshold
     
     def report_fault(self, equipment_id: int, reported_by: int,
                     fault_description: str, severity: str = "low") -> Fault:
-        """Report a new fault"""
+        """Report a new fault (returns the open fault it duplicates instead, if any)"""
+        return self.submit_report(equipment_id, reported_by, fault_description, severity)[0]
+    
+    def submit_report(self, equipment_id: int, reported_by: int, fault_description: str,
+                      severity: str = "low", deduplicate: bool = True) -> tuple:
+        """
+        Report a fault. Returns (fault, None) for a new fault, or (open fault,
+        FaultDuplicate) when the report was attached to an open fault.
+        """
         # Validate equipment exists
         equipment = self.equipment_repository.find_by_id(equipment_id)
         if not equipment:
             raise ValueError("Equipment not found")
         
-        # Create fault
         reported_at = datetime.now()
+        if deduplicate:
+            match = self.find_duplicate_target(equipment_id, fault_description, reported_at)
+            if match:
+                fault, similarity = match
+                duplicate = FaultDuplicate(
+                    fault_id=fault.id,
+                    reported_by=reported_by,
+                    fault_description=fault_description,
+                    severity=severity,
+                    similarity=round(similarity, 3),
+                    reported_at=reported_at
+                )
+                duplicate.id = self.fault_repository.create_duplicate(duplicate)
+                if SEVERITY_RANKS.get(severity, -1) > SEVERITY_RANKS.get(fault.severity, -1):
+                    previous_severity = fault.severity
+                    fault.severity = severity
+                    self.fault_repository.update_severity(fault.id, severity)
+                    self.events.notify('fault_severity_raised', {'fault': fault, 'equipment': equipment,
+                                                                 'previous_severity': previous_severity})
+                return fault, duplicate
+        
+        # Create fault
         fault = Fault(
             equipment_id=equipment_id,
             reported_by=reported_by,
@@ -41,19 +86,42 @@ class FaultService:
         equipment.status = "faulty"
         self.equipment_repository.update(equipment)
         
-        return fault
+        self.events.notify('fault_reported', {'fault': fault, 'equipment': equipment})
+        return fault, None
+    
+    def find_duplicate_target(self, equipment_id: int, fault_description: str, at: datetime) -> tuple:
+        """(open fault, similarity) a report at `at` duplicates, or None"""
+        since = at - timedelta(minutes=self.duplicate_window_minutes)
+        # Stored times are 'YYYY-MM-DD HH:MM:SS' or isoformat with 'T'; the space form of
+        # `since` sorts before both, and the exact window is checked on the parsed times
+        best = None
+        for fault in self.fault_repository.find_open_since(equipment_id, since.isoformat(' ')):
+            if fault.reported_at is None or fault.reported_at < since:
+                continue
+            similarity = text_overlap(fault_description, fault.fault_description)
+            if similarity >= self.duplicate_threshold and (best is None or similarity > best[1]):
+                best = (fault, similarity)
+        return best
+    
+    def get_duplicates(self, fault_id: int) -> list:
+        """Duplicate reports attached to a fault"""
+        return self.fault_repository.find_duplicates(fault_id)
     
     def get_fault_by_id(self, fault_id: int) -> Fault:
         """Get fault by ID"""
         return self.fault_repository.find_by_id(fault_id)
     
-    def get_all_faults(self, limit: int = 100) -> list:
+    def get_all_faults(self, limit: int = 100, as_dict: bool = False) -> list:
         """Get all faults"""
-        return self.fault_repository.find_all(limit)
+        return self.fault_repository.find_all(limit, as_dict)
+    
+    def iter_all_faults(self, limit: int = 100):
+        """Stream the most recent faults as dicts"""
+        return self.fault_repository.iter_all(limit)
     
-    def get_faults_by_status(self, status: str) -> list:
+    def get_faults_by_status(self, status: str, as_dict: bool = False) -> list:
         """Get faults by status"""
-        return self.fault_repository.find_by_status(status)
+        return self.fault_repository.find_by_status(status, as_dict)
     
     def get_faults_by_equipment(self, equipment_id: int) -> list:
         """Get faults by equipment"""
@@ -69,6 +137,7 @@ class FaultService:
         if not fault:
             raise ValueError("Fault not found")
         
+        previous_status = fault.status
         fault.status = status
         if status == "resolved":
             fault.resolved_at = datetime.now()
@@ -79,5 +148,6 @@ class FaultService:
                 self.equipment_repository.update(equipment)
         
         self.fault_repository.update(fault)
+        self.events.notify('fault_status_changed', {'fault': fault, 'previous_status': previous_status})
         return fault
 
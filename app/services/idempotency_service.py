@@ -0,0 +1,71 @@
+"""
+Idempotency Service
+"""
+import hashlib
+import time
+from app.repositories.idempotency_repository import IdempotencyRepository
+
+# Longest accepted Idempotency-Key
+MAX_KEY_LENGTH = 255
+
+# A key held by a request that never finished (crashed worker) frees up after this
+IN_PROGRESS_SECONDS = 300
+
+
+def request_fingerprint(method: str, path: str, query_string: bytes, body: bytes) -> str:
+    """Hash of what makes two requests the same request"""
+    digest = hashlib.sha256()
+    for part in (method.encode(), path.encode(), query_string, body):
+        digest.update(len(part).to_bytes(8, 'big'))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class IdempotencyService:
+    """
+    Remembers the response of each write request sent with an Idempotency-Key
+    so a retry with the same key gets that response back instead of running
+    the write again. Keys are per user and kept for a TTL.
+    """
+
+    NEW, REPLAY, MISMATCH, IN_PROGRESS = 'new', 'replay', 'mismatch', 'in_progress'
+
+    def __init__(self, idempotency_repository: IdempotencyRepository):
+        self.idempotency_repository = idempotency_repository
+
+    def begin(self, user_id: int, key: str, fingerprint: str) -> tuple:
+        """
+        (state, stored row) for a request about to run:
+          - new: the key is now held by this request, run it
+          - replay: the stored response of the first request with this key
+          - mismatch: the key was used for a different request
+          - in_progress: the first request with this key has not finished
+        """
+        now = time.time()
+        row = self.idempotency_repository.find(user_id, key, now)
+        if row is None:
+            if self.idempotency_repository.claim(user_id, key, fingerprint, now, now + IN_PROGRESS_SECONDS):
+                return self.NEW, None
+            # Another request claimed it in between
+            row = self.idempotency_repository.find(user_id, key, now)
+            if row is None:
+                return self.IN_PROGRESS, None
+        if row['request_hash'] != fingerprint:
+            return self.MISMATCH, row
+        if row['status_code'] is None:
+            return self.IN_PROGRESS, row
+        return self.REPLAY, row
+
+    def complete(self, user_id: int, key: str, status_code: int, content_type: str,
+                 body: bytes, ttl_seconds: int):
+        """Store the response for replay until the TTL runs out"""
+        self.idempotency_repository.complete(user_id, key, status_code, content_type, body,
+                                             time.time() + ttl_seconds)
+
+    def release(self, user_id: int, key: str):
+        """Drop a held key without a response (the request failed)"""
+        self.idempotency_repository.release(user_id, key)
+
+    def purge_expired(self) -> int:
+        """Delete expired keys"""
+        return self.idempotency_repository.purge_expired(time.time())
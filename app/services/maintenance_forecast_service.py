@@ -0,0 +1,102 @@
+"""
+Maintenance Forecast Service
+"""
+import math
+import time
+from datetime import date, timedelta
+from app.repositories.maintenance_forecast_repository import MaintenanceForecastRepository
+from app.repositories.equipment_repository import EquipmentRepository
+from app.services.threshold_service import ThresholdService
+from app.models.maintenance_forecast import MaintenanceForecast
+from app.algorithms.threshold_rules import LIMIT_FIELDS
+from app.algorithms.maintenance_forecast import np, forecast, CHECK_NAMES
+
+class MaintenanceForecastService:
+    """Suggests next maintenance dates from per-equipment monitoring trends"""
+    
+    def __init__(self, forecast_repository: MaintenanceForecastRepository,
+                 equipment_repository: EquipmentRepository,
+                 threshold_service: ThresholdService):
+        self.forecast_repository = forecast_repository
+        self.equipment_repository = equipment_repository
+        self.threshold_service = threshold_service
+    
+    def run_forecast(self, window_days: int = 90, horizon_days: int = 180, lead_days: int = 7,
+                     apply: bool = False, min_confidence: float = 0.5, as_of: date = None) -> dict:
+        """
+        Fit every equipment's last `window_days` of daily stats, store the
+        earliest threshold crossing within `horizon_days` as a suggested
+        maintenance date (`lead_days` before it), and with `apply` copy
+        confident suggestions into equipment.next_maintenance_date
+        """
+        if np is None:
+            raise RuntimeError("Maintenance forecasting requires numpy (pip install numpy)")
+        if window_days < 7 or horizon_days < 1 or lead_days < 0:
+            raise ValueError("Invalid forecast window, horizon or lead time")
+        start = time.perf_counter()
+        today = as_of or date.today()
+        window_start = today - timedelta(days=window_days - 1)
+        
+        equipment = sorted(self.equipment_repository.find_all(), key=lambda e: e.id)
+        ids = np.array([e.id for e in equipment], dtype=np.int64)
+        series = self._daily_series(ids, window_start, today, window_days)
+        rules = self.threshold_service.get_rules()
+        limit_table = np.array([rules.limits_for(e.id, e.equipment_type) for e in equipment],
+                               dtype=float).reshape(len(equipment), len(LIMIT_FIELDS))
+        limits = {field: limit_table[:, i] for i, field in enumerate(LIMIT_FIELDS)}
+        
+        result = forecast(series, limits, window_days - 1, horizon_days)
+        forecasts = []
+        for i in np.flatnonzero(~np.isnan(result['days'])):
+            crossing_date = today + timedelta(days=math.ceil(result['days'][i]))
+            forecasts.append(MaintenanceForecast(
+                equipment_id=int(ids[i]),
+                suggested_date=max(today, crossing_date - timedelta(days=lead_days)),
+                crossing_date=crossing_date,
+                metric=CHECK_NAMES[result['metric'][i]],
+                limit_value=round(float(result['limit'][i]), 4),
+                slope_per_day=float(result['slope'][i]),
+                confidence=round(float(result['confidence'][i]), 3),
+                days_used=int(result['days_used'][i])
+            ))
+        self.forecast_repository.replace_all(forecasts)
+        applied = self.forecast_repository.apply_suggestions(min_confidence) if apply else 0
+        
+        return {
+            'as_of': today.isoformat(),
+            'equipment': len(equipment),
+            'forecasts': len(forecasts),
+            'confident': sum(1 for f in forecasts if f.confidence >= min_confidence),
+            'applied': applied,
+            'duration_ms': round((time.perf_counter() - start) * 1000, 2)
+        }
+    
+    def _daily_series(self, ids, window_start: date, today: date, window_days: int) -> dict:
+        """(equipment x day) matrices of daily means and the voltage standard deviation"""
+        shape = (len(ids), window_days)
+        rows = self.forecast_repository.find_daily_stats(window_start, today)
+        data = np.array(rows, dtype=float).reshape(-1, 6)    # NULL -> NaN
+        position = np.searchsorted(ids, data[:, 0])
+        known = (position < len(ids)) & (ids[np.minimum(position, len(ids) - 1)] == data[:, 0])
+        data, position = data[known], position[known]
+        day = data[:, 1].astype(np.int64)
+        
+        def matrix(values):
+            out = np.full(shape, np.nan)
+            out[position, day] = values
+            return out
+        
+        return {
+            'voltage': matrix(data[:, 2]),
+            'voltage_std': matrix(np.sqrt(np.maximum(data[:, 3], 0.0))),
+            'current': matrix(data[:, 4]),
+            'power_factor': matrix(data[:, 5])
+        }
+    
+    def get_forecasts(self, min_confidence: float = 0.0, limit: int = 100) -> list:
+        """Stored forecasts, soonest suggested date first"""
+        return self.forecast_repository.find_all(min_confidence, limit)
+    
+    def get_equipment_forecast(self, equipment_id: int) -> MaintenanceForecast:
+        """Stored forecast for one equipment (None when no crossing is expected)"""
+        return self.forecast_repository.find_by_equipment(equipment_id)
@@ -4,6 +4,9 @@ Monitoring Service
 from datetime import date
 from app.repositories.monitoring_repository import MonitoringRepository
 from app.repositories.equipment_repository import EquipmentRepository
+from app.services.threshold_service import ThresholdService
+from app.services.anomaly_service import AnomalyService
+from app.patterns.observer import Subject
 from app.models.monitoring import DailyMonitoring
 from app.models.equipment import Equipment
 
@@ -11,9 +14,15 @@ class MonitoringService:
     """Service for monitoring operations"""
     
     def __init__(self, monitoring_repository: MonitoringRepository, 
-                 equipment_repository: EquipmentRepository):
+                 equipment_repository: EquipmentRepository,
+                 threshold_service: ThresholdService,
+                 anomaly_service: AnomalyService,
+                 events: Subject = None):
         self.monitoring_repository = monitoring_repository
         self.equipment_repository = equipment_repository
+        self.threshold_service = threshold_service
+        self.anomaly_service = anomaly_service
+        self.events = events or Subject()
     
     def create_monitoring_record(self, equipment_id: int, technician_id: int,
                                 monitoring_date: date, shift: str = None,
@@ -30,19 +39,9 @@ class MonitoringService:
         if not equipment:
             raise ValueError(f"Equipment with ID {equipment_id} not found. Please select a valid equipment from the list.")
         
-        # Determine operational status based on readings (APDS thresholds)
+        # Determine operational status from the equipment's threshold profile
         if operational_status == "normal":
-            # Voltage: Normal range 220-240V, warning if outside
-            if voltage and (voltage < 220 or voltage > 240):
-                operational_status = "warning"
-            # Current: Check against rated current (example: > 100A is warning)
-            if current and current > 100:
-                operational_status = "warning"
-            # Power Factor: Should be close to 1.0, < 0.85 is critical
-            if power_factor and power_factor < 0.85:
-                operational_status = "critical"
-            elif power_factor and power_factor < 0.90:
-                operational_status = "warning"
+            operational_status = self.threshold_service.classify(equipment, voltage, current, power_factor)
         
         monitoring = DailyMonitoring(
             equipment_id=equipment_id,
@@ -64,19 +63,38 @@ class MonitoringService:
             equipment.status = "faulty"
             self.equipment_repository.update(equipment)
         
+        # Check the reading against the equipment's recent behaviour (never fails the reading)
+        try:
+            self.anomaly_service.check_reading(monitoring, equipment)
+        except Exception as e:
+            print(f"Warning: Anomaly detection failed for monitoring {monitoring_id}: {e}")
+        
+        self.events.notify('monitoring_recorded', {'monitoring': monitoring, 'equipment': equipment})
         return monitoring
     
-    def get_equipment_monitoring_history(self, equipment_id: int, limit: int = 100) -> list:
+    def get_anomaly_state(self, equipment_id: int) -> dict:
+        """Rolling statistics the anomaly detector keeps for an equipment"""
+        return self.anomaly_service.get_equipment_state(equipment_id)
+    
+    def get_equipment_monitoring_history(self, equipment_id: int, limit: int = 100, as_dict: bool = False) -> list:
         """Get monitoring history for equipment"""
-        return self.monitoring_repository.find_by_equipment(equipment_id, limit)
+        return self.monitoring_repository.find_by_equipment(equipment_id, limit, as_dict)
     
-    def get_technician_monitoring_history(self, technician_id: int, limit: int = 100) -> list:
+    def get_technician_monitoring_history(self, technician_id: int, limit: int = 100, as_dict: bool = False) -> list:
         """Get monitoring history for technician"""
-        return self.monitoring_repository.find_by_technician(technician_id, limit)
+        return self.monitoring_repository.find_by_technician(technician_id, limit, as_dict)
+    
+    def iter_technician_monitoring_history(self, technician_id: int, limit: int = 100):
+        """Stream technician monitoring history as dicts"""
+        return self.monitoring_repository.iter_by_technician(technician_id, limit)
     
-    def get_critical_monitoring_records(self) -> list:
+    def get_status_board(self) -> list:
+        """Every equipment with its latest reading"""
+        return self.monitoring_repository.get_status_board()
+    
+    def get_critical_monitoring_records(self, as_dict: bool = False) -> list:
         """Get all critical monitoring records"""
-        return self.monitoring_repository.find_critical_status()
+        return self.monitoring_repository.find_critical_status(as_dict)
     
     def get_monitoring_by_date_range(self, start_date: date, end_date: date) -> list:
         """Get monitoring records by date range"""
@@ -93,11 +111,10 @@ class MonitoringService:
                                 operational_status: str = None,
                                 observations: str = None) -> DailyMonitoring:
         """Update a monitoring record"""
-        monitoring = self.monitoring_repository.find_by_id(monitoring_id)
-        if not monitoring:
-            raise ValueError("Monitoring record not found")
+        monitoring = self._find_writable(monitoring_id)
         
         # Update fields if provided
+        equipment = None
         if equipment_id is not None:
             equipment = self.equipment_repository.find_by_id(equipment_id)
             if not equipment:
@@ -122,17 +139,11 @@ class MonitoringService:
         if operational_status is not None:
             monitoring.operational_status = operational_status
         else:
-            # Recalculate operational status based on readings
-            if monitoring.voltage and (monitoring.voltage < 220 or monitoring.voltage > 240):
-                monitoring.operational_status = "warning"
-            elif monitoring.current and monitoring.current > 100:
-                monitoring.operational_status = "warning"
-            elif monitoring.power_factor and monitoring.power_factor < 0.85:
-                monitoring.operational_status = "critical"
-            elif monitoring.power_factor and monitoring.power_factor < 0.90:
-                monitoring.operational_status = "warning"
-            else:
-                monitoring.operational_status = "normal"
+            # Recalculate operational status from the equipment's threshold profile
+            if equipment is None:
+                equipment = self.equipment_repository.find_by_id(monitoring.equipment_id) or Equipment(id=monitoring.equipment_id)
+            monitoring.operational_status = self.threshold_service.classify(
+                equipment, monitoring.voltage, monitoring.current, monitoring.power_factor)
         
         if observations is not None:
             monitoring.observations = observations
@@ -150,9 +161,15 @@ class MonitoringService:
     
     def delete_monitoring_record(self, monitoring_id: int) -> None:
         """Delete a monitoring record"""
+        self._find_writable(monitoring_id)
+        self.monitoring_repository.delete(monitoring_id)
+    
+    def _find_writable(self, monitoring_id: int) -> DailyMonitoring:
+        """A live monitoring record; archived records can be read but not changed"""
         monitoring = self.monitoring_repository.find_by_id(monitoring_id)
         if not monitoring:
             raise ValueError("Monitoring record not found")
-        
-        self.monitoring_repository.delete(monitoring_id)
+        if self.monitoring_repository.is_archived(monitoring_id):
+            raise ValueError("Monitoring record is archived and can no longer be changed")
+        return monitoring
 
@@ -8,9 +8,10 @@ from app.models.notification import Notification
 class NotificationService:
     """Service for notification management"""
     
-    def __init__(self, notification_repository: NotificationRepository):
+    def __init__(self, notification_repository: NotificationRepository,
+                 user_repository: UserRepository):
         self.notification_repository = notification_repository
-        self.user_repository = UserRepository()
+        self.user_repository = user_repository
     
     def create_notification(self, user_id: int, title: str, message: str,
                            notification_type: str = "info",
@@ -34,36 +34,24 @@ class PerformanceReportService:
         return report
     
     def compile_report_data(self, technician_id: int, period_start: date,
-                           period_end: date) -> dict:
-        """Compile monitoring data for report period"""
-        # Get all monitoring records for the period
-        all_records = self.monitoring_repository.find_by_technician(technician_id, limit=10000)
-        
-        # Filter by date range
-        period_records = [
-            r for r in all_records
-            if period_start <= r.monitoring_date <= period_end
-        ]
-        
-        # Calculate statistics
-        total_readings = len(period_records)
-        normal_count = sum(1 for r in period_records if r.operational_status == 'normal')
-        warning_count = sum(1 for r in period_records if r.operational_status == 'warning')
-        critical_count = sum(1 for r in period_records if r.operational_status == 'critical')
-        
-        avg_voltage = sum(r.voltage for r in period_records if r.voltage) / len([r for r in period_records if r.voltage]) if any(r.voltage for r in period_records) else 0
-        avg_current = sum(r.current for r in period_records if r.current) / len([r for r in period_records if r.current]) if any(r.current for r in period_records) else 0
-        avg_pf = sum(r.power_factor for r in period_records if r.power_factor) / len([r for r in period_records if r.power_factor]) if any(r.power_factor for r in period_records) else 0
+                           period_end: date, stream: bool = False) -> dict:
+        """
+        Compile monitoring data for report period.
+        Statistics are aggregated in SQL; with stream=True 'records' is a
+        generator over the cursor instead of a list.
+        """
+        summary = self.monitoring_repository.summarize_technician_period(technician_id, period_start, period_end)
+        records = self.monitoring_repository.iter_by_technician_period(technician_id, period_start, period_end)
         
         return {
-            'total_readings': total_readings,
-            'normal_count': normal_count,
-            'warning_count': warning_count,
-            'critical_count': critical_count,
-            'avg_voltage': round(avg_voltage, 2),
-            'avg_current': round(avg_current, 2),
-            'avg_power_factor': round(avg_pf, 3),
-            'records': [r.to_dict() for r in period_records]
+            'total_readings': summary['total_readings'],
+            'normal_count': summary['normal_count'],
+            'warning_count': summary['warning_count'],
+            'critical_count': summary['critical_count'],
+            'avg_voltage': round(summary['avg_voltage'], 2),
+            'avg_current': round(summary['avg_current'], 2),
+            'avg_power_factor': round(summary['avg_power_factor'], 3),
+            'records': records if stream else list(records)
         }
     
     def submit_for_approval(self, report_id: int) -> PerformanceReport:
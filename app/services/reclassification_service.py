@@ -0,0 +1,243 @@
+"""
+Re-classification Service
+
+Recomputes daily_monitoring.operational_status with the current threshold
+profiles, e.g. after limits were tuned. The table is walked by id (rowid)
+range in chunks on a dedicated connection; each chunk is read, classified and
+written in one short BEGIN IMMEDIATE transaction, and only rows whose status
+changes are updated. After every chunk the job sleeps `throttle` times as long
+as the chunk held the write lock, so interactive writers keep getting in.
+
+Runs are recorded in reclassification_runs (next id, rows scanned/changed), so
+an interrupted run resumes where it stopped and the web app and the CLI see
+the same progress. Rows already moved to the archive database are not touched.
+When a run ends, the health status mix of the equipment whose readings changed
+is recomputed (of all equipment for a run resumed from another process).
+"""
+import sqlite3
+import threading
+import time
+from app.database.db_connection import DatabaseConnection
+from app.repositories.status_board import latest_readings
+from app.services.threshold_service import ThresholdService
+from app.services.equipment_health_service import EquipmentHealthService
+
+CHUNK_QUERY = """
+    SELECT m.id, m.equipment_id, e.equipment_type, m.voltage, m.current, m.power_factor,
+           m.operational_status
+    FROM daily_monitoring m
+    LEFT JOIN equipment e ON e.id = m.equipment_id
+    WHERE m.id >= ? AND m.id < ?
+"""
+
+# Runs that can be picked up again by a later start
+RESUMABLE = ('running', 'cancelled', 'failed')
+
+
+def _signature_text(signature) -> str:
+    return ':'.join(str(part) for part in signature or ())
+
+
+class ReclassificationService:
+    """Chunked, throttled re-classification of monitoring history"""
+
+    def __init__(self, threshold_service: ThresholdService, health_service: EquipmentHealthService = None,
+                 chunk_size: int = 2000, throttle: float = 1.0, busy_timeout_ms: int = 1000):
+        self.threshold_service = threshold_service
+        self.health_service = health_service
+        self.db = DatabaseConnection()
+        self.chunk_size = chunk_size
+        self.throttle = throttle
+        self.busy_timeout_ms = busy_timeout_ms
+        self._thread = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._progress = None
+
+    def is_running(self) -> bool:
+        """True while a background run is active in this process"""
+        return bool(self._thread and self._thread.is_alive())
+
+    def start(self, resume: bool = True) -> dict:
+        """Start a background run (one at a time per process)"""
+        with self._lock:
+            if self.is_running():
+                raise ValueError("A re-classification run is already in progress")
+            self._stop.clear()
+            self._progress = {'run_id': None, 'status': 'starting'}
+            self._thread = threading.Thread(target=self._run_background, args=(resume,),
+                                            name='apds-reclassify', daemon=True)
+            self._thread.start()
+        return self.status()
+
+    def cancel(self) -> bool:
+        """Ask the background run to stop after its current chunk"""
+        if not self.is_running():
+            return False
+        self._stop.set()
+        return True
+
+    def status(self) -> dict:
+        """Progress of the current run in this process, else the last recorded run"""
+        with self._lock:
+            if self._progress is not None:
+                return dict(self._progress, running=self.is_running())
+        conn = self.db.open_connection('readonly')
+        try:
+            run = conn.execute("SELECT * FROM reclassification_runs ORDER BY id DESC LIMIT 1").fetchone()
+        finally:
+            conn.close()
+        if not run:
+            return {'running': False, 'run_id': None}
+        return dict(self._describe(dict(run)), running=False)
+
+    def run(self, resume: bool = True, progress=None, stop: threading.Event = None) -> dict:
+        """
+        Re-classify every live monitoring row with the current rules.
+        `progress` is called with the progress dict after every chunk; `stop`
+        (a threading.Event) ends the run after the current chunk.
+        """
+        conn = self.db.open_connection(busy_timeout=self.busy_timeout_ms)
+        run = None
+        try:
+            rules = self.threshold_service.get_rules()
+            run = self._open_run(conn, _signature_text(rules.signature), resume)
+            started = time.perf_counter()
+            start_id = run['next_id']
+            # Equipment whose readings changed (earlier parts of a resumed run are unknown)
+            touched = set() if start_id == run['first_id'] else None
+
+            while run['next_id'] <= run['last_id']:
+                if stop is not None and stop.is_set():
+                    run['status'] = 'cancelled'
+                    break
+                began = time.perf_counter()
+                try:
+                    touched_latest = self._reclassify_chunk(conn, rules, run, touched)
+                except sqlite3.OperationalError as e:
+                    if conn.in_transaction:
+                        conn.rollback()
+                    if 'locked' not in str(e).lower() and 'busy' not in str(e).lower():
+                        raise
+                    # Writers are busy: back off and retry the same chunk
+                    time.sleep(max(0.05, self.busy_timeout_ms / 1000))
+                    continue
+                held = time.perf_counter() - began
+                if touched_latest:
+                    latest_readings.invalidate()
+
+                elapsed = time.perf_counter() - started
+                if progress:
+                    progress(self._describe(run, (run['next_id'] - start_id) / elapsed if elapsed else None))
+                time.sleep(max(0.005, held * self.throttle))
+            else:
+                run['status'] = 'completed'
+
+            self._close_run(conn, run)
+            self._refresh_health(touched)
+            return self._describe(run)
+        except Exception as e:
+            if conn.in_transaction:
+                conn.rollback()
+            if run is not None:
+                run.update(status='failed', error=str(e))
+                self._close_run(conn, run)
+            raise
+        finally:
+            conn.close()
+
+    def _run_background(self, resume: bool):
+        def publish(report):
+            with self._lock:
+                self._progress = report
+        try:
+            publish(self.run(resume, publish, self._stop))
+        except Exception as e:
+            print(f"Warning: Monitoring re-classification failed: {e}")
+            publish(dict(self._progress or {}, status='failed', error=str(e)))
+
+    def _open_run(self, conn: sqlite3.Connection, signature: str, resume: bool) -> dict:
+        previous = conn.execute(
+            "SELECT * FROM reclassification_runs ORDER BY id DESC LIMIT 1").fetchone()
+        if (resume and previous and previous['status'] in RESUMABLE
+                and previous['rules_signature'] == signature):
+            conn.execute("UPDATE reclassification_runs SET status = 'running', error = NULL, "
+                         "finished_at = NULL WHERE id = ?", (previous['id'],))
+            conn.commit()
+            return dict(previous, status='running', error=None)
+
+        if previous and previous['status'] in RESUMABLE:
+            conn.execute("UPDATE reclassification_runs SET status = 'superseded', "
+                         "finished_at = CURRENT_TIMESTAMP WHERE id = ?", (previous['id'],))
+        first_id, last_id = conn.execute("SELECT MIN(id), MAX(id) FROM daily_monitoring").fetchone()
+        first_id, last_id = first_id or 1, last_id or 0
+        run_id = conn.execute(
+            "INSERT INTO reclassification_runs (rules_signature, first_id, last_id, next_id) "
+            "VALUES (?, ?, ?, ?)", (signature, first_id, last_id, first_id)).lastrowid
+        conn.commit()
+        return dict(conn.execute("SELECT * FROM reclassification_runs WHERE id = ?", (run_id,)).fetchone())
+
+    def _refresh_health(self, touched: set):
+        if self.health_service is None or touched == set():
+            return
+        try:
+            self.health_service.statuses_reclassified(None if touched is None else sorted(touched))
+        except Exception as e:
+            print(f"Warning: Could not refresh equipment health after re-classification: {e}")
+
+    def _reclassify_chunk(self, conn: sqlite3.Connection, rules, run: dict, touched: set = None) -> bool:
+        upper = run['next_id'] + self.chunk_size
+        conn.execute("BEGIN IMMEDIATE")
+        rows = conn.execute(CHUNK_QUERY, (run['next_id'], upper)).fetchall()
+        touched_latest = False
+        changed = 0
+        if rows:
+            ids, equipment_ids, types, voltages, currents, power_factors, current_statuses = zip(*rows)
+            statuses = rules.classify_batch(equipment_ids, types, voltages, currents, power_factors)
+            updates = [(status, row_id) for row_id, old, status in zip(ids, current_statuses, statuses)
+                       if status != old]
+            if updates and touched is not None:
+                touched.update(equipment_id for equipment_id, old, status
+                               in zip(equipment_ids, current_statuses, statuses) if status != old)
+            if updates:
+                conn.executemany("UPDATE daily_monitoring SET operational_status = ? WHERE id = ?", updates)
+                touched_latest = conn.executemany(
+                    "UPDATE equipment_latest_reading SET operational_status = ? WHERE monitoring_id = ?",
+                    updates).rowcount > 0
+                changed = len(updates)
+        run['next_id'] = upper
+        run['rows_scanned'] += len(rows)
+        run['rows_changed'] += changed
+        conn.execute(
+            "UPDATE reclassification_runs SET next_id = ?, rows_scanned = ?, rows_changed = ? WHERE id = ?",
+            (run['next_id'], run['rows_scanned'], run['rows_changed'], run['id']))
+        conn.commit()
+        return touched_latest
+
+    def _close_run(self, conn: sqlite3.Connection, run: dict):
+        conn.execute("UPDATE reclassification_runs SET status = ?, error = ?, "
+                     "finished_at = CURRENT_TIMESTAMP WHERE id = ?",
+                     (run['status'], run.get('error'), run['id']))
+        conn.commit()
+
+    def _describe(self, run: dict, ids_per_second: float = None) -> dict:
+        span = max(run['last_id'] - run['first_id'] + 1, 1)
+        done = min(max(run['next_id'] - run['first_id'], 0), span)
+        remaining = span - done
+        eta = None
+        if run['status'] == 'running' and ids_per_second:
+            eta = round(remaining / ids_per_second, 1)
+        return {
+            'run_id': run['id'],
+            'status': run['status'],
+            'rules_signature': run['rules_signature'],
+            'rows_scanned': run['rows_scanned'],
+            'rows_changed': run['rows_changed'],
+            'next_id': run['next_id'],
+            'last_id': run['last_id'],
+            'percent': round(100.0 * done / span, 1),
+            'eta_seconds': eta,
+            'error': run.get('error'),
+            'started_at': run.get('started_at'),
+            'finished_at': run.get('finished_at')
+        }
@@ -0,0 +1,69 @@
+"""
+Reliability Service
+"""
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from app.repositories.reliability_repository import ReliabilityRepository, DIMENSIONS
+
+PERIOD_PATTERN = re.compile(r'^(\d+)d$')
+
+class ReliabilityService:
+    """
+    MTBF/MTTR per equipment, equipment type or location. Results are cached
+    per (dimension, period) until a fault is reported or changes status (see
+    ReliabilityObserver); `ttl` bounds how long changes made by other
+    processes go unseen.
+    """
+
+    def __init__(self, reliability_repository: ReliabilityRepository, ttl: float = 300.0):
+        self.reliability_repository = reliability_repository
+        self.ttl = ttl
+        self._cache = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get_reliability(self, dimension: str = 'equipment', period: str = 'all') -> dict:
+        """Reliability figures for one dimension over 'all' time or the last '<N>d' days"""
+        if dimension not in DIMENSIONS:
+            raise ValueError(f"Dimension must be one of: {', '.join(DIMENSIONS)}")
+        period = period or 'all'
+        match = PERIOD_PATTERN.match(period)
+        if period != 'all' and not match:
+            raise ValueError("Period must be 'all' or a number of days such as '90d'")
+
+        key = (dimension, period)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() - cached[0] < self.ttl:
+                return cached[1]
+            generation = self._generation
+
+        since = None
+        if match:
+            since = (datetime.now() - timedelta(days=int(match.group(1)))).isoformat()
+        rows = self.reliability_repository.find_reliability(dimension, since)
+        for row in rows:
+            mtbf, mttr = row['mtbf_hours'], row['mttr_hours']
+            row['availability'] = None
+            if mtbf is not None and mttr is not None and mtbf + mttr > 0:
+                row['availability'] = mtbf / (mtbf + mttr)
+        result = {
+            'dimension': dimension,
+            'period': period,
+            'since': since,
+            'computed_at': datetime.now().isoformat(),
+            'rows': rows
+        }
+        with self._lock:
+            # Not cached when a fault changed while it was being computed
+            if generation == self._generation:
+                self._cache[key] = (time.monotonic(), result)
+        return result
+
+    def invalidate(self):
+        """Drop every cached result (the fault history changed)"""
+        with self._lock:
+            self._cache.clear()
+            self._generation += 1
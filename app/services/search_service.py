@@ -0,0 +1,136 @@
+"""
+Search Service
+"""
+import html
+import re
+from app.repositories.search_repository import SearchRepository, MATCH_START, MATCH_END
+from app.database.db_connection import SEARCH_KINDS, LIBRARY_KINDS
+
+# "quoted phrases" or single words
+TERM_PATTERN = re.compile(r'"([^"]+)"|(\w+)')
+
+MAX_LIMIT = 100
+
+# Library hits shown per group
+HITS_PER_GROUP = 5
+
+# Library grouping: index column and the label fields shown for the group
+LIBRARY_GROUPS = {
+    'equipment': ('equipment', ('equipment_code', 'equipment_name')),
+    'package': ('package', ('package_name',)),
+}
+
+
+def match_expression(text: str) -> str:
+    """
+    FTS5 expression for free text: every word (or quoted phrase) must occur,
+    and FTS5 operators and punctuation in the input are taken literally
+    """
+    terms = []
+    for phrase, word in TERM_PATTERN.findall(text or ''):
+        words = re.findall(r'\w+', phrase) if phrase else [word]
+        if words:
+            terms.append('"' + ' '.join(words) + '"')
+    return ' '.join(terms)
+
+
+def _mark(text: str) -> str:
+    """Escape indexed text for HTML and turn the match markers into <mark> tags"""
+    if text is None:
+        return None
+    return html.escape(text).replace(MATCH_START, '<mark>').replace(MATCH_END, '</mark>')
+
+
+class SearchService:
+    """
+    Full-text search over faults, root cause analyses and resolution reports,
+    and over the technical reference and documentation library
+    """
+
+    def __init__(self, search_repository: SearchRepository):
+        self.search_repository = search_repository
+
+    def search(self, text: str, entity_types: list = None, equipment_id: int = None,
+               page: int = 1, per_page: int = 20) -> dict:
+        """One page of hits, best match first"""
+        match, entity_types = self._prepare(text, entity_types, SEARCH_KINDS, 'search_index')
+
+        page = max(page, 1)
+        per_page = min(max(per_page, 1), MAX_LIMIT)
+        # One extra row tells whether there is a next page without counting every match
+        hits = self.search_repository.search(match, entity_types, equipment_id,
+                                             per_page + 1, (page - 1) * per_page)
+        for hit in hits:
+            hit['title'] = _mark(hit['title'])
+            hit['snippet'] = _mark(hit['snippet'])
+            hit['score'] = -hit['score']
+        return {
+            'query': text,
+            'page': page,
+            'per_page': per_page,
+            'has_more': len(hits) > per_page,
+            'results': hits[:per_page]
+        }
+
+    def search_library(self, text: str, group_by: str = 'equipment', entity_types: list = None,
+                       equipment_id: int = None, page: int = 1, per_page: int = 20) -> dict:
+        """
+        One page of library groups (per equipment or documentation package),
+        ordered by their best hit, each with its best few hits. Hits without
+        the group key (references have no package) form a last group with a
+        null id.
+        """
+        if group_by not in LIBRARY_GROUPS:
+            raise ValueError(f"group_by must be one of: {', '.join(LIBRARY_GROUPS)}")
+        match, entity_types = self._prepare(text, entity_types, LIBRARY_KINDS, 'library_index')
+        column, labels = LIBRARY_GROUPS[group_by]
+
+        page = max(page, 1)
+        per_page = min(max(per_page, 1), MAX_LIMIT)
+        groups = self.search_repository.find_library_groups(
+            match, column, entity_types, equipment_id, per_page + 1, (page - 1) * per_page)
+        has_more = len(groups) > per_page
+        groups = groups[:per_page]
+        hits = self.search_repository.find_library_hits(
+            match, column, [group['group_key'] for group in groups], entity_types, equipment_id,
+            HITS_PER_GROUP) if groups else []
+
+        by_key = {}
+        for group in groups:
+            by_key[group['group_key']] = {
+                group_by + '_id': group['group_key'],
+                'score': -group['score'],
+                'hit_count': group['hit_count'],
+                'hits': []
+            }
+        for hit in hits:
+            group = by_key[hit.pop('group_key')]
+            for label in labels:
+                group.setdefault(label, hit[label])
+            hit.pop('position')
+            hit.pop('hit_rowid')
+            hit['title'] = _mark(hit['title'])
+            hit['snippet'] = _mark(hit['snippet'])
+            hit['score'] = -hit['score']
+            group['hits'].append(hit)
+        return {
+            'query': text,
+            'group_by': group_by,
+            'page': page,
+            'per_page': per_page,
+            'has_more': has_more,
+            'groups': list(by_key.values())
+        }
+
+    def _prepare(self, text: str, entity_types: list, kinds: dict, index: str) -> tuple:
+        """Match expression and validated entity types for a search over `index`"""
+        match = match_expression(text)
+        if not match:
+            raise ValueError("Enter at least one word to search for")
+        entity_types = [kind for kind in (entity_types or []) if kind]
+        unknown = [kind for kind in entity_types if kind not in kinds]
+        if unknown:
+            raise ValueError(f"Unknown type(s): {', '.join(unknown)}. Use: {', '.join(kinds)}")
+        if not self.search_repository.is_available(index):
+            raise RuntimeError("Full-text search is not available (SQLite without FTS5)")
+        return match, entity_types
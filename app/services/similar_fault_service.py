@@ -0,0 +1,90 @@
+"""
+Similar Fault Service
+"""
+import threading
+import time
+from app.repositories.fault_similarity_repository import FaultSimilarityRepository
+from app.algorithms.fault_similarity import FaultSimilarityIndex
+
+MAX_K = 20
+
+class SimilarFaultService:
+    """
+    Suggests root causes for a fault from the most similar resolved faults.
+    The index is built on first use and kept in memory. Before each query it
+    picks up faults created or given an RCA or resolution report since the
+    last look (by id), and faults whose status changed in this process (see
+    SimilarityObserver); rebuild() reloads everything, e.g. after edits.
+    """
+
+    def __init__(self, similarity_repository: FaultSimilarityRepository):
+        self.similarity_repository = similarity_repository
+        self.index = FaultSimilarityIndex()
+        self._watermarks = None
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    def find_similar(self, fault_id: int, k: int = 5) -> dict:
+        """The k resolved faults most similar to a fault, with their root causes"""
+        fault = self.similarity_repository.find_fault(fault_id)
+        if not fault:
+            raise ValueError("Fault not found")
+        k = min(max(k, 1), MAX_K)
+        self.refresh()
+        start = time.perf_counter()
+        with self._lock:
+            matches = self.index.query(fault['fault_description'], fault['equipment_type'],
+                                       fault['severity'], k, exclude=fault_id)
+        details = self.similarity_repository.find_details([match[0] for match in matches])
+        results = []
+        for similar_id, score, cosine in matches:
+            if similar_id in details:
+                results.append({**details[similar_id], 'score': round(score, 4), 'text_similarity': round(cosine, 4)})
+        return {
+            'fault_id': fault_id,
+            'indexed_faults': len(self.index),
+            'duration_ms': round((time.perf_counter() - start) * 1000, 2),
+            'results': results
+        }
+
+    def refresh(self):
+        """Index the faults changed since the last refresh (builds the index the first time)"""
+        with self._lock:
+            if self._watermarks is None:
+                self._rebuild()
+                return
+            watermarks = self.similarity_repository.find_watermarks()
+            if watermarks == self._watermarks and not self._dirty:
+                return
+            changed = set(self.similarity_repository.find_changed_fault_ids(self._watermarks))
+            changed |= self._dirty
+            self._dirty.clear()
+            self._watermarks = watermarks
+            documents = self.similarity_repository.find_documents(sorted(changed))
+            for fault_id, text, equipment_type, severity in documents:
+                self.index.add(fault_id, text, equipment_type, severity)
+            # Changed faults without a document are no longer resolved (or never were)
+            for fault_id in changed - {document[0] for document in documents}:
+                self.index.remove(fault_id)
+
+    def rebuild(self) -> dict:
+        """Reload the whole index from the database"""
+        start = time.perf_counter()
+        with self._lock:
+            self._rebuild()
+            return {
+                'indexed_faults': len(self.index),
+                'terms': len(self.index.postings),
+                'duration_ms': round((time.perf_counter() - start) * 1000, 2)
+            }
+
+    def fault_changed(self, fault_id: int):
+        """Reindex a fault at the next query (its status or texts changed)"""
+        with self._lock:
+            self._dirty.add(fault_id)
+
+    def _rebuild(self):
+        # Watermarks first: rows added while loading are picked up by the next refresh
+        self._watermarks = self.similarity_repository.find_watermarks()
+        self._dirty.clear()
+        self.index.rebuild(self.similarity_repository.find_documents())
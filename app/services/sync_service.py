@@ -0,0 +1,71 @@
+"""
+Sync Service
+"""
+from app.repositories.sync_repository import SyncRepository, SYNC_MODELS
+from app.models.user import User
+
+MAX_LIMIT = 5000
+
+
+class SyncService:
+    """
+    Delta sync for offline clients. Every insert, update and delete of
+    equipment, monitoring records, faults and notifications moves the record
+    to the end of change_log with a new sequence number, so a client that
+    keeps the last number it has seen gets exactly the records changed since,
+    however long it was offline. Technicians get their own monitoring records
+    only, everyone gets their own notifications (deletions included). Rows
+    moved to the archive are not reported as deleted.
+    """
+
+    def __init__(self, sync_repository: SyncRepository):
+        self.sync_repository = sync_repository
+
+    def get_changes(self, user_id: int, role: str, since: int = 0, entities: list = None,
+                    limit: int = 500) -> dict:
+        """
+        Records changed after sequence number `since`, at most `limit` changes
+        per call; call again with next_since while has_more is true
+        """
+        if since < 0:
+            raise ValueError("since must be 0 or a sequence number from an earlier sync")
+        entities = [entity for entity in (entities or []) if entity] or list(SYNC_MODELS)
+        unknown = [entity for entity in entities if entity not in SYNC_MODELS]
+        if unknown:
+            raise ValueError(f"Unknown table(s): {', '.join(unknown)}. Use: {', '.join(SYNC_MODELS)}")
+        limit = min(max(limit, 1), MAX_LIMIT)
+
+        # One extra row tells whether there is more without counting
+        changes = self.sync_repository.find_changes(since, entities, limit + 1)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        # Entities the user only sees their own records of (deletions included)
+        owned = {'notifications'}
+        if not User(role=role).has_permission('engineer'):
+            owned.add('monitoring')
+
+        changed, deleted = {}, {}
+        for change in changes:
+            if change['deleted']:
+                if change['entity'] not in owned or change['owner_id'] == user_id:
+                    deleted.setdefault(change['entity'], []).append(change['row_id'])
+            else:
+                changed.setdefault(change['entity'], []).append(change['row_id'])
+
+        rows = {}
+        for entity in entities:
+            row_ids = changed.get(entity)
+            owner_id = user_id if entity in owned else None
+            rows[entity] = self.sync_repository.find_rows(entity, row_ids, owner_id) if row_ids else []
+        return {
+            'since': since,
+            'next_since': changes[-1]['seq'] if changes else since,
+            'has_more': has_more,
+            'changes': rows,
+            'deleted': {entity: deleted.get(entity, []) for entity in entities}
+        }
+
+    def get_latest_seq(self) -> int:
+        """Sequence number of the newest change"""
+        return self.sync_repository.find_latest_seq()
@@ -0,0 +1,116 @@
+"""
+Threshold Service
+"""
+import threading
+from datetime import datetime
+from app.repositories.threshold_profile_repository import ThresholdProfileRepository
+from app.repositories.equipment_repository import EquipmentRepository
+from app.models.threshold_profile import ThresholdProfile
+from app.models.equipment import Equipment
+from app.algorithms.threshold_rules import ThresholdRules, LIMIT_FIELDS
+
+class ThresholdService:
+    """Service for threshold profiles and monitoring status classification"""
+
+    def __init__(self, threshold_repository: ThresholdProfileRepository,
+                 equipment_repository: EquipmentRepository):
+        self.threshold_repository = threshold_repository
+        self.equipment_repository = equipment_repository
+        self._rules = None
+        self._lock = threading.Lock()
+
+    def get_rules(self) -> ThresholdRules:
+        """Compiled rules, recompiled only when the profiles have changed"""
+        signature = self.threshold_repository.get_signature()
+        rules = self._rules
+        if rules is not None and rules.signature == signature:
+            return rules
+        with self._lock:
+            if self._rules is None or self._rules.signature != signature:
+                self._rules = ThresholdRules.compile(
+                    self.threshold_repository.find_all(),
+                    self.threshold_repository.find_equipment_types(),
+                    signature
+                )
+            return self._rules
+
+    def classify(self, equipment: Equipment, voltage: float = None, current: float = None,
+                 power_factor: float = None) -> str:
+        """Status (normal/warning/critical) of one reading for an equipment"""
+        return self.get_rules().classify(voltage, current, power_factor,
+                                         equipment.id, equipment.equipment_type)
+
+    def classify_batch(self, equipment_ids, equipment_types, voltages, currents, power_factors) -> list:
+        """Statuses for parallel columns of readings (bulk ingestion / re-classification)"""
+        return self.get_rules().classify_batch(equipment_ids, equipment_types,
+                                               voltages, currents, power_factors)
+
+    def get_effective_limits(self, equipment_id: int) -> dict:
+        """Limits that apply to an equipment after inheritance"""
+        equipment = self.equipment_repository.find_by_id(equipment_id)
+        if not equipment:
+            raise ValueError("Equipment not found")
+        return self.get_rules().describe(equipment.id, equipment.equipment_type)
+
+    def get_profiles(self) -> list:
+        """All threshold profiles"""
+        return self.threshold_repository.find_all()
+
+    def create_profile(self, name: str, equipment_type: str = None, equipment_id: int = None,
+                       limits: dict = None, is_active: bool = True) -> ThresholdProfile:
+        """Create a profile for the default, an equipment type or one equipment"""
+        if not name:
+            raise ValueError("Profile name is required")
+        if equipment_type and equipment_id:
+            raise ValueError("A profile applies to an equipment type or to one equipment, not both")
+        if equipment_id is not None and not self.equipment_repository.find_by_id(equipment_id):
+            raise ValueError("Equipment not found")
+        if self.threshold_repository.find_by_scope(equipment_type or None, equipment_id):
+            raise ValueError("A threshold profile already exists for this scope")
+
+        profile = ThresholdProfile(
+            name=name,
+            equipment_type=equipment_type or None,
+            equipment_id=equipment_id,
+            is_active=is_active,
+            updated_at=datetime.now()
+        )
+        self._apply_limits(profile, limits or {})
+        profile.id = self.threshold_repository.create(profile)
+        return self.threshold_repository.find_by_id(profile.id)
+
+    def update_profile(self, profile_id: int, name: str = None, limits: dict = None,
+                       is_active: bool = None) -> ThresholdProfile:
+        """Update a profile's name, limits or active flag (limits set to None are inherited)"""
+        profile = self.threshold_repository.find_by_id(profile_id)
+        if not profile:
+            raise ValueError("Threshold profile not found")
+        if name is not None:
+            profile.name = name
+        if limits:
+            self._apply_limits(profile, limits)
+        if is_active is not None:
+            profile.is_active = is_active
+        self.threshold_repository.update(profile)
+        return self.threshold_repository.find_by_id(profile_id)
+
+    def delete_profile(self, profile_id: int) -> None:
+        """Delete a type or equipment profile (the default profile stays)"""
+        profile = self.threshold_repository.find_by_id(profile_id)
+        if not profile:
+            raise ValueError("Threshold profile not found")
+        if profile.scope == 'default':
+            raise ValueError("The default threshold profile cannot be deleted")
+        self.threshold_repository.delete(profile_id)
+
+    def _apply_limits(self, profile: ThresholdProfile, limits: dict):
+        for field, value in limits.items():
+            if field not in LIMIT_FIELDS:
+                raise ValueError(f"Unknown threshold field: {field}")
+            if value in (None, ''):
+                setattr(profile, field, None)
+                continue
+            try:
+                setattr(profile, field, float(value))
+            except (TypeError, ValueError):
+                raise ValueError(f"Invalid value for {field}: {value}")
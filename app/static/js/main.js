@@ -1,5 +1,53 @@
 // Main JavaScript for Operations & Monitoring System
 
+// Idempotency keys for API writes: every POST/PUT to /api/ carries an
+// Idempotency-Key. The key is kept (per page session) until a response
+// arrives, so resubmitting the same data after a network failure or a 409
+// reuses it and the server replays the first result instead of writing twice.
+(function installIdempotencyKeys() {
+    if (!window.fetch || !window.sessionStorage) return;
+    const originalFetch = window.fetch.bind(window);
+    
+    function newKey() {
+        if (window.crypto && crypto.randomUUID) return crypto.randomUUID();
+        return Date.now().toString(36) + '-' + Math.random().toString(36).slice(2) + Math.random().toString(36).slice(2);
+    }
+    
+    function storageKey(method, url, body) {
+        // Short string hash of the request so the storage key stays small
+        const text = method + ' ' + url + ' ' + body;
+        let hash = 5381;
+        for (let i = 0; i < text.length; i++) {
+            hash = ((hash << 5) + hash + text.charCodeAt(i)) | 0;
+        }
+        return 'apds-idempotency:' + (hash >>> 0).toString(36) + ':' + text.length;
+    }
+    
+    window.fetch = function(input, init) {
+        init = init || {};
+        const method = (init.method || 'GET').toUpperCase();
+        const url = typeof input === 'string' ? input : input.url;
+        const headers = new Headers(init.headers || {});
+        if ((method !== 'POST' && method !== 'PUT') || !url.startsWith('/api/') ||
+            typeof init.body !== 'string' || headers.has('Idempotency-Key')) {
+            return originalFetch(input, init);
+        }
+        
+        const stored = storageKey(method, url, init.body);
+        let key = sessionStorage.getItem(stored);
+        if (!key) {
+            key = newKey();
+            sessionStorage.setItem(stored, key);
+        }
+        headers.set('Idempotency-Key', key);
+        return originalFetch(input, Object.assign({}, init, { headers: headers })).then(function(response) {
+            // 409: the first attempt is still running - keep the key for the retry
+            if (response.status !== 409) sessionStorage.removeItem(stored);
+            return response;
+        });
+    };
+})();
+
 // Initialize on DOM load
 document.addEventListener('DOMContentLoaded', function() {
     initializeDate();
@@ -0,0 +1,55 @@
+"""
+Monitoring Archive Script
+Moves old daily_monitoring rows into the archive database (safe while the app is running)
+
+Usage:
+    python archive_db.py archive --days 365
+    python archive_db.py archive --before 2024-01-01
+    python archive_db.py status
+"""
+import argparse
+import sys
+from datetime import date
+from app.database.db_connection import DatabaseConnection
+from app.database.archive import MonitoringArchiver
+
+def main():
+    parser = argparse.ArgumentParser(description='Archive old APDS monitoring rows')
+    parser.add_argument('--archive-path', help='Archive database (default: <db>_archive.db)')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    archive = commands.add_parser('archive', help='Move old rows into the archive')
+    horizon = archive.add_mutually_exclusive_group(required=True)
+    horizon.add_argument('--days', type=int, help='Archive rows more than N days old')
+    horizon.add_argument('--before', help='Archive rows dated before YYYY-MM-DD')
+
+    commands.add_parser('status', help='Show the archive boundary and row counts')
+
+    args = parser.parse_args()
+    archiver = MonitoringArchiver(DatabaseConnection(), args.archive_path)
+
+    if args.command == 'archive':
+        try:
+            before = date.fromisoformat(args.before) if args.before else None
+        except ValueError:
+            print(f"[ERROR] Invalid date: {args.before}")
+            return 1
+        result = archiver.archive(before) if before else archiver.archive_older_than(args.days)
+        print(f"[OK] Archived {result['rows_archived']} rows from {result['days_archived']} days "
+              f"into {result['archive_path']} ({result['duration_ms']} ms)")
+        print(f"     Archive boundary: {result['archived_before']}")
+
+    elif args.command == 'status':
+        status = archiver.status()
+        print(f"Archive boundary: {status['archived_before'] or 'none'}")
+        print(f"Live rows:        {status['live_rows']}")
+        print(f"Archived rows:    {status['archived_rows']}")
+        print(f"Archive file:     {status['archive_path']} ({status['archive_bytes']} bytes)")
+        if status['last_run']:
+            run = status['last_run']
+            print(f"Last run:         {run['started_at']} -> {run['finished_at'] or 'unfinished'}, "
+                  f"{run['rows_archived']} rows")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""
+Database Backup Script
+Online snapshots of operations_monitoring.db (safe while the app is running)
+
+Usage:
+    python backup_db.py snapshot [--label NAME] [--keep N] [--keep-days D]
+    python backup_db.py list
+    python backup_db.py verify [SNAPSHOT ...]
+    python backup_db.py prune --keep N [--keep-days D]
+    python backup_db.py restore SNAPSHOT [--force]
+"""
+import argparse
+import os
+import sys
+from app.database.db_connection import DatabaseConnection
+from app.database.backup import DatabaseBackup
+
+def main():
+    parser = argparse.ArgumentParser(description='Online backup for the APDS database')
+    parser.add_argument('--dir', help='Backup directory (default: backups/ next to the database)')
+    parser.add_argument('--pages', type=int, default=256, help='Pages copied per step')
+    parser.add_argument('--sleep', type=float, default=0.01, help='Seconds to sleep between steps')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    snapshot = commands.add_parser('snapshot', help='Take a snapshot now')
+    snapshot.add_argument('--label', help='Suffix added to the snapshot name')
+    snapshot.add_argument('--keep', type=int, help='Apply retention afterwards, keeping N snapshots')
+    snapshot.add_argument('--keep-days', type=int, help='Only prune snapshots older than D days')
+
+    commands.add_parser('list', help='List snapshots')
+
+    verify = commands.add_parser('verify', help='Verify checksums and integrity')
+    verify.add_argument('snapshots', nargs='*', help='Snapshots to verify (default: all)')
+
+    prune = commands.add_parser('prune', help='Apply retention')
+    prune.add_argument('--keep', type=int, required=True)
+    prune.add_argument('--keep-days', type=int)
+
+    restore = commands.add_parser('restore', help='Restore a snapshot into the live database')
+    restore.add_argument('snapshot')
+    restore.add_argument('--force', action='store_true',
+                         help='Restore even while the database is open elsewhere (e.g. the running app)')
+
+    args = parser.parse_args()
+    backup = DatabaseBackup(DatabaseConnection(), args.dir, args.pages, args.sleep)
+
+    if args.command == 'snapshot':
+        result = backup.create_snapshot(args.label)
+        print(f"[OK] Snapshot {result['path']} ({result['size_bytes']} bytes, "
+              f"{result['steps']} steps, {result['duration_ms']} ms)")
+        print(f"     sha256 {result['sha256']}")
+        if args.keep:
+            for path in backup.apply_retention(args.keep, args.keep_days):
+                print(f"[OK] Removed {path}")
+
+    elif args.command == 'list':
+        snapshots = backup.list_snapshots()
+        if not snapshots:
+            print(f"No snapshots in {backup.backup_dir}")
+        for snapshot in snapshots:
+            checksum = '' if snapshot['has_checksum'] else '  (no checksum)'
+            print(f"{snapshot['created_at']}  {snapshot['size_bytes']:>12}  {snapshot['name']}{checksum}")
+
+    elif args.command == 'verify':
+        paths = args.snapshots or [s['path'] for s in backup.list_snapshots()]
+        failed = 0
+        for path in paths:
+            result = backup.verify(path)
+            print(f"[{'OK' if result['ok'] else 'ERROR'}] {os.path.basename(path)}: {result['message']}")
+            failed += not result['ok']
+        return 1 if failed else 0
+
+    elif args.command == 'prune':
+        removed = backup.apply_retention(args.keep, args.keep_days)
+        for path in removed:
+            print(f"[OK] Removed {path}")
+        print(f"{len(removed)} snapshot(s) removed")
+
+    elif args.command == 'restore':
+        try:
+            result = backup.restore(args.snapshot, force=args.force)
+        except (ValueError, RuntimeError) as e:
+            print(f"[ERROR] {e}")
+            return 1
+        if result['forced']:
+            print("[WARN] The database was open elsewhere; restart the app to drop its stale connections.")
+        print(f"[OK] Restored from {result['restored_from']}")
+        print(f"     Previous database saved as {result['safety_snapshot']}")
+
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,7 @@
+"""
+Benchmarks package
+
+Synthetic data generation and repeatable endpoint benchmarks. Benchmarks run
+against a separate database selected through APDS_DB_PATH, never against
+operations_monitoring.db.
+"""
@@ -0,0 +1,330 @@
+"""
+Synthetic Data Generator
+
+Builds a large, realistic APDS dataset for benchmarking:
+users per role, thousands of equipment, millions of daily_monitoring rows,
+faults with RCAs, resolution reports, escalations, performance reports and
+notifications.
+
+Usage:
+    python -m benchmarks.data_generator --db benchmarks/data/bench.db --equipment 2000 --days 365
+"""
+import argparse
+import hashlib
+import os
+import random
+import sqlite3
+import time
+from datetime import date, datetime, timedelta
+from app.algorithms.threshold_rules import ThresholdRules
+
+BENCH_PASSWORD = 'password123'
+
+EQUIPMENT_TYPES = {
+    # type: (nominal current A, typical power factor)
+    'Transformer': (80.0, 0.95),
+    'Panel': (45.0, 0.93),
+    'Generator': (90.0, 0.92),
+    'HVAC': (60.0, 0.88),
+    'Lighting': (15.0, 0.96),
+    'Motor': (70.0, 0.86),
+    'UPS': (35.0, 0.97)
+}
+BUILDINGS = ['Building A', 'Building B', 'Building C', 'Substation 1', 'Substation 2', 'Pump House']
+SHIFT_HOURS = {'morning': 8, 'afternoon': 15, 'night': 22}
+FAULT_TEXTS = [
+    'Breaker trip on main feeder',
+    'Overheating detected on windings',
+    'Abnormal noise from cooling fan',
+    'Voltage fluctuation beyond tolerance',
+    'Low power factor alarm',
+    'Insulation resistance below limit',
+    'Earth fault relay operated',
+    'Oil leakage observed near gasket',
+    'Control circuit failure',
+    'Loose termination on phase B'
+]
+ROOT_CAUSES = [
+    'Aged insulation', 'Loose connection', 'Overloading during peak hours',
+    'Capacitor bank failure', 'Cooling system blockage', 'Moisture ingress'
+]
+BATCH_SIZE = 50000
+
+
+DEFAULT_RULES = ThresholdRules.compile([])
+
+
+def classify(voltage: float, current: float, power_factor: float) -> str:
+    """Status under the default threshold profile (as MonitoringService would record it)"""
+    return DEFAULT_RULES.classify(voltage, current, power_factor)
+
+
+def _ts(value: datetime) -> str:
+    return value.strftime('%Y-%m-%d %H:%M:%S')
+
+
+def _batched(rows, size: int = BATCH_SIZE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class DataGenerator:
+    """Generates a synthetic dataset into an empty APDS database"""
+
+    def __init__(self, db_path: str, equipment: int = 2000, days: int = 365,
+                 technicians: int = 50, engineers: int = 10, managers: int = 3,
+                 fault_rate: float = 0.002, seed: int = 42):
+        self.db_path = db_path
+        self.equipment_count = equipment
+        self.days = days
+        self.technician_count = technicians
+        self.engineer_count = engineers
+        self.manager_count = managers
+        self.fault_rate = fault_rate
+        self.random = random.Random(seed)
+        self.today = date.today()
+        self.conn = None
+        self.users = {'technician': [], 'engineer': [], 'dm': [], 'dgm': []}
+        self.equipment = []
+
+    def run(self) -> dict:
+        """Create schema and generate all data; returns row counts"""
+        self._create_schema()
+        from app.database.profiles import apply_profile, get_profile
+        self.conn = sqlite3.connect(self.db_path)
+        settings = get_profile('ingest')
+        settings.update({'synchronous': 'OFF', 'foreign_keys': 'OFF'})
+        apply_profile(self.conn, settings)
+        try:
+            steps = [
+                ('users', self._generate_users),
+                ('equipment', self._generate_equipment),
+                ('daily_monitoring', self._generate_monitoring),
+                ('faults', self._generate_faults),
+                ('performance_reports', self._generate_performance_reports)
+            ]
+            for name, step in steps:
+                start = time.perf_counter()
+                step()
+                self.conn.commit()
+                print(f"[OK] {name} generated in {time.perf_counter() - start:.1f}s")
+            # Rows were inserted directly, so fill the latest-reading, daily stats and health tables here
+            from app.database.db_connection import (LATEST_READING_BACKFILL, DAILY_STATS_MERGE,
+                                                    EQUIPMENT_HEALTH_REBUILD, HEALTH_STATUS_DECAY)
+            self.conn.execute(LATEST_READING_BACKFILL)
+            self.conn.execute("DELETE FROM equipment_daily_stats")
+            self.conn.execute(DAILY_STATS_MERGE.format(where='1'), {'sign': 1})
+            self.conn.execute("DELETE FROM equipment_health")
+            self.conn.execute(EQUIPMENT_HEALTH_REBUILD, {'decay': HEALTH_STATUS_DECAY})
+            self.conn.execute("ANALYZE")
+            self.conn.commit()
+            return self.counts()
+        finally:
+            self.conn.close()
+
+    def counts(self) -> dict:
+        """Row counts of the generated tables"""
+        tables = ['users', 'equipment', 'daily_monitoring', 'faults', 'root_cause_analysis',
+                  'resolution_reports', 'escalations', 'notifications', 'performance_reports']
+        return {t: self.conn.execute(f"SELECT COUNT(*) FROM {t}").fetchone()[0] for t in tables}
+
+    def _create_schema(self):
+        # Let the application create its own schema so benchmarks track it
+        os.environ['APDS_DB_PATH'] = self.db_path
+        from app.database.db_connection import DatabaseConnection
+        DatabaseConnection()
+
+    def _generate_users(self):
+        password_hash = hashlib.sha256(BENCH_PASSWORD.encode()).hexdigest()
+        counts = {'technician': self.technician_count, 'engineer': self.engineer_count,
+                  'dm': self.manager_count, 'dgm': self.manager_count}
+        cursor = self.conn.cursor()
+        for role, count in counts.items():
+            for i in range(1, count + 1):
+                username = f"bench_{role}_{i:03d}"
+                cursor.execute("""
+                    INSERT INTO users (username, email, password_hash, role, full_name)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (username, f"{username}@bench.local", password_hash, role, f"Bench {role.upper()} {i}"))
+                self.users[role].append(cursor.lastrowid)
+
+    def _generate_equipment(self):
+        cursor = self.conn.cursor()
+        types = list(EQUIPMENT_TYPES)
+        for i in range(1, self.equipment_count + 1):
+            equipment_type = types[i % len(types)]
+            location = f"{self.random.choice(BUILDINGS)} - Bay {self.random.randint(1, 40)}"
+            last_maintenance = self.today - timedelta(days=self.random.randint(10, 400))
+            cursor.execute("""
+                INSERT INTO equipment (equipment_code, equipment_name, equipment_type, location,
+                                       status, last_maintenance_date)
+                VALUES (?, ?, ?, ?, 'operational', ?)
+            """, (f"BEQ-{i:06d}", f"{equipment_type} {i}", equipment_type, location,
+                  last_maintenance.isoformat()))
+            self.equipment.append((cursor.lastrowid, equipment_type))
+
+    def _monitoring_rows(self):
+        rnd = self.random
+        technicians = self.users['technician']
+        start = self.today - timedelta(days=self.days - 1)
+        # Each equipment gets a slow drift so trend analyses have something to find
+        drift = {eq_id: (rnd.gauss(0, 0.01), rnd.gauss(0, 0.0002)) for eq_id, _ in self.equipment}
+        for day in range(self.days):
+            monitoring_date = start + timedelta(days=day)
+            for shift, hour in SHIFT_HOURS.items():
+                created_at = _ts(datetime.combine(monitoring_date, datetime.min.time()) + timedelta(hours=hour))
+                for eq_id, equipment_type in self.equipment:
+                    nominal_current, nominal_pf = EQUIPMENT_TYPES[equipment_type]
+                    v_drift, pf_drift = drift[eq_id]
+                    voltage = round(rnd.gauss(230 + v_drift * day, 4.0), 2)
+                    current = round(abs(rnd.gauss(nominal_current, nominal_current * 0.15)), 2)
+                    power_factor = round(min(1.0, max(0.5, rnd.gauss(nominal_pf - pf_drift * day, 0.02))), 3)
+                    yield (eq_id, technicians[eq_id % len(technicians)], monitoring_date.isoformat(),
+                           shift, voltage, current, power_factor,
+                           classify(voltage, current, power_factor), None, created_at)
+
+    def _generate_monitoring(self):
+        query = """
+            INSERT INTO daily_monitoring
+            (equipment_id, technician_id, monitoring_date, shift, voltage, current,
+             power_factor, operational_status, observations, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """
+        total = 0
+        for batch in _batched(self._monitoring_rows()):
+            self.conn.executemany(query, batch)
+            self.conn.commit()
+            total += len(batch)
+            if total % (BATCH_SIZE * 20) == 0:
+                print(f"    {total:,} monitoring rows")
+
+    def _generate_faults(self):
+        rnd = self.random
+        cursor = self.conn.cursor()
+        technicians = self.users['technician']
+        engineers = self.users['engineer']
+        dms = self.users['dm']
+        notifications = []
+        fault_count = max(1, int(self.equipment_count * self.days * self.fault_rate))
+        now = datetime.now()
+        for _ in range(fault_count):
+            eq_id, equipment_type = rnd.choice(self.equipment)
+            reported_at = now - timedelta(days=rnd.uniform(0, self.days), hours=rnd.uniform(0, 24))
+            severity = rnd.choices(['low', 'medium', 'high', 'critical'], weights=[40, 35, 18, 7])[0]
+            age_days = (now - reported_at).days
+            if age_days > 14:
+                status = rnd.choices(['resolved', 'escalated'], weights=[92, 8])[0]
+            else:
+                status = rnd.choice(['reported', 'investigating', 'escalated', 'resolved'])
+            resolved_at = _ts(reported_at + timedelta(hours=rnd.uniform(1, 96))) if status == 'resolved' else None
+            description = f"{rnd.choice(FAULT_TEXTS)} on {equipment_type.lower()} {eq_id}"
+            cursor.execute("""
+                INSERT INTO faults (equipment_id, reported_by, fault_description, severity, status,
+                                    reported_at, resolved_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (eq_id, rnd.choice(technicians), description, severity, status, _ts(reported_at), resolved_at))
+            fault_id = cursor.lastrowid
+
+            for engineer_id in engineers:
+                if severity in ('high', 'critical'):
+                    notifications.append((engineer_id, 'Critical Fault Reported',
+                                          f"Critical fault reported: {description}", 'error',
+                                          1 if status == 'resolved' else 0, 'fault', fault_id, _ts(reported_at)))
+
+            if status == 'escalated' or (severity == 'critical' and rnd.random() < 0.5):
+                for level in range(1, rnd.randint(1, 3) + 1):
+                    escalated_at = reported_at + timedelta(hours=6 * level)
+                    target = rnd.choice(dms)
+                    cursor.execute("""
+                        INSERT INTO escalations (fault_id, escalated_from, escalated_to, escalation_reason,
+                                                 escalation_level, status, escalated_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, (fault_id, rnd.choice(engineers), target, 'Unresolved within SLA', level,
+                          'resolved' if status == 'resolved' else 'pending', _ts(escalated_at)))
+                    notifications.append((target, 'Fault Escalated',
+                                          'Fault has been escalated to you: Unresolved within SLA',
+                                          'escalation', 0, 'escalation', cursor.lastrowid, _ts(escalated_at)))
+
+            if status == 'resolved':
+                engineer_id = rnd.choice(engineers)
+                cursor.execute("""
+                    INSERT INTO root_cause_analysis (fault_id, analyzed_by, root_cause, contributing_factors, analysis_date)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (fault_id, engineer_id, rnd.choice(ROOT_CAUSES), 'Identified during inspection', resolved_at))
+                rca_id = cursor.lastrowid
+                report_status = rnd.choices(['approved', 'pending_approval', 'draft'], weights=[80, 15, 5])[0]
+                cursor.execute("""
+                    INSERT INTO resolution_reports (fault_id, rca_id, prepared_by, resolution_description,
+                                                    actions_taken, preventive_measures, status, created_at,
+                                                    approved_by, approved_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (fault_id, rca_id, engineer_id, f"Resolved: {description}", 'Component replaced and tested',
+                      'Added to preventive maintenance plan', report_status, resolved_at,
+                      rnd.choice(dms) if report_status == 'approved' else None,
+                      resolved_at if report_status == 'approved' else None))
+
+        self.conn.executemany("""
+            INSERT INTO notifications (user_id, title, message, notification_type, is_read,
+                                       related_entity_type, related_entity_id, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, notifications)
+
+    def _generate_performance_reports(self):
+        rnd = self.random
+        rows = []
+        for technician_id in self.users['technician']:
+            for week in range(0, min(self.days, 364), 7):
+                period_end = self.today - timedelta(days=week)
+                period_start = period_end - timedelta(days=6)
+                status = 'submitted' if week < 14 else 'approved'
+                rows.append((technician_id, period_start.isoformat(), period_end.isoformat(), 'weekly',
+                             'Readings within tolerance', 'Continue monitoring', status,
+                             _ts(datetime.combine(period_end, datetime.min.time())),
+                             rnd.choice(self.users['dm']) if status == 'approved' else None))
+        self.conn.executemany("""
+            INSERT INTO performance_reports (technician_id, report_period_start, report_period_end, report_type,
+                                             analysis, recommendations, status, submitted_at, approved_by)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a synthetic APDS dataset for benchmarks')
+    parser.add_argument('--db', default=os.path.join(os.path.dirname(__file__), 'data', 'bench.db'))
+    parser.add_argument('--equipment', type=int, default=2000)
+    parser.add_argument('--days', type=int, default=365)
+    parser.add_argument('--technicians', type=int, default=50)
+    parser.add_argument('--engineers', type=int, default=10)
+    parser.add_argument('--managers', type=int, default=3)
+    parser.add_argument('--fault-rate', type=float, default=0.002,
+                        help='Faults per equipment per day')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--force', action='store_true', help='Overwrite an existing database')
+    args = parser.parse_args()
+
+    if os.path.exists(args.db):
+        if not args.force:
+            parser.error(f"{args.db} already exists (use --force to overwrite)")
+        for suffix in ('', '-wal', '-shm'):
+            if os.path.exists(args.db + suffix):
+                os.remove(args.db + suffix)
+    os.makedirs(os.path.dirname(os.path.abspath(args.db)), exist_ok=True)
+
+    start = time.perf_counter()
+    generator = DataGenerator(args.db, equipment=args.equipment, days=args.days,
+                              technicians=args.technicians, engineers=args.engineers,
+                              managers=args.managers, fault_rate=args.fault_rate, seed=args.seed)
+    counts = generator.run()
+    print(f"\nDataset generated in {time.perf_counter() - start:.1f}s: {args.db}")
+    for table, count in counts.items():
+        print(f"  {table}: {count:,}")
+
+
+if __name__ == '__main__':
+    main()
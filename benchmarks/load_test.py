@@ -0,0 +1,298 @@
+"""
+Load Test Harness
+
+Simulates concurrent users per role against a locally started app (app.py)
+or an already running server:
+  - technicians submit readings and poll their dashboard
+  - engineers poll the fault list and review faults
+  - DMs/DGMs poll pending reports and approve them
+Polling follows the dashboards' 30 second cadence, compressed by --speedup.
+
+Reports throughput, latency percentiles per action and the rate of
+"database is locked" errors.
+
+Usage:
+    python -m benchmarks.load_test --db benchmarks/data/bench.db --technicians 40 --engineers 8 --duration 60
+"""
+import argparse
+import importlib.util
+import json
+import os
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import date
+from http.cookiejar import CookieJar
+
+from benchmarks.data_generator import BENCH_PASSWORD
+from benchmarks.stats import summarize
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DASHBOARD_POLL_SECONDS = 30
+
+
+class Metrics:
+    """Thread-safe collection of latencies and errors per action"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies = {}
+        self.errors = {}
+        self.locked = 0
+        self.total = 0
+
+    def record(self, action: str, elapsed_ms: float, ok: bool, locked: bool):
+        with self._lock:
+            self.latencies.setdefault(action, []).append(elapsed_ms)
+            self.total += 1
+            if not ok:
+                self.errors[action] = self.errors.get(action, 0) + 1
+            if locked:
+                self.locked += 1
+
+    def report(self, elapsed: float) -> dict:
+        actions = {}
+        for action, values in sorted(self.latencies.items()):
+            actions[action] = summarize(values)
+            actions[action]['errors'] = self.errors.get(action, 0)
+        return {
+            'duration_s': round(elapsed, 2),
+            'requests': self.total,
+            'throughput_rps': round(self.total / elapsed, 2) if elapsed else 0.0,
+            'errors': sum(self.errors.values()),
+            'database_locked': self.locked,
+            'database_locked_rate': round(self.locked / self.total, 5) if self.total else 0.0,
+            'latency': summarize([v for values in self.latencies.values() for v in values]),
+            'actions': actions
+        }
+
+
+class SimulatedUser(threading.Thread):
+    """One logged-in user running periodic role tasks until the deadline"""
+
+    def __init__(self, base_url: str, username: str, metrics: Metrics, deadline: float,
+                 speedup: float, seed: int):
+        super().__init__(daemon=True, name=username)
+        self.base_url = base_url
+        self.username = username
+        self.metrics = metrics
+        self.deadline = deadline
+        self.speedup = speedup
+        self.random = random.Random(seed)
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(CookieJar()))
+
+    def request(self, action: str, method: str, path: str, payload: dict = None):
+        """Send a request, record its latency and return decoded JSON (or None)"""
+        data = json.dumps(payload).encode() if payload is not None else None
+        req = urllib.request.Request(self.base_url + path, data=data, method=method,
+                                     headers={'Content-Type': 'application/json'} if data else {})
+        start = time.perf_counter()
+        status, body = 0, b''
+        try:
+            with self.opener.open(req, timeout=60) as response:
+                status, body = response.status, response.read()
+        except urllib.error.HTTPError as e:
+            status, body = e.code, e.read()
+        except OSError as e:
+            body = str(e).encode()
+        elapsed = (time.perf_counter() - start) * 1000
+        locked = b'database is locked' in body.lower()
+        self.metrics.record(action, elapsed, 200 <= status < 400 and not locked, locked)
+        try:
+            return json.loads(body)
+        except ValueError:
+            return None
+
+    def tasks(self) -> list:
+        """(interval seconds, callable) pairs for this role"""
+        return []
+
+    def run(self):
+        self.request('login', 'POST', '/login', {'username': self.username, 'password': BENCH_PASSWORD})
+        schedule = []
+        now = time.monotonic()
+        for interval, task in self.tasks():
+            interval = interval / self.speedup
+            # Stagger first runs so users don't poll in lock-step
+            schedule.append([now + self.random.uniform(0, interval), interval, task])
+        while schedule:
+            schedule.sort(key=lambda item: item[0])
+            due, interval, task = schedule[0]
+            wait = due - time.monotonic()
+            if due > self.deadline:
+                break
+            if wait > 0:
+                time.sleep(wait)
+            task()
+            schedule[0][0] = due + interval
+
+    def poll_notifications(self):
+        self.request('notifications_unread_count', 'GET', '/api/notifications/unread-count')
+
+
+class TechnicianUser(SimulatedUser):
+    def __init__(self, *args, equipment_count: int = 100, reading_interval: float = 60, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.equipment_count = equipment_count
+        self.reading_interval = reading_interval
+
+    def tasks(self):
+        return [
+            (DASHBOARD_POLL_SECONDS, self.poll_dashboard),
+            (DASHBOARD_POLL_SECONDS, self.poll_notifications),
+            (self.reading_interval, self.submit_reading)
+        ]
+
+    def poll_dashboard(self):
+        self.request('technician_recent_readings', 'GET', '/api/monitoring/technician?limit=10')
+
+    def submit_reading(self):
+        self.request('monitoring_create', 'POST', '/api/monitoring', {
+            'equipment_id': self.random.randint(1, self.equipment_count),
+            'monitoring_date': date.today().isoformat(),
+            'shift': self.random.choice(['morning', 'afternoon', 'night']),
+            'voltage': round(self.random.gauss(230, 5), 2),
+            'current': round(self.random.uniform(10, 110), 2),
+            'power_factor': round(self.random.uniform(0.82, 0.99), 3),
+            'observations': 'load test reading'
+        })
+
+
+class EngineerUser(SimulatedUser):
+    def __init__(self, *args, review_interval: float = 90, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.review_interval = review_interval
+        self.fault_ids = []
+
+    def tasks(self):
+        return [
+            (DASHBOARD_POLL_SECONDS, self.poll_faults),
+            (DASHBOARD_POLL_SECONDS, self.poll_notifications),
+            (self.review_interval, self.review_fault)
+        ]
+
+    def poll_faults(self):
+        result = self.request('faults_list', 'GET', '/api/faults?limit=1000')
+        if result and result.get('success'):
+            self.fault_ids = [f['id'] for f in result['data'] if f['status'] != 'resolved']
+
+    def review_fault(self):
+        if not self.fault_ids:
+            return
+        fault_id = self.random.choice(self.fault_ids)
+        self.request('fault_get', 'GET', f'/api/faults/{fault_id}')
+        self.request('fault_update_status', 'PUT', f'/api/faults/{fault_id}/status', {'status': 'investigating'})
+
+
+class ManagerUser(SimulatedUser):
+    def __init__(self, *args, approve_interval: float = 120, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.approve_interval = approve_interval
+        self.pending = []
+
+    def tasks(self):
+        return [
+            (DASHBOARD_POLL_SECONDS, self.poll_dashboard),
+            (DASHBOARD_POLL_SECONDS, self.poll_notifications),
+            (self.approve_interval, self.approve_report)
+        ]
+
+    def poll_dashboard(self):
+        self.request('faults_list', 'GET', '/api/faults?limit=1000')
+        result = self.request('reports_pending', 'GET', '/api/reports/pending')
+        if result and result.get('success'):
+            self.pending = [(r['report_type'], r['id']) for r in result['data']]
+
+    def approve_report(self):
+        if not self.pending:
+            return
+        report_type, report_id = self.pending.pop(self.random.randrange(len(self.pending)))
+        if report_type == 'performance':
+            self.request('performance_report_approve', 'POST', f'/api/performance-reports/{report_id}/approve')
+        else:
+            self.request('report_approve', 'POST', f'/api/reports/{report_id}/approve')
+
+
+def start_local_server(db_path: str, port: int):
+    """Load the app from app.py and serve it from a background thread"""
+    from werkzeug.serving import make_server, WSGIRequestHandler
+
+    class QuietHandler(WSGIRequestHandler):
+        def log_request(self, *args, **kwargs):
+            pass
+
+    os.environ['APDS_DB_PATH'] = os.path.abspath(db_path)
+    spec = importlib.util.spec_from_file_location('apds_main', os.path.join(ROOT_DIR, 'app.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    server = make_server('127.0.0.1', port, module.app, threaded=True, request_handler=QuietHandler)
+    threading.Thread(target=server.serve_forever, daemon=True, name='apds-server').start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Concurrent role-based load test for APDS')
+    parser.add_argument('--db', default=os.path.join(os.path.dirname(__file__), 'data', 'bench.db'),
+                        help='Dataset used when starting the app locally')
+    parser.add_argument('--url', help='Target an already running server instead of starting app.py')
+    parser.add_argument('--port', type=int, default=0)
+    parser.add_argument('--technicians', type=int, default=20)
+    parser.add_argument('--engineers', type=int, default=5)
+    parser.add_argument('--managers', type=int, default=2, help='DMs and DGMs each')
+    parser.add_argument('--equipment', type=int, default=100, help='Equipment IDs readings are spread over')
+    parser.add_argument('--duration', type=float, default=60, help='Seconds to run')
+    parser.add_argument('--speedup', type=float, default=10,
+                        help='Divide polling/think intervals by this factor')
+    parser.add_argument('--reading-interval', type=float, default=60)
+    parser.add_argument('--output', help='Write JSON results to this file')
+    args = parser.parse_args()
+
+    server = None
+    if args.url:
+        base_url = args.url.rstrip('/')
+    else:
+        if not os.path.exists(args.db):
+            parser.error(f"{args.db} not found - run python -m benchmarks.data_generator first")
+        server, base_url = start_local_server(args.db, args.port)
+
+    metrics = Metrics()
+    deadline = time.monotonic() + args.duration
+    common = {'metrics': metrics, 'deadline': deadline, 'speedup': args.speedup}
+    users = []
+    for i in range(1, args.technicians + 1):
+        users.append(TechnicianUser(base_url, f"bench_technician_{i:03d}", seed=i,
+                                    equipment_count=args.equipment,
+                                    reading_interval=args.reading_interval, **common))
+    for i in range(1, args.engineers + 1):
+        users.append(EngineerUser(base_url, f"bench_engineer_{i:03d}", seed=1000 + i, **common))
+    for role in ('dm', 'dgm'):
+        for i in range(1, args.managers + 1):
+            users.append(ManagerUser(base_url, f"bench_{role}_{i:03d}", seed=2000 + i, **common))
+
+    print(f"Running {len(users)} simulated users against {base_url} for {args.duration:.0f}s...")
+    start = time.perf_counter()
+    for user in users:
+        user.start()
+    for user in users:
+        user.join()
+    report = metrics.report(time.perf_counter() - start)
+    report['config'] = vars(args)
+
+    print(f"\nRequests: {report['requests']}  throughput: {report['throughput_rps']} req/s  "
+          f"errors: {report['errors']}  'database is locked': {report['database_locked']} "
+          f"({report['database_locked_rate'] * 100:.2f}%)")
+    for action, r in report['actions'].items():
+        print(f"  {action:<30} n={r['count']:<6} p50={r['p50_ms']:>9.2f}ms  p95={r['p95_ms']:>9.2f}ms  "
+              f"p99={r['p99_ms']:>9.2f}ms  errors={r['errors']}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+    if server:
+        server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+"""
+Endpoint Benchmarks
+
+Runs the hot endpoints through the Flask test client against a generated
+dataset and writes JSON results (p50/p95/p99 per scenario) that can be
+compared between commits.
+
+Usage:
+    python -m benchmarks.run_benchmarks --db benchmarks/data/bench.db --output results.json
+    python -m benchmarks.run_benchmarks --db benchmarks/data/bench.db --compare baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+from benchmarks.data_generator import BENCH_PASSWORD
+from benchmarks.stats import summarize
+
+
+def _today_minus(days: int) -> str:
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+def monitoring_payload(iteration: int) -> dict:
+    return {
+        'equipment_id': 1 + iteration % 100,
+        'monitoring_date': date.today().isoformat(),
+        'shift': 'morning',
+        'voltage': 231.5,
+        'current': 42.0,
+        'power_factor': 0.94,
+        'observations': 'benchmark reading'
+    }
+
+
+# name -> (role, method, path, json payload factory or None)
+SCENARIOS = {
+    'monitoring_create': ('technician', 'POST', '/api/monitoring', monitoring_payload),
+    'monitoring_list_technician': ('technician', 'GET', '/api/monitoring/technician?limit=1000', None),
+    'monitoring_list_equipment': ('engineer', 'GET', '/api/monitoring/equipment/1?limit=100', None),
+    'faults_list': ('engineer', 'GET', '/api/faults?limit=1000', None),
+    'dashboard_technician': ('technician', 'GET', '/dashboard/technician', None),
+    'dashboard_engineer': ('engineer', 'GET', '/dashboard/engineer', None),
+    'dashboard_dm': ('dm', 'GET', '/dashboard/dm', None),
+    'dashboard_dgm': ('dgm', 'GET', '/dashboard/dgm', None),
+    'reports_pending': ('dm', 'GET', '/api/reports/pending', None),
+    'performance_compile': ('technician', 'POST', '/api/performance-reports/compile',
+                            lambda i: {'period_start': _today_minus(30), 'period_end': _today_minus(0)}),
+}
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return 'unknown'
+
+
+class BenchmarkRunner:
+    """Runs benchmark scenarios through Flask test clients, one per role"""
+
+    def __init__(self, db_path: str, iterations: int = 50, warmup: int = 5):
+        os.environ['APDS_DB_PATH'] = os.path.abspath(db_path)
+        # Background maintenance would add noise to the timings (opt back in with APDS_DB_MAINTENANCE=1)
+        os.environ.setdefault('APDS_DB_MAINTENANCE', '0')
+        from app import create_app
+        self.app = create_app()
+        self.iterations = iterations
+        self.warmup = warmup
+        self.clients = {}
+
+    def client_for(self, role: str):
+        """Logged-in test client for the first benchmark user of a role"""
+        if role not in self.clients:
+            client = self.app.test_client()
+            response = client.post('/login', json={'username': f"bench_{role}_001", 'password': BENCH_PASSWORD})
+            if response.status_code != 200:
+                raise RuntimeError(f"Login failed for bench_{role}_001 - was the dataset generated?")
+            self.clients[role] = client
+        return self.clients[role]
+
+    def run_scenario(self, name: str) -> dict:
+        role, method, path, payload = SCENARIOS[name]
+        client = self.client_for(role)
+        latencies = []
+        errors = 0
+        response_bytes = 0
+        for i in range(self.warmup + self.iterations):
+            kwargs = {'json': payload(i)} if payload else {}
+            start = time.perf_counter()
+            response = client.open(path, method=method, **kwargs)
+            body = response.get_data()
+            elapsed = (time.perf_counter() - start) * 1000
+            if i < self.warmup:
+                continue
+            latencies.append(elapsed)
+            response_bytes = len(body)
+            if response.status_code >= 400:
+                errors += 1
+        result = summarize(latencies)
+        result.update({'method': method, 'path': path, 'role': role,
+                       'errors': errors, 'response_bytes': response_bytes})
+        return result
+
+    def run(self, names: list) -> dict:
+        results = {}
+        for name in names:
+            results[name] = self.run_scenario(name)
+            r = results[name]
+            print(f"{name:<30} p50={r['p50_ms']:>9.2f}ms  p95={r['p95_ms']:>9.2f}ms  "
+                  f"p99={r['p99_ms']:>9.2f}ms  errors={r['errors']}")
+        return {
+            'meta': {
+                'git_revision': git_revision(),
+                'timestamp': datetime.now().isoformat(),
+                'python': sys.version.split()[0],
+                'platform': platform.platform(),
+                'iterations': self.iterations,
+                'warmup': self.warmup,
+                'database': os.environ['APDS_DB_PATH']
+            },
+            'results': results
+        }
+
+
+def compare(current: dict, baseline: dict):
+    """Print p50/p95 change versus a previous results file"""
+    print(f"\nComparison with {baseline['meta'].get('git_revision')} "
+          f"({baseline['meta'].get('timestamp')}):")
+    for name, result in current['results'].items():
+        old = baseline['results'].get(name)
+        if not old:
+            continue
+        deltas = []
+        for key in ('p50_ms', 'p95_ms', 'p99_ms'):
+            change = (result[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+            deltas.append(f"{key[:3]} {change:+6.1f}%")
+        print(f"{name:<30} " + '  '.join(deltas))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark APDS hot endpoints')
+    parser.add_argument('--db', default=os.path.join(os.path.dirname(__file__), 'data', 'bench.db'))
+    parser.add_argument('--iterations', type=int, default=50)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--scenario', action='append', choices=sorted(SCENARIOS),
+                        help='Run only the given scenario (repeatable)')
+    parser.add_argument('--output', help='Write JSON results to this file')
+    parser.add_argument('--compare', help='Compare against a previous JSON results file')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        parser.error(f"{args.db} not found - run python -m benchmarks.data_generator first")
+
+    runner = BenchmarkRunner(args.db, iterations=args.iterations, warmup=args.warmup)
+    report = runner.run(args.scenario or list(SCENARIOS))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(report, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,137 @@
+"""
+Similar-Fault Benchmark
+
+Loads the similar-fault index from a generated dataset, optionally grows it
+with synthetic fault documents (--scale), and measures for a sample of
+queries:
+  - query latency of the in-memory index (p50/p95/p99)
+  - recall@k of the default query (very common words skipped) against an
+    exhaustive query over every word
+  - end-to-end latency of SimilarFaultService.find_similar on real faults,
+    including the detail lookup
+
+Usage:
+    python -m benchmarks.similarity_benchmark --db benchmarks/data/bench.db --queries 200 --k 5
+    python -m benchmarks.similarity_benchmark --db benchmarks/data/bench.db --scale 100000 --output similarity.json
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import time
+from datetime import datetime
+
+from benchmarks.run_benchmarks import git_revision
+from benchmarks.stats import summarize
+
+# Synthetic documents: extra words drawn from a Zipf-like vocabulary of this size
+SYNTHETIC_VOCABULARY = 5000
+SYNTHETIC_WORDS = 20
+
+
+def synthetic_documents(documents: list, count: int, seed: int = 7) -> list:
+    """`count` documents mixing real fault texts with words of a skewed synthetic vocabulary"""
+    rnd = random.Random(seed)
+    vocabulary = [f"part{n}" for n in range(SYNTHETIC_VOCABULARY)]
+    weights = [1.0 / (rank + 1) for rank in range(SYNTHETIC_VOCABULARY)]
+    start = max((document[0] for document in documents), default=0) + 1
+    synthetic = []
+    for offset in range(count):
+        _, text, equipment_type, severity = rnd.choice(documents)
+        words = rnd.choices(vocabulary, weights, k=SYNTHETIC_WORDS)
+        synthetic.append((start + offset, text + ' ' + ' '.join(words), equipment_type, severity))
+    return synthetic
+
+
+def run(db_path: str, queries: int, k: int, scale: int, seed: int) -> dict:
+    os.environ['APDS_DB_PATH'] = os.path.abspath(db_path)
+    os.environ.setdefault('APDS_DB_MAINTENANCE', '0')
+    from app.patterns.factory import ServiceFactory
+    from app.algorithms.fault_similarity import FaultSimilarityIndex
+
+    service = ServiceFactory.create_similar_fault_service()
+    documents = service.similarity_repository.find_documents()
+    if not documents:
+        raise SystemExit("No resolved faults with a root cause analysis in this database")
+    corpus = documents + synthetic_documents(documents, max(scale - len(documents), 0), seed)
+
+    index = FaultSimilarityIndex()
+    start = time.perf_counter()
+    index.rebuild(corpus)
+    build_ms = (time.perf_counter() - start) * 1000
+    print(f"Index: {len(index)} documents, {len(index.postings)} terms, built in {build_ms:.0f} ms")
+
+    rnd = random.Random(seed)
+    sample = rnd.sample(corpus, min(queries, len(corpus)))
+    latencies, exhaustive_latencies, recalls = [], [], []
+    for fault_id, text, equipment_type, severity in sample:
+        start = time.perf_counter()
+        found = index.query(text, equipment_type, severity, k, exclude=fault_id)
+        latencies.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        exact = index.query(text, equipment_type, severity, k, exclude=fault_id, exhaustive=True)
+        exhaustive_latencies.append((time.perf_counter() - start) * 1000)
+        if exact:
+            # Ties at the k-th score make several exact answers equally right
+            cutoff = exact[-1][1]
+            hits = sum(1 for match in found if match[1] >= cutoff - 1e-9)
+            recalls.append(min(hits, len(exact)) / len(exact))
+
+    end_to_end = []
+    service.rebuild()
+    for fault_id, *_ in rnd.sample(documents, min(queries, len(documents))):
+        start = time.perf_counter()
+        service.find_similar(fault_id, k)
+        end_to_end.append((time.perf_counter() - start) * 1000)
+
+    results = {
+        'index_query': summarize(latencies),
+        'index_query_exhaustive': summarize(exhaustive_latencies),
+        'find_similar': summarize(end_to_end)
+    }
+    recall = sum(recalls) / len(recalls) if recalls else 0.0
+    for name, result in results.items():
+        print(f"{name:<24} p50 {result['p50_ms']:>8.2f} ms  p95 {result['p95_ms']:>8.2f} ms  "
+              f"p99 {result['p99_ms']:>8.2f} ms")
+    print(f"recall@{k} (vs exhaustive)  {recall:.3f}")
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'db': os.path.abspath(db_path),
+            'documents': len(index),
+            'terms': len(index.postings),
+            'queries': len(sample),
+            'k': k
+        },
+        'build_ms': round(build_ms, 1),
+        'recall_at_k': round(recall, 4),
+        'results': results
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark the APDS similar-fault index')
+    parser.add_argument('--db', default=os.path.join(os.path.dirname(__file__), 'data', 'bench.db'))
+    parser.add_argument('--queries', type=int, default=200)
+    parser.add_argument('--k', type=int, default=5)
+    parser.add_argument('--scale', type=int, default=0,
+                        help='Grow the index with synthetic documents to this many')
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', help='Write JSON results to this file')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        parser.error(f"{args.db} not found - run python -m benchmarks.data_generator first")
+
+    report = run(args.db, args.queries, args.k, args.scale, args.seed)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
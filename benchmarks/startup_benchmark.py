@@ -0,0 +1,115 @@
+"""
+Startup Benchmark
+
+Measures cold start in fresh interpreter processes: importing the app package,
+create_app() and the first request. Each run is a separate process so module
+imports, controller construction and schema checks are all paid again.
+
+Usage:
+    python -m benchmarks.startup_benchmark --db benchmarks/data/bench.db --runs 20 --output startup.json
+    python -m benchmarks.startup_benchmark --db benchmarks/data/bench.db --compare startup.json
+"""
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+from benchmarks.run_benchmarks import git_revision
+from benchmarks.stats import summarize
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PHASES = ('import_ms', 'create_app_ms', 'first_request_ms', 'total_ms')
+
+# Executed in a child process; prints one JSON line with the phase timings
+CHILD_SCRIPT = """
+import contextlib, io, json, time
+start = time.perf_counter()
+with contextlib.redirect_stdout(io.StringIO()):
+    import app as app_package
+    imported = time.perf_counter()
+    application = app_package.create_app()
+    created = time.perf_counter()
+    application.test_client().get('/login')
+    served = time.perf_counter()
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'create_app_ms': (created - imported) * 1000,
+    'first_request_ms': (served - created) * 1000,
+    'total_ms': (served - start) * 1000
+}))
+"""
+
+
+def run_once(db_path: str) -> dict:
+    env = dict(os.environ, APDS_DB_PATH=db_path, APDS_DB_MAINTENANCE='0')
+    output = subprocess.check_output([sys.executable, '-c', CHILD_SCRIPT], cwd=ROOT, env=env, text=True)
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run(db_path: str, runs: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        run_once(db_path)
+    samples = {phase: [] for phase in PHASES}
+    for _ in range(runs):
+        timings = run_once(db_path)
+        for phase in PHASES:
+            samples[phase].append(timings[phase])
+    results = {phase: summarize(values) for phase, values in samples.items()}
+    for phase, result in results.items():
+        print(f"{phase:<18} p50 {result['p50_ms']:>9.2f} ms  p95 {result['p95_ms']:>9.2f} ms")
+    return {
+        'meta': {
+            'timestamp': datetime.now().isoformat(),
+            'git_revision': git_revision(),
+            'python': platform.python_version(),
+            'db': os.path.abspath(db_path),
+            'runs': runs
+        },
+        'results': results
+    }
+
+
+def compare(current: dict, baseline: dict):
+    """Print p50/p95 change per phase versus a previous results file"""
+    print(f"\nComparison with {baseline['meta'].get('git_revision')} "
+          f"({baseline['meta'].get('timestamp')}):")
+    for phase, result in current['results'].items():
+        old = baseline['results'].get(phase)
+        if not old:
+            continue
+        deltas = []
+        for key in ('p50_ms', 'p95_ms'):
+            change = (result[key] - old[key]) / old[key] * 100 if old[key] else 0.0
+            deltas.append(f"{key[:3]} {old[key]:.1f} -> {result[key]:.1f} ms ({change:+.1f}%)")
+        print(f"{phase:<18} " + '  '.join(deltas))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark APDS application startup')
+    parser.add_argument('--db', default=os.path.join(os.path.dirname(__file__), 'data', 'bench.db'))
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--warmup', type=int, default=2)
+    parser.add_argument('--output', help='Write JSON results to this file')
+    parser.add_argument('--compare', help='Compare against a previous JSON results file')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.db):
+        parser.error(f"{args.db} not found - run python -m benchmarks.data_generator first")
+
+    report = run(args.db, args.runs, args.warmup)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            compare(report, json.load(f))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+"""
+Latency statistics helpers shared by the benchmark and load-test tools
+"""
+import math
+
+
+def percentile(sorted_values: list, pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize(latencies_ms: list) -> dict:
+    """Summarize latencies (milliseconds) as count/mean/min/max/p50/p95/p99"""
+    values = sorted(latencies_ms)
+    if not values:
+        return {'count': 0, 'mean_ms': 0.0, 'min_ms': 0.0, 'max_ms': 0.0,
+                'p50_ms': 0.0, 'p95_ms': 0.0, 'p99_ms': 0.0}
+    return {
+        'count': len(values),
+        'mean_ms': round(sum(values) / len(values), 3),
+        'min_ms': round(values[0], 3),
+        'max_ms': round(values[-1], 3),
+        'p50_ms': round(percentile(values, 50), 3),
+        'p95_ms': round(percentile(values, 95), 3),
+        'p99_ms': round(percentile(values, 99), 3)
+    }
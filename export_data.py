@@ -0,0 +1,54 @@
+"""
+Data Export Script
+Bulk export of monitoring and fault history to CSV, Parquet or Arrow
+
+Usage:
+    python export_data.py monitoring --output monitoring.csv
+    python export_data.py faults --format parquet --output faults.parquet --status open
+    python export_data.py monitoring --format arrow --output june.arrow \\
+        --start-date 2024-06-01 --end-date 2024-06-30 --equipment-id 12
+
+Parquet/Arrow output needs pyarrow (pip install pyarrow).
+"""
+import argparse
+import sys
+import time
+from app.services.export_service import ExportService, EXPORTS, FORMATS
+
+def main():
+    parser = argparse.ArgumentParser(description='Export APDS monitoring or fault history')
+    parser.add_argument('kind', choices=sorted(EXPORTS))
+    parser.add_argument('--format', choices=FORMATS, default='csv')
+    parser.add_argument('--output', required=True, help='Output file path')
+    parser.add_argument('--equipment-id', type=int)
+    parser.add_argument('--technician-id', type=int, help='Technician (monitoring) or reporter (faults)')
+    parser.add_argument('--status', help='Operational status (monitoring) or fault status')
+    parser.add_argument('--start-date', help='YYYY-MM-DD, inclusive')
+    parser.add_argument('--end-date', help='YYYY-MM-DD, inclusive')
+    parser.add_argument('--batch-size', type=int, default=5000, help='Rows per batch / row group')
+    args = parser.parse_args()
+
+    service = ExportService(batch_size=args.batch_size)
+    if args.format != 'csv' and not service.parquet_available():
+        print("[ERROR] Parquet/Arrow export requires pyarrow (pip install pyarrow)")
+        return 1
+
+    filters = {
+        'equipment_id': args.equipment_id,
+        'technician_id': args.technician_id,
+        'status': args.status,
+        'start_date': args.start_date,
+        'end_date': args.end_date
+    }
+    started = time.perf_counter()
+    try:
+        rows = service.write_file(args.kind, filters, args.output, args.format)
+    except ValueError as e:
+        print(f"[ERROR] {e}")
+        return 1
+    elapsed = time.perf_counter() - started
+    print(f"[OK] Exported {rows} {args.kind} rows to {args.output} in {elapsed:.2f}s")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""
+Maintenance Forecast Script
+Suggests next maintenance dates from each equipment's monitoring trends
+(power factor decline, current rise, voltage drift and variance growth)
+
+Usage:
+    python forecast_maintenance.py run
+    python forecast_maintenance.py run --window-days 120 --horizon-days 365 --apply
+    python forecast_maintenance.py list --min-confidence 0.5
+
+Needs numpy (pip install numpy).
+"""
+import argparse
+import sys
+from app.patterns.factory import ServiceFactory
+
+def main():
+    parser = argparse.ArgumentParser(description='Forecast APDS equipment maintenance dates')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Recompute forecasts for all equipment')
+    run.add_argument('--window-days', type=int, default=90, help='Days of history to fit')
+    run.add_argument('--horizon-days', type=int, default=180, help='Ignore crossings further out')
+    run.add_argument('--lead-days', type=int, default=7, help='Suggest maintenance this long before a crossing')
+    run.add_argument('--apply', action='store_true',
+                     help='Write confident suggestions to equipment.next_maintenance_date (never later than a set date)')
+    run.add_argument('--min-confidence', type=float, default=0.5)
+
+    listing = commands.add_parser('list', help='Show stored forecasts, soonest first')
+    listing.add_argument('--min-confidence', type=float, default=0.0)
+    listing.add_argument('--limit', type=int, default=20)
+
+    args = parser.parse_args()
+    service = ServiceFactory.create_maintenance_forecast_service()
+
+    if args.command == 'run':
+        try:
+            result = service.run_forecast(args.window_days, args.horizon_days, args.lead_days,
+                                          args.apply, args.min_confidence)
+        except (RuntimeError, ValueError) as e:
+            print(f"[ERROR] {e}")
+            return 1
+        print(f"[OK] {result['forecasts']} of {result['equipment']} equipment expected to cross a threshold "
+              f"({result['confident']} with confidence >= {args.min_confidence}) in {result['duration_ms']} ms")
+        if args.apply:
+            print(f"     next_maintenance_date set on {result['applied']} equipment")
+
+    elif args.command == 'list':
+        for forecast in service.get_forecasts(args.min_confidence, args.limit):
+            equipment = forecast['equipment']
+            print(f"{forecast['suggested_date']}  {equipment['equipment_code']:<12} {forecast['metric']:<16} "
+                  f"crossing {forecast['crossing_date']}  confidence {forecast['confidence']:.2f}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
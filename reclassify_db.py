@@ -0,0 +1,68 @@
+"""
+Monitoring Re-classification Script
+Recomputes operational_status of monitoring history with the current threshold
+profiles (safe while the app is running; an interrupted run resumes)
+
+Usage:
+    python reclassify_db.py run
+    python reclassify_db.py run --chunk-size 5000 --throttle 0.5
+    python reclassify_db.py run --restart
+    python reclassify_db.py status
+"""
+import argparse
+import sys
+import time
+from app.patterns.factory import ServiceFactory
+
+def print_progress(report):
+    eta = f"{report['eta_seconds']}s" if report['eta_seconds'] is not None else '-'
+    print(f"  {report['percent']:5.1f}%  {report['rows_scanned']} rows scanned, "
+          f"{report['rows_changed']} changed, ETA {eta}")
+
+def main():
+    parser = argparse.ArgumentParser(description='Re-classify APDS monitoring history')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='Re-classify with the current thresholds')
+    run.add_argument('--chunk-size', type=int, default=2000, help='Ids per transaction')
+    run.add_argument('--throttle', type=float, default=1.0,
+                     help='Sleep this many times the time each chunk held the write lock')
+    run.add_argument('--restart', action='store_true', help='Start over instead of resuming')
+
+    commands.add_parser('status', help='Show the last run')
+
+    args = parser.parse_args()
+    service = ServiceFactory.create_reclassification_service()
+
+    if args.command == 'run':
+        service.chunk_size = args.chunk_size
+        service.throttle = args.throttle
+        last_print = 0.0
+
+        def progress(report):
+            nonlocal last_print
+            if time.monotonic() - last_print >= 1.0:
+                last_print = time.monotonic()
+                print_progress(report)
+
+        start = time.perf_counter()
+        result = service.run(resume=not args.restart, progress=progress)
+        print(f"[OK] Run {result['run_id']} {result['status']}: {result['rows_scanned']} rows scanned, "
+              f"{result['rows_changed']} changed ({time.perf_counter() - start:.1f} s)")
+
+    elif args.command == 'status':
+        status = service.status()
+        if not status['run_id']:
+            print("No re-classification runs yet")
+            return 0
+        print(f"Run:            {status['run_id']} ({status['status']})")
+        print(f"Rules:          {status['rules_signature']}")
+        print(f"Progress:       {status['percent']}% (next id {status['next_id']} of {status['last_id']})")
+        print(f"Rows:           {status['rows_scanned']} scanned, {status['rows_changed']} changed")
+        print(f"Started:        {status['started_at']} -> {status['finished_at'] or 'unfinished'}")
+        if status['error']:
+            print(f"Error:          {status['error']}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
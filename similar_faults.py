@@ -0,0 +1,48 @@
+"""
+Similar Faults Script
+Builds the similar-fault index (resolved faults with their RCAs and resolution
+reports) and looks up the faults most similar to a given one
+
+Usage:
+    python similar_faults.py rebuild
+    python similar_faults.py query 42 --k 5
+
+The running application keeps its own copy of the index in memory; rebuild it
+there with POST /api/faults/similar/rebuild.
+"""
+import argparse
+import sys
+from app.patterns.factory import ServiceFactory
+
+def main():
+    parser = argparse.ArgumentParser(description='Build and query the APDS similar-fault index')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    commands.add_parser('rebuild', help='Build the index from the database and report its size')
+
+    query = commands.add_parser('query', help='Show the resolved faults most similar to a fault')
+    query.add_argument('fault_id', type=int)
+    query.add_argument('--k', type=int, default=5, help='Number of similar faults')
+
+    args = parser.parse_args()
+    service = ServiceFactory.create_similar_fault_service()
+
+    result = service.rebuild()
+    print(f"[OK] Indexed {result['indexed_faults']} resolved faults ({result['terms']} terms) "
+          f"in {result['duration_ms']} ms")
+
+    if args.command == 'query':
+        try:
+            similar = service.find_similar(args.fault_id, args.k)
+        except ValueError as e:
+            print(f"[ERROR] {e}")
+            return 1
+        print(f"     query took {similar['duration_ms']} ms")
+        for match in similar['results']:
+            print(f"#{match['fault_id']:<7} {match['score']:.3f}  {match['equipment_code']:<12} "
+                  f"{match['fault_description']}")
+            print(f"         root cause: {match['root_cause']}")
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())